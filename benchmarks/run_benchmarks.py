@@ -0,0 +1,695 @@
+"""Benchmark the executor's hot paths at increasing numbers of jobs.
+
+Each benchmark is run at every requested scale (number of jobs) and timed with
+``time.perf_counter``. Results are written to a JSON file so that runs from
+different releases can be compared with ``--compare``.
+
+Usage::
+
+    python benchmarks/run_benchmarks.py --output bench.json
+    python benchmarks/run_benchmarks.py --scales 10 100 1000 --only dispatch collector
+    python benchmarks/run_benchmarks.py --output new.json --compare bench.json --tolerance 0.2
+"""
+
+import argparse
+import gc
+import json
+import math
+import multiprocessing
+import os
+import platform
+import statistics
+import sys
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from datetime import UTC
+from datetime import datetime
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from qiskit import QuantumCircuit  # type: ignore
+
+import quantum_executor
+from quantum_executor import Dispatch
+from quantum_executor import QuantumExecutor
+from quantum_executor.dispatch import Job
+from quantum_executor.policies.simple_aggregate import merge as simple_aggregate_merge
+from quantum_executor.result_collector import ResultCollector
+
+DEFAULT_SCALES = (10, 100, 1_000, 10_000, 100_000)
+FORMAT_VERSION = 1
+
+# Fake backend names used by the split benchmarks; split policies do not contact them.
+NUM_BACKENDS = 10
+COLLECTOR_THREADS = 4
+
+# A benchmark maps a scale (number of jobs) to a zero-argument callable that does the timed work.
+Setup = Callable[[int], Callable[[], Any]]
+
+
+def _circuit() -> QuantumCircuit:
+    """Build the small Bell-state circuit used by every benchmark.
+
+    Returns
+    -------
+    QuantumCircuit
+        A 2-qubit circuit with measurements.
+
+    """
+    qc = QuantumCircuit(2, 2)
+    qc.h(0)
+    qc.cx(0, 1)
+    qc.measure([0, 1], [0, 1])
+    return qc
+
+
+@cache
+def _executor() -> QuantumExecutor:
+    """Create the executor shared by all benchmarks, once.
+
+    Returns
+    -------
+    QuantumExecutor
+        An executor with only the local Aer provider.
+
+    """
+    return QuantumExecutor(providers=["local_aer"])
+
+
+@cache
+def _session_executor() -> QuantumExecutor:
+    """Create an executor with a started session, so its worker pool outlives each run.
+
+    Returns
+    -------
+    QuantumExecutor
+        A started executor with only the local Aer provider.
+
+    """
+    return QuantumExecutor(providers=["local_aer"]).start()
+
+
+def _backends() -> dict[str, list[str]]:
+    """Return the backends the split benchmarks spread jobs over.
+
+    Returns
+    -------
+    Dict[str, List[str]]
+        One provider with ``NUM_BACKENDS`` backends.
+
+    """
+    return {"local_aer": [f"backend_{i}" for i in range(NUM_BACKENDS)]}
+
+
+def _filled_dispatch(scale: int, columnar: bool = False) -> Dispatch:
+    """Build a dispatch with `scale` jobs spread over ``NUM_BACKENDS`` backends.
+
+    Parameters
+    ----------
+    scale : int
+        Number of jobs.
+    columnar : bool, optional
+        If True, build a columnar dispatch.
+
+    Returns
+    -------
+    Dispatch
+        The dispatch.
+
+    """
+    qc = _circuit()
+    dispatch = Dispatch(columnar=columnar)
+    for i, backend in enumerate(_backends()["local_aer"]):
+        count = scale // NUM_BACKENDS + (1 if i < scale % NUM_BACKENDS else 0)
+        if count:
+            dispatch.add_job("local_aer", backend, [qc] * count, 100, {"optimization_level": 1})
+    return dispatch
+
+
+def _run_threads(target: Callable[[int], object], threads: int = COLLECTOR_THREADS) -> None:
+    """Run `target(index)` in several threads and wait for all of them.
+
+    Parameters
+    ----------
+    target : Callable[[int], object]
+        Work done by each thread, given the thread index.
+    threads : int, optional
+        Number of threads.
+
+    """
+    workers = [threading.Thread(target=target, args=(i,)) for i in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+
+def generate_dispatch(policy: str, parallel: str | None = None) -> Setup:
+    """Benchmark ``QuantumExecutor.generate_dispatch`` with a split policy.
+
+    Parameters
+    ----------
+    policy : str
+        Name of the split policy.
+    parallel : str, optional
+        "threads" or "processes" to split the circuits in parallel.
+
+    Returns
+    -------
+    Setup
+        Splits ``scale / NUM_BACKENDS`` circuits over ``NUM_BACKENDS`` backends.
+
+    """
+
+    def setup(scale: int) -> Callable[[], Any]:
+        executor = _executor()
+        circuits = [_circuit() for _ in range(max(1, scale // NUM_BACKENDS))]
+        backends = _backends()
+        return lambda: executor.generate_dispatch(circuits, 1000, backends, split_policy=policy, parallel=parallel)
+
+    return setup
+
+
+def stream_dispatch(policy: str) -> Setup:
+    """Benchmark producing every job of ``QuantumExecutor.stream_dispatch`` with a split policy.
+
+    Parameters
+    ----------
+    policy : str
+        Name of the split policy.
+
+    Returns
+    -------
+    Setup
+        Splits ``scale / NUM_BACKENDS`` circuits over ``NUM_BACKENDS`` backends, reading
+        each job once and keeping none.
+
+    """
+
+    def setup(scale: int) -> Callable[[], Any]:
+        executor = _executor()
+        qc = _circuit()
+        backends = _backends()
+
+        def run() -> None:
+            circuits = (qc for _ in range(max(1, scale // NUM_BACKENDS)))
+            deque(executor.stream_dispatch(circuits, 1000, backends, split_policy=policy).all_jobs(), maxlen=0)
+
+        return run
+
+    return setup
+
+
+def dispatch_add_job(columnar: bool = False) -> Setup:
+    """Benchmark adding jobs to a Dispatch one at a time.
+
+    Parameters
+    ----------
+    columnar : bool, optional
+        If True, add them to a columnar dispatch.
+
+    Returns
+    -------
+    Setup
+        Adds `scale` jobs.
+
+    """
+
+    def setup(scale: int) -> Callable[[], Any]:
+        qc = _circuit()
+        backends = _backends()["local_aer"]
+        config = {"optimization_level": 1}
+
+        def run() -> Dispatch:
+            dispatch = Dispatch(columnar=columnar)
+            for i in range(scale):
+                dispatch.add_job("local_aer", backends[i % NUM_BACKENDS], qc, 100, config)
+            return dispatch
+
+        return run
+
+    return setup
+
+
+@cache
+def _noise_config() -> dict[str, Any]:
+    """Build a job configuration carrying the noise model of a 133-qubit device, once.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The configuration.
+
+    """
+    from qiskit_aer.noise import NoiseModel  # type: ignore # pylint: disable=import-outside-toplevel
+    from qiskit_ibm_runtime.fake_provider import FakeTorino  # type: ignore # pylint: disable=import-outside-toplevel
+
+    return {"noise_model": NoiseModel.from_backend(FakeTorino()), "seed_simulator": 42}
+
+
+def dispatch_noise_model(declarative: bool) -> Setup:
+    """Benchmark building a Dispatch whose jobs carry a noise model in their configuration.
+
+    Parameters
+    ----------
+    declarative : bool
+        If True, build it from a dispatch dictionary, otherwise with one ``add_job`` call per job.
+
+    Returns
+    -------
+    Setup
+        Builds a dispatch of `scale` jobs sharing one noise-model configuration.
+
+    """
+
+    def setup(scale: int) -> Callable[[], Any]:
+        qc = _circuit()
+        backends = _backends()["local_aer"]
+        config = _noise_config()
+        if declarative:
+            jobs: dict[str, list[dict[str, Any]]] = {backend: [] for backend in backends}
+            for i in range(scale):
+                jobs[backends[i % NUM_BACKENDS]].append({"circuit": qc, "shots": 100, "configuration": config})
+            return lambda: Dispatch({"local_aer": jobs})
+
+        def run() -> Dispatch:
+            dispatch = Dispatch()
+            for i in range(scale):
+                dispatch.add_job("local_aer", backends[i % NUM_BACKENDS], qc, 100, config)
+            return dispatch
+
+        return run
+
+    return setup
+
+
+def dispatch_all_jobs(columnar: bool = False) -> Setup:
+    """Benchmark iterating over every job of a Dispatch.
+
+    Parameters
+    ----------
+    columnar : bool, optional
+        If True, iterate over a columnar dispatch.
+
+    Returns
+    -------
+    Setup
+        Iterates over `scale` jobs.
+
+    """
+
+    def setup(scale: int) -> Callable[[], Any]:
+        dispatch = _filled_dispatch(scale, columnar)
+        return lambda: sum(1 for _ in dispatch.all_jobs())
+
+    return setup
+
+
+def dispatch_to_dict(scale: int) -> Callable[[], Any]:
+    """Benchmark converting a Dispatch to its dictionary form.
+
+    Parameters
+    ----------
+    scale : int
+        Number of jobs.
+
+    Returns
+    -------
+    Callable[[], Any]
+        The timed work.
+
+    """
+    dispatch = _filled_dispatch(scale)
+    return dispatch.to_dict
+
+
+def collector_register(scale: int) -> Callable[[], Any]:
+    """Benchmark registering `scale` jobs from concurrent threads.
+
+    Parameters
+    ----------
+    scale : int
+        Number of jobs.
+
+    Returns
+    -------
+    Callable[[], Any]
+        The timed work.
+
+    """
+    qc = _circuit()
+    jobs = [Job(qc, 100) for _ in range(scale)]
+    collector = ResultCollector()
+
+    def register(index: int) -> None:
+        for job in jobs[index::COLLECTOR_THREADS]:
+            collector.register_job_mapping(job, "local_aer", f"backend_{index}")
+
+    return lambda: _run_threads(register)
+
+
+def collector_store(scale: int) -> Callable[[], Any]:
+    """Benchmark storing `scale` results from concurrent threads.
+
+    Parameters
+    ----------
+    scale : int
+        Number of jobs.
+
+    Returns
+    -------
+    Callable[[], Any]
+        The timed work.
+
+    """
+    qc = _circuit()
+    jobs = [Job(qc, 100) for _ in range(scale)]
+    collector = ResultCollector()
+    for i, job in enumerate(jobs):
+        collector.register_job_mapping(job, "local_aer", f"backend_{i % NUM_BACKENDS}")
+
+    def store(index: int) -> None:
+        for job in jobs[index::COLLECTOR_THREADS]:
+            collector.store_result(job, {"00": 50, "11": 50})
+
+    return lambda: _run_threads(store)
+
+
+def collector_get_results(scale: int) -> Callable[[], Any]:
+    """Benchmark concurrent readers of a complete collector.
+
+    Parameters
+    ----------
+    scale : int
+        Number of jobs.
+
+    Returns
+    -------
+    Callable[[], Any]
+        The timed work: every thread calls ``get_results`` once.
+
+    """
+    qc = _circuit()
+    jobs = [Job(qc, 100) for _ in range(scale)]
+    collector = ResultCollector()
+    for i, job in enumerate(jobs):
+        collector.register_job_mapping(job, "local_aer", f"backend_{i % NUM_BACKENDS}")
+    # Store in reverse so each completion check stops at the first (still pending) job.
+    for job in reversed(jobs):
+        collector.store_result(job, {"00": 50, "11": 50})
+    return lambda: _run_threads(lambda _: collector.get_results())
+
+
+def merge_simple_aggregate(scale: int) -> Callable[[], Any]:
+    """Benchmark the simple_aggregate merge policy.
+
+    Parameters
+    ----------
+    scale : int
+        Number of job results.
+
+    Returns
+    -------
+    Callable[[], Any]
+        The timed work.
+
+    """
+    results: dict[str, dict[str, list[Any]]] = {"local_aer": {}}
+    for i in range(scale):
+        counts = {"00": 25 + i % 7, "01": 25, "10": 25, "11": 25 - i % 7}
+        results["local_aer"].setdefault(f"backend_{i % NUM_BACKENDS}", []).append(counts)
+    return lambda: simple_aggregate_merge(results, None)
+
+
+def run_experiment(multiprocess: bool, session: bool = False) -> Setup:
+    """Benchmark ``QuantumExecutor.run_experiment`` end to end on ``aer_simulator``.
+
+    Parameters
+    ----------
+    multiprocess : bool
+        Whether jobs run in worker processes.
+    session : bool, optional
+        Whether the executor keeps its worker pool between runs (see ``QuantumExecutor.start``).
+
+    Returns
+    -------
+    Setup
+        Runs `scale` single-job circuits and merges them with simple_aggregate.
+
+    """
+
+    def setup(scale: int) -> Callable[[], Any]:
+        executor = _session_executor() if session else _executor()
+        circuits = [_circuit() for _ in range(scale)]
+        backends = {"local_aer": ["aer_simulator"]}
+        return lambda: executor.run_experiment(
+            circuits,
+            100,
+            backends,
+            split_policy="uniform",
+            merge_policy="simple_aggregate",
+            multiprocess=multiprocess,
+        )
+
+    return setup
+
+
+# name -> (setup, largest scale it is run at)
+BENCHMARKS: dict[str, tuple[Setup, int]] = {
+    "generate_dispatch.uniform": (generate_dispatch("uniform"), 100_000),
+    "generate_dispatch.multiplier": (generate_dispatch("multiplier"), 100_000),
+    "generate_dispatch.uniform.threads": (generate_dispatch("uniform", parallel="threads"), 100_000),
+    "stream_dispatch.uniform": (stream_dispatch("uniform"), 1_000_000),
+    "dispatch.add_job": (dispatch_add_job(), 100_000),
+    "dispatch.add_job.columnar": (dispatch_add_job(columnar=True), 1_000_000),
+    "dispatch.add_job.noise_model": (dispatch_noise_model(declarative=False), 10_000),
+    "dispatch.init.noise_model": (dispatch_noise_model(declarative=True), 10_000),
+    "dispatch.all_jobs": (dispatch_all_jobs(), 100_000),
+    "dispatch.all_jobs.columnar": (dispatch_all_jobs(columnar=True), 1_000_000),
+    "dispatch.to_dict": (dispatch_to_dict, 100_000),
+    "collector.register_job_mapping": (collector_register, 100_000),
+    "collector.store_result": (collector_store, 100_000),
+    "collector.get_results": (collector_get_results, 100_000),
+    "merge.simple_aggregate": (merge_simple_aggregate, 100_000),
+    "run_experiment.sequential": (run_experiment(multiprocess=False), 1_000),
+    "run_experiment.processes": (run_experiment(multiprocess=True), 1_000),
+    "run_experiment.session": (run_experiment(multiprocess=True, session=True), 1_000),
+}
+
+
+def run_benchmark(setup: Setup, scale: int, repeat: int) -> list[float]:
+    """Time a benchmark at one scale.
+
+    Parameters
+    ----------
+    setup : Setup
+        The benchmark; called before each repetition so the timed work starts from a fresh state.
+    scale : int
+        Number of jobs.
+    repeat : int
+        Number of timed repetitions.
+
+    Returns
+    -------
+    List[float]
+        Elapsed seconds of each repetition.
+
+    """
+    times = []
+    for _ in range(repeat):
+        work = setup(scale)
+        gc.collect()
+        start = time.perf_counter()
+        work()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def _predict(previous: list[tuple[int, float]], scale: int) -> float:
+    """Extrapolate the time of one repetition at `scale` from earlier scales.
+
+    Parameters
+    ----------
+    previous : List[Tuple[int, float]]
+        ``(scale, median seconds)`` of the scales already run, in increasing order.
+    scale : int
+        The next scale.
+
+    Returns
+    -------
+    float
+        Predicted seconds; 0 if nothing has been run yet.
+
+    """
+    if not previous:
+        return 0.0
+    last_scale, last_time = previous[-1]
+    exponent = 1.0
+    if len(previous) > 1:
+        prev_scale, prev_time = previous[-2]
+        if prev_time > 0 and last_time > 0:
+            # Ignore sub-linear growth: small scales are dominated by fixed overheads.
+            exponent = max(1.0, math.log(last_time / prev_time) / math.log(last_scale / prev_scale))
+    return float(last_time * (scale / last_scale) ** exponent)
+
+
+def run_all(
+    names: list[str],
+    scales: list[int],
+    repeat: int,
+    budget: float,
+) -> dict[str, Any]:
+    """Run the selected benchmarks at every scale.
+
+    Parameters
+    ----------
+    names : List[str]
+        Benchmarks to run.
+    scales : List[int]
+        Numbers of jobs, in increasing order.
+    repeat : int
+        Timed repetitions per scale.
+    budget : float
+        Larger scales of a benchmark are skipped once one repetition is predicted
+        to take longer than this many seconds. The prediction extrapolates the
+        growth observed between the two previous scales, so quadratic paths are
+        caught before they run for minutes.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The report written to JSON: environment metadata, results and skipped runs.
+
+    """
+    results: list[dict[str, Any]] = []
+    skipped: list[dict[str, Any]] = []
+    for name in names:
+        setup, max_scale = BENCHMARKS[name]
+        previous: list[tuple[int, float]] = []
+        for scale in scales:
+            if scale > max_scale:
+                skipped.append({"benchmark": name, "scale": scale, "reason": "over max scale"})
+                continue
+            predicted = _predict(previous, scale)
+            if predicted > budget:
+                skipped.append({"benchmark": name, "scale": scale, "reason": f"predicted {predicted:.0f}s"})
+                continue
+            times = run_benchmark(setup, scale, repeat)
+            median = statistics.median(times)
+            results.append(
+                {
+                    "benchmark": name,
+                    "scale": scale,
+                    "repeat": repeat,
+                    "times": times,
+                    "min": min(times),
+                    "median": median,
+                    "per_job_us": median / scale * 1e6,
+                }
+            )
+            print(f"{name:<34} {scale:>8} jobs  median {median:10.4f}s  ({median / scale * 1e6:9.2f} µs/job)")
+            previous.append((scale, median))
+
+    return {
+        "format_version": FORMAT_VERSION,
+        "created": datetime.now(UTC).isoformat(),
+        "quantum_executor": quantum_executor.__version__,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "results": results,
+        "skipped": skipped,
+    }
+
+
+def compare(report: dict[str, Any], baseline: dict[str, Any], tolerance: float) -> list[dict[str, Any]]:
+    """Find benchmarks that got slower than a baseline report.
+
+    Parameters
+    ----------
+    report : Dict[str, Any]
+        The new report.
+    baseline : Dict[str, Any]
+        A report from an earlier run.
+    tolerance : float
+        Allowed relative slowdown of the median, e.g. 0.2 for 20 %.
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        One entry per regression with the old and new medians and their ratio.
+
+    """
+    old = {(r["benchmark"], r["scale"]): r["median"] for r in baseline.get("results", [])}
+    regressions = []
+    for result in report["results"]:
+        key = (result["benchmark"], result["scale"])
+        if key not in old or old[key] <= 0:
+            continue
+        ratio = result["median"] / old[key]
+        if ratio > 1 + tolerance:
+            regressions.append(
+                {"benchmark": key[0], "scale": key[1], "old": old[key], "new": result["median"], "ratio": ratio}
+            )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark suite from the command line.
+
+    Parameters
+    ----------
+    argv : List[str], optional
+        Command-line arguments; defaults to ``sys.argv[1:]``.
+
+    Returns
+    -------
+    int
+        Exit status: 1 if a regression was found with ``--compare``, else 0.
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", type=int, nargs="+", default=list(DEFAULT_SCALES), help="numbers of jobs")
+    parser.add_argument("--repeat", type=int, default=3, help="timed repetitions per scale")
+    parser.add_argument("--budget", type=float, default=60.0, help="seconds after which larger scales are skipped")
+    parser.add_argument("--only", nargs="+", default=[], help="run benchmarks whose name starts with these prefixes")
+    parser.add_argument("--output", type=Path, default=None, help="write the JSON report to this file")
+    parser.add_argument("--compare", type=Path, default=None, help="baseline JSON report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative slowdown (default 0.2)")
+    args = parser.parse_args(argv)
+
+    names = [name for name in BENCHMARKS if not args.only or name.startswith(tuple(args.only))]
+    if not names:
+        parser.error(f"No benchmark matches {args.only}; available: {', '.join(BENCHMARKS)}")
+
+    try:
+        report = run_all(names, sorted(args.scales), args.repeat, args.budget)
+    finally:
+        if _session_executor.cache_info().currsize:
+            _session_executor().close()
+    if args.output is not None:
+        with args.output.open("w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.output}")
+
+    if args.compare is None:
+        return 0
+    with args.compare.open(encoding="utf-8") as f:
+        regressions = compare(report, json.load(f), args.tolerance)
+    for reg in regressions:
+        print(
+            f"REGRESSION {reg['benchmark']} at {reg['scale']} jobs: "
+            f"{reg['old']:.4f}s -> {reg['new']:.4f}s (x{reg['ratio']:.2f})"
+        )
+    if not regressions:
+        print(f"No regression beyond {args.tolerance:.0%} against {args.compare}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    # Same start method as the test suite: forking after Aer has started its threads can deadlock.
+    multiprocessing.set_start_method("spawn", force=True)
+    sys.exit(main())
@@ -0,0 +1,221 @@
+"""Cooperative cancellation of the provider jobs of a dispatch.
+
+Jobs wait for their results in worker threads or processes, blocked in the
+provider's ``job.result()``. They are interrupted by cancelling the provider job
+through its handle, which makes that call return or raise. A :class:`CancelScope`
+holds the handles of the jobs running in the executor's process, so that
+cancelling a dispatch cancels them all; a per-job timeout does the same for one
+handle, also inside worker processes. A :class:`CancelFlag` carries a cancellation
+request into a worker process, where it cancels the job through a scope of its own.
+"""
+
+import logging
+import threading
+from contextlib import suppress
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+CANCELLED_ERROR = "Job cancelled."
+
+# How often, in seconds, a worker process checks whether its job was cancelled.
+POLL_INTERVAL = 0.05
+
+
+def cancel_job(job: Any) -> None:  # noqa: ANN401
+    """Ask the provider to cancel a job, ignoring failures.
+
+    Parameters
+    ----------
+    job : QuantumJob
+        The provider job handle.
+
+    """
+    try:
+        job.cancel()
+    except Exception as e:  # pylint: disable=broad-except
+        logger.warning("Could not cancel provider job %s: %s", getattr(job, "id", job), e)
+
+
+class CancelScope:
+    """Set of provider job handles that are cancelled together.
+
+    Anything with a ``cancel()`` method can be tracked, so scopes nest: a scope
+    added to another is cancelled with it.
+
+    Examples
+    --------
+    >>> scope = CancelScope()
+    >>> if scope.add(job):
+    ...     result = job.result()
+    >>> scope.discard(job)
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty, active CancelScope."""
+        self._lock = threading.Lock()
+        self._jobs: dict[int, Any] = {}
+        self._cancelled = False
+
+    @property
+    def cancelled(self) -> bool:
+        """Check whether the scope was cancelled.
+
+        Returns
+        -------
+        bool
+            True once :meth:`cancel` has been called.
+
+        """
+        return self._cancelled
+
+    def add(self, job: Any) -> bool:  # noqa: ANN401
+        """Track a provider job until it is discarded.
+
+        Parameters
+        ----------
+        job : QuantumJob
+            The provider job handle.
+
+        Returns
+        -------
+        bool
+            False if the scope is already cancelled; the job is then cancelled right away.
+
+        """
+        with self._lock:
+            if not self._cancelled:
+                self._jobs[id(job)] = job
+                return True
+        cancel_job(job)
+        return False
+
+    def discard(self, job: Any) -> None:  # noqa: ANN401
+        """Stop tracking a provider job that has finished.
+
+        Parameters
+        ----------
+        job : QuantumJob
+            The provider job handle.
+
+        """
+        with self._lock:
+            self._jobs.pop(id(job), None)
+
+    def cancel(self) -> None:
+        """Cancel every tracked job, and every job added from now on."""
+        with self._lock:
+            self._cancelled = True
+            jobs, self._jobs = self._jobs, {}
+        for job in jobs.values():
+            cancel_job(job)
+
+
+class CancelFlag:
+    """Cancellation request shared with a worker process through one byte of shared memory.
+
+    The executor creates the flag and passes it along with the job; pickling sends
+    only the segment name, and the worker attaches it and calls :meth:`watch`.
+    The creator owns the segment and unlinks it in :meth:`close`, once the job is done.
+
+    Examples
+    --------
+    >>> flag = CancelFlag()
+    >>> future = pool.submit(run_job_in_worker, "ionq", "qpu.aria-1", circuit, 100, cancel_flag=flag)
+    >>> flag.cancel()  # The worker cancels the provider job within POLL_INTERVAL seconds.
+    >>> future.result()
+    >>> flag.close()
+
+    """
+
+    def __init__(self) -> None:
+        """Create an unset flag in a new shared-memory segment."""
+        self._segment = SharedMemory(create=True, size=1)
+        self._segment.buf[0] = 0
+        self._owner = True
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> str:
+        """Return the picklable state of the flag.
+
+        Returns
+        -------
+        str
+            The segment name.
+
+        """
+        return self._segment.name
+
+    def __setstate__(self, name: str) -> None:
+        """Attach the flag's segment in the unpickling process.
+
+        Parameters
+        ----------
+        name : str
+            The segment name.
+
+        """
+        self._segment = SharedMemory(name=name)
+        self._owner = False
+        self._closed = False
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self) -> bool:
+        """Check whether the flag was set.
+
+        Returns
+        -------
+        bool
+            True once :meth:`cancel` has been called in any process.
+
+        """
+        with self._lock:
+            return not self._closed and bool(self._segment.buf[0])
+
+    def cancel(self) -> None:
+        """Set the flag, unless it was closed already."""
+        with self._lock:
+            if not self._closed:
+                self._segment.buf[0] = 1
+
+    def watch(self, scope: CancelScope, interval: float = POLL_INTERVAL) -> threading.Event:
+        """Cancel a scope once the flag is set, polling it in a background thread.
+
+        Parameters
+        ----------
+        scope : CancelScope
+            The scope tracking the job.
+        interval : float, optional
+            Seconds between two checks of the flag.
+
+        Returns
+        -------
+        threading.Event
+            Set it to stop watching, once the job is done.
+
+        """
+        done = threading.Event()
+
+        def _poll() -> None:
+            while not self.cancelled:
+                if done.wait(interval):
+                    return
+            scope.cancel()
+
+        threading.Thread(target=_poll, name="quantum-executor-cancel-flag", daemon=True).start()
+        return done
+
+    def close(self) -> None:
+        """Release the flag; the creating process also unlinks its segment."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._segment.close()
+        if self._owner:
+            with suppress(FileNotFoundError):
+                self._segment.unlink()
@@ -0,0 +1,606 @@
+"""Estimate the relative cost of quantum jobs to order and pack them across workers."""
+
+import functools
+import heapq
+import json
+import logging
+import math
+import os
+import threading
+import weakref
+from abc import ABC
+from abc import abstractmethod
+from collections.abc import Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+
+if TYPE_CHECKING:  # pragma: no cover
+    from quantum_executor.dispatch import Job
+
+logger = logging.getLogger(__name__)
+
+# Providers whose backends run on the local machine (and therefore compete for CPU).
+LOCAL_PROVIDERS: frozenset[str] = frozenset({"local_aer"})
+
+
+# Statistics of the circuits inspected so far, by identity: id → (weak reference, stats).
+# Entries go away with their circuit, and circuits are not expected to change once dispatched.
+_circuit_stats_cache: dict[int, tuple["weakref.ref[Any]", tuple[int, int]]] = {}
+
+
+def circuit_stats(circuit: Any) -> tuple[int, int]:  # noqa: ANN401
+    """Return the number of qubits and the depth of a circuit.
+
+    Qiskit-like circuits are inspected directly; other program types are loaded
+    through qBraid. Unknown programs yield ``(0, 0)``. The result is cached for as long
+    as the circuit is alive, so ordering, memory estimates and runtime recording inspect
+    each circuit only once.
+
+    Parameters
+    ----------
+    circuit : Any
+        The quantum circuit.
+
+    Returns
+    -------
+    tuple[int, int]
+        The number of qubits and the circuit depth.
+
+    """
+    key = id(circuit)
+    entry = _circuit_stats_cache.get(key)
+    if entry is not None and entry[0]() is circuit:
+        return entry[1]
+    stats = _inspect_circuit(circuit)
+    try:
+        ref = weakref.ref(circuit, functools.partial(_forget_circuit, key))
+    except TypeError:
+        # Not weakly referenceable (e.g. a QASM string): its id could be reused, so nothing is cached.
+        return stats
+    _circuit_stats_cache[key] = (ref, stats)
+    return stats
+
+
+def _forget_circuit(key: int, ref: "weakref.ref[Any]") -> None:
+    """Drop the cached statistics of a circuit that was garbage collected.
+
+    Parameters
+    ----------
+    key : int
+        The id the circuit had.
+    ref : weakref.ref
+        The dead reference; entries of a newer circuit with the same id are kept.
+
+    """
+    entry = _circuit_stats_cache.get(key)
+    if entry is not None and entry[0] is ref:
+        del _circuit_stats_cache[key]
+
+
+def _inspect_circuit(circuit: Any) -> tuple[int, int]:  # noqa: ANN401
+    """Compute the number of qubits and the depth of a circuit.
+
+    Parameters
+    ----------
+    circuit : Any
+        The quantum circuit.
+
+    Returns
+    -------
+    tuple[int, int]
+        The number of qubits and the circuit depth.
+
+    """
+    num_qubits = getattr(circuit, "num_qubits", None)
+    depth = getattr(circuit, "depth", None)
+    if isinstance(num_qubits, int) and callable(depth):
+        return num_qubits, int(depth())
+    try:
+        from qbraid.programs import load_program  # type: ignore # pylint: disable=import-outside-toplevel
+
+        program = load_program(circuit)
+        # Analog and annealing programs have no gate depth.
+        num_qubits = getattr(program, "num_qubits", None)
+        depth = getattr(program, "depth", None)
+        if num_qubits is None or depth is None:
+            return 0, 0
+        return int(num_qubits), int(depth)
+    except Exception:  # pylint: disable=broad-except
+        return 0, 0
+
+
+class RuntimeHistory:
+    """Thread-safe record of measured job runtimes, used to calibrate cost estimates.
+
+    For every provider/backend pair the history accumulates the heuristic cost
+    and the measured wall time of finished jobs. Their ratio rescales heuristic
+    estimates for that backend. The history can be stored locally as JSON with
+    :meth:`save` and restored with :meth:`load`.
+    """
+
+    _format_version = 1
+
+    def __init__(self) -> None:
+        """Initialize an empty RuntimeHistory."""
+        self._lock = threading.Lock()
+        # provider -> backend -> [total heuristic cost, total seconds, number of jobs]
+        self._records: dict[str, dict[str, list[float]]] = {}
+
+    def __repr__(self) -> str:
+        """Return a string representation of the RuntimeHistory.
+
+        Returns
+        -------
+        str
+            Includes the number of recorded jobs per provider/backend.
+
+        """
+        with self._lock:
+            counts = {p: {b: int(r[2]) for b, r in backs.items()} for p, backs in self._records.items()}
+        return f"RuntimeHistory({counts})"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable representation of the history.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The format version and, per provider and backend, the total cost, seconds and job count.
+
+        """
+        with self._lock:
+            records = {
+                provider: {backend: {"cost": r[0], "seconds": r[1], "jobs": int(r[2])} for backend, r in backs.items()}
+                for provider, backs in self._records.items()
+            }
+        return {"version": self._format_version, "records": records}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "RuntimeHistory":
+        """Create a history from the output of :meth:`to_dict`.
+
+        Parameters
+        ----------
+        data : Dict[str, Any]
+            The serialized history.
+
+        Returns
+        -------
+        RuntimeHistory
+            The restored history.
+
+        Raises
+        ------
+        ValueError
+            If the data has an unsupported format version.
+
+        """
+        if data.get("version") != cls._format_version:
+            raise ValueError(f"Unsupported runtime history version: {data.get('version')}.")
+        history = cls()
+        for provider, backs in data.get("records", {}).items():
+            for backend, r in backs.items():
+                history._records.setdefault(provider, {})[backend] = [
+                    float(r["cost"]),
+                    float(r["seconds"]),
+                    int(r["jobs"]),
+                ]
+        return history
+
+    def save(self, path: str | Path) -> None:
+        """Atomically write the history to a JSON file.
+
+        Parameters
+        ----------
+        path : str or Path
+            Destination file; parent folders are created if needed.
+
+        """
+        dest = Path(path)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        tmp = dest.with_name(f"{dest.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(self.to_dict()), encoding="utf-8")
+        tmp.replace(dest)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "RuntimeHistory":
+        """Read a history from a JSON file written by :meth:`save`.
+
+        A missing or unreadable file yields an empty history.
+
+        Parameters
+        ----------
+        path : str or Path
+            The file to read.
+
+        Returns
+        -------
+        RuntimeHistory
+            The loaded history.
+
+        """
+        try:
+            return cls.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
+        except FileNotFoundError:
+            return cls()
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Ignoring unreadable runtime history '%s': %s", path, e)
+            return cls()
+
+    def record(self, provider_name: str, backend_name: str, cost: float, seconds: float) -> None:
+        """Record the measured runtime of a finished job.
+
+        Parameters
+        ----------
+        provider_name : str
+            The provider the job ran on.
+        backend_name : str
+            The backend the job ran on.
+        cost : float
+            The heuristic cost of the job.
+        seconds : float
+            The measured wall time of the job.
+
+        """
+        with self._lock:
+            entry = self._records.setdefault(provider_name, {}).setdefault(backend_name, [0.0, 0.0, 0])
+            entry[0] += cost
+            entry[1] += seconds
+            entry[2] += 1
+
+    def seconds_per_cost(self, provider_name: str, backend_name: str) -> float | None:
+        """Return the calibrated seconds per heuristic cost unit for a backend.
+
+        Parameters
+        ----------
+        provider_name : str
+            The provider name.
+        backend_name : str
+            The backend name.
+
+        Returns
+        -------
+        float or None
+            The ratio of measured seconds to heuristic cost, or None if there is no usable history.
+
+        """
+        with self._lock:
+            entry = self._records.get(provider_name, {}).get(backend_name)
+        if entry is None or entry[0] <= 0:
+            return None
+        return entry[1] / entry[0]
+
+    def overall_seconds_per_cost(self) -> float | None:
+        """Return the seconds per heuristic cost unit across all recorded backends.
+
+        Returns
+        -------
+        float or None
+            The ratio of all measured seconds to all heuristic cost, or None if there is no usable history.
+
+        """
+        with self._lock:
+            cost = sum(r[0] for backs in self._records.values() for r in backs.values())
+            seconds = sum(r[1] for backs in self._records.values() for r in backs.values())
+        if cost <= 0:
+            return None
+        return seconds / cost
+
+    def mean_seconds(self, provider_name: str, backend_name: str) -> float | None:
+        """Return the mean measured runtime of jobs on a backend.
+
+        Parameters
+        ----------
+        provider_name : str
+            The provider name.
+        backend_name : str
+            The backend name.
+
+        Returns
+        -------
+        float or None
+            The mean runtime in seconds, or None if nothing was recorded.
+
+        """
+        with self._lock:
+            entry = self._records.get(provider_name, {}).get(backend_name)
+        if entry is None or entry[2] == 0:
+            return None
+        return entry[1] / entry[2]
+
+
+class CostModel(ABC):
+    """Base class for job cost estimators.
+
+    Subclasses implement :meth:`estimate`, returning an estimated run time in
+    seconds; for job ordering alone, costs only need to be comparable with each other.
+
+    Parameters
+    ----------
+    history : RuntimeHistory, optional
+        Measured runtimes used to calibrate the estimates.
+
+    """
+
+    def __init__(self, history: RuntimeHistory | None = None) -> None:
+        """Initialize the CostModel.
+
+        Parameters
+        ----------
+        history : RuntimeHistory, optional
+            Measured runtimes used to calibrate the estimates.
+
+        """
+        self.history = history
+
+    @abstractmethod
+    def estimate(self, provider_name: str, backend_name: str, job: "Job") -> float:
+        """Estimate the cost of running a job on a backend.
+
+        Parameters
+        ----------
+        provider_name : str
+            The provider name.
+        backend_name : str
+            The backend name.
+        job : Job
+            The job to estimate.
+
+        Returns
+        -------
+        float
+            The estimated cost.
+
+        """
+
+    def estimate_memory(  # pylint: disable=unused-argument
+        self,
+        provider_name: str,  # noqa: ARG002
+        backend_name: str,  # noqa: ARG002
+        job: "Job",  # noqa: ARG002
+    ) -> int:
+        """Estimate the peak memory needed to run a job.
+
+        Parameters
+        ----------
+        provider_name : str
+            The provider name.
+        backend_name : str
+            The backend name.
+        job : Job
+            The job to estimate.
+
+        Returns
+        -------
+        int
+            The estimated peak memory in bytes; 0 if the model does not estimate memory.
+
+        """
+        return 0
+
+    def observe(self, provider_name: str, backend_name: str, job: "Job", seconds: float) -> None:
+        """Feed the measured runtime of a finished job back into the history.
+
+        Parameters
+        ----------
+        provider_name : str
+            The provider the job ran on.
+        backend_name : str
+            The backend the job ran on.
+        job : Job
+            The finished job.
+        seconds : float
+            The measured wall time of the job.
+
+        """
+        if self.history is not None:
+            self.history.record(provider_name, backend_name, self.raw_cost(provider_name, backend_name, job), seconds)
+
+    def raw_cost(self, provider_name: str, backend_name: str, job: "Job") -> float:
+        """Return the uncalibrated cost of a job.
+
+        Parameters
+        ----------
+        provider_name : str
+            The provider name.
+        backend_name : str
+            The backend name.
+        job : Job
+            The job to estimate.
+
+        Returns
+        -------
+        float
+            The cost before history calibration; by default the same as :meth:`estimate`.
+
+        """
+        return self.estimate(provider_name, backend_name, job)
+
+
+class CircuitCostModel(CostModel):
+    """Heuristic cost model based on circuit size, shots and backend type.
+
+    Costs are rough run times in seconds. Local simulators are charged for the
+    state-vector work (``depth * 2**qubits`` amplitude updates) plus per-shot
+    sampling, while remote backends are charged a fixed queue overhead plus a
+    per-shot execution time. When a :class:`RuntimeHistory` is available, the
+    heuristic is rescaled by the measured-to-estimated ratio of the backend.
+
+    Parameters
+    ----------
+    history : RuntimeHistory, optional
+        Measured runtimes used to calibrate the estimates.
+    amplitude_time : float, optional
+        Seconds per state-vector amplitude update on a local simulator.
+    shot_time : float, optional
+        Seconds per shot and qubit.
+    job_overhead : float, optional
+        Fixed seconds charged to every job (backend lookup, transpilation, conversion).
+    remote_overhead : float, optional
+        Fixed seconds charged to every job on a remote backend (queueing, network).
+    local_providers : Sequence[str], optional
+        Providers whose backends are local simulators.
+
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments too-many-positional-arguments
+        self,
+        history: RuntimeHistory | None = None,
+        amplitude_time: float = 1e-9,
+        shot_time: float = 1e-6,
+        job_overhead: float = 0.05,
+        remote_overhead: float = 60.0,
+        local_providers: Sequence[str] = tuple(LOCAL_PROVIDERS),
+    ) -> None:
+        """Initialize the CircuitCostModel.
+
+        Parameters
+        ----------
+        history : RuntimeHistory, optional
+            Measured runtimes used to calibrate the estimates.
+        amplitude_time : float, optional
+            Seconds per state-vector amplitude update on a local simulator.
+        shot_time : float, optional
+            Seconds per shot and qubit.
+        job_overhead : float, optional
+            Fixed seconds charged to every job (backend lookup, transpilation, conversion).
+        remote_overhead : float, optional
+            Fixed seconds charged to every job on a remote backend (queueing, network).
+        local_providers : Sequence[str], optional
+            Providers whose backends are local simulators.
+
+        """
+        super().__init__(history)
+        self.amplitude_time = amplitude_time
+        self.shot_time = shot_time
+        self.job_overhead = job_overhead
+        self.remote_overhead = remote_overhead
+        self.local_providers = frozenset(local_providers)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the CircuitCostModel.
+
+        Returns
+        -------
+        str
+            Includes the cost parameters and the history.
+
+        """
+        return (
+            f"CircuitCostModel(amplitude_time={self.amplitude_time}, shot_time={self.shot_time}, "
+            f"job_overhead={self.job_overhead}, remote_overhead={self.remote_overhead}, history={self.history})"
+        )
+
+    def raw_cost(self, provider_name: str, backend_name: str, job: "Job") -> float:  # noqa: ARG002
+        """Return the uncalibrated heuristic cost of a job.
+
+        Parameters
+        ----------
+        provider_name : str
+            The provider name.
+        backend_name : str
+            The backend name.
+        job : Job
+            The job to estimate.
+
+        Returns
+        -------
+        float
+            The heuristic run time in seconds.
+
+        """
+        num_qubits, depth = circuit_stats(job.circuit)
+        cost = self.job_overhead + self.shot_time * job.shots * max(num_qubits, 1)
+        if provider_name in self.local_providers:
+            return cost + self.amplitude_time * max(depth, 1) * math.ldexp(1.0, min(num_qubits, 60))
+        return cost + self.remote_overhead
+
+    def estimate(self, provider_name: str, backend_name: str, job: "Job") -> float:
+        """Estimate the run time of a job on a backend.
+
+        Parameters
+        ----------
+        provider_name : str
+            The provider name.
+        backend_name : str
+            The backend name.
+        job : Job
+            The job to estimate.
+
+        Returns
+        -------
+        float
+            The heuristic run time in seconds, rescaled by the backend's measured ratio
+            (or the ratio across all backends) if history is available.
+
+        """
+        cost = self.raw_cost(provider_name, backend_name, job)
+        if self.history is not None:
+            ratio = self.history.seconds_per_cost(provider_name, backend_name)
+            if ratio is None:
+                ratio = self.history.overall_seconds_per_cost()
+            if ratio is not None:
+                return cost * ratio
+        return cost
+
+    def estimate_memory(self, provider_name: str, backend_name: str, job: "Job") -> int:  # noqa: ARG002
+        """Estimate the peak memory needed to run a job.
+
+        Local simulators need a complex128 state vector; every backend also holds the counts.
+
+        Parameters
+        ----------
+        provider_name : str
+            The provider name.
+        backend_name : str
+            The backend name.
+        job : Job
+            The job to estimate.
+
+        Returns
+        -------
+        int
+            The estimated peak memory in bytes.
+
+        """
+        num_qubits, _ = circuit_stats(job.circuit)
+        # Each distinct outcome is a bitstring key plus an int value in a dict entry.
+        counts_bytes = min(job.shots, 1 << min(num_qubits, 60)) * (num_qubits + 100)
+        if provider_name in self.local_providers:
+            return (16 << min(num_qubits, 60)) + counts_bytes
+        return counts_bytes
+
+
+def lpt_schedule(costs: Sequence[float], workers: int) -> tuple[list[int], list[float]]:
+    """Order jobs longest-processing-time-first and pack them onto workers.
+
+    Parameters
+    ----------
+    costs : Sequence[float]
+        The estimated cost of each job.
+    workers : int
+        The number of parallel workers.
+
+    Returns
+    -------
+    tuple[list[int], list[float]]
+        The job indices in submission order and the resulting load of each worker.
+        The makespan is the maximum worker load.
+
+    Raises
+    ------
+    ValueError
+        If `workers` is smaller than 1.
+
+    """
+    if workers < 1:
+        raise ValueError("workers must be a positive integer.")
+    order = sorted(range(len(costs)), key=lambda i: costs[i], reverse=True)
+    heap = [(0.0, w) for w in range(workers)]
+    loads = [0.0] * workers
+    for i in order:
+        load, worker = heapq.heappop(heap)
+        loads[worker] = load + costs[i]
+        heapq.heappush(heap, (loads[worker], worker))
+    return order, loads
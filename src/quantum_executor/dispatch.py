@@ -1,13 +1,397 @@
 """Module containing classes representing quantum jobs and their dispatch."""
 
+# pylint: disable=too-many-lines
+
+import itertools
+import os
 import uuid
+import weakref
+from array import array
 from collections.abc import Generator
+from collections.abc import Hashable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Mapping
 from copy import deepcopy
 from typing import Any
 
 DispatchDict = dict[str, dict[str, list[dict[str, Any]]]]  # provider -> backend -> list of job-info dicts
 
 
+def _new_process_tag() -> str:
+    """Return a random tag telling the job ids of this process from those of any other.
+
+    Returns
+    -------
+    str
+        Twelve hexadecimal digits.
+
+    """
+    return os.urandom(6).hex()
+
+
+_process_tag = _new_process_tag()
+_scope_numbers = itertools.count()
+
+
+def _reset_after_fork() -> None:
+    """Give a forked child its own process tag and default scope, so that its ids do not repeat its parent's."""
+    global _process_tag, _default_scope  # pylint: disable=global-statement
+    _process_tag = _new_process_tag()
+    _default_scope = IdScope()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+class IdScope:
+    """Issue compact job ids: a scope prefix followed by a monotonic counter.
+
+    The prefix joins a random tag of the process to the number of the scope within
+    it, so ids such as ``"5f0c9a1e27b4.3-17"`` are unique across scopes and processes
+    while costing a counter increment instead of a UUID. Each :class:`Dispatch` has a
+    scope of its own. Ids that must stay unique beyond the process, e.g. once stored
+    for later runs, come from a persistent scope, whose prefix is a random UUID.
+
+    Parameters
+    ----------
+    persistent : bool, optional
+        If True, prefix the ids with a UUID instead of the process tag. Defaults to False.
+
+    """
+
+    __slots__ = ("_counter", "prefix")
+
+    def __init__(self, persistent: bool = False) -> None:
+        """Initialize an IdScope.
+
+        Parameters
+        ----------
+        persistent : bool, optional
+            If True, prefix the ids with a UUID instead of the process tag.
+
+        """
+        self.prefix: str = uuid.uuid4().hex if persistent else f"{_process_tag}.{next(_scope_numbers)}"
+        self._counter = itertools.count()
+
+    def __repr__(self) -> str:
+        """Return a string representation of the IdScope.
+
+        Returns
+        -------
+        str
+            Includes the prefix.
+
+        """
+        return f"IdScope(prefix={self.prefix!r})"
+
+    def next_id(self) -> str:
+        """Return a new id.
+
+        Returns
+        -------
+        str
+            The prefix and the next value of the counter.
+
+        """
+        return self.format(next(self._counter))
+
+    def format(self, number: int) -> str:
+        """Return the id of a given counter value.
+
+        Parameters
+        ----------
+        number : int
+            The counter value.
+
+        Returns
+        -------
+        str
+            The id.
+
+        """
+        return f"{self.prefix}-{number}"
+
+
+# Scope of the jobs created outside of a Dispatch.
+_default_scope = IdScope()
+
+
+class FrozenList(tuple[Any, ...]):
+    """Read-only list nested in a :class:`FrozenConfig`; it compares equal to a list with the same items."""
+
+    __slots__ = ()
+
+    def __eq__(self, other: object) -> bool:
+        """Compare with a list or a tuple.
+
+        Parameters
+        ----------
+        other : object
+            The other sequence.
+
+        Returns
+        -------
+        bool
+            True if both hold the same items in the same order.
+
+        """
+        return tuple.__eq__(self, tuple(other) if isinstance(other, list) else other)
+
+    def __ne__(self, other: object) -> bool:
+        """Compare with a list or a tuple.
+
+        Parameters
+        ----------
+        other : object
+            The other sequence.
+
+        Returns
+        -------
+        bool
+            True unless both hold the same items in the same order.
+
+        """
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = tuple.__hash__
+
+    def __repr__(self) -> str:
+        """Return a string representation of the FrozenList.
+
+        Returns
+        -------
+        str
+            The items, as a list.
+
+        """
+        return repr(list(self))
+
+
+def _freeze(value: Any) -> Any:  # noqa: ANN401
+    """Return a read-only snapshot of the containers in a configuration value.
+
+    Parameters
+    ----------
+    value : Any
+        The value.
+
+    Returns
+    -------
+    Any
+        Mappings as FrozenConfigs, lists as FrozenLists, tuples and sets as tuples and
+        frozensets of frozen items; any other value as is.
+
+    """
+    if isinstance(value, FrozenConfig | FrozenList | frozenset):
+        return value
+    if isinstance(value, Mapping):
+        return FrozenConfig(value)
+    if isinstance(value, list):
+        return FrozenList(_freeze(item) for item in value)
+    # Exact check: rebuilding a namedtuple as a plain tuple would lose its type.
+    if type(value) is tuple:  # pylint: disable=unidiomatic-typecheck
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+
+def _thaw(value: Any) -> Any:  # noqa: ANN401
+    """Return a frozen configuration value with its containers as plain dicts and lists.
+
+    Parameters
+    ----------
+    value : Any
+        The value.
+
+    Returns
+    -------
+    Any
+        FrozenConfigs as dicts and FrozenLists as lists, recursively; other values as is.
+
+    """
+    if isinstance(value, FrozenConfig):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, FrozenList):
+        return [_thaw(item) for item in value]
+    # Exact check, as in _freeze: namedtuples keep their type.
+    if type(value) is tuple:  # pylint: disable=unidiomatic-typecheck
+        return tuple(_thaw(item) for item in value)
+    return value
+
+
+class FrozenConfig(Mapping[str, Any]):
+    """Read-only job configuration, shared by every job it was given to.
+
+    Freezing snapshots the containers of the configuration, recursively: nested
+    mappings become FrozenConfigs, lists :class:`FrozenList` objects and sets
+    frozensets, so neither later changes to the original dictionary nor writes
+    through a job reach the jobs sharing it. Other values (e.g. noise models) are
+    shared rather than copied. To change a configuration, derive a new one with
+    :meth:`replace`, or take mutable dicts and lists with :meth:`thaw`.
+
+    Parameters
+    ----------
+    data : Mapping[str, Any], optional
+        The configuration options. Defaults to none.
+
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: Mapping[str, Any] | None = None) -> None:
+        """Initialize a FrozenConfig.
+
+        Parameters
+        ----------
+        data : Mapping[str, Any], optional
+            The configuration options.
+
+        """
+        self._data: dict[str, Any] = {key: _freeze(value) for key, value in (data or {}).items()}
+
+    def __getitem__(self, key: str) -> Any:  # noqa: ANN401
+        """Return the value of an option.
+
+        Parameters
+        ----------
+        key : str
+            The option name.
+
+        Returns
+        -------
+        Any
+            Its value.
+
+        """
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the option names.
+
+        Returns
+        -------
+        Iterator[str]
+            The option names.
+
+        """
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        """Return the number of options.
+
+        Returns
+        -------
+        int
+            The number of options.
+
+        """
+        return len(self._data)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare with another configuration, frozen or not.
+
+        Parameters
+        ----------
+        other : object
+            The other configuration.
+
+        Returns
+        -------
+        bool
+            True if both hold the same options.
+
+        """
+        if isinstance(other, FrozenConfig):
+            return self._data == other._data
+        if isinstance(other, Mapping):
+            return self._data == dict(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Return a string representation of the FrozenConfig.
+
+        Returns
+        -------
+        str
+            The options, as a dictionary.
+
+        """
+        return repr(self._data)
+
+    def __reduce__(self) -> tuple[type["FrozenConfig"], tuple[dict[str, Any]]]:
+        """Support pickling, e.g. to send a job to a worker process.
+
+        Returns
+        -------
+        Tuple[type, Tuple[Dict[str, Any]]]
+            The class and its constructor arguments.
+
+        """
+        return FrozenConfig, (self._data,)
+
+    def replace(self, **changes: Any) -> "FrozenConfig":  # noqa: ANN401
+        """Return a new configuration with some options changed.
+
+        Parameters
+        ----------
+        **changes : Any
+            Options to set.
+
+        Returns
+        -------
+        FrozenConfig
+            The new configuration; this one is left unchanged.
+
+        """
+        return FrozenConfig({**self._data, **changes})
+
+    def thaw(self, deep: bool = True) -> dict[str, Any]:
+        """Return the configuration as mutable dicts and lists.
+
+        Parameters
+        ----------
+        deep : bool, optional
+            If True (the default), also copy the other values, e.g. noise models, so that
+            nothing is shared with the jobs. If False, only the containers are new.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The copy.
+
+        """
+        data = _thaw(self)
+        return deepcopy(data) if deep else data
+
+
+EMPTY_CONFIG = FrozenConfig()
+
+
+def freeze_config(config: Mapping[str, Any] | None) -> FrozenConfig:
+    """Return a configuration as a FrozenConfig, without copying one that already is.
+
+    Parameters
+    ----------
+    config : Mapping[str, Any] or None
+        The configuration.
+
+    Returns
+    -------
+    FrozenConfig
+        The frozen configuration.
+
+    """
+    if isinstance(config, FrozenConfig):
+        return config
+    return FrozenConfig(config) if config else EMPTY_CONFIG
+
+
 class Job:  # pylint: disable=too-few-public-methods
     """Represent a single quantum execution request.
 
@@ -17,14 +401,30 @@ class Job:  # pylint: disable=too-few-public-methods
         The quantum circuit to be executed.
     shots : int
         The number of measurement shots.
-    configuration : Optional[Dict[str, Any]]
-        Additional configuration options (e.g., noise models). Defaults to None.
+    configuration : Optional[Mapping[str, Any]]
+        Additional configuration options (e.g., noise models), frozen into a
+        :class:`FrozenConfig`. Defaults to None.
+    job_id : Optional[str]
+        The job id. Defaults to a new id from a process-wide :class:`IdScope`.
+
+    Attributes
+    ----------
+    circuit_key : Hashable or None
+        Which circuit the job was split from. Split policies set it to the index of the
+        circuit among those they were given, and the executor makes it unique to the
+        split; jobs of the same circuit share it. None for jobs not split from a circuit.
 
     """
 
-    __slots__ = ("circuit", "configuration", "id", "shots")
+    __slots__ = ("__weakref__", "circuit", "circuit_key", "configuration", "id", "shots")
 
-    def __init__(self, circuit: Any, shots: int, configuration: dict[str, Any] | None = None) -> None:  # noqa: ANN401
+    def __init__(
+        self,
+        circuit: Any,  # noqa: ANN401
+        shots: int,
+        configuration: Mapping[str, Any] | None = None,
+        job_id: str | None = None,
+    ) -> None:
         """Initialize a Job.
 
         Parameters
@@ -33,14 +433,17 @@ class Job:  # pylint: disable=too-few-public-methods
             The quantum circuit to be executed.
         shots : int
             The number of measurement shots.
-        configuration : Optional[Dict[str, Any]]
+        configuration : Optional[Mapping[str, Any]]
             Additional configuration options (e.g., noise models). Defaults to None.
+        job_id : Optional[str]
+            The job id. Defaults to a new id from a process-wide :class:`IdScope`.
 
         """
-        self.id: str = str(uuid.uuid4())
+        self.id: str = job_id or _default_scope.next_id()
         self.circuit: Any = circuit
         self.shots: int = shots
-        self.configuration: dict[str, Any] = configuration or {}
+        self.configuration: FrozenConfig = freeze_config(configuration)
+        self.circuit_key: Hashable | None = None
 
     def to_dict(self) -> dict[str, Any]:
         """Return a dictionary representation of the Job.
@@ -48,14 +451,15 @@ class Job:  # pylint: disable=too-few-public-methods
         Returns
         -------
         Dict[str, Any]
-            Dictionary containing job details: id, circuit, shots, and configuration.
+            Dictionary containing job details: id, circuit, shots, and configuration,
+            as a plain dictionary whose values (e.g. noise models) are shared with the job.
 
         """
         return {
             "id": self.id,
             "circuit": self.circuit,
             "shots": self.shots,
-            "configuration": self.configuration,
+            "configuration": self.configuration.thaw(deep=False),
         }
 
     def __repr__(self) -> str:
@@ -73,6 +477,213 @@ class Job:  # pylint: disable=too-few-public-methods
         )
 
 
+class JobTable:  # pylint: disable=too-many-instance-attributes
+    """Array-backed, columnar storage for the jobs of a large :class:`Dispatch`.
+
+    Each job is a row: a shot count and codes into deduplicated tables of circuits
+    and configurations. The row number is the counter of the job id, formatted by the
+    table's :class:`IdScope` when the job is read. Rows are grouped by (provider, backend),
+    whose names are interned once. :class:`Job` objects are only built when jobs are
+    read, and are cached for as long as something else holds them, so reading the
+    same job twice while it is in use yields the same object.
+
+    Circuits and configurations are deduplicated by identity; configurations are
+    frozen first (see :class:`FrozenConfig`), so jobs share them safely.
+    """
+
+    def __init__(self, scope: IdScope | None = None) -> None:
+        """Initialize an empty JobTable.
+
+        Parameters
+        ----------
+        scope : IdScope, optional
+            The scope of the job ids. Defaults to a new one.
+
+        """
+        self._scope = scope or IdScope()
+        # (provider, backend) → group code, and the rows of each group in insertion order.
+        self._groups: dict[tuple[str, str], int] = {}
+        # pylint: disable=unsubscriptable-object  # array is generic in typeshed only.
+        self._rows: list[array[int]] = []
+        self._shots: array[int] = array("q")
+        self._circuit_codes: array[int] = array("I")
+        self._config_codes: array[int] = array("I")
+        self._circuits: list[Any] = []
+        # id(circuit) → circuit code; the circuits list keeps every circuit alive, so ids stay valid.
+        self._circuit_index: dict[int, int] = {}
+        self._configs: list[FrozenConfig] = [EMPTY_CONFIG]
+        self._config_index: dict[int, int] = {id(EMPTY_CONFIG): 0}
+        # Row → id given explicitly as a string, e.g. when loading a dispatch dictionary.
+        self._named: dict[int, str] = {}
+        # Row → circuit key, for the jobs that have one.
+        self._circuit_keys: dict[int, Hashable] = {}
+        self._jobs: weakref.WeakValueDictionary[int, Job] = weakref.WeakValueDictionary()
+
+    def __len__(self) -> int:
+        """Return the number of jobs.
+
+        Returns
+        -------
+        int
+            The number of rows.
+
+        """
+        return len(self._shots)
+
+    def append(  # pylint: disable=too-many-arguments too-many-positional-arguments
+        self,
+        provider_name: str,
+        backend_name: str,
+        circuit: Any,  # noqa: ANN401
+        shots: int,
+        config: Mapping[str, Any] | None = None,
+        job_id: str | None = None,
+        circuit_key: Hashable | None = None,
+    ) -> None:
+        """Add a job.
+
+        Parameters
+        ----------
+        provider_name : str
+            Name of the quantum provider.
+        backend_name : str
+            Name of the backend.
+        circuit : Any
+            The quantum circuit.
+        shots : int
+            The number of measurement shots.
+        config : Mapping[str, Any], optional
+            The job configuration; frozen unless it already is.
+        job_id : str, optional
+            Explicit job id; defaults to one made from the row number.
+        circuit_key : Hashable, optional
+            The circuit key of the job (see :attr:`Job.circuit_key`).
+
+        """
+        group = self._groups.get((provider_name, backend_name))
+        if group is None:
+            group = self._groups[(provider_name, backend_name)] = len(self._rows)
+            self._rows.append(array("I"))
+        row = len(self._shots)
+        self._rows[group].append(row)
+        self._shots.append(shots)
+        self._circuit_codes.append(self._intern(circuit, self._circuits, self._circuit_index))
+        self._config_codes.append(self._intern(freeze_config(config), self._configs, self._config_index))
+        if job_id is not None:
+            self._named[row] = job_id
+        if circuit_key is not None:
+            self._circuit_keys[row] = circuit_key
+
+    @staticmethod
+    def _intern(value: Any, table: list[Any], index: dict[int, int]) -> int:  # noqa: ANN401
+        """Return the code of an object in a table, adding it if it is not there yet.
+
+        Parameters
+        ----------
+        value : Any
+            The object, looked up by identity.
+        table : List[Any]
+            The table of distinct objects.
+        index : Dict[int, int]
+            Object id → code.
+
+        Returns
+        -------
+        int
+            The position of `value` in `table`.
+
+        """
+        code = index.get(id(value))
+        if code is None:
+            code = index[id(value)] = len(table)
+            table.append(value)
+        return code
+
+    def job(self, row: int) -> Job:
+        """Return the Job of a row.
+
+        Parameters
+        ----------
+        row : int
+            The row index.
+
+        Returns
+        -------
+        Job
+            The job, built on first access.
+
+        """
+        job = self._jobs.get(row)
+        if job is None:
+            job = Job.__new__(Job)
+            job.id = self._named.get(row) or self._scope.format(row)
+            job.circuit = self._circuits[self._circuit_codes[row]]
+            job.shots = self._shots[row]
+            job.configuration = self._configs[self._config_codes[row]]
+            job.circuit_key = self._circuit_keys.get(row)
+            self._jobs[row] = job
+        return job
+
+    def set_circuit_key(self, row: int, circuit_key: Hashable | None) -> None:
+        """Set the circuit key of a row, and of its job if it is in use.
+
+        Parameters
+        ----------
+        row : int
+            The row index.
+        circuit_key : Hashable or None
+            The new circuit key.
+
+        """
+        if circuit_key is None:
+            self._circuit_keys.pop(row, None)
+        else:
+            self._circuit_keys[row] = circuit_key
+        job = self._jobs.get(row)
+        if job is not None:
+            job.circuit_key = circuit_key
+
+    def groups(self) -> Generator[tuple[str, str, "array[int]"], None, None]:
+        """Iterate over the (provider, backend) groups.
+
+        Yields
+        ------
+        Tuple[str, str, array]
+            The provider and backend names, and the rows of their jobs.
+
+        """
+        for (provider_name, backend_name), group in self._groups.items():
+            yield provider_name, backend_name, self._rows[group]
+
+
+def _pair_circuit_keys(circuit_keys: int | list[int] | None, count: int) -> list[int | None]:
+    """Return the circuit key of each of the jobs added at once to a dispatch.
+
+    Parameters
+    ----------
+    circuit_keys : int, list[int] or None
+        A key shared by every job, or one key per job.
+    count : int
+        Number of jobs.
+
+    Returns
+    -------
+    list[int or None]
+        One key per job.
+
+    Raises
+    ------
+    ValueError
+        If a list of keys does not have one key per job.
+
+    """
+    if not isinstance(circuit_keys, list):
+        return [circuit_keys] * count
+    if len(circuit_keys) != count:
+        raise ValueError(f"Length of circuit keys list must match the number of jobs: {len(circuit_keys)} != {count}")
+    return list(circuit_keys)
+
+
 class Dispatch:
     """Hold a collection of jobs grouped by provider and backend.
 
@@ -85,6 +696,21 @@ class Dispatch:
         - 'shots': int
         - optionally 'configuration': Dict[str, Any]
         - optionally 'id': str
+    columnar : bool, optional
+        If True, store the jobs in a :class:`JobTable` instead of one :class:`Job` object
+        each, which takes far less memory and time for very large dispatches. Defaults to False.
+    persistent_ids : bool, optional
+        If True, prefix the generated job ids with a UUID, so that they stay unique
+        once stored outside the process. Defaults to False.
+
+    Notes
+    -----
+    Job configurations are frozen into :class:`FrozenConfig` objects, which copy their
+    containers but share their other values (e.g. noise models). Every job given the
+    same, unchanged configuration dictionary shares a single FrozenConfig.
+
+    Jobs added without an id get one from the dispatch's :class:`IdScope`: its prefix
+    and a sequence number, e.g. ``"5f0c9a1e27b4.3-17"``.
 
     Methods
     -------
@@ -100,6 +726,8 @@ class Dispatch:
     def __init__(
         self,
         initial_jobs: DispatchDict | None = None,
+        columnar: bool = False,
+        persistent_ids: bool = False,
     ) -> None:
         """Initialize a Dispatch, optionally from a nested jobs dictionary.
 
@@ -109,10 +737,18 @@ class Dispatch:
             Nested dict mapping provider -> backend -> list of job-info dicts.
             Each job-info dict must contain 'circuit', 'shots', and optionally
             'configuration' and 'id'. Defaults to None.
+        columnar : bool, optional
+            If True, store the jobs in a :class:`JobTable`. Defaults to False.
+        persistent_ids : bool, optional
+            If True, prefix the generated job ids with a UUID. Defaults to False.
 
         """
         # Internal nested dictionary: provider -> backend -> list of Job instances.
         self._jobs: dict[str, dict[str, list[Job]]] = {}
+        self._ids = IdScope(persistent=persistent_ids)
+        self._table: JobTable | None = JobTable(self._ids) if columnar else None
+        # id(config dict) → its frozen form, to share one FrozenConfig among the jobs given it.
+        self._frozen: dict[int, FrozenConfig] = {}
 
         if initial_jobs:
             for provider, backends in initial_jobs.items():
@@ -120,10 +756,11 @@ class Dispatch:
                     for job_info in jobs:
                         circuit = job_info["circuit"]
                         shots = job_info["shots"]
-                        config = deepcopy(job_info.get("configuration", {}))
-                        job = Job(circuit, shots, config)
-                        if "id" in job_info:
-                            job.id = job_info["id"]
+                        config = self._freeze(job_info.get("configuration"))
+                        if self._table is not None:
+                            self._table.append(provider, backend, circuit, shots, config, job_info.get("id"))
+                            continue
+                        job = Job(circuit, shots, config, job_info.get("id") or self._ids.next_id())
                         self._jobs.setdefault(provider, {}).setdefault(backend, []).append(job)
 
     def __repr__(self) -> str:
@@ -135,7 +772,41 @@ class Dispatch:
             Shows the structure of jobs per provider/backend.
 
         """
-        return f"Dispatch({self._jobs})"
+        return f"Dispatch({self.items()})"
+
+    @property
+    def columnar(self) -> bool:
+        """Check whether the jobs are stored in a :class:`JobTable`.
+
+        Returns
+        -------
+        bool
+            True for a columnar dispatch.
+
+        """
+        return self._table is not None
+
+    def _freeze(self, config: Mapping[str, Any] | None) -> FrozenConfig:
+        """Freeze a configuration, reusing the frozen form of a dictionary seen before.
+
+        Parameters
+        ----------
+        config : Mapping[str, Any] or None
+            The configuration.
+
+        Returns
+        -------
+        FrozenConfig
+            The frozen configuration.
+
+        """
+        if not config or isinstance(config, FrozenConfig):
+            return freeze_config(config)
+        frozen = self._frozen.get(id(config))
+        # A changed dictionary, or a new one that reused the id of a dead one, is frozen anew.
+        if frozen is None or frozen != config:
+            frozen = self._frozen[id(config)] = FrozenConfig(config)
+        return frozen
 
     def add_job(  # pylint: disable=too-many-arguments, too-many-positional-arguments
         self,
@@ -143,12 +814,13 @@ class Dispatch:
         backend_name: str,
         circuits: Any | list[Any],  # noqa: ANN401
         shots: int | list[int],
-        config: dict[str, Any] | None = None,
+        config: Mapping[str, Any] | None = None,
+        circuit_keys: int | list[int] | None = None,
     ) -> None:
         """Add one or more jobs to the dispatch.
 
         If `circuits` is a list, each element is paired with either a single integer `shots` (repeated)
-        or with an element from a list of shot counts.
+        or with an element from a list of shot counts, and likewise with `circuit_keys`.
 
         Parameters
         ----------
@@ -160,40 +832,96 @@ class Dispatch:
             A single circuit or a list of circuits.
         shots : Union[int, List[int]]
             A single shot count or a list of shot counts corresponding to `circuits`.
-        config : Optional[Dict[str, Any]], optional
-            Additional configuration for the job(s), by default None.
+        config : Optional[Mapping[str, Any]], optional
+            Additional configuration for the job(s), by default None. It is frozen, not
+            copied: its values are shared with the caller.
+        circuit_keys : Union[int, List[int]], optional
+            For a split policy, the index of the circuit each job is split from among the
+            circuits the policy was given (see :attr:`Job.circuit_key`). Defaults to None.
 
         Raises
         ------
         ValueError
-            If the lengths of circuits and shots lists do not match as required.
+            If the lengths of circuits and shots (or circuit keys) lists do not match as required.
 
         """
-        if provider_name not in self._jobs:
-            self._jobs[provider_name] = {}
-        if backend_name not in self._jobs[provider_name]:
-            self._jobs[provider_name][backend_name] = []
-
         if isinstance(circuits, list):
             if isinstance(shots, list):
                 if len(circuits) != len(shots):
                     raise ValueError(
                         f"Length of circuits list must match length of shots list: {len(circuits)} != {len(shots)}"
                     )
-                for ckt, s in zip(circuits, shots, strict=False):
-                    self._jobs[provider_name][backend_name].append(Job(ckt, s, deepcopy(config)))
+                pairs = list(zip(circuits, shots, strict=False))
             else:
-                for ckt in circuits:
-                    self._jobs[provider_name][backend_name].append(Job(ckt, shots, deepcopy(config)))
+                pairs = [(ckt, shots) for ckt in circuits]
+        elif isinstance(shots, list):
+            if len(shots) != 1:
+                raise ValueError(
+                    "If circuits is a single circuit, shots must be a single integer or a list of length 1."
+                )
+            pairs = [(circuits, shots[0])]
         else:
-            if isinstance(shots, list):
-                if len(shots) != 1:
-                    raise ValueError(
-                        "If circuits is a single circuit, shots must be a single integer or a list of length 1."
-                    )
-                self._jobs[provider_name][backend_name].append(Job(circuits, shots[0], deepcopy(config)))
+            pairs = [(circuits, shots)]
+        keys = _pair_circuit_keys(circuit_keys, len(pairs))
+
+        frozen = self._freeze(config)
+        if self._table is not None:
+            for (ckt, s), key in zip(pairs, keys, strict=True):
+                self._table.append(provider_name, backend_name, ckt, s, frozen, circuit_key=key)
+            return
+        job_list = self._jobs.setdefault(provider_name, {}).setdefault(backend_name, [])
+        for (ckt, s), key in zip(pairs, keys, strict=True):
+            job = Job(ckt, s, frozen, self._ids.next_id())
+            job.circuit_key = key
+            job_list.append(job)
+
+    def extend(self, other: "Dispatch | Iterable[tuple[str, str, Job]]") -> None:
+        """Add the jobs of another dispatch, keeping their ids.
+
+        Parameters
+        ----------
+        other : Dispatch or Iterable[Tuple[str, str, Job]]
+            The dispatch whose jobs are added, or its (provider_name, backend_name, job)
+            tuples. The Job objects are shared, not copied.
+
+        """
+        jobs = other.all_jobs() if isinstance(other, Dispatch) else other
+        for provider_name, backend_name, job in jobs:
+            if self._table is not None:
+                self._table.append(
+                    provider_name, backend_name, job.circuit, job.shots, job.configuration, job.id, job.circuit_key
+                )
             else:
-                self._jobs[provider_name][backend_name].append(Job(circuits, shots, deepcopy(config)))
+                self._jobs.setdefault(provider_name, {}).setdefault(backend_name, []).append(job)
+
+    def key_circuits(self, split: Hashable, start: int = 0, index: int | None = None) -> None:
+        """Make the circuit keys of the jobs unique to one split of circuits.
+
+        A job given the circuit index ``i`` by its split policy gets the key ``(split, start + i)``.
+        Jobs without one keep theirs, so a policy that sets no keys leaves the jobs unkeyed.
+
+        Parameters
+        ----------
+        split : Hashable
+            Identifies the split, e.g. a number drawn once per call to the split policy.
+        start : int, optional
+            Index of the first circuit given to the policy among the circuits of the split.
+        index : int, optional
+            Index of the circuit every job was split from, replacing the policy's indices.
+
+        """
+
+        def _key(local: Hashable | None) -> Hashable | None:
+            local = index if index is not None else local
+            return (split, start + local) if isinstance(local, int) else local
+
+        if self._table is not None:
+            for _, _, rows in self._table.groups():
+                for row in rows:
+                    self._table.set_circuit_key(row, _key(self._table.job(row).circuit_key))
+            return
+        for _, _, job in self.all_jobs():
+            job.circuit_key = _key(job.circuit_key)
 
     def all_jobs(self) -> Generator[tuple[str, str, Job], None, None]:
         """Return terator over all jobs in the dispatch.
@@ -204,11 +932,63 @@ class Dispatch:
             A tuple with (provider_name, backend_name, job).
 
         """
+        if self._table is not None:
+            for provider_name, backend_name, rows in self._table.groups():
+                for row in rows:
+                    yield provider_name, backend_name, self._table.job(row)
+            return
         for provider_name, backends in self._jobs.items():
             for backend_name, job_list in backends.items():
                 for job in job_list:
                     yield provider_name, backend_name, job
 
+    def all_job_rows(self) -> Generator[tuple[str, str, Job, int], None, None]:
+        """Iterate over all jobs of a columnar dispatch with their rows.
+
+        A job is rebuilt from its row by :meth:`job`, so whoever refers to many jobs for
+        long, such as a ResultCollector, can keep the row instead of the job and let the
+        job be freed once it is no longer in use.
+
+        Yields
+        ------
+        Tuple[str, str, Job, int]
+            The provider and backend names, the job and its row.
+
+        Raises
+        ------
+        ValueError
+            If the dispatch is not columnar.
+
+        """
+        if self._table is None:
+            raise ValueError("Only a columnar dispatch has job rows.")
+        for provider_name, backend_name, rows in self._table.groups():
+            for row in rows:
+                yield provider_name, backend_name, self._table.job(row), row
+
+    def job(self, row: int) -> Job:
+        """Return the job of a row of a columnar dispatch.
+
+        Parameters
+        ----------
+        row : int
+            The row, as given by :meth:`all_job_rows`.
+
+        Returns
+        -------
+        Job
+            The job; the same object for as long as it is in use, otherwise rebuilt.
+
+        Raises
+        ------
+        ValueError
+            If the dispatch is not columnar.
+
+        """
+        if self._table is None:
+            raise ValueError("Only a columnar dispatch has job rows.")
+        return self._table.job(row)
+
     def items(self) -> dict[str, dict[str, list[Job]]]:
         """Return a shallow copy of the internal jobs dictionary.
 
@@ -218,6 +998,11 @@ class Dispatch:
             The nested dictionary mapping provider to backend to list of jobs.
 
         """
+        if self._table is not None:
+            jobs: dict[str, dict[str, list[Job]]] = {}
+            for provider_name, backend_name, rows in self._table.groups():
+                jobs.setdefault(provider_name, {})[backend_name] = [self._table.job(row) for row in rows]
+            return jobs
         return self._jobs.copy()
 
     def to_dict(self) -> DispatchDict:
@@ -231,5 +1016,105 @@ class Dispatch:
         """
         return {
             provider: {backend: [job.to_dict() for job in jobs] for backend, jobs in backends.items()}
-            for provider, backends in self._jobs.items()
+            for provider, backends in self.items().items()
         }
+
+
+class LazyDispatch:
+    """Jobs produced on demand, one :class:`Dispatch` at a time.
+
+    A LazyDispatch wraps an iterable of dispatches, typically a generator running a
+    split policy over the circuits of a sweep (see
+    :meth:`QuantumExecutor.stream_dispatch`). :meth:`QuantumExecutor.run_dispatch`
+    pulls its jobs only as it has room to run them, so the first jobs start while later
+    circuits are still to be split, and only the dispatches being run are in memory.
+    It can be consumed once.
+
+    Parameters
+    ----------
+    parts : Iterable[Dispatch]
+        The dispatches, in order.
+    split_data : Dict[str, Any], optional
+        Split data of the policy filling the dispatch, updated as it is consumed.
+
+    Attributes
+    ----------
+    error : Exception or None
+        The error that ended the production of jobs early, if any. Jobs produced
+        before it still run.
+
+    """
+
+    def __init__(self, parts: Iterable[Dispatch], split_data: dict[str, Any] | None = None) -> None:
+        """Initialize a LazyDispatch.
+
+        Parameters
+        ----------
+        parts : Iterable[Dispatch]
+            The dispatches, in order.
+        split_data : Dict[str, Any], optional
+            Split data of the policy filling the dispatch.
+
+        """
+        self._parts: Iterator[Dispatch] | None = iter(parts)
+        self.split_data: dict[str, Any] | None = split_data
+        self.error: Exception | None = None
+
+    def __repr__(self) -> str:
+        """Return a string representation of the LazyDispatch.
+
+        Returns
+        -------
+        str
+            Tells whether the dispatch was consumed.
+
+        """
+        return f"LazyDispatch(consumed={self.consumed})"
+
+    @property
+    def consumed(self) -> bool:
+        """Check whether the jobs were already read.
+
+        Returns
+        -------
+        bool
+            True once :meth:`parts` or :meth:`all_jobs` was called.
+
+        """
+        return self._parts is None
+
+    def parts(self) -> Iterator[Dispatch]:
+        """Return the dispatches, produced as they are read.
+
+        Returns
+        -------
+        Iterator[Dispatch]
+            The dispatches.
+
+        Raises
+        ------
+        RuntimeError
+            If the dispatch was already consumed.
+
+        """
+        if self._parts is None:
+            raise RuntimeError("A LazyDispatch can only be consumed once.")
+        parts, self._parts = self._parts, None
+        return parts
+
+    def all_jobs(self) -> Iterator[tuple[str, str, Job]]:
+        """Return an iterator over the jobs, producing each dispatch when its first job is read.
+
+        Returns
+        -------
+        Iterator[Tuple[str, str, Job]]
+            The (provider_name, backend_name, job) tuples.
+
+        Raises
+        ------
+        RuntimeError
+            If the dispatch was already consumed.
+
+        """
+        parts = self.parts()
+        return (item for part in parts for item in part.all_jobs())
@@ -1,21 +1,67 @@
 """The QuantumExecutor orchestrates quantum job splitting, dispatching, execution, and (optionally) result merging."""
 
+# pylint: disable=too-many-lines
+
+import functools
 import importlib.util
+import itertools
 import logging
+import math
+import os
 import threading
+import time
+from collections import deque
 from collections.abc import Callable
+from collections.abc import Generator
+from collections.abc import Iterable
+from collections.abc import Iterator
 from collections.abc import Sequence
+from concurrent.futures import Executor
+from concurrent.futures import Future
 from concurrent.futures import ProcessPoolExecutor
-from concurrent.futures import as_completed
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import resource_tracker
 from pathlib import Path
+from types import TracebackType
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import Union
 
+from quantum_executor.cancellation import CANCELLED_ERROR
+from quantum_executor.cancellation import CancelFlag
+from quantum_executor.cancellation import CancelScope
+from quantum_executor.cost_model import CircuitCostModel
+from quantum_executor.cost_model import CostModel
+from quantum_executor.cost_model import RuntimeHistory
+from quantum_executor.cost_model import lpt_schedule
 from quantum_executor.dispatch import Dispatch
+from quantum_executor.dispatch import Job
+from quantum_executor.dispatch import LazyDispatch
+from quantum_executor.hedging import HedgePolicy
+from quantum_executor.job_runner import init_worker
+from quantum_executor.job_runner import policy_reference
+from quantum_executor.job_runner import run_job_in_thread
+from quantum_executor.job_runner import run_job_in_worker
 from quantum_executor.job_runner import run_single_job_static
+from quantum_executor.job_runner import split_circuits
+from quantum_executor.job_runner import split_in_worker
+from quantum_executor.metrics import NULL_METRICS
+from quantum_executor.metrics import MetricsRegistry
+from quantum_executor.metrics import NullMetrics
 from quantum_executor.result_collector import MergedResultCollector
 from quantum_executor.result_collector import ResultCollector
+from quantum_executor.retry import RetryPolicy
+from quantum_executor.scheduler import JobScheduler
+from quantum_executor.shared_result import DEFAULT_SHARED_MEMORY_THRESHOLD
+from quantum_executor.shared_result import attach_result
+from quantum_executor.shared_result import discard_result
+from quantum_executor.stopping import StoppingRule
+from quantum_executor.stopping import total_counts
+from quantum_executor.timing import Timings
+from quantum_executor.timing import current_worker
+from quantum_executor.timing import record_phase
+from quantum_executor.timing import run_time
 from quantum_executor.virtual_provider import VirtualProvider
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -23,10 +69,24 @@ if TYPE_CHECKING:  # pragma: no cover
 
 logger = logging.getLogger(__name__)
 
+EXECUTION_MODES = ("sequential", "threads", "processes", "auto")
+
+# Providers whose jobs are simulated locally and keep a CPU busy; in "auto" mode they
+# run in worker processes, while jobs of every other provider mostly wait on the
+# network (or, for "synthetic", on a timer) and run in threads.
+CPU_BOUND_PROVIDERS = frozenset({"local_aer"})
+
+# Jobs suspected of crashing a worker are rerun in processes of their own, at most this many
+# at a time, so that recovering from an out-of-memory kill does not start a crowd of processes.
+MAX_ISOLATED_JOBS = 1
+
+# Numbers each split of circuits, so that the circuit keys of its jobs are unique (see Dispatch.key_circuits).
+_split_numbers = itertools.count()
+
 
 def load_policies_from_folder(  # pylint: disable=too-many-branches
     folder_path: str, raise_exc: bool = False
-) -> dict[str, dict[str, Callable[..., Any]]]:
+) -> dict[str, dict[str, Any]]:
     """Dynamically load split and/or merge policies from Python files in a folder.
 
     Parameters
@@ -39,8 +99,11 @@ def load_policies_from_folder(  # pylint: disable=too-many-branches
 
     Returns
     -------
-    Dict[str, Dict[str, Callable[..., Any]]]
-        Mapping policy names → dict with keys "split" and/or "merge".
+    Dict[str, Dict[str, Any]]
+        Mapping policy names → dict with keys "split" and/or "merge", plus "observe"
+        for multi-round split policies (see :meth:`QuantumExecutor.run_experiment`),
+        "split_many" for split policies that split a batch of circuits at once and
+        "stateless" for split policies whose module sets ``STATELESS = True``.
 
     """
     logger.debug("Loading policies from folder '%s'...", folder_path)
@@ -51,7 +114,7 @@ def load_policies_from_folder(  # pylint: disable=too-many-branches
         Path.mkdir(Path(folder_path), parents=True, exist_ok=True)
         return {}
 
-    policies: dict[str, dict[str, Callable[..., Any]]] = {}
+    policies: dict[str, dict[str, Any]] = {}
     for fname in Path(folder_path).iterdir():
         if not fname.is_file() or not fname.name.endswith(".py"):
             continue
@@ -75,11 +138,17 @@ def load_policies_from_folder(  # pylint: disable=too-many-branches
             logger.warning(msg)
             continue
 
-        funcs: dict[str, Callable[..., Any]] = {}
+        funcs: dict[str, Any] = {}
         if hasattr(module, "split") and callable(module.split):
             funcs["split"] = module.split
         if hasattr(module, "merge") and callable(module.merge):
             funcs["merge"] = module.merge
+        if funcs and hasattr(module, "observe") and callable(module.observe):
+            funcs["observe"] = module.observe
+        if "split" in funcs and hasattr(module, "split_many") and callable(module.split_many):
+            funcs["split_many"] = module.split_many
+        if "split" in funcs and getattr(module, "STATELESS", False) is True:
+            funcs["stateless"] = True
 
         if funcs:
             policies[name] = funcs
@@ -145,9 +214,54 @@ def add_policy_from_file(file_path: str, policy_folder: str, raise_exc: bool = F
     logger.info("Policy '%s' copied to '%s'.", Path(file_path).name, policy_folder)
 
 
-class QuantumExecutor:
+def _succeeded(fut: "Future[Any]") -> bool:
+    """Check whether a job future holds a result that is not an error.
+
+    Parameters
+    ----------
+    fut : Future
+        A finished future of :func:`run_job_in_worker` or :func:`run_job_in_thread`.
+
+    Returns
+    -------
+    bool
+        False if the future was cancelled, raised, or returned an error dictionary.
+
+    """
+    if fut.cancelled() or fut.exception() is not None:
+        return False
+    value = fut.result()[0]
+    return not (isinstance(value, dict) and "error" in value)
+
+
+def _pop_cancelled(result: Any) -> bool:  # noqa: ANN401
+    """Remove the flag marking the result of a job that timed out or was cancelled.
+
+    Parameters
+    ----------
+    result : Any
+        A job result; error dictionaries of interrupted jobs carry ``"cancelled": True``.
+
+    Returns
+    -------
+    bool
+        True if the job timed out or was cancelled.
+
+    """
+    return isinstance(result, dict) and bool(result.pop("cancelled", False))
+
+
+class QuantumExecutor:  # pylint: disable=too-many-instance-attributes
     """Manage splitting, dispatching, execution, and optional merging of quantum jobs.
 
+    Used as a context manager (or through :meth:`start` / :meth:`close`), the executor
+    keeps its worker pools alive for all parallel dispatches and drains pending
+    dispatches on exit:
+
+    >>> with QuantumExecutor(providers=["local_aer"]) as executor:
+    ...     for circuit in circuits:
+    ...         executor.run_experiment(circuit, 1024, backends, multiprocess=True)
+
     Parameters
     ----------
     providers_info : Dict[str, Dict[str, Any]], optional
@@ -173,12 +287,48 @@ class QuantumExecutor:
         If True, propagate initialization or policy-load errors.
     virtual_provider : VirtualProvider, optional
         If provided, use this instead of creating a new one.
+    shared_memory_threshold : int or None, optional
+        Serialized size in bytes from which worker results are returned through
+        shared memory instead of the process pool pipe. None disables it.
+    provider_limits : Dict[str, int], optional
+        Default maximum number of concurrently running jobs per provider.
+    backend_limits : Dict[str, Dict[str, int]], optional
+        Default maximum number of concurrently running jobs per backend (provider → backend → limit).
+    cost_model : CostModel, optional
+        Estimator used to order jobs longest-first and to estimate dispatches.
+        Defaults to a CircuitCostModel calibrated by the executor's runtime history.
+    history_path : str, optional
+        JSON file where measured job runtimes are loaded from and saved to, so that
+        estimates improve across sessions. If None, the history is kept in memory only,
+        and runtimes are only measured for dispatches run with ``job_order="lpt"``.
+    metrics : MetricsRegistry, optional
+        Registry receiving job counts, latencies, in-flight gauges and pool utilization.
+        Defaults to no metrics, which adds no overhead.
+    max_threads : int, optional
+        Max threads for the "threads" and "auto" execution modes.
+        Defaults to the number of CPUs plus 4, capped at 32.
+    max_tasks_per_worker : int, optional
+        Number of jobs after which a worker process is replaced by a fresh one, releasing
+        the memory held by simulators and caches. Defaults to never.
+    max_worker_memory : int, optional
+        Resident memory in bytes above which the process pool is recycled: the pool is
+        replaced and the old one exits once its queued jobs are done. Defaults to never.
+    worker_memory_limit : int, optional
+        Maximum address space in bytes of each worker process (Unix only), so that a
+        runaway job fails with MemoryError instead of exhausting the machine.
+    high_memory_threshold : int, optional
+        Estimated peak memory in bytes (see ``CostModel.estimate_memory``) above which a
+        job runs on a dedicated worker, one job at a time and without `worker_memory_limit`.
+    retry_policy : RetryPolicy, optional
+        Default policy retrying jobs that fail with transient errors. Defaults to no retries.
+    hedge_policy : HedgePolicy, optional
+        Default policy duplicating jobs that run much longer than usual. Defaults to no hedging.
 
     """
 
     _default_split = "uniform"
 
-    def __init__(  # pylint: disable=too-many-arguments too-many-positional-arguments
+    def __init__(  # pylint: disable=too-many-arguments too-many-positional-arguments too-many-locals
         self,
         providers_info: dict[str, dict[str, Any]] | None = None,
         providers: list[str] | None = None,
@@ -186,6 +336,19 @@ class QuantumExecutor:
         max_workers: int | None = None,
         raise_exc: bool = False,
         virtual_provider: VirtualProvider | None = None,
+        shared_memory_threshold: int | None = DEFAULT_SHARED_MEMORY_THRESHOLD,
+        provider_limits: dict[str, int] | None = None,
+        backend_limits: dict[str, dict[str, int]] | None = None,
+        cost_model: CostModel | None = None,
+        history_path: str | None = None,
+        metrics: MetricsRegistry | NullMetrics | None = None,
+        max_threads: int | None = None,
+        max_tasks_per_worker: int | None = None,
+        max_worker_memory: int | None = None,
+        worker_memory_limit: int | None = None,
+        high_memory_threshold: int | None = None,
+        retry_policy: RetryPolicy | None = None,
+        hedge_policy: HedgePolicy | None = None,
     ) -> None:
         """Manage splitting, dispatching, execution, and optional merging of quantum jobs.
 
@@ -214,11 +377,65 @@ class QuantumExecutor:
             If True, propagate initialization or policy-load errors.
         virtual_provider : VirtualProvider, optional
             If provided, use this instead of creating a new one.
+        shared_memory_threshold : int or None, optional
+            Serialized size in bytes from which worker results are returned through
+            shared memory instead of the process pool pipe. None disables it.
+        provider_limits : Dict[str, int], optional
+            Default maximum number of concurrently running jobs per provider.
+        backend_limits : Dict[str, Dict[str, int]], optional
+            Default maximum number of concurrently running jobs per backend (provider → backend → limit).
+        cost_model : CostModel, optional
+            Estimator used to order jobs longest-first and to estimate dispatches.
+            Defaults to a CircuitCostModel calibrated by the executor's runtime history.
+        history_path : str, optional
+            JSON file where measured job runtimes are loaded from and saved to, so that
+            estimates improve across sessions. If None, the history is kept in memory only,
+            and runtimes are only measured for dispatches run with ``job_order="lpt"``.
+        metrics : MetricsRegistry, optional
+            Registry receiving job counts, latencies, in-flight gauges and pool utilization.
+            Defaults to no metrics, which adds no overhead.
+        max_threads : int, optional
+            Max threads for the "threads" and "auto" execution modes.
+            Defaults to the number of CPUs plus 4, capped at 32.
+        max_tasks_per_worker : int, optional
+            Number of jobs after which a worker process is replaced by a fresh one, releasing
+            the memory held by simulators and caches. Defaults to never.
+        max_worker_memory : int, optional
+            Resident memory in bytes above which the process pool is recycled: the pool is
+            replaced and the old one exits once its queued jobs are done. Defaults to never.
+        worker_memory_limit : int, optional
+            Maximum address space in bytes of each worker process (Unix only), so that a
+            runaway job fails with MemoryError instead of exhausting the machine.
+        high_memory_threshold : int, optional
+            Estimated peak memory in bytes (see ``CostModel.estimate_memory``) above which a
+            job runs on a dedicated worker, one job at a time and without `worker_memory_limit`.
+        retry_policy : RetryPolicy, optional
+            Default policy retrying jobs that fail with transient errors. Defaults to no retries.
+        hedge_policy : HedgePolicy, optional
+            Default policy duplicating jobs that run much longer than usual. Defaults to no hedging.
 
         """
         self._policies_folder = policies_folder
         self._max_workers = max_workers
+        self._max_threads = max_threads
+        self._max_tasks_per_worker = max_tasks_per_worker
+        self._max_worker_memory = max_worker_memory
+        self._worker_memory_limit = worker_memory_limit
+        self._high_memory_threshold = high_memory_threshold
+        self._retry_policy = retry_policy
+        self._hedge_policy = hedge_policy
         self._raise_exc = raise_exc
+        self._shared_memory_threshold = shared_memory_threshold
+        self._provider_limits = provider_limits or {}
+        self._backend_limits = backend_limits or {}
+        self._history_path = history_path
+        self._history = RuntimeHistory.load(history_path) if history_path else RuntimeHistory()
+        self._cost_model = cost_model or CircuitCostModel(history=self._history)
+        self._metrics = metrics or NULL_METRICS
+        # Session pools: execution mode ("processes" or "threads") → (pool, workers).
+        self._pools: dict[str, tuple[Executor, int]] = {}
+        self._threads: list[threading.Thread] = []
+        self._lock = threading.Lock()
 
         if virtual_provider is None:
             self._providers_info = providers_info or {}
@@ -227,6 +444,7 @@ class QuantumExecutor:
                 providers_info=self._providers_info,
                 include=self._providers,
                 raise_exc=self._raise_exc,
+                metrics=self._metrics,
             )
         else:
             self._providers_info = virtual_provider._providers_info
@@ -243,6 +461,8 @@ class QuantumExecutor:
         backends: dict[str, list[str]],
         split_policy: str = _default_split,
         split_data: dict[str, Any] | None = None,
+        parallel: str | None = None,
+        max_workers: int | None = None,
     ) -> tuple[Dispatch, dict[str, Any]]:
         """Split a circuit into jobs based on the specified split policy.
 
@@ -257,14 +477,30 @@ class QuantumExecutor:
         backends : dict[str, list[str]]
             Provider → list of backends.
         split_policy : str, optional
-            Which split policy to use.
+            Which split policy to use. Several circuits are split in a single call to its
+            ``split_many`` function if it has one, and one at a time otherwise.
         split_data : dict, optional
             Initial data for split policy.
+        parallel : str, optional
+            "threads" or "processes" to split several circuits in chunks on a pool, for
+            expensive split policies declared stateless (see :meth:`add_policy`). The jobs
+            keep the order of the circuits. Worker processes load the policy from its source
+            file, so it must be defined at the top level of one. Defaults to None (split in
+            the calling thread).
+        max_workers : int, optional
+            Size of the pool used with `parallel`. Defaults to the session pool, if any, or
+            to the executor's default for that kind of pool.
 
         Returns
         -------
         tuple[Dispatch, dict[str, Any]]
-            A Dispatch object containing the jobs and any updated split data.
+            A Dispatch object containing the jobs and any updated split data. With several
+            circuits, the ``"pending_shots"`` a multi-round policy holds back are listed per circuit.
+
+        Raises
+        ------
+        ValueError
+            If `parallel` is not a known mode or the split policy is not stateless.
         """
         if isinstance(circuits, Sequence):
             circuits = list(circuits)
@@ -276,18 +512,31 @@ class QuantumExecutor:
                 )
 
             split_fn = self.get_split_policy(split_policy)
-            aggregated: dict[str, dict[str, list[Any]]] = {}
-
-            split_data = split_data or {}
-            for circ, sh in zip(circuits, shots_list, strict=False):
+            split_data = {} if split_data is None else split_data
+            if parallel is not None:
+                return self._split_parallel(
+                    split_policy, circuits, shots_list, backends, split_data, parallel, max_workers
+                ), split_data
+            split_many = self._policies[split_policy].get("split_many")
+            split_key = next(_split_numbers)
+            if split_many is not None:
+                batch, split_data = split_many(circuits, shots_list, backends, self._virtual_provider, split_data)
+                batch.key_circuits(split_key)
+                return batch, {} if split_data is None else split_data
+
+            aggregated = Dispatch()
+            pending: list[int] = []
+            for index, (circ, sh) in enumerate(zip(circuits, shots_list, strict=False)):
                 disp_i, updated_split_data = split_fn(circ, sh, backends, self._virtual_provider, split_data)
+                disp_i.key_circuits(split_key, index=index)
                 split_data = updated_split_data
-                for prov, back_map in disp_i.to_dict().items():
-                    agg_back_map = aggregated.setdefault(prov, {})
-                    for back, jobs in back_map.items():
-                        agg_back_map.setdefault(back, []).extend(jobs)
+                pending.append(split_data.pop("pending_shots", 0) if isinstance(split_data, dict) else 0)
+                aggregated.extend(disp_i)
 
-            return Dispatch(aggregated), split_data or {}
+            split_data = {} if split_data is None else split_data
+            if any(pending):
+                split_data["pending_shots"] = pending
+            return aggregated, split_data
 
         if isinstance(shots, Sequence) and len(shots) > 1:
             raise ValueError("When passing a single circuit, shots must be a single int, not a list.")
@@ -296,16 +545,173 @@ class QuantumExecutor:
 
         # Single-circuit path
         split_fn = self.get_split_policy(split_policy)
-        split_data = split_data or {}
-        return split_fn(  # type: ignore[no-any-return]
-            circuits,
-            shots,
-            backends,
-            self._virtual_provider,
-            split_data,
-        )
+        split_data = {} if split_data is None else split_data
+        batch, split_data = split_fn(circuits, shots, backends, self._virtual_provider, split_data)
+        batch.key_circuits(next(_split_numbers), index=0)
+        return batch, {} if split_data is None else split_data
 
-    def run_experiment(  # pylint: disable=too-many-positional-arguments too-many-arguments
+    def _split_parallel(  # pylint: disable=too-many-arguments too-many-positional-arguments too-many-locals
+        self,
+        split_policy: str,
+        circuits: list[Any],
+        shots_list: list[int],
+        backends: dict[str, list[str]],
+        split_data: dict[str, Any],
+        parallel: str,
+        max_workers: int | None,
+    ) -> Dispatch:
+        """Split circuits in contiguous chunks on a pool, with a stateless split policy.
+
+        Parameters
+        ----------
+        split_policy : str
+            Name of the split policy.
+        circuits : list[Any]
+            The circuits to split.
+        shots_list : list[int]
+            Number of shots of each circuit.
+        backends : dict[str, list[str]]
+            Provider → list of backends.
+        split_data : dict[str, Any]
+            Split data, passed to the policy for every circuit.
+        parallel : str
+            "threads" or "processes".
+        max_workers : int or None
+            Requested number of workers, if any.
+
+        Returns
+        -------
+        Dispatch
+            The jobs of every circuit, in the order of the circuits.
+
+        Raises
+        ------
+        ValueError
+            If `parallel` is not a known mode or the split policy is not stateless.
+
+        """
+        if parallel not in {"threads", "processes"}:
+            raise ValueError(f"Unknown parallel mode '{parallel}'; use 'threads' or 'processes'.")
+        entry = self._policies[split_policy]
+        if not entry.get("stateless"):
+            raise ValueError(f"Split policy '{split_policy}' is not stateless and cannot split circuits in parallel.")
+        split_fn, split_many = entry["split"], entry.get("split_many")
+        split_key = next(_split_numbers)
+        # Each chunk is submitted as task(circuits, shots, start=start). Threads return the
+        # chunk's Dispatch, processes its (provider, backend, job) tuples.
+        task: Callable[..., Dispatch | list[tuple[str, str, Job]]]
+        if parallel == "threads":
+            task = functools.partial(
+                split_circuits,
+                split_fn,
+                split_many,
+                backends=backends,
+                virtual_provider=self._virtual_provider,
+                split_data=split_data,
+                split_key=split_key,
+            )
+        else:
+            # Resolved before any work is submitted, so that an unpicklable policy fails fast.
+            task = functools.partial(
+                split_in_worker,
+                policy_reference(split_fn),
+                policy_reference(split_many) if split_many is not None else None,
+                backends=backends,
+                split_data=split_data,
+                split_key=split_key,
+                providers_info=self._providers_info,
+                providers=self._providers,
+                raise_exc=self._raise_exc,
+            )
+
+        pool, workers, owned = self._get_pool(parallel, max_workers)
+        # A few chunks per worker even out policies whose cost varies between circuits.
+        size = max(1, math.ceil(len(circuits) / (workers * 4)))
+        futures: list[Future[Dispatch | list[tuple[str, str, Job]]]] = []
+        try:
+            for start in range(0, len(circuits), size):
+                chunk, chunk_shots = circuits[start : start + size], shots_list[start : start + size]
+                futures.append(pool.submit(task, chunk, chunk_shots, start=start))
+            aggregated = Dispatch()
+            for future in futures:
+                aggregated.extend(future.result())
+        finally:
+            for future in futures:
+                future.cancel()
+            if owned:
+                self._retire_pool(pool)
+                self._metrics.add("quantum_executor_pool_workers", -workers)
+        logger.debug("Split %d circuits in %d chunks on %d %s.", len(circuits), len(futures), workers, parallel)
+        return aggregated
+
+    def stream_dispatch(  # pylint: disable=too-many-arguments too-many-positional-arguments
+        self,
+        circuits: Iterable[Any],
+        shots: int | Iterable[int],
+        backends: dict[str, list[str]],
+        split_policy: str = _default_split,
+        split_data: dict[str, Any] | None = None,
+    ) -> LazyDispatch:
+        """Split circuits into jobs lazily, as :meth:`run_dispatch` pulls them.
+
+        Unlike :meth:`generate_dispatch`, no job exists before the dispatch runs: each
+        circuit is split when the executor has room for its jobs, so execution starts
+        at once and memory does not grow with the number of circuits. `circuits` and
+        `shots` may be generators.
+
+        Parameters
+        ----------
+        circuits : Iterable[Any]
+            The quantum circuits.
+        shots : int or Iterable[int]
+            Number of shots of every circuit, or of each one in turn.
+        backends : dict[str, list[str]]
+            Provider → list of backends.
+        split_policy : str, optional
+            Which split policy to use. Policies holding shots back for a later round
+            (see :meth:`run_experiment`) are not supported.
+        split_data : dict, optional
+            Initial data for split policy.
+
+        Returns
+        -------
+        LazyDispatch
+            The dispatch; its ``split_data`` is updated as circuits are split. Errors,
+            e.g. a shot count missing, are raised when the jobs are read.
+
+        Examples
+        --------
+        >>> sweep = (ansatz.assign_parameters(p) for p in parameter_grid)
+        >>> lazy = executor.stream_dispatch(sweep, 1000, backends)
+        >>> results = executor.run_dispatch(lazy, execution_mode="threads")
+
+        """
+        split_fn = self.get_split_policy(split_policy)
+
+        def _split() -> Generator[Dispatch, None, None]:
+            shots_iter: Iterator[int] = iter(shots) if not isinstance(shots, int) else itertools.repeat(shots)
+            split_key = next(_split_numbers)
+            for index, circuit in enumerate(circuits):
+                circuit_shots = next(shots_iter, None)
+                if circuit_shots is None:
+                    raise ValueError("There are fewer shot counts than circuits.")
+                part, lazy.split_data = split_fn(
+                    circuit, circuit_shots, backends, self._virtual_provider, lazy.split_data
+                )
+                part.key_circuits(split_key, index=index)
+                if isinstance(lazy.split_data, dict) and lazy.split_data.get("pending_shots"):
+                    raise ValueError(
+                        f"Split policy '{split_policy}' holds shots back for a later round; "
+                        "a lazy dispatch runs a single round."
+                    )
+                yield part
+            if not isinstance(shots, int) and next(shots_iter, None) is not None:
+                raise ValueError("There are more shot counts than circuits.")
+
+        lazy = LazyDispatch(_split(), {} if split_data is None else split_data)
+        return lazy  # noqa: RET504
+
+    def run_experiment(  # pylint: disable=too-many-positional-arguments too-many-arguments too-many-locals too-many-branches
         self,
         circuits: Any | Sequence[Any],  # noqa: ANN401
         shots: int | Sequence[int],
@@ -317,9 +723,20 @@ class QuantumExecutor:
         split_data: dict[str, Any] | None = None,
         merge_data: dict[str, Any] | None = None,
         max_workers: int | None = None,
+        max_rounds: int | None = None,
+        stopping_rule: StoppingRule | None = None,
+        shots_per_round: int | None = None,
+        split_parallel: str | None = None,
+        **dispatch_options: Any,  # noqa: ANN401
     ) -> ResultCollector | MergedResultCollector:
         """Split a circuit into jobs, dispatch them, and optionally merge results.
 
+        A split policy may hold back part of the shots for a later round by setting
+        ``"pending_shots"`` in its split data, as the ``adaptive`` policy does after its
+        pilot. The round is then run to completion, its jobs are handed to the policy's
+        ``observe(jobs, split_data)`` function if it has one, and the policy is called
+        again with the pending shots. The returned collector holds the jobs of all rounds.
+
         Parameters
         ----------
         circuits : Any or Sequence[Any]
@@ -337,13 +754,28 @@ class QuantumExecutor:
         multiprocess : bool, optional
             If True, run jobs in parallel processes.
         wait : bool, optional
-            If True, block until execution (and merge) finishes.
+            If True, block until execution (and merge) finishes. Earlier rounds always block.
         split_data : dict, optional
-            Initial data for split policy.
+            Initial data for split policy; updated in place by policies keeping state.
         merge_data : dict, optional
             Initial data for merge policy, if None, use updated split data.
         max_workers : int, optional
             Override for max parallel processes.
+        max_rounds : int, optional
+            Maximum number of rounds; shots still pending after the last one are not run.
+            Defaults to 4, plus the number of increments with a stopping rule.
+        stopping_rule : StoppingRule, optional
+            Send the shots of a single circuit in increments of `shots_per_round`, and stop
+            as soon as the counts of all rounds so far meet the rule; `shots` is then the
+            budget. All rounds block, whatever `wait`.
+        shots_per_round : int, optional
+            Shots of each increment with a stopping rule. Defaults to a tenth of `shots`.
+        split_parallel : str, optional
+            "threads" or "processes" to split several circuits in parallel with a stateless
+            split policy (see :meth:`generate_dispatch`).
+        **dispatch_options : Any
+            Additional keyword arguments forwarded to :meth:`run_dispatch`
+            (e.g. `max_in_flight`, `provider_limits`).
 
         Returns
         -------
@@ -356,13 +788,75 @@ class QuantumExecutor:
             split_policy,
             merge_policy,
         )
+        if stopping_rule is not None:
+            if isinstance(circuits, Sequence) or not isinstance(shots, int):
+                raise ValueError("A stopping rule applies to a single circuit with an integer shot budget.")
+            increment = max(1, shots // 10) if shots_per_round is None else shots_per_round
+            if increment < 1:
+                raise ValueError("shots_per_round must be positive.")
+            remaining, shots = max(shots - increment, 0), min(shots, increment)
+            increments = math.ceil((shots + remaining) / increment)
+        else:
+            increment = remaining = increments = 0
+        if max_rounds is None:
+            max_rounds = 4 + increments
+        if max_rounds < 1:
+            raise ValueError("max_rounds must be at least 1.")
+        observe_fn = self._policies.get(split_policy, {}).get("observe")
         dispatch_obj, updated_split = self.generate_dispatch(
             circuits=circuits,
             shots=shots,
             backends=backends,
             split_policy=split_policy,
             split_data=split_data,
+            parallel=split_parallel,
         )
+        pending = updated_split.pop("pending_shots", None)
+        earlier: ResultCollector | None = None
+        counts_before: dict[str, int] | None = None
+        for round_num in range(2, max_rounds + 1):
+            if not pending and not remaining:
+                break
+            if isinstance(pending, list):
+                # Only the circuits with pending shots take part in the next round.
+                circuits = [circ for circ, sh in zip(circuits, pending, strict=True) if sh]
+                pending = [sh for sh in pending if sh]
+            collector = self.run_dispatch(
+                dispatch=dispatch_obj,
+                multiprocess=multiprocess,
+                max_workers=max_workers,
+                prior_results=earlier,
+                **dispatch_options,
+            )
+            # Without a merge policy, run_dispatch returns the plain collector.
+            assert isinstance(collector, ResultCollector)
+            earlier = collector
+            if observe_fn is not None:
+                updated_split = observe_fn(collector.get_jobs(), updated_split)
+            if not pending and stopping_rule is not None:
+                # A whole increment has run: check the stopping rule before sending the next one.
+                counts = total_counts(collector.get_results())
+                if stopping_rule.should_stop(counts, counts_before):
+                    logger.info("Stopping rule met after %d shots, %d spared.", sum(counts.values()), remaining)
+                    if merge_policy is None:
+                        return collector
+                    return self._merge(collector, merge_policy, merge_data or updated_split, wait=True)
+                counts_before = counts
+                pending = min(increment, remaining)
+                remaining -= pending
+            logger.info("Experiment round %d: %s shots.", round_num, pending)
+            dispatch_obj, updated_split = self.generate_dispatch(
+                circuits=circuits,
+                shots=pending,
+                backends=backends,
+                split_policy=split_policy,
+                split_data=updated_split,
+                parallel=split_parallel,
+            )
+            pending = updated_split.pop("pending_shots", None)
+        if pending or remaining:
+            left = (sum(pending) if isinstance(pending, list) else pending or 0) + remaining
+            logger.warning("Experiment stopped after %d rounds with %d shots pending.", max_rounds, left)
 
         return self.run_dispatch(
             dispatch=dispatch_obj,
@@ -371,36 +865,102 @@ class QuantumExecutor:
             max_workers=max_workers,
             merge_policy=merge_policy,
             merge_data=merge_data or updated_split,
+            prior_results=earlier,
+            **dispatch_options,
         )
 
     # pylint: disable=too-many-positional-arguments too-many-arguments too-many-locals too-many-branches
     def run_dispatch(  # pylint: disable=too-many-statements
         self,
-        dispatch: Union[Dispatch, "DispatchDict"],
+        dispatch: Union[Dispatch, LazyDispatch, "DispatchDict"],
         multiprocess: bool = False,
         wait: bool = True,
         max_workers: int | None = None,
         merge_policy: str | None = None,
         merge_data: dict[str, Any] | None = None,
+        max_in_flight: int | None = None,
+        provider_limits: dict[str, int] | None = None,
+        backend_limits: dict[str, dict[str, int]] | None = None,
+        job_order: str = "fifo",
+        execution_mode: str | None = None,
+        crash_retries: int = 1,
+        retry_policy: RetryPolicy | None = None,
+        hedge_policy: HedgePolicy | None = None,
+        timeout: float | None = None,
+        quorum_shots: int | None = None,
+        quorum_backends: int | None = None,
+        quorum_action: str = "cancel",
+        prior_results: ResultCollector | None = None,
     ) -> ResultCollector | MergedResultCollector:
         """Execute all jobs in a Dispatch and optionally merge their results.
 
         Parameters
         ----------
-        dispatch : Dispatch or DispatchDict
-            Jobs to execute.
+        dispatch : Dispatch, LazyDispatch or DispatchDict
+            Jobs to execute. The jobs of a :class:`LazyDispatch` are produced as there is
+            room to run them, so only those running or about to run are held in memory;
+            it does not support `quorum_backends`, and ``job_order="lpt"`` reads it whole
+            before running anything.
         multiprocess : bool, optional
-            If True, run in parallel processes.
+            If True, run in parallel processes. Shorthand for ``execution_mode="processes"``.
         wait : bool, optional
             If True, block until execution (and merge) finishes.
-            If False, jobs run in a background thread (sequentially if multiprocess=False,
-            or gathering + merging in threads if multiprocess=True).
+            If False, jobs run in a background thread (sequentially in "sequential" mode,
+            or gathering + merging in threads otherwise).
         max_workers : int, optional
-            Override for max parallel processes.
+            Override for max parallel processes, or threads in "threads" mode. In a started
+            session, a value other than the session's runs this dispatch on a dedicated pool.
         merge_policy : str or None, optional
             Which merge policy to apply after dispatch.
         merge_data : dict, optional
             Initial data for merge policy.
+        max_in_flight : int, optional
+            Maximum number of jobs submitted to the process pool at any time.
+            Defaults to twice the number of worker processes.
+        provider_limits : Dict[str, int], optional
+            Maximum number of concurrently running jobs per provider.
+            Defaults to the limits given to the constructor.
+        backend_limits : Dict[str, Dict[str, int]], optional
+            Maximum number of concurrently running jobs per backend (provider → backend → limit).
+            Defaults to the limits given to the constructor.
+        job_order : str, optional
+            Order in which jobs are submitted to the process pool: "fifo" keeps the dispatch
+            order, "lpt" submits the longest jobs (according to the cost model) first to
+            minimize the makespan. Ignored for sequential execution.
+        execution_mode : str, optional
+            How jobs run: "sequential" in the calling thread, "processes" in a process pool,
+            "threads" in a thread pool sharing the executor's VirtualProvider (best for remote
+            providers, which mostly wait on the network), or "auto" to send local simulator
+            jobs to processes and the others to threads. Defaults to "processes" if
+            `multiprocess` is True, otherwise "sequential".
+        crash_retries : int, optional
+            How often a job whose worker process died is retried after it has also crashed
+            a process of its own. When a worker dies, the process pool is replaced and every
+            job it was running is rerun alone in a new process, one job at a time, so a job
+            that keeps crashing workers is isolated from the others and then reported as an error.
+        retry_policy : RetryPolicy, optional
+            Policy retrying jobs whose errors it classifies as transient, after an exponential
+            backoff. In parallel modes a job keeps its concurrency slot while it backs off.
+            Defaults to the policy given to the constructor.
+        hedge_policy : HedgePolicy, optional
+            Policy submitting a duplicate of a job that is still running after a percentile of
+            its backend's latencies; the first copy to succeed is kept and the other cancelled.
+            Ignored in "sequential" mode. Defaults to the policy given to the constructor.
+        timeout : float, optional
+            Seconds each job may run once submitted to its provider before it is cancelled and
+            reported as such (see ``JobResult.cancelled``). A ``"timeout"`` entry in a job's
+            configuration overrides it. Defaults to no timeout.
+        quorum_shots : int, optional
+            Complete the dispatch, and merge its results, as soon as successful jobs add up to
+            this many shots, instead of waiting for the slowest backend.
+        quorum_backends : int, optional
+            Complete the dispatch as soon as this many backends have run all their jobs successfully.
+        quorum_action : str, optional
+            Once a quorum is reached, "cancel" the unfinished jobs (the default) or "abandon"
+            them: they keep running in the background and their results are still stored.
+        prior_results : ResultCollector, optional
+            Complete collector of an earlier round of the same experiment, whose jobs are
+            added to the returned collector (and merged) without being run again.
 
         Returns
         -------
@@ -409,89 +969,585 @@ class QuantumExecutor:
 
         """
         logger.info(
-            "Dispatch start: multiprocess=%s, wait=%s, merge_policy=%s",
-            multiprocess,
+            "Dispatch start: execution_mode=%s, wait=%s, merge_policy=%s",
+            execution_mode or ("processes" if multiprocess else "sequential"),
             wait,
             merge_policy,
         )
-        if not isinstance(dispatch, Dispatch):
+        if job_order not in {"fifo", "lpt"}:
+            raise ValueError(f"Unknown job order '{job_order}'; expected 'fifo' or 'lpt'.")
+        mode = execution_mode or ("processes" if multiprocess else "sequential")
+        if mode not in EXECUTION_MODES:
+            raise ValueError(f"Unknown execution mode '{mode}'; expected one of {EXECUTION_MODES}.")
+        if crash_retries < 0:
+            raise ValueError("crash_retries must be a non-negative integer.")
+        if timeout is not None and timeout <= 0:
+            raise ValueError("timeout must be positive.")
+        # Measured runtimes only matter if they are stored or calibrate the order of jobs.
+        record_runtimes = self._history_path is not None or job_order == "lpt"
+        if isinstance(dispatch, LazyDispatch):
+            if quorum_backends is not None:
+                raise ValueError("quorum_backends needs every job up front; it is not supported for a LazyDispatch.")
+        elif not isinstance(dispatch, Dispatch):
             dispatch = Dispatch(dispatch)
 
-        collector = ResultCollector()
-        jobs = list(dispatch.all_jobs())
-        if not jobs:
+        metrics = self._metrics
+        collector = ResultCollector(
+            metrics=metrics, quorum_shots=quorum_shots, quorum_backends=quorum_backends, quorum_action=quorum_action
+        )
+        # With a quorum, a blocking call returns once it is reached and the remaining jobs run in the background.
+        run_here = wait and quorum_shots is None and quorum_backends is None
+        if prior_results is not None:
+            collector.adopt(prior_results)
+        hedge = self._hedge_policy if hedge_policy is None else hedge_policy
+        # Backends of every provider in the dispatch, where slow jobs may be hedged.
+        dispatch_backends: dict[str, dict[str, None]] | None = {} if hedge is not None else None
+        num_jobs = 0
+        jobs: Iterator[tuple[str, str, Job]]
+        if isinstance(dispatch, LazyDispatch):
+            source = dispatch
+
+            def _register(lazy_jobs: Iterator[tuple[str, str, Job]]) -> Generator[tuple[str, str, Job], None, None]:
+                """Register the jobs of the lazy dispatch as they are produced."""
+                nonlocal num_jobs
+                try:
+                    for prov, back, job in lazy_jobs:
+                        collector.register_job_mapping(job, prov, back)
+                        num_jobs += 1
+                        if dispatch_backends is not None:
+                            dispatch_backends.setdefault(prov, {})[back] = None
+                        yield prov, back, job
+                except Exception as e:  # pylint: disable=broad-except
+                    if not num_jobs:
+                        raise
+                    logger.error("Error producing the jobs of a lazy dispatch; running %d jobs only: %s", num_jobs, e)
+                    source.error = e
+                finally:
+                    collector.registration_open = False
+
+            collector.registration_open = True
+            jobs = _register(dispatch.all_jobs())
+            # Produce the first job right away, to tell an empty dispatch and raise errors in splitting it.
+            first = next(jobs, None)
+            if first is not None:
+                jobs = itertools.chain([first], jobs)
+        else:
+            # A columnar dispatch rebuilds its jobs from their rows, so the collector keeps the rows
+            # rather than the jobs, and each job is freed once it has run.
+            load = dispatch.job if dispatch.columnar else None
+            rows = dispatch.all_job_rows() if load else ((p, b, j, 0) for p, b, j in dispatch.all_jobs())
+            for prov, back, job, row in rows:
+                collector.register_job_mapping(job, prov, back, load=load, row=row)
+                num_jobs += 1
+                if dispatch_backends is not None:
+                    dispatch_backends.setdefault(prov, {})[back] = None
+            jobs = dispatch.all_jobs()
+        if not num_jobs:
             logger.warning("No jobs to dispatch.")
             collector.complete = True
             return collector if merge_policy is None else MergedResultCollector(collector)
 
-        for prov, back, job in jobs:
-            collector.register_job_mapping(job, prov, back)
+        dispatch_start = time.monotonic()
+        policy = self._retry_policy if retry_policy is None else retry_policy
+        # Cancelling the collector cancels the provider jobs running in this process, and stops waits.
+        scope = CancelScope()
+        stop = threading.Event()
+        collector.on_cancel(scope.cancel)
+        collector.on_cancel(stop.set)
+
+        def _retry_delay(prov: str, back: str, job: Job, res: Any, attempt: int) -> float | None:  # noqa: ANN401
+            """Return the backoff before retrying a failed attempt, or None to keep its result."""
+            if policy is None or not (isinstance(res, dict) and "error" in res) or res.get("cancelled"):
+                return None
+            delay = policy.next_delay(prov, str(res["error"]), attempt)
+            if delay is not None:
+                metrics.inc("quantum_executor_job_retries_total", provider=prov, backend=back)
+                logger.warning("Job %s failed (attempt %d): %s; retry in %.2fs.", job.id, attempt, res["error"], delay)
+            return delay
 
         def _run_sequential() -> None:
             """Run all jobs sequentially."""
             for prov, back, job in jobs:
-                try:
-                    res = run_single_job_static(
-                        prov,
-                        back,
-                        job.circuit,
-                        job.shots,
-                        job.configuration or {},
-                        self._providers_info,
-                        self._providers,
-                        self._raise_exc,
-                        virtual_provider=self._virtual_provider,
-                    )
-                except Exception as e:  # pylint: disable=broad-except
-                    logger.error("Error fetching result for Job %s: %s", job.id, e)
-                    res = {"error": str(e)}
-                collector.store_result(job, res)
+                if stop.is_set():
+                    break
+                queued = dispatch_start
+                errors: list[str] = []
+                first_failure = queued
+                while True:
+                    timings: Timings = {"queue": (queued, time.monotonic())}
+                    metrics.inc("quantum_executor_jobs_submitted_total", provider=prov, backend=back)
+                    metrics.add("quantum_executor_jobs_in_flight", 1, provider=prov, backend=back)
+                    try:
+                        res = run_single_job_static(
+                            prov,
+                            back,
+                            job.circuit,
+                            job.shots,
+                            job.configuration or {},
+                            self._providers_info,
+                            self._providers,
+                            self._raise_exc,
+                            virtual_provider=self._virtual_provider,
+                            timings=timings,
+                            timeout=timeout,
+                            cancel_scope=scope,
+                        )
+                    except Exception as e:  # pylint: disable=broad-except
+                        logger.error("Error fetching result for Job %s: %s", job.id, e)
+                        res = {"error": str(e)}
+                    metrics.add("quantum_executor_jobs_in_flight", -1, provider=prov, backend=back)
+                    delay = _retry_delay(prov, back, job, res, len(errors) + 1)
+                    if delay is None:
+                        break
+                    if not errors:
+                        first_failure = timings["queue"][1]
+                    errors.append(str(res["error"]))
+                    stop.wait(delay)
+                    queued = time.monotonic()
+                if errors:
+                    timings["retry"] = (first_failure, queued)
+                if record_runtimes:
+                    self._record_runtime(prov, back, job, res, run_time(timings))
+                collector.store_result(
+                    job,
+                    res,
+                    timings=timings,
+                    worker=current_worker(),
+                    attempts=len(errors) + 1,
+                    errors=errors,
+                    cancelled=_pop_cancelled(res),
+                )
             collector.complete = True
+            self._save_history()
 
-        if not multiprocess:
-            if wait:
+        if mode == "sequential":
+            if run_here:
                 _run_sequential()
             else:
-                threading.Thread(target=_run_sequential, daemon=True).start()
+                self._start_thread(_run_sequential)
         else:
-            executor = ProcessPoolExecutor(max_workers or self._max_workers)
-            futures: dict[Any, Any] = {}
-            for prov, back, job in jobs:
-                futures[
-                    executor.submit(
-                        run_single_job_static,
+            # In "auto" mode `max_workers` only sizes the process pool.
+            pools = {
+                kind: self._get_pool(kind, max_workers if mode != "auto" or kind == "processes" else None)
+                for kind in (("processes", "threads") if mode == "auto" else (mode,))
+            }
+            workers = sum(size for _, size, _ in pools.values())
+            scheduler = JobScheduler(
+                max_in_flight=max_in_flight if max_in_flight is not None else 2 * workers,
+                provider_limits=self._provider_limits if provider_limits is None else provider_limits,
+                backend_limits=self._backend_limits if backend_limits is None else backend_limits,
+            )
+
+            submitted: dict[str, float] = {}
+            # Job id → (process pool running it, whether the job runs alone in it).
+            running_on: dict[str, tuple[Executor, bool]] = {}
+            isolated_crashes: dict[str, int] = {}
+            # Suspects waiting for an isolation slot, each behind a future woken when its turn comes.
+            isolation_queue: deque[Future[Any]] = deque()
+            isolation_turns: set[Future[Any]] = set()
+            isolated_running = 0
+            # Retry state: failed attempts per job id, when the first one started, and pending backoffs.
+            failures: dict[str, list[str]] = {}
+            retry_start: dict[str, float] = {}
+            backoffs: set[Future[Any]] = set()
+            # Hedging state: watched future → (job future, deadline timer), and race future → its two copies
+            # and the backend of the duplicate, which holds a scheduler slot there until the race is decided.
+            hedges_used = 0
+
+            def _can_hedge() -> bool:
+                # The budget follows the jobs registered so far, which grow with a lazy dispatch.
+                return hedge is not None and hedges_used < hedge.budget(num_jobs)
+
+            watching: dict[Future[Any], tuple[Future[Any], threading.Timer]] = {}
+            races: dict[Future[Any], tuple[Future[Any], Future[Any], tuple[str, str]]] = {}
+            # Launched future → the scope (threads) or flag (processes) cancelling just that copy.
+            cancellers: dict[Future[Any], CancelScope | CancelFlag] = {}
+            race_lock = threading.Lock()
+            # Futures of the jobs handed to the pools, cancelled if they are still queued when the dispatch is.
+            launched: set[Future[Any]] = set()
+
+            def _cancel_pending() -> None:
+                for fut in list(launched):
+                    fut.cancel()
+                for waiting in list(backoffs):
+                    _wake(waiting)
+
+            collector.on_cancel(_cancel_pending)
+
+            def _track(prov: str, back: str, delta: int) -> None:
+                # Called from the scheduling thread only, so the pool-wide count needs no lock.
+                busy = min(len(submitted), workers)
+                metrics.add("quantum_executor_jobs_in_flight", delta, provider=prov, backend=back)
+                metrics.add("quantum_executor_pool_busy_workers", busy - min(len(submitted) - delta, workers))
+
+            def _skipped() -> "Future[Any]":
+                skipped: Future[Any] = Future()
+                skipped.set_result(({"error": CANCELLED_ERROR, "cancelled": True}, {}, None, None))
+                return skipped
+
+            def _submit(prov: str, back: str, job: Job) -> "Future[Any]":
+                if stop.is_set():
+                    return _skipped()
+                submitted[job.id] = time.monotonic()
+                if metrics.enabled:
+                    metrics.inc("quantum_executor_jobs_submitted_total", provider=prov, backend=back)
+                    _track(prov, back, 1)
+                deadline = hedge.deadline(prov, back) if _can_hedge() else None  # type: ignore[union-attr]
+                # A job that may be hedged can be cancelled on its own, should its duplicate win.
+                fut = _launch(prov, back, job, cancellable=deadline is not None)
+                return fut if deadline is None else _watch(fut, deadline)
+
+            def _launch(prov: str, back: str, job: Job, copy: bool = False, cancellable: bool = False) -> "Future[Any]":
+                canceller: CancelScope | CancelFlag | None = None
+                if cancellable:
+                    canceller = CancelScope() if _in_thread(prov) else CancelFlag()
+                    scope.add(canceller)
+                try:
+                    fut = _route(prov, back, job, copy, canceller)
+                except BaseException:
+                    if canceller is not None:
+                        _release_canceller(canceller)
+                    raise
+                launched.add(fut)
+                fut.add_done_callback(launched.discard)
+                if canceller is not None:
+                    cancellers[fut] = canceller
+                    fut.add_done_callback(lambda done: _release_canceller(cancellers.pop(done)))
+                return fut
+
+            def _release_canceller(canceller: "CancelScope | CancelFlag") -> None:
+                scope.discard(canceller)
+                if isinstance(canceller, CancelFlag):
+                    canceller.close()
+
+            def _in_thread(prov: str) -> bool:
+                return mode == "threads" or (mode == "auto" and prov not in CPU_BOUND_PROVIDERS)
+
+            def _route(
+                prov: str, back: str, job: Job, copy: bool, canceller: "CancelScope | CancelFlag | None"
+            ) -> "Future[Any]":
+                if _in_thread(prov):
+                    job_scope = canceller if isinstance(canceller, CancelScope) else scope
+                    return pools["threads"][0].submit(
+                        run_job_in_thread,
                         prov,
                         back,
                         job.circuit,
                         job.shots,
                         job.configuration or {},
-                        self._providers_info,
-                        self._providers,
+                        self._virtual_provider,
                         self._raise_exc,
-                        None,
+                        timeout,
+                        job_scope,
                     )
-                ] = job
+                pool = pools["processes"][0]
+                threshold = self._high_memory_threshold
+                if threshold is not None and self._cost_model.estimate_memory(prov, back, job) > threshold:
+                    if "high_memory" not in pools:
+                        pools["high_memory"] = (self._new_process_pool(1, dedicated=True), 1, True)
+                        metrics.add("quantum_executor_pool_workers", 1)
+                    pool = pools["high_memory"][0]
+                flag = canceller if isinstance(canceller, CancelFlag) else None
+                return _run_in_process(prov, back, job, pool, copy=copy, flag=flag)
+
+            def _run_in_process(  # pylint: disable=too-many-arguments too-many-positional-arguments
+                prov: str,
+                back: str,
+                job: Job,
+                pool: Executor,
+                alone: bool = False,
+                copy: bool = False,
+                flag: CancelFlag | None = None,
+            ) -> "Future[Any]":
+                if not copy:
+                    # Hedged copies are not tracked: if one crashes its worker, the other copy still counts.
+                    running_on[job.id] = (pool, alone)
+                return pool.submit(
+                    run_job_in_worker,
+                    prov,
+                    back,
+                    job.circuit,
+                    job.shots,
+                    job.configuration or {},
+                    self._providers_info,
+                    self._providers,
+                    self._raise_exc,
+                    self._shared_memory_threshold,
+                    timeout,
+                    flag,
+                )
+
+            def _recover(prov: str, back: str, job: Job, pool: Executor, alone: bool) -> "Future[Any] | None":
+                metrics.inc("quantum_executor_worker_crashes_total", provider=prov, backend=back)
+                if alone:
+                    # The job ran by itself, so the crash is its own.
+                    self._retire_pool(pool)
+                    crashes = isolated_crashes[job.id] = isolated_crashes.get(job.id, 0) + 1
+                    if crashes > crash_retries:
+                        logger.error("Job %s crashed %d worker processes of its own; giving up.", job.id, crashes)
+                        return None
+                elif pool is pools["processes"][0]:
+                    # The first job reporting the crash replaces the pool; all jobs it was running are suspects.
+                    _replace_processes("A worker process died")
+                elif "high_memory" in pools and pool is pools["high_memory"][0]:
+                    self._retire_pool(pool)
+                    pools["high_memory"] = (self._new_process_pool(1, dedicated=True), 1, True)
+                logger.warning("The worker process running Job %s died; retrying it in a process of its own.", job.id)
+                return _isolate(prov, back, job)
+
+            def _isolate(prov: str, back: str, job: Job) -> "Future[Any]":
+                # Run a suspect in a fresh process of its own, or queue it until an isolation slot is free.
+                nonlocal isolated_running
+                if isolated_running < MAX_ISOLATED_JOBS:
+                    isolated_running += 1
+                    return _run_in_process(prov, back, job, self._new_process_pool(1, dedicated=True), alone=True)
+                waiting: Future[Any] = Future()
+                isolation_queue.append(waiting)
+                isolation_turns.add(waiting)
+                return waiting
+
+            def _release_isolation() -> None:
+                # The slot of a finished suspect passes to the next one waiting, if any.
+                nonlocal isolated_running
+                if isolation_queue:
+                    _wake(isolation_queue.popleft())
+                else:
+                    isolated_running -= 1
+
+            def _replace_processes(reason: str) -> None:
+                old, size, owned = pools["processes"]
+                new_pool, owned = self._replace_pool(old, size, owned, reason)
+                pools["processes"] = (new_pool, size, owned)
+
+            def _backoff(delay: float) -> "Future[Any]":
+                waiting: Future[Any] = Future()
+                timer = threading.Timer(delay, _wake, args=(waiting,))
+                timer.daemon = True
+                timer.start()
+                backoffs.add(waiting)
+                return waiting
+
+            def _resubmit(prov: str, back: str, job: Job) -> "Future[Any]":
+                try:
+                    return _submit(prov, back, job)
+                except Exception as e:  # pylint: disable=broad-except
+                    failed: Future[Any] = Future()
+                    failed.set_exception(e)
+                    return failed
+
+            def _wake(waiting: "Future[Any]") -> None:
+                with race_lock:
+                    if not waiting.done():
+                        waiting.set_result(None)
+
+            def _watch(primary: "Future[Any]", deadline: float) -> "Future[Any]":
+                # Resolves when the job finishes or its deadline passes, whichever comes first.
+                watched: Future[Any] = Future()
+                timer = threading.Timer(deadline, _wake, args=(watched,))
+                timer.daemon = True
+                watching[watched] = (primary, timer)
+                primary.add_done_callback(lambda _: _wake(watched))
+                timer.start()
+                return watched
+
+            def _hedge(prov: str, back: str, job: Job, primary: "Future[Any]") -> "Future[Any]":
+                nonlocal hedges_used
+                alt_prov, alt_back = hedge.alternate(prov, back, dispatch_backends)  # type: ignore[union-attr]
+                # The duplicate counts against the concurrency limits of the backend it runs on.
+                if not scheduler.reserve(alt_prov, alt_back):
+                    logger.debug("No slot on %s/%s to hedge Job %s; waiting for it.", alt_prov, alt_back, job.id)
+                    return primary
+                try:
+                    copy = _launch(alt_prov, alt_back, job, copy=True, cancellable=True)
+                except Exception as e:  # pylint: disable=broad-except
+                    scheduler.release_reservation(alt_prov, alt_back)
+                    logger.warning("Could not hedge Job %s on %s/%s: %s", job.id, alt_prov, alt_back, e)
+                    return primary
+                hedges_used += 1
+                metrics.inc("quantum_executor_hedges_total", provider=prov, backend=back)
+                logger.info("Job %s is slow on %s/%s; hedging it on %s/%s.", job.id, prov, back, alt_prov, alt_back)
+                race: Future[Any] = Future()
+
+                def _settle(_: "Future[Any]") -> None:
+                    # The first copy to succeed wins; if both fail, the original's outcome is kept.
+                    with race_lock:
+                        if race.done():
+                            return
+                        for candidate in (primary, copy):
+                            if candidate.done() and _succeeded(candidate):
+                                race.set_result(candidate)
+                                return
+                        if primary.done() and copy.done():
+                            race.set_result(primary)
+
+                races[race] = (primary, copy, (alt_prov, alt_back))
+                primary.add_done_callback(_settle)
+                copy.add_done_callback(_settle)
+                return race
+
+            def _discard(prov: str, back: str, job: Job, won_at: float | None, loser: "Future[Any]") -> None:
+                # Runs when the losing copy stops. Only an original that could not be cancelled and
+                # finished anyway tells how much time its winning hedge saved.
+                if loser.cancelled() or loser.exception() is not None:
+                    return
+                value = loser.result()[0]
+                if isinstance(value, dict) and value.get("cancelled"):
+                    metrics.inc("quantum_executor_hedge_losers_cancelled_total", provider=prov, backend=back)
+                    return
+                discard_result(value)
+                if won_at is not None:
+                    saved = time.monotonic() - won_at
+                    collector.record_hedge_saving(job, saved)
+                    metrics.inc("quantum_executor_hedge_saved_seconds_total", saved, provider=prov, backend=back)
+
+            def _on_done(  # pylint: disable=too-many-locals too-many-branches too-many-return-statements
+                prov: str, back: str, job: Job, fut: "Future[Any]"
+            ) -> "Future[Any] | None":
+                if fut in backoffs:
+                    backoffs.discard(fut)
+                    return _resubmit(prov, back, job)
+                if fut in isolation_turns:
+                    # Its turn in isolation has come, with the slot of the suspect that finished.
+                    isolation_turns.discard(fut)
+                    if stop.is_set():
+                        _release_isolation()
+                        return _skipped()
+                    return _run_in_process(prov, back, job, self._new_process_pool(1, dedicated=True), alone=True)
+                hedged = None
+                # The backend that produced the result, whose runtime history it feeds.
+                ran_on = (prov, back)
+                if fut in watching:
+                    primary, timer = watching.pop(fut)
+                    timer.cancel()
+                    if not primary.done():
+                        return _hedge(prov, back, job, primary) if _can_hedge() else primary
+                    fut = primary
+                elif fut in races:
+                    primary, copy, alternate = races.pop(fut)
+                    scheduler.release_reservation(*alternate)
+                    fut = fut.result()
+                    loser = copy if fut is primary else primary
+                    hedged = "primary" if fut is primary else "hedge"
+                    if hedged == "hedge":
+                        ran_on = alternate
+                        metrics.inc("quantum_executor_hedge_wins_total", provider=prov, backend=back)
+                    if not loser.cancel():
+                        # The loser is running: cancel it on its provider, through its own scope or flag.
+                        canceller = cancellers.get(loser)
+                        if canceller is not None:
+                            canceller.cancel()
+                        won_at = time.monotonic() if hedged == "hedge" else None
+                        loser.add_done_callback(functools.partial(_discard, prov, back, job, won_at))
+                pool, alone = running_on.pop(job.id, (None, False))
+                crashed = False
+                if pool is not None:
+                    if alone:
+                        _release_isolation()
+                    crashed = not fut.cancelled() and isinstance(fut.exception(), BrokenProcessPool)
+                    if crashed:
+                        retry = _recover(prov, back, job, pool, alone)
+                        if retry is not None:
+                            return retry
+                    elif alone:
+                        self._retire_pool(pool)
+                segment = None
+                timings: Timings = {}
+                worker = None
+                submit_time = submitted.pop(job.id, None)
+                if metrics.enabled and submit_time is not None:
+                    _track(prov, back, -1)
+                try:
+                    value, timings, worker, rss = fut.result()
+                    received = time.monotonic()
+                    limit = self._max_worker_memory
+                    if limit is not None and rss is not None and rss > limit and pool is pools["processes"][0]:
+                        metrics.inc("quantum_executor_pool_recycles_total")
+                        _replace_processes(f"A worker process uses {rss} bytes (limit {limit})")
+                    if timings:
+                        if submit_time is not None:
+                            timings["queue"] = (submit_time, min(start for start, _ in timings.values()))
+                        timings["transfer"] = (max(end for _, end in timings.values()), received)
+                    with record_phase(timings, "attach"):
+                        res, segment = attach_result(value)
+                    if record_runtimes:
+                        self._record_runtime(*ran_on, job, res, run_time(timings))
+                    if hedge is not None and hedged != "hedge" and submit_time is not None and "error" not in res:
+                        hedge.observe(prov, back, received - submit_time)
+                except Exception as e:  # pylint: disable=broad-except
+                    logger.error("Error fetching result for Job %s: %s", job.id, e)
+                    res = {"error": str(e)}
+                errors = failures.get(job.id, [])
+                delay = None if crashed else _retry_delay(prov, back, job, res, len(errors) + 1)
+                if delay is not None:
+                    retry_start.setdefault(job.id, submit_time if submit_time is not None else time.monotonic())
+                    failures[job.id] = [*errors, str(res["error"])]
+                    return _backoff(delay)
+                if job.id in retry_start:
+                    timings["retry"] = (retry_start.pop(job.id), submit_time or time.monotonic())
+                    del failures[job.id]
+                collector.store_result(
+                    job,
+                    res,
+                    shared_segment=segment,
+                    timings=timings,
+                    worker=worker,
+                    attempts=len(errors) + 1,
+                    errors=errors,
+                    hedge=hedged,
+                    cancelled=_pop_cancelled(res),
+                )
+                return None
+
+            jobs_source: Iterable[tuple[str, str, Job]] = jobs
+            if job_order == "lpt":
+                # Longest-processing-time-first needs the whole job list to sort it.
+                scheduled = list(jobs)
+                order, _ = lpt_schedule([self._cost_model.estimate(p, b, j) for p, b, j in scheduled], workers)
+                jobs_source = [scheduled[i] for i in order]
 
             def _gather() -> None:
-                for fut in as_completed(futures):
-                    job_obj = futures[fut]
-                    try:
-                        res = fut.result()
-                    except Exception as e:  # pylint: disable=broad-except
-                        logger.error("Error fetching result for Job %s: %s", job_obj.id, e)
-                        res = {"error": str(e)}
-                    collector.store_result(job_obj, res)
+                scheduler.run(jobs_source, _submit, _on_done)
                 collector.complete = True
-                executor.shutdown(wait=False)
+                for pool, size, owned in pools.values():
+                    if owned:
+                        self._retire_pool(pool)
+                        metrics.add("quantum_executor_pool_workers", -size)
+                self._save_history()
 
-            if wait:
+            if run_here:
                 _gather()
             else:
-                threading.Thread(target=_gather, daemon=True).start()
+                self._start_thread(_gather)
+        if wait:
+            collector.wait_for_completion()
 
         if merge_policy is None:
             return collector
 
+        return self._merge(collector, merge_policy, merge_data, wait)
+
+    def _merge(
+        self, collector: ResultCollector, merge_policy: str, merge_data: dict[str, Any] | None, wait: bool
+    ) -> MergedResultCollector:
+        """Merge the results of a collector with a merge policy once it is complete.
+
+        Parameters
+        ----------
+        collector : ResultCollector
+            The collector whose results are merged.
+        merge_policy : str
+            Which merge policy to apply.
+        merge_data : dict, optional
+            Initial data for merge policy.
+        wait : bool
+            If True, merge before returning, otherwise in a background thread.
+
+        Returns
+        -------
+        MergedResultCollector
+            The merged collector.
+
+        """
         merged = MergedResultCollector(collector)
 
         def _merge_dispatch() -> None:
@@ -511,10 +1567,349 @@ class QuantumExecutor:
         if wait:
             _merge_dispatch()
         else:
-            threading.Thread(target=_merge_dispatch, daemon=True).start()
+            self._start_thread(_merge_dispatch)
 
         return merged
 
+    def _start_thread(self, target: Callable[[], None]) -> None:
+        """Run `target` in a background thread that :meth:`close` waits for.
+
+        Parameters
+        ----------
+        target : Callable[[], None]
+            The function to run.
+
+        """
+        thread = threading.Thread(target=target, daemon=True)
+        with self._lock:
+            self._threads = [t for t in self._threads if t.is_alive()]
+            self._threads.append(thread)
+        thread.start()
+
+    def _default_workers(self, kind: str) -> int:
+        """Return the default size of a pool.
+
+        Parameters
+        ----------
+        kind : str
+            "processes" or "threads".
+
+        Returns
+        -------
+        int
+            The number of workers.
+
+        """
+        if kind == "threads":
+            return self._max_threads or min(32, (os.cpu_count() or 1) + 4)
+        return self._max_workers or os.cpu_count() or 1
+
+    def _get_pool(self, kind: str, max_workers: int | None) -> tuple[Executor, int, bool]:
+        """Return the pool to run a dispatch's jobs of the given kind.
+
+        The session pool is used unless there is none or `max_workers` asks for a different
+        size, in which case a new pool is created for the dispatch.
+
+        Parameters
+        ----------
+        kind : str
+            "processes" or "threads".
+        max_workers : int or None
+            Requested number of workers, if any.
+
+        Returns
+        -------
+        tuple[Executor, int, bool]
+            The pool, its number of workers and whether the caller must shut it down.
+
+        """
+        with self._lock:
+            session = self._pools.get(kind)
+        if session is not None and max_workers in {None, session[1]}:
+            return session[0], session[1], False
+        workers = max_workers or self._default_workers(kind)
+        pool: Executor
+        if kind == "threads":
+            pool = ThreadPoolExecutor(workers, thread_name_prefix="quantum-executor")
+        else:
+            pool = self._new_process_pool(workers)
+        self._metrics.add("quantum_executor_pool_workers", workers)
+        return pool, workers, True
+
+    def _new_process_pool(self, workers: int, session: bool = False, dedicated: bool = False) -> ProcessPoolExecutor:
+        """Create a process pool with the executor's worker recycling and memory settings.
+
+        Parameters
+        ----------
+        workers : int
+            Number of worker processes.
+        session : bool, optional
+            If True, workers build their VirtualProvider once, when they start.
+        dedicated : bool, optional
+            If True, the pool runs one job at a time (high-memory jobs, crash isolation):
+            each job gets a fresh process, without the address-space limit.
+
+        Returns
+        -------
+        ProcessPoolExecutor
+            The new pool.
+
+        """
+        # Workers share the parent's resource tracker only if it runs before they are forked; one
+        # of their own would unlink the shared-memory segments they hand over when they exit.
+        resource_tracker.ensure_running()
+        memory_limit = None if dedicated else self._worker_memory_limit
+        if not session and memory_limit is None:
+            return ProcessPoolExecutor(workers, max_tasks_per_child=1 if dedicated else self._max_tasks_per_worker)
+        return ProcessPoolExecutor(
+            workers,
+            initializer=init_worker,
+            initargs=(self._providers_info, self._providers, self._raise_exc, memory_limit, session),
+            max_tasks_per_child=1 if dedicated else self._max_tasks_per_worker,
+        )
+
+    def _retire_pool(self, pool: Executor) -> None:
+        """Shut a pool down in the background, once its queued jobs are done.
+
+        Shutting a process pool down without waiting would orphan its queued jobs once workers
+        exit after `max_tasks_per_worker` jobs, and races its manager thread, which replaces such
+        workers after the pool has dropped its process table. Waiting in a thread that
+        :meth:`close` joins avoids both without blocking the dispatch.
+
+        Parameters
+        ----------
+        pool : Executor
+            The pool to shut down.
+
+        """
+        self._start_thread(pool.shutdown)
+
+    def _replace_pool(self, old: Executor, workers: int, owned: bool, reason: str) -> tuple[Executor, bool]:
+        """Replace a broken or recycled process pool; the old one exits once its queued jobs are done.
+
+        Parameters
+        ----------
+        old : Executor
+            The pool to replace.
+        workers : int
+            Number of worker processes of the new pool.
+        owned : bool
+            Whether the old pool belongs to the dispatch rather than to the session.
+        reason : str
+            Why the pool is replaced, for the log.
+
+        Returns
+        -------
+        tuple[Executor, bool]
+            The new pool and whether it belongs to the dispatch. A session pool already
+            replaced by another dispatch is reused; if the session was closed in the
+            meantime, the dispatch gets a pool of its own.
+
+        """
+        self._retire_pool(old)
+        with self._lock:
+            session = self._pools.get("processes")
+            if not owned and session is not None:
+                if session[0] is old:
+                    self._pools["processes"] = (self._new_process_pool(session[1], session=True), session[1])
+                    logger.warning("%s; the session process pool was replaced.", reason)
+                return self._pools["processes"][0], False
+        if not owned:
+            self._metrics.add("quantum_executor_pool_workers", workers)
+        logger.warning("%s; the process pool was replaced.", reason)
+        return self._new_process_pool(workers), True
+
+    def start(self, max_workers: int | None = None, max_threads: int | None = None) -> "QuantumExecutor":
+        """Start a session with long-lived worker pools.
+
+        Until :meth:`close` is called, parallel dispatches reuse a process pool and a
+        thread pool instead of creating them each time, and worker processes build
+        their VirtualProvider only once. Calling it on a started executor does nothing.
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            Number of worker processes. Defaults to the constructor's `max_workers`,
+            or the number of CPUs.
+        max_threads : int, optional
+            Number of threads. Defaults to the constructor's `max_threads`.
+
+        Returns
+        -------
+        QuantumExecutor
+            The executor itself.
+
+        """
+        with self._lock:
+            if self._pools:
+                return self
+            workers = max_workers or self._default_workers("processes")
+            threads = max_threads or self._default_workers("threads")
+            self._pools = {
+                "processes": (self._new_process_pool(workers, session=True), workers),
+                "threads": (ThreadPoolExecutor(threads, thread_name_prefix="quantum-executor"), threads),
+            }
+        self._metrics.add("quantum_executor_pool_workers", workers + threads)
+        logger.info("Session started with %d processes and %d threads.", workers, threads)
+        return self
+
+    def close(self, wait: bool = True) -> None:
+        """Close the session and release its worker pool.
+
+        Parameters
+        ----------
+        wait : bool, optional
+            If True, first wait for every dispatch still running in the background
+            (including non-blocking ones) and for the pool to shut down. If False,
+            jobs not yet started are cancelled and reported as errors.
+
+        """
+        with self._lock:
+            pools, self._pools = self._pools, {}
+            threads, self._threads = self._threads, []
+        while wait and threads:
+            for thread in threads:
+                thread.join()
+            # The joined threads may have started others, such as those retiring pools.
+            with self._lock:
+                threads, self._threads = self._threads, []
+        for pool, workers in pools.values():
+            pool.shutdown(wait=wait, cancel_futures=not wait)
+            self._metrics.add("quantum_executor_pool_workers", -workers)
+        if pools:
+            logger.info("Session closed.")
+
+    def __enter__(self) -> "QuantumExecutor":
+        """Start a session; see :meth:`start`.
+
+        Returns
+        -------
+        QuantumExecutor
+            The started executor.
+
+        """
+        return self.start()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the session, waiting for pending dispatches; see :meth:`close`.
+
+        Parameters
+        ----------
+        exc_type : type[BaseException] or None
+            The exception type, if the block raised.
+        exc_value : BaseException or None
+            The exception, if the block raised.
+        traceback : TracebackType or None
+            The traceback, if the block raised.
+
+        """
+        self.close()
+
+    def estimate_dispatch(
+        self,
+        dispatch: Union[Dispatch, "DispatchDict"],
+        multiprocess: bool = True,
+        max_workers: int | None = None,
+    ) -> dict[str, Any]:
+        """Predict the cost of running a dispatch without executing it.
+
+        Job run times come from the executor's cost model, calibrated by the runtime
+        history of previously executed jobs. The wall time assumes jobs are packed
+        longest-first onto the worker processes; concurrency limits are not modelled.
+
+        Parameters
+        ----------
+        dispatch : Dispatch or DispatchDict
+            Jobs to estimate.
+        multiprocess : bool, optional
+            If True, estimate a run on a process pool; otherwise a sequential run.
+        max_workers : int, optional
+            Override for max parallel processes.
+
+        Returns
+        -------
+        Dict[str, Any]
+            A dictionary with keys:
+            - "jobs": number of jobs,
+            - "max_workers": number of parallel workers assumed,
+            - "wall_time": predicted elapsed seconds,
+            - "total_time": sum of predicted job run times in seconds,
+            - "backend_load": provider → backend → predicted seconds of work,
+            - "peak_memory": predicted peak memory of the running jobs in bytes,
+            - "calibrated": whether measured runtimes were available.
+
+        """
+        if not isinstance(dispatch, Dispatch):
+            dispatch = Dispatch(dispatch)
+        workers = (max_workers or self._max_workers or os.cpu_count() or 1) if multiprocess else 1
+
+        costs: list[float] = []
+        memories: list[int] = []
+        backend_load: dict[str, dict[str, float]] = {}
+        for prov, back, job in dispatch.all_jobs():
+            cost = self._cost_model.estimate(prov, back, job)
+            costs.append(cost)
+            memories.append(self._cost_model.estimate_memory(prov, back, job))
+            load = backend_load.setdefault(prov, {})
+            load[back] = load.get(back, 0.0) + cost
+
+        _, loads = lpt_schedule(costs, workers)
+        history = self._cost_model.history
+        return {
+            "jobs": len(costs),
+            "max_workers": workers,
+            "wall_time": max(loads, default=0.0),
+            "total_time": sum(costs),
+            "backend_load": backend_load,
+            "peak_memory": sum(sorted(memories, reverse=True)[:workers]),
+            "calibrated": history is not None and history.overall_seconds_per_cost() is not None,
+        }
+
+    def _record_runtime(
+        self,
+        provider_name: str,
+        backend_name: str,
+        job: Job,
+        result: Any,  # noqa: ANN401
+        seconds: float,
+    ) -> None:
+        """Feed the measured runtime of a successful job into the cost model.
+
+        Parameters
+        ----------
+        provider_name : str
+            The provider the job ran on.
+        backend_name : str
+            The backend the job ran on.
+        job : Job
+            The finished job.
+        result : Any
+            The job result; error results are not recorded.
+        seconds : float
+            The measured run time.
+
+        """
+        if isinstance(result, dict) and "error" in result:
+            return
+        try:
+            self._cost_model.observe(provider_name, backend_name, job, seconds)
+        except Exception as e:  # pylint: disable=broad-except
+            logger.warning("Unable to record runtime of Job %s: %s", job.id, e)
+
+    def _save_history(self) -> None:
+        """Persist the runtime history if a history path was configured."""
+        if self._history_path is None:
+            return
+        try:
+            self._history.save(self._history_path)
+        except OSError as e:
+            logger.warning("Unable to save runtime history to '%s': %s", self._history_path, e)
+
     def get_split_policy(self, name: str) -> Callable[..., Any]:
         """Get a split policy by name.
 
@@ -535,7 +1930,7 @@ class QuantumExecutor:
 
         """
         try:
-            p = self._policies[name]["split"]
+            p: Callable[..., Any] = self._policies[name]["split"]
             if not callable(p):
                 raise KeyError(f"Split policy '{name}' not found.")
             return p
@@ -562,7 +1957,7 @@ class QuantumExecutor:
 
         """
         try:
-            p = self._policies[name]["merge"]
+            p: Callable[..., Any] = self._policies[name]["merge"]
             if not callable(p):
                 raise KeyError(f"Merge policy '{name}' not found.")
             return p
@@ -574,6 +1969,8 @@ class QuantumExecutor:
         name: str,
         split_policy: Callable[..., Any] | None = None,
         merge_policy: Callable[..., Any] | None = None,
+        split_many: Callable[..., Any] | None = None,
+        stateless: bool = False,
     ) -> None:
         """Dynamically add or update a policy (split and/or merge).
 
@@ -585,11 +1982,27 @@ class QuantumExecutor:
             Split function.
         merge_policy : Callable[..., Any], optional
             Merge function.
+        split_many : Callable[..., Any], optional
+            Batch split function, used by :meth:`generate_dispatch` for several circuits.
+            Requires `split_policy`.
+        stateless : bool, optional
+            Declare that the split policy does not update its split data, so that each circuit
+            is split independently of the others and :meth:`generate_dispatch` may split
+            circuits in parallel. Requires `split_policy`.
+            Defaults to False.
 
         """
-        entry: dict[str, Callable[..., Any]] = {}
+        entry: dict[str, Any] = {}
+        if split_many and not split_policy:
+            raise ValueError("split_many requires a split_policy.")
+        if stateless and not split_policy:
+            raise ValueError("stateless requires a split_policy.")
         if split_policy:
             entry["split"] = split_policy
+        if split_many:
+            entry["split_many"] = split_many
+        if stateless:
+            entry["stateless"] = True
         if merge_policy:
             entry["merge"] = merge_policy
         if not entry:
@@ -624,6 +2037,42 @@ class QuantumExecutor:
         """
         return list(self._policies.keys())
 
+    @property
+    def runtime_history(self) -> RuntimeHistory:
+        """Get the runtime history of executed jobs.
+
+        Returns
+        -------
+        RuntimeHistory
+            The history of measured job runtimes.
+
+        """
+        return self._history
+
+    @property
+    def cost_model(self) -> CostModel:
+        """Get the cost model used to order jobs.
+
+        Returns
+        -------
+        CostModel
+            The cost model instance.
+
+        """
+        return self._cost_model
+
+    @property
+    def metrics(self) -> MetricsRegistry | NullMetrics:
+        """Get the metrics registry the executor reports to.
+
+        Returns
+        -------
+        MetricsRegistry or NullMetrics
+            The registry given to the constructor, or a no-op sink if metrics are disabled.
+
+        """
+        return self._metrics
+
     @property
     def virtual_provider(self) -> VirtualProvider:
         """Get the virtual provider.
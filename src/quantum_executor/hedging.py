@@ -0,0 +1,208 @@
+"""Hedge slow jobs by running a duplicate once they exceed a latency percentile.
+
+A backend's queue occasionally stalls one job far beyond the others. With hedging,
+a job still unfinished after the given percentile of its backend's recent latencies
+is submitted a second time, possibly to an equivalent backend; whichever copy
+succeeds first is kept and the other is cancelled or discarded.
+"""
+
+import math
+import statistics
+import threading
+from collections import deque
+from collections.abc import Iterable
+from collections.abc import Mapping
+
+DEFAULT_WINDOW = 200
+
+
+class HedgePolicy:  # pylint: disable=too-many-instance-attributes
+    """Decide when a running job is duplicated, and where.
+
+    Latencies are measured from submission to result, per (provider, backend), over
+    the last `window` jobs that succeeded. The policy keeps them across dispatches, so
+    an executor reusing the same policy hedges from its first jobs on.
+
+    Parameters
+    ----------
+    percentile : float, optional
+        Latency percentile, between 0 and 100, after which a job is hedged. Defaults to 95.
+    min_samples : int, optional
+        Number of latencies needed before the percentile is trusted. Defaults to 10.
+    delay : float, optional
+        Deadline in seconds used until `min_samples` latencies are known. Defaults to
+        no hedging until then.
+    max_ratio : float, optional
+        Maximum fraction of a dispatch's jobs that may be hedged, bounding the extra
+        load. Defaults to 0.1.
+    alternates : Dict[str, Dict[str, Tuple[str, str]]], optional
+        Provider → backend → (provider, backend) running the duplicates of its jobs.
+        Backends not listed are hedged on another backend of the same provider in the
+        dispatch, or on themselves if there is none.
+    window : int, optional
+        Number of recent latencies kept per backend. Defaults to 200.
+
+    Examples
+    --------
+    >>> policy = HedgePolicy(percentile=90, alternates={"ionq": {"qpu.aria-1": ("ionq", "qpu.forte-1")}})
+    >>> executor.run_dispatch(dispatch, execution_mode="threads", hedge_policy=policy)
+
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments too-many-positional-arguments
+        self,
+        percentile: float = 95.0,
+        min_samples: int = 10,
+        delay: float | None = None,
+        max_ratio: float = 0.1,
+        alternates: dict[str, dict[str, tuple[str, str]]] | None = None,
+        window: int = DEFAULT_WINDOW,
+    ) -> None:
+        """Initialize the HedgePolicy.
+
+        Parameters
+        ----------
+        percentile : float, optional
+            Latency percentile, between 0 and 100, after which a job is hedged.
+        min_samples : int, optional
+            Number of latencies needed before the percentile is trusted.
+        delay : float, optional
+            Deadline in seconds used until `min_samples` latencies are known.
+        max_ratio : float, optional
+            Maximum fraction of a dispatch's jobs that may be hedged.
+        alternates : Dict[str, Dict[str, Tuple[str, str]]], optional
+            Provider → backend → (provider, backend) running the duplicates of its jobs.
+        window : int, optional
+            Number of recent latencies kept per backend.
+
+        Raises
+        ------
+        ValueError
+            If a parameter is out of range.
+
+        """
+        if not 0 < percentile <= 100:
+            raise ValueError("percentile must be in (0, 100].")
+        if min_samples < 1 or window < min_samples:
+            raise ValueError("min_samples must be at least 1 and no larger than window.")
+        if delay is not None and delay < 0:
+            raise ValueError("delay must be non-negative.")
+        if not 0 <= max_ratio <= 1:
+            raise ValueError("max_ratio must be between 0 and 1.")
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.delay = delay
+        self.max_ratio = max_ratio
+        self.alternates = alternates or {}
+        self.window = window
+        self._latencies: dict[tuple[str, str], deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """Return a string representation of the HedgePolicy.
+
+        Returns
+        -------
+        str
+            Includes the percentile, the fallback delay and the hedging budget.
+
+        """
+        return f"HedgePolicy(percentile={self.percentile}, delay={self.delay}, max_ratio={self.max_ratio})"
+
+    def observe(self, provider_name: str, backend_name: str, latency: float) -> None:
+        """Record the latency of a job that succeeded.
+
+        Parameters
+        ----------
+        provider_name : str
+            The provider that ran the job.
+        backend_name : str
+            The backend that ran the job.
+        latency : float
+            Seconds from submission to result.
+
+        """
+        with self._lock:
+            samples = self._latencies.get((provider_name, backend_name))
+            if samples is None:
+                samples = self._latencies[(provider_name, backend_name)] = deque(maxlen=self.window)
+            samples.append(latency)
+
+    def deadline(self, provider_name: str, backend_name: str) -> float | None:
+        """Return after how long a job on a backend is hedged.
+
+        Parameters
+        ----------
+        provider_name : str
+            The provider of the job.
+        backend_name : str
+            The backend of the job.
+
+        Returns
+        -------
+        float or None
+            Seconds after submission, or None if the job is not hedged.
+
+        """
+        with self._lock:
+            samples = sorted(self._latencies.get((provider_name, backend_name), ()))
+        if len(samples) < self.min_samples:
+            return self.delay
+        # Nearest-rank percentile.
+        return samples[max(0, math.ceil(self.percentile / 100 * len(samples)) - 1)]
+
+    def alternate(
+        self, provider_name: str, backend_name: str, backends: Mapping[str, Iterable[str]] | None = None
+    ) -> tuple[str, str]:
+        """Return where the duplicate of a job on a backend runs.
+
+        A configured alternate wins. Otherwise the duplicate goes to another backend of
+        the same provider among `backends`, the one with the lowest median latency
+        measured so far, or the first one listed if none was measured. The job's own
+        backend is used only when its provider has no other backend.
+
+        Parameters
+        ----------
+        provider_name : str
+            The provider of the job.
+        backend_name : str
+            The backend of the job.
+        backends : Mapping[str, Iterable[str]], optional
+            Provider → backends the duplicate may run on, usually those of the dispatch.
+
+        Returns
+        -------
+        Tuple[str, str]
+            The (provider, backend) of the duplicate.
+
+        """
+        configured = self.alternates.get(provider_name, {}).get(backend_name)
+        if configured is not None:
+            return configured
+        candidates = [name for name in (backends or {}).get(provider_name, ()) if name != backend_name]
+        if not candidates:
+            return provider_name, backend_name
+        with self._lock:
+            medians = {
+                name: statistics.median(self._latencies[(provider_name, name)])
+                for name in candidates
+                if self._latencies.get((provider_name, name))
+            }
+        # Measured backends first, fastest first; min keeps the listing order among ties.
+        return provider_name, min(candidates, key=lambda name: (name not in medians, medians.get(name, 0.0)))
+
+    def budget(self, num_jobs: int) -> int:
+        """Return how many jobs of a dispatch may be hedged.
+
+        Parameters
+        ----------
+        num_jobs : int
+            Number of jobs in the dispatch.
+
+        Returns
+        -------
+        int
+            The maximum number of hedged jobs.
+
+        """
+        return math.ceil(self.max_ratio * num_jobs)
@@ -1,25 +1,142 @@
 """Module with helper function to execute a single quantum job."""
 
+import importlib.util
 import logging
+import os
+import sys
+import threading
+from collections.abc import Callable
+from collections.abc import Hashable
+from collections.abc import Mapping
+from collections.abc import Sequence
+from pathlib import Path
+from types import ModuleType
 from typing import Any
 
 from qbraid import transpile  # type: ignore
 
+from quantum_executor.cancellation import CANCELLED_ERROR
+from quantum_executor.cancellation import CancelFlag
+from quantum_executor.cancellation import CancelScope
+from quantum_executor.cancellation import cancel_job
+from quantum_executor.dispatch import Dispatch
+from quantum_executor.dispatch import FrozenConfig
+from quantum_executor.dispatch import Job
+from quantum_executor.shared_result import DEFAULT_SHARED_MEMORY_THRESHOLD
+from quantum_executor.shared_result import share_result
+from quantum_executor.timing import Timings
+from quantum_executor.timing import WorkerInfo
+from quantum_executor.timing import current_worker
+from quantum_executor.timing import record_phase
 from quantum_executor.virtual_provider import VirtualProvider
 
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None  # type: ignore[assignment]
+
 ResultData = dict[str, Any]
 
+# VirtualProvider built once by `init_worker` in the processes of a long-lived pool.
+_WORKER_STATE: dict[str, VirtualProvider] = {}
+
+# (source file, function name) from which a worker process loads a policy function.
+PolicyReference = tuple[str, str]
+# Policy modules loaded by a worker process, by source file.
+_POLICY_MODULES: dict[str, ModuleType] = {}
+
+
+def init_worker(
+    providers_info: dict[str, dict[str, Any]] | None = None,
+    providers: list[str] | None = None,
+    raise_exc: bool = False,
+    memory_limit: int | None = None,
+    build_provider: bool = True,
+) -> None:
+    """Initialize a worker process.
+
+    Optionally caps the worker's address space, then builds the VirtualProvider
+    once, so the jobs run by a long-lived worker skip the "provider_init" phase.
+    If it cannot be built, jobs fall back to building their own.
+
+    Parameters
+    ----------
+    providers_info : Dict[str, Dict[str, Any]], optional
+        Provider configuration used to build the worker's VirtualProvider.
+    providers : List[str], optional
+        Provider names to initialize in the worker's VirtualProvider.
+    raise_exc : bool, optional
+        If True, provider initialization errors are raised by the VirtualProvider.
+    memory_limit : int, optional
+        Maximum address space of the worker in bytes. Allocations beyond it raise
+        MemoryError in the worker instead of exhausting the machine. Ignored where
+        the platform has no `resource` module.
+    build_provider : bool, optional
+        If False, only apply the memory limit.
+
+    """
+    if memory_limit is not None:
+        _limit_address_space(memory_limit)
+    if not build_provider:
+        return
+    try:
+        _WORKER_STATE["virtual_provider"] = VirtualProvider(
+            providers_info=providers_info, include=providers, raise_exc=raise_exc
+        )
+    except Exception as e:  # pylint: disable=broad-except
+        logging.getLogger(__name__).error("[ChildProcess] Worker initialization failed: %s", e)
+
+
+def _limit_address_space(limit: int) -> None:
+    """Cap the address space of the current process.
 
-def run_single_job_static(  # pylint: disable=too-many-positional-arguments too-many-arguments  too-many-locals
+    Parameters
+    ----------
+    limit : int
+        Maximum address space in bytes; never raised above the current hard limit.
+
+    """
+    if resource is None:  # pragma: no cover
+        logging.getLogger(__name__).warning("[ChildProcess] Worker memory limits are not supported on this platform.")
+        return
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+def worker_rss() -> int | None:
+    """Return the resident set size of the current process.
+
+    Returns
+    -------
+    int or None
+        The current RSS in bytes on Linux, the peak RSS on other Unix systems,
+        or None if it cannot be measured.
+
+    """
+    try:
+        return int(Path("/proc/self/statm").read_text(encoding="ascii").split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        if resource is None:  # pragma: no cover
+            return None
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return int(peak if sys.platform == "darwin" else peak * 1024)
+
+
+def run_single_job_static(  # pylint: disable=too-many-positional-arguments too-many-arguments  too-many-locals too-many-branches
     provider_name: str,
     backend_name: str,
     circuit: Any,  # noqa: ANN401
     shots: int,
-    config: dict[str, Any] | None = None,
+    config: Mapping[str, Any] | None = None,
     providers_info: dict[str, dict[str, Any]] | None = None,
     providers: list[str] | None = None,
     raise_exc: bool = True,
     virtual_provider: VirtualProvider | None = None,
+    timings: Timings | None = None,
+    timeout: float | None = None,
+    cancel_scope: CancelScope | None = None,
 ) -> "ResultData":
     """Worker function to execute a single quantum job.
 
@@ -33,7 +150,7 @@ def run_single_job_static(  # pylint: disable=too-many-positional-arguments too-
         The quantum circuit to be executed.
     shots : int
         Number of execution shots.
-    config : Dict[str, Any], optional
+    config : Mapping[str, Any], optional
         Additional job configuration parameters.
     providers_info : Dict[str, Dict[str, Any]], optional
         A dictionary mapping provider names to their respective API keys or configuration.
@@ -56,11 +173,21 @@ def run_single_job_static(  # pylint: disable=too-many-positional-arguments too-
         If True, exceptions are re-raised; otherwise, they are logged and returned as error data.
     virtual_provider : Optional[VirtualProvider], optional
         An optional instance of VirtualProvider. If None, a new one is created.
+    timings : Timings, optional
+        If given, updated in place with the monotonic ``(start, end)`` time of each phase:
+        "provider_init", "get_backend", "transpile", "submit", "execute" and "convert".
+    timeout : float, optional
+        Seconds the job may run once submitted before it is cancelled. A ``"timeout"``
+        entry in `config` takes precedence; it is not passed on to the provider.
+    cancel_scope : CancelScope, optional
+        Scope tracking the submitted job, so that cancelling it cancels the job.
 
     Returns
     -------
     ResultData
-        The result counts from the job execution or an error dictionary.
+        The result counts from the job execution or an error dictionary. Jobs that timed
+        out or were cancelled return ``{"error": ..., "cancelled": True}``, even if
+        `raise_exc` is True.
 
     """
     logger = logging.getLogger(__name__)
@@ -72,30 +199,60 @@ def run_single_job_static(  # pylint: disable=too-many-positional-arguments too-
     )
 
     if virtual_provider is None:
-        local_virtual_provider = VirtualProvider(providers_info=providers_info, include=providers, raise_exc=raise_exc)
+        with record_phase(timings, "provider_init"):
+            local_virtual_provider = VirtualProvider(
+                providers_info=providers_info, include=providers, raise_exc=raise_exc
+            )
     else:
         local_virtual_provider = virtual_provider
 
-    provider_backend = local_virtual_provider.get_backend(provider_name, backend_name, online=True)
+    with record_phase(timings, "get_backend"):
+        provider_backend = local_virtual_provider.get_backend(provider_name, backend_name, online=True)
 
     qc = circuit
     # Transpile step if needed (e.g., for IonQ)
     if provider_name.lower() == "ionq":
-        qc = transpile(qc, "qiskit").remove_final_measurements(inplace=False)
+        with record_phase(timings, "transpile"):
+            qc = transpile(qc, "qiskit").remove_final_measurements(inplace=False)
 
-    if config is None:
-        config = {}
+    # Providers get plain dicts and lists; the values inside them are still shared with the job.
+    config = config.thaw(deep=False) if isinstance(config, FrozenConfig) else dict(config or {})
+    timeout = config.pop("timeout", timeout)
+    if cancel_scope is not None and cancel_scope.cancelled:
+        return {"error": CANCELLED_ERROR, "cancelled": True}
 
     logger.debug("[ChildProcess] Configuration: %s", config)
+    expired = threading.Event()
+    timer = None
+    job = None
     try:
-        job = provider_backend.run(qc, shots=shots, **config)
+        with record_phase(timings, "submit"):
+            job = provider_backend.run(qc, shots=shots, **config)
 
         if isinstance(job, list):
             job = job[0]
 
-        result = job.result()
-        return result.data.get_counts()  # type: ignore
+        if timeout is not None:
+
+            def _expire() -> None:
+                expired.set()
+                cancel_job(job)
+
+            timer = threading.Timer(timeout, _expire)
+            timer.daemon = True
+            timer.start()
+        if cancel_scope is not None:
+            cancel_scope.add(job)
+        # Waiting on the result covers provider-side queueing and the execution itself.
+        with record_phase(timings, "execute"):
+            result = job.result()
+        if expired.is_set() or (cancel_scope is not None and cancel_scope.cancelled):
+            return _interrupted(timeout, expired)
+        with record_phase(timings, "convert"):
+            return result.data.get_counts()  # type: ignore
     except Exception as exc:  # pylint: disable=broad-except
+        if expired.is_set() or (cancel_scope is not None and cancel_scope.cancelled):
+            return _interrupted(timeout, expired)
         logger.error(
             "[ChildProcess] Error while executing job on %s/%s: %s",
             provider_name,
@@ -105,3 +262,350 @@ def run_single_job_static(  # pylint: disable=too-many-positional-arguments too-
         if raise_exc:
             raise
         return {"error": str(exc)}
+    finally:
+        if timer is not None:
+            timer.cancel()
+        if cancel_scope is not None and job is not None:
+            cancel_scope.discard(job)
+
+
+def _interrupted(timeout: float | None, expired: threading.Event) -> "ResultData":
+    """Build the result of a job that timed out or was cancelled.
+
+    Parameters
+    ----------
+    timeout : float or None
+        The job timeout.
+    expired : threading.Event
+        Set if the timeout expired.
+
+    Returns
+    -------
+    ResultData
+        An error dictionary flagged as cancelled.
+
+    """
+    error = f"Job timed out after {timeout} s and was cancelled." if expired.is_set() else CANCELLED_ERROR
+    return {"error": error, "cancelled": True}
+
+
+def run_job_in_worker(  # pylint: disable=too-many-positional-arguments too-many-arguments too-many-locals
+    provider_name: str,
+    backend_name: str,
+    circuit: Any,  # noqa: ANN401
+    shots: int,
+    config: Mapping[str, Any] | None = None,
+    providers_info: dict[str, dict[str, Any]] | None = None,
+    providers: list[str] | None = None,
+    raise_exc: bool = True,
+    shared_memory_threshold: int | None = DEFAULT_SHARED_MEMORY_THRESHOLD,
+    timeout: float | None = None,
+    cancel_flag: CancelFlag | None = None,
+) -> tuple[Any, Timings, WorkerInfo, int | None]:
+    """Execute a single quantum job inside a worker process.
+
+    Wraps :func:`run_single_job_static`, records the timing of each phase and
+    moves large results into shared memory so they are not copied through the
+    process pool result pipe.
+
+    Parameters
+    ----------
+    provider_name : str
+        Name of the quantum provider.
+    backend_name : str
+        The specific backend name for the provider.
+    circuit : Any
+        The quantum circuit to be executed.
+    shots : int
+        Number of execution shots.
+    config : Mapping[str, Any], optional
+        Additional job configuration parameters.
+    providers_info : Dict[str, Dict[str, Any]], optional
+        Provider configuration used to build the worker's VirtualProvider.
+    providers : List[str], optional
+        Provider names to initialize in the worker's VirtualProvider.
+    raise_exc : bool, optional
+        If True, exceptions are re-raised; otherwise, they are returned as error data.
+    shared_memory_threshold : int or None, optional
+        Serialized size in bytes from which the result is returned through shared memory.
+        If None, results are always returned through the pipe.
+    timeout : float, optional
+        Seconds the job may run once submitted before it is cancelled.
+    cancel_flag : CancelFlag, optional
+        Flag through which the executor cancels the job, e.g. when its hedge won.
+
+    Returns
+    -------
+    tuple[ResultData or SharedResultHandle, Timings, WorkerInfo, int or None]
+        The result data (or a handle to it if it was moved into shared memory),
+        the phase timings (including "serialize" for the shared-memory check),
+        the identity of the worker and its resident set size in bytes (see :func:`worker_rss`).
+
+    """
+    timings: Timings = {}
+    scope = None
+    watching = threading.Event()
+    if cancel_flag is not None:
+        scope = CancelScope()
+        watching = cancel_flag.watch(scope)
+    try:
+        data = run_single_job_static(
+            provider_name,
+            backend_name,
+            circuit,
+            shots,
+            config,
+            providers_info,
+            providers,
+            raise_exc,
+            _WORKER_STATE.get("virtual_provider"),
+            timings,
+            timeout,
+            scope,
+        )
+    finally:
+        watching.set()
+        if cancel_flag is not None:
+            cancel_flag.close()
+    with record_phase(timings, "serialize"):
+        value = share_result(data, shared_memory_threshold)
+    return value, timings, current_worker(), worker_rss()
+
+
+def run_job_in_thread(  # pylint: disable=too-many-positional-arguments too-many-arguments
+    provider_name: str,
+    backend_name: str,
+    circuit: Any,  # noqa: ANN401
+    shots: int,
+    config: Mapping[str, Any] | None,
+    virtual_provider: VirtualProvider,
+    raise_exc: bool = True,
+    timeout: float | None = None,
+    cancel_scope: CancelScope | None = None,
+) -> tuple[ResultData, Timings, WorkerInfo, None]:
+    """Execute a single quantum job in a thread of the calling process.
+
+    Unlike :func:`run_job_in_worker`, the job reuses the caller's VirtualProvider
+    and its result is returned as is, since nothing crosses a process boundary.
+
+    Parameters
+    ----------
+    provider_name : str
+        Name of the quantum provider.
+    backend_name : str
+        The specific backend name for the provider.
+    circuit : Any
+        The quantum circuit to be executed.
+    shots : int
+        Number of execution shots.
+    config : Mapping[str, Any] or None
+        Additional job configuration parameters.
+    virtual_provider : VirtualProvider
+        The VirtualProvider shared by all threads.
+    raise_exc : bool, optional
+        If True, exceptions are re-raised; otherwise, they are returned as error data.
+    timeout : float, optional
+        Seconds the job may run once submitted before it is cancelled.
+    cancel_scope : CancelScope, optional
+        Scope tracking the submitted job, so that cancelling it cancels the job.
+
+    Returns
+    -------
+    tuple[ResultData, Timings, WorkerInfo, None]
+        The result data, the phase timings, the identity of the thread and, unlike
+        :func:`run_job_in_worker`, no memory usage since the thread shares the caller's.
+
+    """
+    timings: Timings = {}
+    data = run_single_job_static(
+        provider_name,
+        backend_name,
+        circuit,
+        shots,
+        config,
+        raise_exc=raise_exc,
+        virtual_provider=virtual_provider,
+        timings=timings,
+        timeout=timeout,
+        cancel_scope=cancel_scope,
+    )
+    return data, timings, current_worker(), None
+
+
+def policy_reference(func: Callable[..., Any]) -> PolicyReference:
+    """Return the reference from which a worker process can load a policy function.
+
+    Policies loaded from the policies folder are not importable by name, so they
+    cannot be pickled; worker processes load them from their source file instead.
+
+    Parameters
+    ----------
+    func : Callable[..., Any]
+        The policy function.
+
+    Returns
+    -------
+    Tuple[str, str]
+        The source file of the function and its name.
+
+    Raises
+    ------
+    ValueError
+        If the function is not defined at the top level of a source file.
+
+    """
+    code = getattr(func, "__code__", None)
+    if code is None or func.__qualname__ != func.__name__ or not Path(code.co_filename).is_file():
+        raise ValueError(f"Policy function {func!r} is not defined at the top level of a file.")
+    return code.co_filename, func.__name__
+
+
+def _load_policy(reference: PolicyReference) -> Callable[..., Any]:
+    """Load a policy function in a worker process, loading its module once.
+
+    Parameters
+    ----------
+    reference : Tuple[str, str]
+        The source file of the function and its name.
+
+    Returns
+    -------
+    Callable[..., Any]
+        The policy function.
+
+    Raises
+    ------
+    ImportError
+        If the source file cannot be loaded.
+
+    """
+    path, name = reference
+    module = _POLICY_MODULES.get(path)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(f"quantum_executor_policy_{Path(path).stem}", path)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Cannot load policy module from '{path}'.")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _POLICY_MODULES[path] = module
+    return getattr(module, name)  # type: ignore[no-any-return]
+
+
+def split_circuits(  # pylint: disable=too-many-arguments too-many-positional-arguments
+    split: Callable[..., Any],
+    split_many: Callable[..., Any] | None,
+    circuits: Sequence[Any],
+    shots_list: Sequence[int],
+    backends: dict[str, list[str]],
+    virtual_provider: VirtualProvider | None,
+    split_data: Any,  # noqa: ANN401
+    split_key: Hashable = None,
+    start: int = 0,
+) -> Dispatch:
+    """Split a chunk of circuits with a stateless split policy.
+
+    Parameters
+    ----------
+    split : Callable[..., Any]
+        The policy's split function.
+    split_many : Callable[..., Any] or None
+        The policy's batch split function, used instead of `split` if given.
+    circuits : Sequence[Any]
+        The circuits of the chunk.
+    shots_list : Sequence[int]
+        Number of shots of each circuit.
+    backends : Dict[str, List[str]]
+        Provider → list of backends.
+    virtual_provider : VirtualProvider or None
+        Passed on to the policy.
+    split_data : Any
+        Split data, passed to the policy for every circuit; changes to it are not kept.
+    split_key : Hashable, optional
+        Identifies the split the chunk belongs to, in the circuit keys of the jobs
+        (see :meth:`Dispatch.key_circuits`).
+    start : int, optional
+        Index of the first circuit of the chunk among the circuits of the split.
+
+    Returns
+    -------
+    Dispatch
+        The jobs of every circuit, in order.
+
+    """
+    dispatch: Dispatch
+    if split_many is not None:
+        dispatch, _ = split_many(circuits, shots_list, backends, virtual_provider, split_data)
+        dispatch.key_circuits(split_key, start)
+        return dispatch
+    dispatch = Dispatch()
+    for index, (circuit, shots) in enumerate(zip(circuits, shots_list, strict=True)):
+        part, _ = split(circuit, shots, backends, virtual_provider, split_data)
+        part.key_circuits(split_key, start, index)
+        dispatch.extend(part)
+    return dispatch
+
+
+def split_in_worker(  # pylint: disable=too-many-arguments too-many-positional-arguments
+    split: PolicyReference,
+    split_many: PolicyReference | None,
+    circuits: Sequence[Any],
+    shots_list: Sequence[int],
+    backends: dict[str, list[str]],
+    split_data: Any,  # noqa: ANN401
+    split_key: Hashable = None,
+    start: int = 0,
+    providers_info: dict[str, dict[str, Any]] | None = None,
+    providers: list[str] | None = None,
+    raise_exc: bool = False,
+) -> list[tuple[str, str, Job]]:
+    """Split a chunk of circuits with a stateless split policy inside a worker process.
+
+    Parameters
+    ----------
+    split : Tuple[str, str]
+        Reference to the policy's split function (see :func:`policy_reference`).
+    split_many : Tuple[str, str] or None
+        Reference to the policy's batch split function, if it has one.
+    circuits : Sequence[Any]
+        The circuits of the chunk.
+    shots_list : Sequence[int]
+        Number of shots of each circuit.
+    backends : Dict[str, List[str]]
+        Provider → list of backends.
+    split_data : Any
+        Split data, passed to the policy for every circuit.
+    split_key : Hashable, optional
+        Identifies the split the chunk belongs to, in the circuit keys of the jobs.
+    start : int, optional
+        Index of the first circuit of the chunk among the circuits of the split.
+    providers_info : Dict[str, Dict[str, Any]], optional
+        Provider configuration, used to build a VirtualProvider if the worker has none yet.
+    providers : List[str], optional
+        Provider names to initialize in that VirtualProvider.
+    raise_exc : bool, optional
+        If True, provider initialization errors are raised by the VirtualProvider.
+
+    Returns
+    -------
+    List[Tuple[str, str, Job]]
+        The (provider, backend, job) tuples of every circuit, in order.
+
+    """
+    virtual_provider = _WORKER_STATE.get("virtual_provider")
+    if virtual_provider is None:
+        # Kept for the next chunks this worker splits.
+        virtual_provider = _WORKER_STATE["virtual_provider"] = VirtualProvider(
+            providers_info=providers_info, include=providers, raise_exc=raise_exc
+        )
+    dispatch = split_circuits(
+        _load_policy(split),
+        _load_policy(split_many) if split_many is not None else None,
+        circuits,
+        shots_list,
+        backends,
+        virtual_provider,
+        split_data,
+        split_key,
+        start,
+    )
+    return list(dispatch.all_jobs())
@@ -0,0 +1,549 @@
+"""In-process metrics with a Prometheus text exporter.
+
+Components of the executor report counters, gauges and histograms to a metrics
+registry. By default they report to :data:`NULL_METRICS`, whose methods do
+nothing, so metrics cost nothing unless a :class:`MetricsRegistry` is passed in.
+The registry renders its samples in the Prometheus text exposition format and
+can optionally serve them over a local HTTP endpoint.
+"""
+
+import logging
+import math
+import threading
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from itertools import pairwise
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Upper bounds (in seconds) of the latency histogram buckets; remote jobs can take minutes.
+DEFAULT_BUCKETS: tuple[float, ...] = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+# Metrics reported by the executor: name -> (type, help).
+METRICS: dict[str, tuple[str, str]] = {
+    "quantum_executor_jobs_submitted_total": ("counter", "Jobs submitted for execution."),
+    "quantum_executor_jobs_completed_total": ("counter", "Jobs that finished with a result."),
+    "quantum_executor_jobs_failed_total": ("counter", "Jobs that finished with an error."),
+    "quantum_executor_jobs_cancelled_total": ("counter", "Jobs that timed out or were cancelled."),
+    "quantum_executor_jobs_in_flight": ("gauge", "Jobs submitted and not yet finished."),
+    "quantum_executor_job_duration_seconds": ("histogram", "Run time of finished jobs, excluding queueing."),
+    "quantum_executor_job_queue_seconds": ("histogram", "Time jobs spent waiting before they started running."),
+    "quantum_executor_pool_workers": ("gauge", "Worker processes and threads of the running pools."),
+    "quantum_executor_pool_busy_workers": ("gauge", "Worker processes and threads currently running a job."),
+    "quantum_executor_job_retries_total": ("counter", "Failed job attempts retried after a backoff."),
+    "quantum_executor_hedges_total": ("counter", "Slow jobs duplicated by the hedge policy."),
+    "quantum_executor_hedge_wins_total": ("counter", "Hedged jobs whose duplicate finished first."),
+    "quantum_executor_hedge_saved_seconds_total": ("counter", "Time by which winning duplicates beat the originals."),
+    "quantum_executor_hedge_losers_cancelled_total": ("counter", "Losing hedge copies cancelled on their provider."),
+    "quantum_executor_worker_crashes_total": ("counter", "Jobs interrupted by the death of their worker process."),
+    "quantum_executor_pool_recycles_total": ("counter", "Process pools recycled because a worker exceeded its memory."),
+    "quantum_executor_backend_lookups_total": ("counter", "Backend lookups by the VirtualProvider, by outcome."),
+    "quantum_executor_backend_lookup_seconds": ("histogram", "Time spent retrieving a backend from its provider."),
+    "quantum_executor_provider_init_failures_total": ("counter", "Providers that failed to initialize."),
+}
+
+LabelKey = tuple[tuple[str, str], ...]
+
+
+def _label_key(labels: dict[str, Any]) -> LabelKey:
+    """Turn label keyword arguments into a hashable, ordered key.
+
+    Parameters
+    ----------
+    labels : Dict[str, Any]
+        The label names and values.
+
+    Returns
+    -------
+    LabelKey
+        The labels sorted by name, with values converted to strings.
+
+    """
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _format_labels(key: LabelKey, extra: tuple[str, str] | None = None) -> str:
+    """Render a label set in the Prometheus text format.
+
+    Parameters
+    ----------
+    key : LabelKey
+        The labels of the sample.
+    extra : tuple[str, str], optional
+        An additional label appended last (e.g. the ``le`` bucket bound).
+
+    Returns
+    -------
+    str
+        ``{name="value",...}`` or an empty string if there are no labels.
+
+    """
+    pairs = [*key, extra] if extra is not None else list(key)
+    if not pairs:
+        return ""
+    escaped = (value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, value in pairs)
+    return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped, strict=True)) + "}"
+
+
+def _format_value(value: float) -> str:
+    """Render a sample value in the Prometheus text format.
+
+    Parameters
+    ----------
+    value : float
+        The value to render.
+
+    Returns
+    -------
+    str
+        The value, with integers written without a decimal point.
+
+    """
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+class NullMetrics:
+    """Metrics sink that discards everything; used when metrics are disabled.
+
+    Call sites that need extra work to compute a sample should check
+    :attr:`enabled` first.
+    """
+
+    enabled: bool = False
+
+    def inc(self, name: str, value: float = 1.0, /, **labels: Any) -> None:  # noqa: ANN401
+        """Increase a counter.
+
+        Parameters
+        ----------
+        name : str
+            The metric name.
+        value : float, optional
+            The amount to add.
+        **labels : Any
+            The label values of the sample.
+
+        """
+
+    def set(self, name: str, value: float, /, **labels: Any) -> None:  # noqa: ANN401
+        """Set a gauge.
+
+        Parameters
+        ----------
+        name : str
+            The metric name.
+        value : float
+            The new value.
+        **labels : Any
+            The label values of the sample.
+
+        """
+
+    def add(self, name: str, value: float, /, **labels: Any) -> None:  # noqa: ANN401
+        """Add to a gauge; `value` may be negative.
+
+        Parameters
+        ----------
+        name : str
+            The metric name.
+        value : float
+            The amount to add.
+        **labels : Any
+            The label values of the sample.
+
+        """
+
+    def observe(self, name: str, value: float, /, **labels: Any) -> None:  # noqa: ANN401
+        """Record an observation in a histogram.
+
+        Parameters
+        ----------
+        name : str
+            The metric name.
+        value : float
+            The observed value.
+        **labels : Any
+            The label values of the sample.
+
+        """
+
+    def render(self) -> str:
+        """Render all samples in the Prometheus text exposition format.
+
+        Returns
+        -------
+        str
+            Always empty.
+
+        """
+        return ""
+
+    def __repr__(self) -> str:
+        """Return a string representation of the sink.
+
+        Returns
+        -------
+        str
+            The class name.
+
+        """
+        return f"{type(self).__name__}()"
+
+
+NULL_METRICS = NullMetrics()
+
+
+class MetricsRegistry(NullMetrics):
+    """Thread-safe registry of counters, gauges and histograms.
+
+    Metrics are created on first use. Names listed in :data:`METRICS` (or declared
+    with :meth:`describe`) get their type and help text from there; other names
+    take the type implied by the first method used on them.
+
+    Parameters
+    ----------
+    buckets : tuple[float, ...], optional
+        Upper bounds of the histogram buckets, in increasing order.
+
+    Examples
+    --------
+    >>> metrics = MetricsRegistry()
+    >>> executor = QuantumExecutor(providers=["local_aer"], metrics=metrics)
+    >>> server = metrics.serve(port=9464)  # http://127.0.0.1:9464/metrics
+
+    """
+
+    enabled = True
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """Initialize an empty registry.
+
+        Parameters
+        ----------
+        buckets : tuple[float, ...], optional
+            Upper bounds of the histogram buckets, in increasing order.
+
+        Raises
+        ------
+        ValueError
+            If the bucket bounds are not strictly increasing.
+
+        """
+        if any(lower >= upper for lower, upper in pairwise(buckets)):
+            raise ValueError("Histogram buckets must be strictly increasing.")
+        self.buckets: tuple[float, ...] = tuple(buckets)
+        self._lock = threading.Lock()
+        self._descriptions: dict[str, tuple[str, str]] = dict(METRICS)
+        # name -> labels -> value (counters and gauges)
+        self._values: dict[str, dict[LabelKey, float]] = {}
+        # name -> labels -> [per-bucket counts..., +Inf count, sum]
+        self._histograms: dict[str, dict[LabelKey, list[float]]] = {}
+
+    def describe(self, name: str, kind: str, help_text: str) -> None:
+        """Declare the type and help text of a metric.
+
+        Parameters
+        ----------
+        name : str
+            The metric name.
+        kind : str
+            One of "counter", "gauge" or "histogram".
+        help_text : str
+            One-line description shown in the exposition.
+
+        Raises
+        ------
+        ValueError
+            If `kind` is not a known metric type.
+
+        """
+        if kind not in {"counter", "gauge", "histogram"}:
+            raise ValueError(f"Unknown metric type '{kind}'.")
+        with self._lock:
+            self._descriptions[name] = (kind, help_text)
+
+    def _declare(self, name: str, kind: str) -> None:
+        """Register the type of a metric on first use; the caller must hold the lock.
+
+        Parameters
+        ----------
+        name : str
+            The metric name.
+        kind : str
+            The metric type implied by the method used.
+
+        """
+        if name not in self._descriptions:
+            self._descriptions[name] = (kind, "")
+
+    def inc(self, name: str, value: float = 1.0, /, **labels: Any) -> None:  # noqa: ANN401
+        """Increase a counter.
+
+        Parameters
+        ----------
+        name : str
+            The metric name.
+        value : float, optional
+            The amount to add; must not be negative.
+        **labels : Any
+            The label values of the sample.
+
+        Raises
+        ------
+        ValueError
+            If `value` is negative.
+
+        """
+        if value < 0:
+            raise ValueError("Counters can only increase.")
+        key = _label_key(labels)
+        with self._lock:
+            self._declare(name, "counter")
+            samples = self._values.setdefault(name, {})
+            samples[key] = samples.get(key, 0.0) + value
+
+    def set(self, name: str, value: float, /, **labels: Any) -> None:  # noqa: ANN401
+        """Set a gauge.
+
+        Parameters
+        ----------
+        name : str
+            The metric name.
+        value : float
+            The new value.
+        **labels : Any
+            The label values of the sample.
+
+        """
+        key = _label_key(labels)
+        with self._lock:
+            self._declare(name, "gauge")
+            self._values.setdefault(name, {})[key] = value
+
+    def add(self, name: str, value: float, /, **labels: Any) -> None:  # noqa: ANN401
+        """Add to a gauge; `value` may be negative.
+
+        Parameters
+        ----------
+        name : str
+            The metric name.
+        value : float
+            The amount to add.
+        **labels : Any
+            The label values of the sample.
+
+        """
+        key = _label_key(labels)
+        with self._lock:
+            self._declare(name, "gauge")
+            samples = self._values.setdefault(name, {})
+            samples[key] = samples.get(key, 0.0) + value
+
+    def observe(self, name: str, value: float, /, **labels: Any) -> None:  # noqa: ANN401
+        """Record an observation in a histogram.
+
+        Parameters
+        ----------
+        name : str
+            The metric name.
+        value : float
+            The observed value.
+        **labels : Any
+            The label values of the sample.
+
+        """
+        key = _label_key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self._declare(name, "histogram")
+            samples = self._histograms.setdefault(name, {})
+            counts = samples.get(key)
+            if counts is None:
+                counts = samples[key] = [0.0] * (len(self.buckets) + 2)
+            counts[index] += 1
+            counts[-1] += value
+
+    def get(self, name: str, /, **labels: Any) -> float:  # noqa: ANN401
+        """Return the current value of a sample.
+
+        Parameters
+        ----------
+        name : str
+            The metric name.
+        **labels : Any
+            The label values of the sample.
+
+        Returns
+        -------
+        float
+            The counter or gauge value, or the number of observations of a histogram;
+            0 if the sample does not exist.
+
+        """
+        key = _label_key(labels)
+        with self._lock:
+            if name in self._histograms:
+                counts = self._histograms[name].get(key)
+                return sum(counts[:-1]) if counts is not None else 0.0
+            return self._values.get(name, {}).get(key, 0.0)
+
+    def render(self) -> str:
+        """Render all samples in the Prometheus text exposition format.
+
+        Returns
+        -------
+        str
+            The exposition, one ``# HELP``/``# TYPE`` block per metric.
+
+        """
+        lines: list[str] = []
+        with self._lock:
+            for name in sorted({*self._values, *self._histograms}):
+                kind, help_text = self._descriptions[name]
+                if help_text:
+                    lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+                for key, value in sorted(self._values.get(name, {}).items()):
+                    lines.append(f"{name}{_format_labels(key)} {_format_value(value)}")
+                for key, counts in sorted(self._histograms.get(name, {}).items()):
+                    cumulative = 0.0
+                    for bound, count in zip((*self.buckets, math.inf), counts[:-1], strict=True):
+                        cumulative += count
+                        le = ("le", _format_value(bound))
+                        lines.append(f"{name}_bucket{_format_labels(key, le)} {_format_value(cumulative)}")
+                    lines.append(f"{name}_sum{_format_labels(key)} {_format_value(counts[-1])}")
+                    lines.append(f"{name}_count{_format_labels(key)} {_format_value(cumulative)}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def serve(self, port: int = 0, host: str = "127.0.0.1") -> "MetricsServer":
+        """Expose the registry over HTTP in a background thread.
+
+        Parameters
+        ----------
+        port : int, optional
+            TCP port to listen on; 0 picks a free port.
+        host : str, optional
+            Interface to bind; defaults to the loopback interface only.
+
+        Returns
+        -------
+        MetricsServer
+            The running server; call :meth:`MetricsServer.close` to stop it.
+
+        """
+        return MetricsServer(self, port=port, host=host)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the registry.
+
+        Returns
+        -------
+        str
+            Includes the number of metrics with samples.
+
+        """
+        with self._lock:
+            return f"MetricsRegistry(metrics={len(self._values) + len(self._histograms)})"
+
+
+class MetricsServer:
+    """HTTP server answering ``GET /metrics`` with the samples of a registry.
+
+    Parameters
+    ----------
+    registry : MetricsRegistry
+        The registry to expose.
+    port : int, optional
+        TCP port to listen on; 0 picks a free port.
+    host : str, optional
+        Interface to bind.
+
+    """
+
+    def __init__(self, registry: MetricsRegistry, port: int = 0, host: str = "127.0.0.1") -> None:
+        """Start serving the registry in a daemon thread.
+
+        Parameters
+        ----------
+        registry : MetricsRegistry
+            The registry to expose.
+        port : int, optional
+            TCP port to listen on; 0 picks a free port.
+        host : str, optional
+            Interface to bind.
+
+        """
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802 # pylint: disable=invalid-name
+                """Serve the registry in the Prometheus text format."""
+                if self.path.split("?", 1)[0] not in {"/", "/metrics"}:
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:  # noqa: ANN401 # pylint: disable=redefined-builtin
+                logger.debug("Metrics request: " + format, *args)
+
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="metrics-server", daemon=True)
+        self._thread.start()
+        logger.info("Serving metrics on %s.", self.url)
+
+    @property
+    def port(self) -> int:
+        """Port the server listens on.
+
+        Returns
+        -------
+        int
+            The bound TCP port.
+
+        """
+        return int(self._server.server_address[1])
+
+    @property
+    def url(self) -> str:
+        """URL of the metrics endpoint.
+
+        Returns
+        -------
+        str
+            ``http://host:port/metrics``.
+
+        """
+        host = self._server.server_address[0]
+        if isinstance(host, bytes | bytearray):
+            host = host.decode()
+        return f"http://{host}:{self.port}/metrics"
+
+    def close(self) -> None:
+        """Stop the server and release its socket."""
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def __repr__(self) -> str:
+        """Return a string representation of the server.
+
+        Returns
+        -------
+        str
+            Includes the endpoint URL.
+
+        """
+        return f"MetricsServer(url={self.url})"
@@ -0,0 +1,319 @@
+"""An adaptive policy that gives each backend a share of the shots matching its measured speed.
+
+Backends whose speed is unknown first run a small pilot batch. Once the executor has
+passed the pilot results to :func:`observe`, the shots left over are allocated so that
+every backend is expected to finish at the same time: a backend measured to start after
+a queue latency ``L`` and to run ``r`` shots per second gets ``r * (T - L)`` shots.
+The measured rates are kept in ``policy_data["rates"]``, so passing the same split data
+to the next experiment skips the pilot.
+"""
+
+import math
+from collections.abc import Sequence
+from typing import Any
+
+from quantum_executor.dispatch import Dispatch
+from quantum_executor.virtual_provider import VirtualProvider
+
+# Fraction of the shots spent on the pilot, and the smallest pilot per backend.
+DEFAULT_PILOT_FRACTION = 0.05
+MIN_PILOT_SHOTS = 2
+
+
+def split(
+    circuit: Any,  # noqa: ANN401
+    shots: int,
+    backends: dict[str, list[str]],
+    _virtual_provider: VirtualProvider,  # pylint: disable=unused-argument
+    policy_data: Any | None = None,  # noqa: ANN401
+) -> tuple[Dispatch, Any]:
+    """Run a pilot on backends of unknown speed, otherwise split the shots by speed.
+
+    Parameters
+    ----------
+    circuit : Any
+        The quantum circuit to run.
+    shots : int
+        Number of shots for the circuit.
+    backends : Dict[str, List[str]]
+        A dictionary mapping provider names to lists of backend names.
+    _virtual_provider : VirtualProvider
+        An instance of VirtualProvider; not used in this policy.
+    policy_data : Dict[str, Any], optional
+        Updated in place. ``"rates"`` holds provider → backend → ``{"throughput", "latency"}``
+        as measured by :func:`observe`; ``"pilot_fraction"`` overrides the share of the
+        shots spent on the pilot. After a pilot, ``"pending_shots"`` holds the shots
+        left for the next round.
+
+    Returns
+    -------
+    Tuple[Dispatch, Any]
+        A tuple containing the Dispatch object with registered jobs and the updated blob.
+
+    """
+    data = {} if policy_data is None else policy_data
+    dispatch = Dispatch()
+    pending = _add_jobs(dispatch, 0, circuit, shots, backends, data, {})
+    if pending:
+        data["pending_shots"] = pending
+    return dispatch, data
+
+
+def split_many(
+    circuits: Sequence[Any],
+    shots_list: Sequence[int],
+    backends: dict[str, list[str]],
+    _virtual_provider: VirtualProvider,  # pylint: disable=unused-argument
+    policy_data: Any | None = None,  # noqa: ANN401
+) -> tuple[Dispatch, Any]:
+    """Split a batch of circuits like :func:`split`, into one Dispatch.
+
+    Circuits with the same shot count share one allocation.
+
+    Parameters
+    ----------
+    circuits : Sequence[Any]
+        The quantum circuits to run.
+    shots_list : Sequence[int]
+        Number of shots of each circuit.
+    backends : Dict[str, List[str]]
+        A dictionary mapping provider names to lists of backend names.
+    _virtual_provider : VirtualProvider
+        An instance of VirtualProvider; not used in this policy.
+    policy_data : Dict[str, Any], optional
+        As for :func:`split`, except that ``"pending_shots"`` lists the shots left
+        for the next round per circuit.
+
+    Returns
+    -------
+    Tuple[Dispatch, Any]
+        A tuple containing the Dispatch object with registered jobs and the updated blob.
+
+    """
+    data = {} if policy_data is None else policy_data
+    dispatch = Dispatch()
+    allocations: dict[int, list[int]] = {}
+    pending = [
+        _add_jobs(dispatch, index, circuit, shots, backends, data, allocations)
+        for index, (circuit, shots) in enumerate(zip(circuits, shots_list, strict=True))
+    ]
+    if any(pending):
+        data["pending_shots"] = pending
+    return dispatch, data
+
+
+def _add_jobs(  # pylint: disable=too-many-arguments too-many-positional-arguments too-many-locals
+    dispatch: Dispatch,
+    index: int,
+    circuit: Any,  # noqa: ANN401
+    shots: int,
+    backends: dict[str, list[str]],
+    data: dict[str, Any],
+    allocations: dict[int, list[int]],
+) -> int:
+    """Add the jobs of one circuit to a dispatch.
+
+    Parameters
+    ----------
+    dispatch : Dispatch
+        The dispatch receiving the jobs.
+    index : int
+        The index of the circuit among those being split, given to its jobs as circuit key.
+    circuit : Any
+        The quantum circuit to run.
+    shots : int
+        Number of shots for the circuit.
+    backends : Dict[str, List[str]]
+        A dictionary mapping provider names to lists of backend names.
+    data : Dict[str, Any]
+        The split data; its ``"rates"`` are created if missing.
+    allocations : Dict[int, List[int]]
+        Shot count → allocation over the backends, filled as allocations are computed.
+
+    Returns
+    -------
+    int
+        The shots left for the next round, after a pilot; otherwise 0.
+
+    """
+    rates = data.setdefault("rates", {})
+    pairs = [(provider_name, backend_name) for provider_name, names in backends.items() for backend_name in names]
+    unknown = [pair for pair in pairs if pair[1] not in rates.get(pair[0], {})]
+
+    if unknown:
+        per_backend = max(
+            MIN_PILOT_SHOTS, int(shots * data.get("pilot_fraction", DEFAULT_PILOT_FRACTION)) // len(pairs)
+        )
+        if per_backend * len(unknown) < shots:
+            # Two jobs of different sizes per backend tell its queue latency from its throughput.
+            small = max(1, per_backend // 4)
+            for provider_name, backend_name in unknown:
+                dispatch.add_job(
+                    provider_name=provider_name,
+                    backend_name=backend_name,
+                    circuits=[circuit.copy(), circuit.copy()],
+                    shots=[small, per_backend - small],
+                    circuit_keys=index,
+                )
+            return shots - per_backend * len(unknown)
+
+    allocation = allocations.get(shots)
+    if allocation is None:
+        allocation = allocations[shots] = _allocate(shots, pairs, rates)
+    for (provider_name, backend_name), backend_shots in zip(pairs, allocation, strict=True):
+        if backend_shots:
+            dispatch.add_job(
+                provider_name=provider_name,
+                backend_name=backend_name,
+                circuits=circuit.copy(),
+                shots=backend_shots,
+                circuit_keys=index,
+            )
+    return 0
+
+
+def observe(results: dict[str, dict[str, list[Any]]], policy_data: Any) -> Any:  # noqa: ANN401
+    """Measure the throughput and queue latency of every backend from a finished round.
+
+    The time of a job spans its submission to its result. A line ``t = L + n / r``
+    through the times of the jobs of a backend gives its latency ``L`` and throughput
+    ``r``; with jobs of a single size, the latency is taken as zero. A backend whose
+    jobs all failed gets a throughput of zero and no further shots.
+
+    Parameters
+    ----------
+    results : Dict[str, Dict[str, List[JobResult]]]
+        The jobs of the round, as returned by ``ResultCollector.get_jobs()``.
+    policy_data : Dict[str, Any]
+        Split data whose ``"rates"`` are updated in place.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The updated split data.
+
+    """
+    rates = policy_data.setdefault("rates", {})
+    for provider_name, backend_results in results.items():
+        for backend_name, job_results in backend_results.items():
+            samples = [
+                (job_result.job.shots, job_result.timings["execute"][1] - job_result.timings["submit"][0])
+                for job_result in job_results
+                if not (isinstance(job_result.data, dict) and "error" in job_result.data)
+                and "submit" in job_result.timings
+                and "execute" in job_result.timings
+            ]
+            rates.setdefault(provider_name, {})[backend_name] = _fit(samples)
+    return policy_data
+
+
+def _fit(samples: list[tuple[int, float]]) -> dict[str, float]:
+    """Fit the latency and throughput of a backend to its (shots, seconds) samples.
+
+    Parameters
+    ----------
+    samples : List[Tuple[int, float]]
+        Shots and time of every successful job.
+
+    Returns
+    -------
+    Dict[str, float]
+        The "throughput" in shots per second and the "latency" in seconds.
+
+    """
+    if not samples:
+        return {"throughput": 0.0, "latency": 0.0}
+    count = len(samples)
+    mean_shots = sum(shots for shots, _ in samples) / count
+    mean_seconds = sum(seconds for _, seconds in samples) / count
+    spread = sum((shots - mean_shots) ** 2 for shots, _ in samples)
+    if spread > 0:
+        slope = sum((shots - mean_shots) * (seconds - mean_seconds) for shots, seconds in samples) / spread
+        latency = mean_seconds - slope * mean_shots
+        if slope > 0 and latency >= 0:
+            return {"throughput": 1 / slope, "latency": latency}
+    # Noisy or single-size samples: attribute the whole time to the shots.
+    total_seconds = sum(seconds for _, seconds in samples)
+    throughput = sum(shots for shots, _ in samples) / total_seconds if total_seconds > 0 else math.inf
+    return {"throughput": throughput, "latency": 0.0}
+
+
+def _allocate(shots: int, pairs: list[tuple[str, str]], rates: dict[str, dict[str, dict[str, float]]]) -> list[int]:
+    """Split shots so that all backends are expected to finish together.
+
+    Backends without a measured rate, left unmeasured when the shots were too few for a
+    pilot, get an even share, as with the ``uniform`` policy; the others split the rest
+    by speed.
+
+    Parameters
+    ----------
+    shots : int
+        Number of shots to allocate.
+    pairs : List[Tuple[str, str]]
+        The (provider, backend) pairs.
+    rates : Dict[str, Dict[str, Dict[str, float]]]
+        Measured throughput and latency of the backends.
+
+    Returns
+    -------
+    List[int]
+        The shots of every pair, in order, adding up to `shots`.
+
+    """
+    measured = {i: rates[p][b] for i, (p, b) in enumerate(pairs) if b in rates.get(p, {})}
+    if len(measured) == len(pairs):
+        weights = _speed_weights(shots, list(measured.values()))
+    else:
+        weights = [1.0] * len(pairs)
+        if measured:
+            known_weights = _speed_weights(shots * len(measured) / len(pairs), list(measured.values()))
+            known_total = sum(known_weights)
+            for i, weight in zip(measured, known_weights, strict=True):
+                weights[i] = len(measured) * weight / known_total
+
+    # Largest remainder rounding keeps the total exact.
+    total = sum(weights)
+    exact = [shots * weight / total for weight in weights]
+    allocation = [math.floor(value) for value in exact]
+    by_remainder = sorted(range(len(pairs)), key=lambda i: exact[i] - allocation[i], reverse=True)
+    for i in by_remainder[: shots - sum(allocation)]:
+        allocation[i] += 1
+    return allocation
+
+
+def _speed_weights(shots: float, speeds: list[dict[str, float]]) -> list[float]:
+    """Weigh backends so that they are expected to finish their shares of the shots together.
+
+    Parameters
+    ----------
+    shots : float
+        Number of shots shared by the backends.
+    speeds : List[Dict[str, float]]
+        Measured throughput and latency of every backend.
+
+    Returns
+    -------
+    List[float]
+        The weight of every backend, proportional to its share.
+
+    """
+    instant = [i for i, rate in enumerate(speeds) if math.isinf(rate["throughput"])]
+    if instant:
+        # Backends with no measurable run time share the shots evenly.
+        return [1.0 if i in instant else 0.0 for i in range(len(speeds))]
+    active = [i for i, rate in enumerate(speeds) if rate["throughput"] > 0]
+    if not active:
+        return [1.0] * len(speeds)
+    # Drop the backends whose latency exceeds the common finishing time, and recompute it.
+    while True:
+        finish = (shots + sum(speeds[i]["throughput"] * speeds[i]["latency"] for i in active)) / sum(
+            speeds[i]["throughput"] for i in active
+        )
+        late = [i for i in active if speeds[i]["latency"] >= finish]
+        if not late or len(late) == len(active):
+            break
+        active = [i for i in active if i not in late]
+    weights = [0.0] * len(speeds)
+    for i in active:
+        weights[i] = max(speeds[i]["throughput"] * (finish - speeds[i]["latency"]), 0.0) or 1.0
+    return weights
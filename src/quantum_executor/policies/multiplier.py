@@ -1,10 +1,14 @@
 """A basic uniform policy that assigns the same circuit and shot count to every backend."""
 
+from collections.abc import Sequence
 from typing import Any
 
 from quantum_executor.dispatch import Dispatch
 from quantum_executor.virtual_provider import VirtualProvider
 
+# Circuits are split independently of each other, so they may be split in parallel.
+STATELESS = True
+
 
 def split(
     circuit: Any,  # noqa: ANN401
@@ -33,14 +37,48 @@ def split(
     Tuple[Dispatch, Any]
         A tuple containing the Dispatch object with registered jobs and the unchanged blob.
 
+    """
+    return split_many([circuit], [shots], backends, _virtual_provider, policy_data)
+
+
+def split_many(
+    circuits: Sequence[Any],
+    shots_list: Sequence[int],
+    backends: dict[str, list[str]],
+    _virtual_provider: VirtualProvider,  # pylint: disable=unused-argument
+    policy_data: Any | None = None,  # noqa: ANN401
+) -> tuple[Dispatch, Any]:
+    """Run every circuit of a batch, with its shot count, on every backend, in one Dispatch.
+
+    Parameters
+    ----------
+    circuits : Sequence[Any]
+        The quantum circuits to run.
+    shots_list : Sequence[int]
+        Number of shots of each circuit.
+    backends : Dict[str, List[str]]
+        A dictionary mapping provider names to lists of backend names.
+    _virtual_provider : VirtualProvider
+        An instance of VirtualProvider; not used in this policy.
+    policy_data : Any, optional
+        Additional data carried along; not used in this policy.
+
+    Returns
+    -------
+    Tuple[Dispatch, Any]
+        A tuple containing the Dispatch object with registered jobs and the unchanged blob.
+
     """
     dispatch = Dispatch()
+    if not circuits:
+        return dispatch, policy_data
     for provider_name, backends_ls in backends.items():
         for backend_name in backends_ls:
             dispatch.add_job(
                 provider_name=provider_name,
                 backend_name=backend_name,
-                circuits=circuit.copy(),
-                shots=shots,
+                circuits=[circuit.copy() for circuit in circuits],
+                shots=list(shots_list),
+                circuit_keys=list(range(len(circuits))),
             )
     return dispatch, policy_data
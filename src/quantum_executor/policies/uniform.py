@@ -1,10 +1,14 @@
 """A basic uniform policy that equally distribute the shot count of a quantum circuit on every backend."""
 
+from collections.abc import Sequence
 from typing import Any
 
 from quantum_executor.dispatch import Dispatch
 from quantum_executor.virtual_provider import VirtualProvider
 
+# Circuits are split independently of each other, so they may be split in parallel.
+STATELESS = True
+
 
 def split(
     circuit: Any,  # noqa: ANN401
@@ -33,21 +37,55 @@ def split(
     Tuple[Dispatch, Any]
         A tuple containing the Dispatch object with registered jobs and the unchanged blob.
 
+    """
+    return split_many([circuit], [shots], backends, _virtual_provider, policy_data)
+
+
+def split_many(
+    circuits: Sequence[Any],
+    shots_list: Sequence[int],
+    backends: dict[str, list[str]],
+    _virtual_provider: VirtualProvider,  # pylint: disable=unused-argument
+    policy_data: Any | None = None,  # noqa: ANN401
+) -> tuple[Dispatch, Any]:
+    """Uniformly distribute every circuit of a batch to every backend, in one Dispatch.
+
+    Parameters
+    ----------
+    circuits : Sequence[Any]
+        The quantum circuits to run.
+    shots_list : Sequence[int]
+        Number of shots of each circuit.
+    backends : Dict[str, List[str]]
+        A dictionary mapping provider names to lists of backend names.
+    _virtual_provider : VirtualProvider
+        An instance of VirtualProvider; not used in this policy.
+    policy_data : Any, optional
+        Additional data carried along; not used in this policy.
+
+    Returns
+    -------
+    Tuple[Dispatch, Any]
+        A tuple containing the Dispatch object with registered jobs and the unchanged blob.
+
     """
     bakends_num = sum(len(backends_ls) for backends_ls in backends.values())
-    backends_shots = [shots // bakends_num] * bakends_num
-    # If shots is not divisible by the number of backends, distribute the remainder
-    remainder = shots % bakends_num
-    for i in range(remainder):
-        backends_shots[i] += 1
+    if not bakends_num or not circuits:
+        return Dispatch(), policy_data
+    # Shares of every distinct shot count; if it is not divisible by the number of backends, distribute the remainder.
+    shares: dict[int, list[int]] = {}
+    for shots in shots_list:
+        if shots not in shares:
+            shares[shots] = [shots // bakends_num + (1 if i < shots % bakends_num else 0) for i in range(bakends_num)]
 
     dispatch = Dispatch()
     for provider_name, backends_ls in backends.items():
-        for backend_name, backend_shots in zip(backends_ls, backends_shots, strict=False):
+        for i, backend_name in enumerate(backends_ls):
             dispatch.add_job(
                 provider_name=provider_name,
                 backend_name=backend_name,
-                circuits=circuit.copy(),
-                shots=backend_shots,
+                circuits=[circuit.copy() for circuit in circuits],
+                shots=[shares[shots][i] for shots in shots_list],
+                circuit_keys=list(range(len(circuits))),
             )
     return dispatch, policy_data
@@ -1,16 +1,43 @@
 """Implement thread-safe collectors for aggregating job results."""
 
+# pylint: disable=too-many-lines
+
+import json
+import logging
+import os
 import threading
 import time
+import weakref
+from collections.abc import Callable
 from collections.abc import Generator
+from collections.abc import Hashable
 from contextlib import contextmanager
+from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import Optional
 
+from quantum_executor.cancellation import CANCELLED_ERROR
+from quantum_executor.metrics import NULL_METRICS
+from quantum_executor.metrics import MetricsRegistry
+from quantum_executor.metrics import NullMetrics
+from quantum_executor.shared_result import release_segment
+from quantum_executor.timing import OVERHEAD_PHASES
+from quantum_executor.timing import run_time
+
 if TYPE_CHECKING:  # pragma: no cover
+    from multiprocessing.shared_memory import SharedMemory
+
     from quantum_executor.dispatch import Job
     from quantum_executor.job_runner import ResultData
+    from quantum_executor.timing import Timings
+    from quantum_executor.timing import WorkerInfo
+
+
+logger = logging.getLogger(__name__)
+
+# What happens to unfinished jobs once a quorum is reached.
+QUORUM_ACTIONS = ("cancel", "abandon")
 
 
 class ReadWriteLock:
@@ -95,7 +122,7 @@ class ReadWriteLock:
             self.release_write()
 
 
-class JobResult:
+class JobResult:  # pylint: disable=too-many-instance-attributes
     """Container for holding the outcome of a job execution.
 
     Parameters
@@ -104,10 +131,46 @@ class JobResult:
         The job instance that was executed.
     data : ResultData, optional
         The result data produced by the job execution, by default None.
+    load : Callable[[int], Job], optional
+        Function returning the job from its `row`, such as :meth:`Dispatch.job` of a
+        columnar dispatch. If given, the JobResult keeps the row instead of the job, so
+        the job can be freed, and :attr:`job` rebuilds it when needed.
+    row : int, optional
+        The row of the job, passed to `load`.
+
+    Attributes
+    ----------
+    job_id : str
+        The id of the job.
+    timings : Timings
+        Phase name → monotonic ``(start, end)`` times recorded while running the job
+        (e.g. "queue", "get_backend", "transpile", "submit", "execute", "convert", "transfer").
+        For a retried job they describe the last attempt, and "retry" spans the failed
+        attempts and their backoff.
+    worker : WorkerInfo or None
+        The (process id, thread id) that ran the job, once complete.
+    attempts : int
+        Number of times the job was run, once complete.
+    errors : List[str]
+        Errors of the failed attempts that were retried.
+    hedge : str or None
+        For a hedged job, which copy produced `data`: "primary" or "hedge".
+    hedge_saved : float or None
+        For a job whose hedge won, how many seconds earlier it finished than the original,
+        once the original has finished too; None while it runs or if it was cancelled.
+    cancelled : bool
+        True if the job timed out or was cancelled; `data` then holds the error.
+    backend : Tuple[str, str] or None
+        The (provider, backend) the job is registered under in its collector.
+    circuit_key : Hashable or None
+        Which circuit the job belongs to, for the shot quorum: its :attr:`Job.circuit_key`,
+        or the identity of its circuit object if it has none.
 
     """
 
-    def __init__(self, job: "Job", data: Optional["ResultData"] = None) -> None:
+    def __init__(
+        self, job: "Job", data: Optional["ResultData"] = None, load: Callable[[int], "Job"] | None = None, row: int = 0
+    ) -> None:
         """Initialize a JobResult instance.
 
         Parameters
@@ -116,11 +179,29 @@ class JobResult:
             The job instance.
         data : ResultData, optional
             The result data, by default None.
+        load : Callable[[int], Job], optional
+            Function returning the job from its row; if given, the job itself is not kept.
+        row : int, optional
+            The row of the job, passed to `load`.
 
         """
-        self.job: Job = job
+        self.job_id: str = job.id
+        self._job: Job | None = job if load is None else None
+        self._load = load
+        self._row = row
         self.data: Any = data
         self.complete: bool = data is not None
+        self.timings: Timings = {}
+        self.worker: WorkerInfo | None = None
+        self.attempts: int = 0
+        self.errors: list[str] = []
+        self.hedge: str | None = None
+        self.hedge_saved: float | None = None
+        self.cancelled: bool = False
+        self.backend: tuple[str, str] | None = None
+        self.circuit_key: Hashable | None = None
+        # pylint: disable-next=unsubscriptable-object  # Generic in typeshed only.
+        self._segment_finalizer: weakref.finalize[[SharedMemory], JobResult] | None = None
 
     def __repr__(self) -> str:
         """Represent the JobResult as a string.
@@ -131,9 +212,23 @@ class JobResult:
             A string representation indicating the job, its completion status, and result data.
 
         """
-        status = "Complete" if self.complete else "Pending"
+        status = "Cancelled" if self.cancelled else "Complete" if self.complete else "Pending"
         return f"JobResult(job={self.job}, status={status}, data={self.data})"
 
+    @property
+    def job(self) -> "Job":
+        """The job that was executed.
+
+        Returns
+        -------
+        Job
+            The job, rebuilt on demand if the JobResult does not keep it.
+
+        """
+        if self._job is not None:
+            return self._job
+        return self._load(self._row)  # type: ignore[misc]
+
     def get_data(self) -> Optional["ResultData"]:
         """Retrieve the result data if the job execution is complete.
 
@@ -145,8 +240,53 @@ class JobResult:
         """
         return self.data if self.complete else None
 
+    def durations(self) -> dict[str, float]:
+        """Return how long each recorded phase of the job took.
+
+        Returns
+        -------
+        Dict[str, float]
+            Phase name → duration in seconds, in chronological order.
+
+        """
+        ordered = sorted(self.timings.items(), key=lambda item: item[1][0])
+        return {phase: end - start for phase, (start, end) in ordered}
+
+    def attach_segment(self, segment: "SharedMemory") -> None:
+        """Tie the lifetime of a shared-memory segment backing `data` to this JobResult.
+
+        The segment is released when :meth:`release` is called or when the
+        JobResult is garbage collected, whichever happens first.
+
+        Parameters
+        ----------
+        segment : SharedMemory
+            The segment the result data was read from.
+
+        """
+        self.release()
+        self._segment_finalizer = weakref.finalize(self, release_segment, segment)
+
+    def release(self) -> None:
+        """Release the shared-memory segment backing the result data, if any."""
+        if self._segment_finalizer is not None:
+            self._segment_finalizer()
+            self._segment_finalizer = None
+
+    @property
+    def shared(self) -> bool:
+        """Check whether the result data is backed by a live shared-memory segment.
+
+        Returns
+        -------
+        bool
+            True if a shared-memory segment is attached and not yet released.
+
+        """
+        return self._segment_finalizer is not None and self._segment_finalizer.alive
+
 
-class ResultCollector:
+class ResultCollector:  # pylint: disable=too-many-instance-attributes
     """Thread-safe collector for job results stored in a nested dictionary.
 
     The structure mirrors the dispatch structure and allows storing and retrieving
@@ -157,6 +297,22 @@ class ResultCollector:
         and _complete/_completion_event.
         Always acquire ResultCollector._lock before acquiring any external locks.
 
+    Parameters
+    ----------
+    metrics : MetricsRegistry, optional
+        Registry receiving completed/failed job counts and job latencies.
+        Defaults to no metrics.
+    quorum_shots : int, optional
+        Complete the collector as soon as the successful jobs of every circuit add up to
+        this many shots, circuits being told apart by their :attr:`JobResult.circuit_key`.
+        A circuit whose jobs have all finished short of it does not hold the others back.
+    quorum_backends : int, optional
+        Complete the collector as soon as this many backends have run all their jobs successfully.
+    quorum_action : str, optional
+        What happens to unfinished jobs once a quorum is reached: "cancel" them (see
+        :meth:`cancel`) or "abandon" them, letting them finish and store their results
+        in the background. Defaults to "cancel".
+
     Attributes
     ----------
     nested_results : Dict[str, Dict[str, List[JobResult]]]
@@ -164,17 +320,63 @@ class ResultCollector:
 
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        metrics: MetricsRegistry | NullMetrics | None = None,
+        quorum_shots: int | None = None,
+        quorum_backends: int | None = None,
+        quorum_action: str = "cancel",
+    ) -> None:
         """Initialize the ResultCollector.
 
         Sets up the nested results dictionary, job mapping, locks, and a completion event.
+
+        Parameters
+        ----------
+        metrics : MetricsRegistry, optional
+            Registry receiving completed/failed job counts and job latencies.
+            Defaults to no metrics.
+        quorum_shots : int, optional
+            Complete the collector as soon as the successful jobs of every circuit add up to this many shots.
+        quorum_backends : int, optional
+            Complete the collector as soon as this many backends have run all their jobs successfully.
+        quorum_action : str, optional
+            "cancel" or "abandon" the unfinished jobs once a quorum is reached.
+
+        Raises
+        ------
+        ValueError
+            If a quorum is not positive or `quorum_action` is unknown.
+
         """
+        if (quorum_shots is not None and quorum_shots < 1) or (quorum_backends is not None and quorum_backends < 1):
+            raise ValueError("Quorums must be positive integers.")
+        if quorum_action not in QUORUM_ACTIONS:
+            raise ValueError(f"Unknown quorum action '{quorum_action}'; expected one of {QUORUM_ACTIONS}.")
         self.nested_results: dict[str, dict[str, list[JobResult]]] = {}
-        # Map each Job → its placeholder JobResult, so we can update it directly.
-        self._job_mapping: dict[Job, JobResult] = {}
+        # Map each job id → its placeholder JobResult, so we can update it directly. Keying by id
+        # rather than by Job lets the jobs of a columnar dispatch be freed once they have run.
+        self._job_mapping: dict[str, JobResult] = {}
+        self._metrics = metrics or NULL_METRICS
+        # Job id → (provider, backend) labels; only tracked when metrics are enabled.
+        self._job_labels: dict[str, dict[str, str]] = {}
         self._lock = ReadWriteLock()
         self._complete: bool = False
         self._completion_event = threading.Event()
+        self._cancelled = False
+        self._cancel_callbacks: list[Callable[[], None]] = []
+        self.quorum_shots = quorum_shots
+        self.quorum_backends = quorum_backends
+        self.quorum_action = quorum_action
+        self._quorum_reached = False
+        # Circuit key → shots of its successful jobs, and → its jobs not finished yet, for the shot quorum.
+        self._shots_done: dict[Hashable, int] = {}
+        self._circuit_pending: dict[Hashable, int] = {}
+        # (provider, backend) → jobs not finished successfully yet, for the backend quorum.
+        self._backend_pending: dict[tuple[str, str], int] = {}
+        self._backends_done = 0
+        # While open, more jobs may still be registered, so finishing the registered ones does not complete.
+        self._registration_open = False
 
     def __repr__(self) -> str:
         """Represent the ResultCollector as a string.
@@ -199,9 +401,18 @@ class ResultCollector:
             )
             return f"ResultCollector(complete_jobs={complete_jobs}, total_jobs={total_jobs}, complete={self.complete})"
 
-    def register_job_mapping(self, job: "Job", provider_name: str, backend_name: str) -> None:
+    def register_job_mapping(  # pylint: disable=too-many-arguments too-many-positional-arguments
+        self,
+        job: "Job",
+        provider_name: str,
+        backend_name: str,
+        load: Callable[[int], "Job"] | None = None,
+        row: int = 0,
+    ) -> None:
         """Register a job and create a placeholder JobResult in the collector.
 
+        Jobs are told apart by their ids, which must be unique within the collector.
+
         Parameters
         ----------
         job : Job
@@ -210,6 +421,11 @@ class ResultCollector:
             The provider name.
         backend_name : str
             The backend name.
+        load : Callable[[int], Job], optional
+            Function returning the job from its `row`, such as :meth:`Dispatch.job` of a
+            columnar dispatch. If given, the collector does not keep the job alive.
+        row : int, optional
+            The row of the job, passed to `load`.
 
         """
         with self._lock.write():
@@ -217,15 +433,101 @@ class ResultCollector:
                 self.nested_results[provider_name] = {}
             if backend_name not in self.nested_results[provider_name]:
                 self.nested_results[provider_name][backend_name] = []
-            placeholder = JobResult(job, data=None)
+            placeholder = JobResult(job, data=None, load=load, row=row)
+            placeholder.backend = (provider_name, backend_name)
+            # A job not split by the executor belongs to the circuit object it holds; the placeholder keeps
+            # the job, or the dispatch holding the circuit, alive, so the id is not reused meanwhile.
+            key = id(job.circuit) if job.circuit_key is None else job.circuit_key
+            placeholder.circuit_key = key
+            self._backend_pending[placeholder.backend] = self._backend_pending.get(placeholder.backend, 0) + 1
+            self._circuit_pending[key] = self._circuit_pending.get(key, 0) + 1
             self.nested_results[provider_name][backend_name].append(placeholder)
-            self._job_mapping[job] = placeholder
+            self._job_mapping[job.id] = placeholder
+            if self._metrics.enabled:
+                self._job_labels[job.id] = {"provider": provider_name, "backend": backend_name}
+
+    @property
+    def registration_open(self) -> bool:
+        """Check whether more jobs may still be registered, as when running a lazy dispatch.
+
+        While registration is open, the collector does not complete on its own once the
+        jobs registered so far have finished.
+
+        Returns
+        -------
+        bool
+            True while registration is open.
+
+        """
+        with self._lock.read():
+            return self._registration_open
+
+    @registration_open.setter
+    def registration_open(self, value: bool) -> None:
+        """Open or close the registration of jobs.
+
+        Closing it completes the collector if every registered job has finished, or if the
+        shot quorum, which is not reached while registration is open, is now reached.
+
+        Parameters
+        ----------
+        value : bool
+            The new registration status.
+
+        """
+        reached = False
+        with self._lock.write():
+            self._registration_open = value
+            if not value and self.quorum_shots is not None:
+                reached = self._check_quorum()
+            if reached or (not value and self._all_jobs_complete()):
+                self._complete = True
+                self._completion_event.set()
+        if reached and self.quorum_action == "cancel":
+            self.cancel()
+
+    def adopt(self, other: "ResultCollector") -> None:
+        """Add the job results of another, complete collector, such as an earlier round of an experiment.
 
-    def store_result(self, job: "Job", result_data: "ResultData") -> None:
+        The JobResult objects are shared, not copied, and do not count towards the quorums.
+
+        Parameters
+        ----------
+        other : ResultCollector
+            The collector whose jobs are added.
+
+        Raises
+        ------
+        ValueError
+            If `other` is not complete.
+
+        """
+        if not other.complete:
+            raise ValueError("Only complete collectors can be adopted.")
+        for provider_name, backends in other.get_jobs().items():
+            for backend_name, job_results in backends.items():
+                with self._lock.write():
+                    self.nested_results.setdefault(provider_name, {}).setdefault(backend_name, []).extend(job_results)
+                    for job_result in job_results:
+                        self._job_mapping[job_result.job_id] = job_result
+
+    def store_result(  # pylint: disable=too-many-arguments too-many-positional-arguments
+        self,
+        job: "Job",
+        result_data: "ResultData",
+        shared_segment: Optional["SharedMemory"] = None,
+        timings: Optional["Timings"] = None,
+        worker: Optional["WorkerInfo"] = None,
+        attempts: int = 1,
+        errors: list[str] | None = None,
+        hedge: str | None = None,
+        cancelled: bool = False,
+    ) -> None:
         """Update a job's placeholder with the actual result data.
 
         After storing the result, the method checks if all registered jobs are complete
-        and, if so, signals completion to waiting threads.
+        and, if so, signals completion to waiting threads. Results of jobs that were
+        already cancelled by :meth:`cancel` are dropped.
 
         Parameters
         ----------
@@ -233,6 +535,20 @@ class ResultCollector:
             The job whose result is to be stored.
         result_data : ResultData
             The result data produced by the job execution.
+        shared_segment : SharedMemory, optional
+            Shared-memory segment backing `result_data`; its lifetime becomes tied to the JobResult.
+        timings : Timings, optional
+            Monotonic ``(start, end)`` times of the job phases.
+        worker : WorkerInfo, optional
+            The (process id, thread id) that ran the job.
+        attempts : int, optional
+            Number of times the job was run. Defaults to 1.
+        errors : List[str], optional
+            Errors of the failed attempts that were retried.
+        hedge : str, optional
+            For a hedged job, which copy produced the result: "primary" or "hedge".
+        cancelled : bool, optional
+            True if the job timed out or was cancelled.
 
         Raises
         ------
@@ -241,16 +557,211 @@ class ResultCollector:
 
         """
         with self._lock.write():
-            if job not in self._job_mapping:
+            job_result = self._job_mapping.get(job.id)
+            if job_result is None:
+                if shared_segment is not None:
+                    release_segment(shared_segment)
                 raise ValueError("Job mapping not found. Call register_job_mapping first.")
-            job_result = self._job_mapping[job]
+            if job_result.cancelled:
+                if shared_segment is not None:
+                    release_segment(shared_segment)
+                return
             job_result.data = result_data
             job_result.complete = True
-
+            if shared_segment is not None:
+                job_result.attach_segment(shared_segment)
+            if timings is not None:
+                job_result.timings = timings
+            job_result.worker = worker
+            job_result.attempts = attempts
+            job_result.errors = errors or []
+            job_result.hedge = hedge
+            job_result.cancelled = cancelled
+            if self._metrics.enabled:
+                self._report(job.id, result_data, timings, cancelled)
+
+            reached = self._count_towards_quorum(job_result)
             # Automatically mark the collector complete if all jobs are done.
-            if self._all_jobs_complete():
+            if reached or self._all_jobs_complete():
                 self._complete = True
                 self._completion_event.set()
+        if reached and self.quorum_action == "cancel":
+            self.cancel()
+
+    def _count_towards_quorum(self, job_result: JobResult) -> bool:
+        """Account for a stored result in the quorums; the caller must hold the write lock.
+
+        Parameters
+        ----------
+        job_result : JobResult
+            The job result that was just stored.
+
+        Returns
+        -------
+        bool
+            True if this result makes a quorum reached for the first time.
+
+        """
+        if self._quorum_reached or (self.quorum_shots is None and self.quorum_backends is None):
+            return False
+        failed = job_result.cancelled or (isinstance(job_result.data, dict) and "error" in job_result.data)
+        key = job_result.circuit_key
+        self._circuit_pending[key] -= 1
+        if not failed:
+            self._shots_done[key] = self._shots_done.get(key, 0) + job_result.job.shots
+        pending = self._backend_pending.get(job_result.backend, 0)  # type: ignore[arg-type]
+        if pending > 0:
+            # A failed job keeps its backend from ever counting.
+            self._backend_pending[job_result.backend] = -1 if failed else pending - 1  # type: ignore[index]
+            if pending == 1 and not failed:
+                self._backends_done += 1
+        return self._check_quorum()
+
+    def _check_quorum(self) -> bool:
+        """Check whether a quorum is reached now; the caller must hold the write lock.
+
+        The shot quorum is reached once every circuit has reached it or has no jobs left to
+        run, and at least one has reached it. While registration is open, more circuits may
+        still come, so it is not reached.
+
+        Returns
+        -------
+        bool
+            True if a quorum is reached for the first time.
+
+        """
+        if self._quorum_reached:
+            return False
+        shots_reached = (
+            self.quorum_shots is not None
+            and not self._registration_open
+            and any(shots >= self.quorum_shots for shots in self._shots_done.values())
+            and all(
+                self._shots_done.get(key, 0) >= self.quorum_shots or not pending
+                for key, pending in self._circuit_pending.items()
+            )
+        )
+        self._quorum_reached = shots_reached or (
+            self.quorum_backends is not None and self._backends_done >= self.quorum_backends
+        )
+        if self._quorum_reached:
+            logger.info(
+                "Quorum reached: %d shots over %d circuits from %d backends.",
+                sum(self._shots_done.values()),
+                len(self._circuit_pending),
+                self._backends_done,
+            )
+        return self._quorum_reached
+
+    @property
+    def quorum_reached(self) -> bool:
+        """Check whether the collector completed early because a quorum was reached.
+
+        Returns
+        -------
+        bool
+            True once `quorum_shots` or `quorum_backends` has been reached.
+
+        """
+        return self._quorum_reached
+
+    def _report(
+        self, job_id: str, result_data: "ResultData", timings: Optional["Timings"], cancelled: bool = False
+    ) -> None:
+        """Report a stored result to the metrics registry.
+
+        Parameters
+        ----------
+        job_id : str
+            The id of the finished job.
+        result_data : ResultData
+            Its result; a dictionary with an "error" key counts as a failure.
+        timings : Timings, optional
+            The job phase timings, used for the latency histograms.
+        cancelled : bool, optional
+            True if the job timed out or was cancelled, which is counted apart from failures.
+
+        """
+        labels = self._job_labels.pop(job_id, {})
+        failed = isinstance(result_data, dict) and "error" in result_data
+        name = "quantum_executor_jobs_failed_total" if failed else "quantum_executor_jobs_completed_total"
+        if cancelled:
+            name = "quantum_executor_jobs_cancelled_total"
+        self._metrics.inc(name, **labels)
+        if timings:
+            self._metrics.observe("quantum_executor_job_duration_seconds", run_time(timings), **labels)
+            if "queue" in timings:
+                start, end = timings["queue"]
+                self._metrics.observe("quantum_executor_job_queue_seconds", end - start, **labels)
+
+    def record_hedge_saving(self, job: "Job", seconds: float) -> None:
+        """Record how much earlier the winning hedge of a job finished than the original.
+
+        Parameters
+        ----------
+        job : Job
+            The hedged job.
+        seconds : float
+            Time between the hedge's result and the original's.
+
+        """
+        with self._lock.write():
+            job_result = self._job_mapping.get(job.id)
+            if job_result is not None:
+                job_result.hedge_saved = seconds
+
+    def cancel(self) -> None:
+        """Cancel the jobs that have not finished yet.
+
+        Unfinished jobs are marked cancelled right away, with an error as their data, and
+        the collector becomes complete. The executor then stops submitting jobs, cancels
+        those waiting in its pools and cancels the provider jobs running in its threads
+        through their handles. Jobs running in worker processes are only interrupted if
+        they may be hedged; the others stop at their own timeout and their results are dropped.
+        """
+        with self._lock.write():
+            if self._cancelled:
+                return
+            self._cancelled = True
+            for job_id, job_result in self._job_mapping.items():
+                if not job_result.complete:
+                    job_result.data = {"error": CANCELLED_ERROR}
+                    job_result.complete = True
+                    job_result.cancelled = True
+                    if self._metrics.enabled:
+                        self._report(job_id, job_result.data, None, cancelled=True)
+            self._complete = True
+            self._completion_event.set()
+            callbacks, self._cancel_callbacks = self._cancel_callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def on_cancel(self, callback: Callable[[], None]) -> None:
+        """Register a function called once when the collector is cancelled.
+
+        Parameters
+        ----------
+        callback : Callable[[], None]
+            Called by :meth:`cancel`, or right away if the collector is already cancelled.
+
+        """
+        with self._lock.write():
+            if not self._cancelled:
+                self._cancel_callbacks.append(callback)
+                return
+        callback()
+
+    @property
+    def cancelled(self) -> bool:
+        """Check whether the collector was cancelled.
+
+        Returns
+        -------
+        bool
+            True once :meth:`cancel` has been called.
+
+        """
+        return self._cancelled
 
     def wait_for_completion(self, timeout: float | None = None) -> bool:
         """Block until all registered job results are complete or until the timeout expires.
@@ -285,6 +796,168 @@ class ResultCollector:
                 for provider, backends in self.nested_results.items()
             }
 
+    def get_timings(self) -> dict[str, dict[str, list[dict[str, float]]]]:
+        """Retrieve the phase durations of every job.
+
+        Returns
+        -------
+        Dict[str, Dict[str, List[Dict[str, float]]]]
+            Nested dictionary mirroring :meth:`get_results` with, for each job,
+            a mapping of phase name → duration in seconds.
+
+        """
+        with self._lock.read():
+            return {
+                provider: {backend: [job.durations() for job in job_list] for backend, job_list in backends.items()}
+                for provider, backends in self.nested_results.items()
+            }
+
+    def get_timing_summary(self) -> dict[str, dict[str, dict[str, dict[str, float]]]]:
+        """Aggregate the phase durations per backend.
+
+        Returns
+        -------
+        Dict[str, Dict[str, Dict[str, Dict[str, float]]]]
+            Provider → backend → phase → statistics, where statistics has the keys
+            "count", "total", "mean" and "max" (durations in seconds).
+
+        """
+        summary: dict[str, dict[str, dict[str, dict[str, float]]]] = {}
+        for provider, backends in self.get_timings().items():
+            for backend, job_timings in backends.items():
+                phases: dict[str, dict[str, float]] = {}
+                for durations in job_timings:
+                    for phase, seconds in durations.items():
+                        stats = phases.setdefault(phase, {"count": 0, "total": 0.0, "mean": 0.0, "max": 0.0})
+                        stats["count"] += 1
+                        stats["total"] += seconds
+                        stats["max"] = max(stats["max"], seconds)
+                for stats in phases.values():
+                    stats["mean"] = stats["total"] / stats["count"]
+                summary.setdefault(provider, {})[backend] = phases
+        return summary
+
+    def get_hedge_summary(self) -> dict[str, float]:
+        """Summarize how often jobs were hedged and how much time it saved.
+
+        Returns
+        -------
+        Dict[str, float]
+            "jobs", "hedged" and "hedge_wins" counts, the "hedge_rate" (hedged / jobs) and the
+            seconds "saved" by winning hedges whose original could not be cancelled and has finished since.
+
+        """
+        with self._lock.read():
+            jobs = [
+                job for backends in self.nested_results.values() for job_list in backends.values() for job in job_list
+            ]
+        hedged = [job for job in jobs if job.hedge is not None]
+        return {
+            "jobs": len(jobs),
+            "hedged": len(hedged),
+            "hedge_wins": sum(job.hedge == "hedge" for job in hedged),
+            "hedge_rate": len(hedged) / len(jobs) if jobs else 0.0,
+            "saved": sum(job.hedge_saved or 0.0 for job in hedged),
+        }
+
+    def get_trace(self) -> dict[str, Any]:  # pylint: disable=too-many-locals
+        """Build a Chrome trace-event timeline of the recorded job phases.
+
+        Every worker process/thread gets its own track with one span per job and
+        nested spans for its phases. Queueing and result transfer happen outside the
+        workers and are shown as asynchronous spans on the dispatching process.
+        Timestamps are microseconds since the first recorded event.
+
+        Returns
+        -------
+        Dict[str, Any]
+            A trace in the Chrome trace-event JSON object format, loadable in
+            ``chrome://tracing`` or https://ui.perfetto.dev.
+
+        """
+        jobs = [
+            (provider, backend, job_result)
+            for provider, backends in self.get_jobs().items()
+            for backend, job_list in backends.items()
+            for job_result in job_list
+            if job_result.timings
+        ]
+        origin = min((start for *_, jr in jobs for start, _ in jr.timings.values()), default=0.0)
+
+        def _us(t: float) -> float:
+            return round((t - origin) * 1e6, 3)
+
+        parent_pid = os.getpid()
+        events: list[dict[str, Any]] = [
+            {"name": "process_name", "ph": "M", "pid": parent_pid, "tid": 0, "args": {"name": "dispatcher"}}
+        ]
+        tracks: set[tuple[int, int]] = set()
+        for index, (provider, backend, job_result) in enumerate(jobs):
+            args = {
+                "job_id": job_result.job_id,
+                "provider": provider,
+                "backend": backend,
+                "shots": job_result.job.shots,
+            }
+            pid, tid = job_result.worker or (parent_pid, 0)
+            if (pid, tid) not in tracks:
+                tracks.add((pid, tid))
+                if pid != parent_pid:
+                    events.append(
+                        {"name": "process_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": f"worker {pid}"}}
+                    )
+                events.append(
+                    {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": f"thread {tid}"}}
+                )
+
+            worker_spans = {p: span for p, span in job_result.timings.items() if p not in OVERHEAD_PHASES}
+            if worker_spans:
+                start = min(s for s, _ in worker_spans.values())
+                end = max(e for _, e in worker_spans.values())
+                events.append(
+                    {
+                        "name": f"{provider}/{backend}",
+                        "cat": "job",
+                        "ph": "X",
+                        "ts": _us(start),
+                        "dur": _us(end) - _us(start),
+                        "pid": pid,
+                        "tid": tid,
+                        "args": args,
+                    }
+                )
+            for phase, (start, end) in sorted(job_result.timings.items(), key=lambda item: item[1][0]):
+                if phase in OVERHEAD_PHASES:
+                    common = {"name": phase, "cat": phase, "id": index, "pid": parent_pid, "tid": 0}
+                    events.append({**common, "ph": "b", "ts": _us(start), "args": args})
+                    events.append({**common, "ph": "e", "ts": _us(end)})
+                else:
+                    events.append(
+                        {
+                            "name": phase,
+                            "cat": "phase",
+                            "ph": "X",
+                            "ts": _us(start),
+                            "dur": _us(end) - _us(start),
+                            "pid": pid,
+                            "tid": tid,
+                            "args": args,
+                        }
+                    )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_trace(self, path: str | Path) -> None:
+        """Write the job timeline to a Chrome trace-event JSON file.
+
+        Parameters
+        ----------
+        path : str or Path
+            Destination file, e.g. ``"dispatch.trace.json"``.
+
+        """
+        with Path(path).open("w", encoding="utf-8") as f:
+            json.dump(self.get_trace(), f)
+
     def get_jobs(self) -> dict[str, dict[str, list[JobResult]]]:
         """Retrieve a shallow copy of the registered job results.
 
@@ -338,10 +1011,12 @@ class ResultCollector:
         Returns
         -------
         bool
-            True if every registered JobResult is complete; otherwise False.
+            True if every registered JobResult is complete and no more jobs are expected; otherwise False.
 
         """
         # No lock here; callers must hold at least a read lock.
+        if self._registration_open:
+            return False
         for backends in self.nested_results.values():
             for job_list in backends.values():
                 for job_result in job_list:
@@ -415,6 +1090,25 @@ class MergedResultCollector:
             return self._merged_results_ready_event.wait(timeout=remaining_time)
         return False
 
+    @property
+    def quorum_reached(self) -> bool:
+        """Check whether the results were merged early because a quorum was reached.
+
+        Returns
+        -------
+        bool
+            True once the underlying collector reached its quorum.
+
+        """
+        return self.results.quorum_reached
+
+    def cancel(self) -> None:
+        """Cancel the jobs that have not finished yet; see :meth:`ResultCollector.cancel`.
+
+        The merge policy then runs on the results collected so far.
+        """
+        self.results.cancel()
+
     def get_jobs(self) -> dict[str, dict[str, list[JobResult]]]:
         """Return the jobs stored in the collector.
 
@@ -437,6 +1131,28 @@ class MergedResultCollector:
         """
         return self.results.get_results()
 
+    def get_trace(self) -> dict[str, Any]:
+        """Return the Chrome trace-event timeline of the underlying jobs.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The trace built by :meth:`ResultCollector.get_trace`.
+
+        """
+        return self.results.get_trace()
+
+    def export_trace(self, path: str | Path) -> None:
+        """Write the timeline of the underlying jobs to a Chrome trace-event JSON file.
+
+        Parameters
+        ----------
+        path : str or Path
+            Destination file.
+
+        """
+        self.results.export_trace(path)
+
     def set_merged_results(
         self,
         merged_results: Any,  # noqa: ANN401
@@ -0,0 +1,204 @@
+"""Retry failed jobs whose errors look transient, with exponential backoff and jitter.
+
+Jobs report failures as ``{"error": message}`` results, also when the error was
+raised in a worker process, so errors are classified by their message. By default
+a message is retryable if it mentions throttling, a timeout, a connection problem
+or an unavailable backend; a classifier can be given per provider to override it.
+"""
+
+import random
+import re
+import threading
+from collections.abc import Callable
+from collections.abc import Iterable
+
+# Lower-case fragments of error messages that usually mean "try again later"; the HTTP
+# status codes only match as whole numbers.
+TRANSIENT_ERRORS: tuple[str, ...] = (
+    "rate limit",
+    "throttl",
+    "too many requests",
+    "429",
+    "502",
+    "503",
+    "504",
+    "timeout",
+    "timed out",
+    "temporarily",
+    "unavailable",
+    "offline",
+    "connection",
+)
+
+ErrorClassifier = Callable[[str], bool]  # error message -> retryable?
+
+
+class RetryPolicy:  # pylint: disable=too-many-instance-attributes
+    """Decide whether and when a failed job is retried.
+
+    The n-th retry waits ``min(max_backoff, backoff * multiplier ** (n - 1))`` seconds,
+    reduced by a random fraction of up to `jitter` so that jobs failing together do not
+    retry in lockstep.
+
+    Parameters
+    ----------
+    max_attempts : int, optional
+        Maximum number of attempts per job, including the first one. Defaults to 3.
+    backoff : float, optional
+        Delay in seconds before the first retry. Defaults to 1.
+    multiplier : float, optional
+        Factor applied to the delay after each retry. Defaults to 2.
+    max_backoff : float, optional
+        Upper bound of the delay in seconds. Defaults to 60.
+    jitter : float, optional
+        Maximum fraction of the delay removed at random, between 0 and 1. Defaults to 0.5.
+    retryable : Iterable[str], optional
+        Case-insensitive fragments of retryable error messages. Fragments made of digits,
+        such as HTTP status codes, only match as whole numbers, so "503" matches
+        "HTTP 503" but not "5030 shots". Defaults to :data:`TRANSIENT_ERRORS`.
+    classifiers : Dict[str, Callable[[str], bool]], optional
+        Provider name → function telling whether an error message of that provider is
+        retryable, replacing the `retryable` fragments for that provider.
+    seed : int, optional
+        Seed of the jitter, for reproducible delays.
+
+    Examples
+    --------
+    >>> policy = RetryPolicy(max_attempts=5, classifiers={"ionq": lambda error: "queue full" in error})
+    >>> executor.run_dispatch(dispatch, retry_policy=policy)
+
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments too-many-positional-arguments
+        self,
+        max_attempts: int = 3,
+        backoff: float = 1.0,
+        multiplier: float = 2.0,
+        max_backoff: float = 60.0,
+        jitter: float = 0.5,
+        retryable: Iterable[str] = TRANSIENT_ERRORS,
+        classifiers: dict[str, ErrorClassifier] | None = None,
+        seed: int | None = None,
+    ) -> None:
+        """Initialize the RetryPolicy.
+
+        Parameters
+        ----------
+        max_attempts : int, optional
+            Maximum number of attempts per job, including the first one.
+        backoff : float, optional
+            Delay in seconds before the first retry.
+        multiplier : float, optional
+            Factor applied to the delay after each retry.
+        max_backoff : float, optional
+            Upper bound of the delay in seconds.
+        jitter : float, optional
+            Maximum fraction of the delay removed at random, between 0 and 1.
+        retryable : Iterable[str], optional
+            Case-insensitive fragments of retryable error messages; digits match as whole numbers.
+        classifiers : Dict[str, Callable[[str], bool]], optional
+            Provider name → function telling whether an error message is retryable.
+        seed : int, optional
+            Seed of the jitter.
+
+        Raises
+        ------
+        ValueError
+            If a parameter is out of range.
+
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1.")
+        if backoff < 0 or max_backoff < 0 or multiplier < 1:
+            raise ValueError("Backoff delays must be non-negative and the multiplier at least 1.")
+        if not 0 <= jitter <= 1:
+            raise ValueError("jitter must be between 0 and 1.")
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.multiplier = multiplier
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retryable = tuple(fragment.lower() for fragment in retryable)
+        alternatives = [
+            rf"\b{fragment}\b" if fragment.isdigit() else re.escape(fragment) for fragment in self.retryable
+        ]
+        # Matches nothing without fragments.
+        self._pattern = re.compile("|".join(alternatives) or r"(?!)")
+        self.classifiers: dict[str, ErrorClassifier] = dict(classifiers or {})
+        self._random = random.Random(seed)  # noqa: S311
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """Return a string representation of the RetryPolicy.
+
+        Returns
+        -------
+        str
+            Includes the attempt limit and the backoff parameters.
+
+        """
+        return (
+            f"RetryPolicy(max_attempts={self.max_attempts}, backoff={self.backoff}, "
+            f"multiplier={self.multiplier}, max_backoff={self.max_backoff}, jitter={self.jitter})"
+        )
+
+    def is_retryable(self, provider_name: str, error: str) -> bool:
+        """Classify an error message.
+
+        Parameters
+        ----------
+        provider_name : str
+            The provider that reported the error.
+        error : str
+            The error message.
+
+        Returns
+        -------
+        bool
+            True if the error is worth retrying.
+
+        """
+        classifier = self.classifiers.get(provider_name)
+        if classifier is not None:
+            return classifier(error)
+        return self._pattern.search(error.lower()) is not None
+
+    def delay(self, attempt: int) -> float:
+        """Return how long to wait before the attempt following `attempt`.
+
+        Parameters
+        ----------
+        attempt : int
+            Number of the attempt that failed, starting at 1.
+
+        Returns
+        -------
+        float
+            Delay in seconds.
+
+        """
+        delay = min(self.max_backoff, self.backoff * self.multiplier ** (attempt - 1))
+        with self._lock:
+            return delay * (1 - self.jitter * self._random.random())
+
+    def next_delay(self, provider_name: str, error: str, attempt: int) -> float | None:
+        """Decide whether a failed attempt is retried.
+
+        Parameters
+        ----------
+        provider_name : str
+            The provider that reported the error.
+        error : str
+            The error message.
+        attempt : int
+            Number of the attempt that failed, starting at 1.
+
+        Returns
+        -------
+        float or None
+            Seconds to wait before retrying, or None if the job must not be retried.
+
+        """
+        if attempt >= self.max_attempts or not self.is_retryable(provider_name, error):
+            return None
+        return self.delay(attempt)
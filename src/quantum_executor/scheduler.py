@@ -0,0 +1,262 @@
+"""Feed jobs from a Dispatch to an executor while enforcing concurrency limits."""
+
+import logging
+from collections import deque
+from collections.abc import Callable
+from collections.abc import Iterable
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import wait
+from typing import TYPE_CHECKING
+from typing import Any
+
+if TYPE_CHECKING:  # pragma: no cover
+    from quantum_executor.dispatch import Job
+
+logger = logging.getLogger(__name__)
+
+ScheduledJob = tuple[str, str, "Job"]  # (provider_name, backend_name, job)
+
+
+class JobScheduler:
+    """Submit jobs lazily, bounding how many are in flight globally, per provider and per backend.
+
+    Jobs are pulled from the input iterable only when a slot is free. A job whose
+    provider or backend is saturated is parked in a bounded look-ahead buffer so
+    jobs for other backends can overtake it. Work started outside the scheduler, such
+    as a hedged duplicate, takes a slot with :meth:`reserve`.
+
+    Parameters
+    ----------
+    max_in_flight : int, optional
+        Maximum number of jobs submitted and not yet finished. None means unbounded.
+    provider_limits : Dict[str, int], optional
+        Maximum number of in-flight jobs per provider name.
+    backend_limits : Dict[str, Dict[str, int]], optional
+        Maximum number of in-flight jobs per backend, as provider -> backend -> limit.
+    max_lookahead : int, optional
+        Maximum number of blocked jobs to buffer while looking for a runnable one.
+
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int | None = None,
+        provider_limits: dict[str, int] | None = None,
+        backend_limits: dict[str, dict[str, int]] | None = None,
+        max_lookahead: int = 1024,
+    ) -> None:
+        """Initialize the JobScheduler.
+
+        Parameters
+        ----------
+        max_in_flight : int, optional
+            Maximum number of jobs submitted and not yet finished. None means unbounded.
+        provider_limits : Dict[str, int], optional
+            Maximum number of in-flight jobs per provider name.
+        backend_limits : Dict[str, Dict[str, int]], optional
+            Maximum number of in-flight jobs per backend, as provider -> backend -> limit.
+        max_lookahead : int, optional
+            Maximum number of blocked jobs to buffer while looking for a runnable one.
+
+        Raises
+        ------
+        ValueError
+            If any limit is smaller than 1.
+
+        """
+        limits = [max_lookahead, *(provider_limits or {}).values()]
+        limits += [limit for backends in (backend_limits or {}).values() for limit in backends.values()]
+        if max_in_flight is not None:
+            limits.append(max_in_flight)
+        if any(limit < 1 for limit in limits):
+            raise ValueError("Concurrency limits must be positive integers.")
+
+        self.max_in_flight = max_in_flight
+        self.provider_limits: dict[str, int] = dict(provider_limits or {})
+        self.backend_limits: dict[str, dict[str, int]] = {p: dict(b) for p, b in (backend_limits or {}).items()}
+        self.max_lookahead = max_lookahead
+
+        self._provider_running: dict[str, int] = {}
+        self._backend_running: dict[tuple[str, str], int] = {}
+        # Jobs started and reserved slots, counted against `max_in_flight`.
+        self._running = 0
+
+    def __repr__(self) -> str:
+        """Return a string representation of the JobScheduler.
+
+        Returns
+        -------
+        str
+            Includes the global, provider and backend limits.
+
+        """
+        return (
+            f"JobScheduler(max_in_flight={self.max_in_flight}, provider_limits={self.provider_limits}, "
+            f"backend_limits={self.backend_limits})"
+        )
+
+    def _can_start(self, provider_name: str, backend_name: str) -> bool:
+        """Check whether a job for the given provider/backend fits within the limits.
+
+        Parameters
+        ----------
+        provider_name : str
+            The provider name.
+        backend_name : str
+            The backend name.
+
+        Returns
+        -------
+        bool
+            True if neither the global, the provider nor the backend limit is reached.
+
+        """
+        if self.max_in_flight is not None and self._running >= self.max_in_flight:
+            return False
+        provider_limit = self.provider_limits.get(provider_name)
+        if provider_limit is not None and self._provider_running.get(provider_name, 0) >= provider_limit:
+            return False
+        backend_limit = self.backend_limits.get(provider_name, {}).get(backend_name)
+        return backend_limit is None or self._backend_running.get((provider_name, backend_name), 0) < backend_limit
+
+    def _acquire(self, provider_name: str, backend_name: str) -> None:
+        """Account for a job being started on the given provider/backend.
+
+        Parameters
+        ----------
+        provider_name : str
+            The provider name.
+        backend_name : str
+            The backend name.
+
+        """
+        self._running += 1
+        self._provider_running[provider_name] = self._provider_running.get(provider_name, 0) + 1
+        key = (provider_name, backend_name)
+        self._backend_running[key] = self._backend_running.get(key, 0) + 1
+
+    def _release(self, provider_name: str, backend_name: str) -> None:
+        """Account for a job having finished on the given provider/backend.
+
+        Parameters
+        ----------
+        provider_name : str
+            The provider name.
+        backend_name : str
+            The backend name.
+
+        """
+        self._running -= 1
+        self._provider_running[provider_name] -= 1
+        self._backend_running[(provider_name, backend_name)] -= 1
+
+    def reserve(self, provider_name: str, backend_name: str) -> bool:
+        """Take a slot on a provider/backend for work started outside :meth:`run`, if the limits allow.
+
+        Like the callbacks of :meth:`run`, it must be called from the scheduling thread.
+
+        Parameters
+        ----------
+        provider_name : str
+            The provider name.
+        backend_name : str
+            The backend name.
+
+        Returns
+        -------
+        bool
+            True if the slot was taken; it must then be given back with :meth:`release_reservation`.
+
+        """
+        if not self._can_start(provider_name, backend_name):
+            return False
+        self._acquire(provider_name, backend_name)
+        return True
+
+    def release_reservation(self, provider_name: str, backend_name: str) -> None:
+        """Give back a slot taken with :meth:`reserve`, from the scheduling thread.
+
+        Parameters
+        ----------
+        provider_name : str
+            The provider name.
+        backend_name : str
+            The backend name.
+
+        """
+        self._release(provider_name, backend_name)
+
+    def run(  # pylint: disable=too-many-branches
+        self,
+        jobs: Iterable[ScheduledJob],
+        submit: Callable[[str, str, "Job"], "Future[Any]"],
+        on_done: Callable[[str, str, "Job", "Future[Any]"], "Future[Any] | None"],
+    ) -> None:
+        """Submit every job through `submit`, respecting the limits, until all have finished.
+
+        Parameters
+        ----------
+        jobs : Iterable[Tuple[str, str, Job]]
+            The (provider, backend, job) tuples to run; consumed lazily.
+        submit : Callable[[str, str, Job], Future]
+            Starts a job and returns its future.
+        on_done : Callable[[str, str, Job, Future], Future or None]
+            Called in the scheduling thread with each finished future. If it returns a
+            new future (e.g. the job was resubmitted after a crash), the job stays in
+            flight and `on_done` is called again when that future finishes.
+
+        """
+        source = iter(jobs)
+        exhausted = False
+        blocked: deque[ScheduledJob] = deque()
+        in_flight: dict[Future[Any], ScheduledJob] = {}
+
+        def _start(item: ScheduledJob) -> None:
+            prov, back, job = item
+            self._acquire(prov, back)
+            try:
+                fut = submit(prov, back, job)
+            except Exception as e:  # pylint: disable=broad-except
+                logger.error("Error submitting Job %s: %s", job.id, e)
+                fut = Future()
+                fut.set_exception(e)
+            in_flight[fut] = item
+
+        while True:
+            # First give previously blocked jobs a chance, preserving their order.
+            still_blocked: deque[ScheduledJob] = deque()
+            while blocked:
+                if self.max_in_flight is not None and self._running >= self.max_in_flight:
+                    break
+                item = blocked.popleft()
+                if self._can_start(item[0], item[1]):
+                    _start(item)
+                else:
+                    still_blocked.append(item)
+            still_blocked.extend(blocked)
+            blocked = still_blocked
+
+            while not exhausted and len(blocked) < self.max_lookahead:
+                if self.max_in_flight is not None and self._running >= self.max_in_flight:
+                    break
+                upcoming: ScheduledJob | None = next(source, None)
+                if upcoming is None:
+                    exhausted = True
+                    break
+                if self._can_start(upcoming[0], upcoming[1]):
+                    _start(upcoming)
+                else:
+                    blocked.append(upcoming)
+
+            if not in_flight:
+                break
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for fut in done:
+                item = in_flight.pop(fut)
+                retry = on_done(*item, fut)
+                if retry is None:
+                    self._release(item[0], item[1])
+                else:
+                    in_flight[retry] = item
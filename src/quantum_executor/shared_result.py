@@ -0,0 +1,270 @@
+"""Transfer large worker results to the parent process through shared memory.
+
+Results returned by worker processes normally travel back through the
+``ProcessPoolExecutor`` result pipe, which pickles and copies the whole payload.
+For large payloads the worker instead writes the pickle stream (and any
+out-of-band buffers, e.g. NumPy arrays) into a ``multiprocessing.shared_memory``
+segment and returns a small :class:`SharedResultHandle`. The parent maps the
+segment and unpickles directly from it; out-of-band buffers are exposed as
+views on the segment without being copied. Whether a result is large is first
+estimated from its shape, so that the usual small results are not pickled twice.
+"""
+
+import logging
+import pickle
+from contextlib import suppress
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Payloads smaller than this (in bytes) are returned through the pipe as usual.
+DEFAULT_SHARED_MEMORY_THRESHOLD = 1 << 20
+
+# Lists and tuples longer than this are sized from their first item.
+SAMPLED_ITEMS = 64
+
+
+class SharedResultHandle:  # pylint: disable=too-few-public-methods
+    """Picklable reference to a result payload stored in a shared-memory segment.
+
+    Parameters
+    ----------
+    name : str
+        Name of the shared-memory segment.
+    payload_size : int
+        Size in bytes of the pickle stream at the start of the segment.
+    buffer_sizes : tuple[int, ...]
+        Sizes in bytes of the out-of-band buffers following the pickle stream.
+
+    """
+
+    __slots__ = ("buffer_sizes", "name", "payload_size")
+
+    def __init__(self, name: str, payload_size: int, buffer_sizes: tuple[int, ...] = ()) -> None:
+        """Initialize a SharedResultHandle.
+
+        Parameters
+        ----------
+        name : str
+            Name of the shared-memory segment.
+        payload_size : int
+            Size in bytes of the pickle stream at the start of the segment.
+        buffer_sizes : tuple[int, ...], optional
+            Sizes in bytes of the out-of-band buffers following the pickle stream.
+
+        """
+        self.name: str = name
+        self.payload_size: int = payload_size
+        self.buffer_sizes: tuple[int, ...] = buffer_sizes
+
+    def __getstate__(self) -> tuple[str, int, tuple[int, ...]]:
+        """Return the picklable state of the handle.
+
+        Returns
+        -------
+        tuple[str, int, tuple[int, ...]]
+            The segment name, payload size and buffer sizes.
+
+        """
+        return self.name, self.payload_size, self.buffer_sizes
+
+    def __setstate__(self, state: tuple[str, int, tuple[int, ...]]) -> None:
+        """Restore the handle from its pickled state.
+
+        Parameters
+        ----------
+        state : tuple[str, int, tuple[int, ...]]
+            The segment name, payload size and buffer sizes.
+
+        """
+        self.name, self.payload_size, self.buffer_sizes = state
+
+    @property
+    def size(self) -> int:
+        """Total number of bytes used in the segment.
+
+        Returns
+        -------
+        int
+            Size of the pickle stream plus all out-of-band buffers.
+
+        """
+        return self.payload_size + sum(self.buffer_sizes)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the handle.
+
+        Returns
+        -------
+        str
+            Includes the segment name and its used size.
+
+        """
+        return f"SharedResultHandle(name={self.name}, size={self.size})"
+
+
+def estimate_size(data: Any) -> int | None:  # noqa: ANN401 # pylint: disable=too-many-return-statements
+    """Estimate the serialized size of a result without serializing it.
+
+    Arrays and buffers count their ``nbytes``. A dictionary, such as a counts
+    dictionary, counts its length times the size of its first entry, and a long
+    list or tuple does the same with its first item.
+
+    Parameters
+    ----------
+    data : Any
+        The result.
+
+    Returns
+    -------
+    int or None
+        The approximate size in bytes, usually above the exact one, or None if `data`
+        holds values of other types.
+
+    """
+    if data is None or isinstance(data, bool | int | float):
+        return 9
+    if isinstance(data, str | bytes | bytearray):
+        return len(data) + 5
+    nbytes = getattr(data, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    if isinstance(data, dict):
+        if not data:
+            return 2
+        key, value = next(iter(data.items()))
+        key_size, value_size = estimate_size(key), estimate_size(value)
+        if key_size is None or value_size is None:
+            return None
+        return len(data) * (key_size + value_size)
+    if isinstance(data, list | tuple):
+        # Results hold few items (e.g. the counts of each circuit), or many of the same kind.
+        sizes = []
+        for item in data[:SAMPLED_ITEMS]:
+            size = estimate_size(item)
+            if size is None:
+                return None
+            sizes.append(size)
+        return sum(sizes) if len(data) <= SAMPLED_ITEMS else len(data) * sizes[0]
+    return None
+
+
+def share_result(data: Any, threshold: int | None = DEFAULT_SHARED_MEMORY_THRESHOLD) -> Any:  # noqa: ANN401
+    """Move a result into shared memory if its serialized size reaches the threshold.
+
+    Called in the worker process. A result estimated by :func:`estimate_size` to be
+    below the threshold is returned without being serialized here. The segment stays
+    registered with the resource tracker, which the executor shares with its workers,
+    until the process attaching it with :func:`attach_result` unlinks it; a segment
+    whose handle is never attached, e.g. because its worker died before returning it,
+    is thus still unlinked when the executor exits.
+
+    Parameters
+    ----------
+    data : Any
+        The result produced by the job.
+    threshold : int or None, optional
+        Minimum serialized size in bytes for a payload to be shared.
+        If None, the result is always returned unchanged.
+
+    Returns
+    -------
+    Any
+        Either `data` itself or a :class:`SharedResultHandle` pointing at it.
+
+    """
+    if threshold is None:
+        return data
+    estimate = estimate_size(data)
+    if estimate is not None and estimate < threshold:
+        return data
+
+    buffers: list[pickle.PickleBuffer] = []
+    payload = pickle.dumps(data, protocol=5, buffer_callback=buffers.append)
+    raws = [buf.raw() for buf in buffers]
+    total = len(payload) + sum(raw.nbytes for raw in raws)
+    if total < threshold:
+        return data
+
+    segment = SharedMemory(create=True, size=total)
+    try:
+        segment.buf[: len(payload)] = payload
+        offset = len(payload)
+        for raw in raws:
+            segment.buf[offset : offset + raw.nbytes] = raw
+            offset += raw.nbytes
+        handle = SharedResultHandle(segment.name, len(payload), tuple(raw.nbytes for raw in raws))
+    except Exception:
+        segment.close()
+        segment.unlink()
+        raise
+    segment.close()
+    logger.debug("Result of %d bytes moved to shared memory segment '%s'.", total, handle.name)
+    return handle
+
+
+def attach_result(value: Any) -> tuple[Any, SharedMemory | None]:  # noqa: ANN401
+    """Resolve a value returned by a worker into the actual result data.
+
+    Parameters
+    ----------
+    value : Any
+        Either a result or a :class:`SharedResultHandle`.
+
+    Returns
+    -------
+    tuple[Any, SharedMemory or None]
+        The result data and, if it was shared, the attached segment backing it.
+        The caller owns the segment and must eventually pass it to :func:`release_segment`.
+
+    """
+    if not isinstance(value, SharedResultHandle):
+        return value, None
+
+    segment = SharedMemory(name=value.name)
+    try:
+        view = segment.buf
+        offset = value.payload_size
+        buffers = []
+        for size in value.buffer_sizes:
+            buffers.append(view[offset : offset + size])
+            offset += size
+        data = pickle.loads(view[: value.payload_size], buffers=buffers)  # noqa: S301
+    except Exception:
+        release_segment(segment)
+        raise
+    return data, segment
+
+
+def discard_result(value: Any) -> None:  # noqa: ANN401
+    """Free the shared-memory segment of a worker result that will not be read.
+
+    Parameters
+    ----------
+    value : Any
+        Either a result, which is left alone, or a :class:`SharedResultHandle`.
+
+    """
+    if isinstance(value, SharedResultHandle):
+        release_segment(SharedMemory(name=value.name))
+
+
+def release_segment(segment: SharedMemory) -> None:
+    """Close and unlink a shared-memory segment obtained from :func:`attach_result`.
+
+    If objects still reference the mapped memory, only the name is unlinked and the
+    mapping is released once those objects are garbage collected.
+
+    Parameters
+    ----------
+    segment : SharedMemory
+        The segment to release.
+
+    """
+    try:
+        segment.close()
+    except BufferError:
+        logger.debug("Shared memory segment '%s' still referenced; deferring close.", segment.name)
+    with suppress(FileNotFoundError):
+        segment.unlink()
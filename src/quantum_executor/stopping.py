@@ -0,0 +1,316 @@
+"""Stop sampling a circuit once its measured distribution is precise enough.
+
+With a stopping rule, :meth:`QuantumExecutor.run_experiment` sends the shots of a
+circuit in increments instead of all at once. After each round the counts of all
+rounds so far are checked against the rule, and the experiment ends as soon as it
+is met, often long before the full shot budget is spent.
+"""
+
+import math
+from abc import ABC
+from abc import abstractmethod
+from statistics import NormalDist
+from typing import Any
+
+Counts = dict[str, int]
+
+
+def total_counts(results: dict[str, dict[str, list[Any]]]) -> Counts:
+    """Add up the counts of every successful job.
+
+    Parameters
+    ----------
+    results : Dict[str, Dict[str, List[ResultData]]]
+        Job results, as returned by ``ResultCollector.get_results()``.
+
+    Returns
+    -------
+    Dict[str, int]
+        Outcome → number of shots, over all jobs.
+
+    """
+    counts: Counts = {}
+    for backends in results.values():
+        for job_results in backends.values():
+            for data in job_results:
+                if not isinstance(data, dict) or "error" in data:
+                    continue
+                for outcome, count in data.items():
+                    counts[outcome] = counts.get(outcome, 0) + count
+    return counts
+
+
+def total_variation_distance(p: Counts, q: Counts) -> float:
+    """Return the total variation distance between two count distributions.
+
+    Parameters
+    ----------
+    p : Dict[str, int]
+        First counts.
+    q : Dict[str, int]
+        Second counts.
+
+    Returns
+    -------
+    float
+        Half the L1 distance between the normalized distributions, between 0 and 1;
+        1 if either is empty.
+
+    """
+    p_total, q_total = sum(p.values()), sum(q.values())
+    if not p_total or not q_total:
+        return 1.0
+    return sum(abs(p.get(k, 0) / p_total - q.get(k, 0) / q_total) for k in p.keys() | q.keys()) / 2
+
+
+class StoppingRule(ABC):  # pylint: disable=too-few-public-methods
+    """Decide, after each round of shots, whether a distribution estimate is good enough.
+
+    Subclasses implement ``_met``, which :meth:`should_stop` calls once `min_shots` is
+    reached. It receives the counts of all rounds so far and those of the rounds before
+    the last one, and must not keep state between calls, so that one rule can serve
+    several experiments.
+
+    Parameters
+    ----------
+    min_shots : int, optional
+        Shots needed before the rule is evaluated at all. Defaults to 0.
+
+    """
+
+    def __init__(self, min_shots: int = 0) -> None:
+        """Initialize the StoppingRule.
+
+        Parameters
+        ----------
+        min_shots : int, optional
+            Shots needed before the rule is evaluated at all.
+
+        Raises
+        ------
+        ValueError
+            If `min_shots` is negative.
+
+        """
+        if min_shots < 0:
+            raise ValueError("min_shots must be non-negative.")
+        self.min_shots = min_shots
+
+    def should_stop(self, counts: Counts, previous: Counts | None) -> bool:
+        """Check whether sampling can stop.
+
+        Parameters
+        ----------
+        counts : Dict[str, int]
+            Counts of all rounds so far.
+        previous : Dict[str, int] or None
+            Counts of all rounds but the last, or None after the first round.
+
+        Returns
+        -------
+        bool
+            True if no more shots are needed.
+
+        """
+        return sum(counts.values()) >= self.min_shots and self._met(counts, previous)
+
+    @abstractmethod
+    def _met(self, counts: Counts, previous: Counts | None) -> bool:
+        """Check the rule itself once `min_shots` is reached.
+
+        Parameters
+        ----------
+        counts : Dict[str, int]
+            Counts of all rounds so far.
+        previous : Dict[str, int] or None
+            Counts of all rounds but the last, or None after the first round.
+
+        Returns
+        -------
+        bool
+            True if no more shots are needed.
+
+        """
+
+
+class ConfidenceIntervalRule(StoppingRule):
+    """Stop once the probabilities of the most frequent outcomes are known within a tolerance.
+
+    The probability of each of the `top` most frequent outcomes is estimated with a
+    Wilson score interval; sampling stops when none is wider than ``2 * half_width``.
+
+    Parameters
+    ----------
+    half_width : float, optional
+        Largest accepted half-width of the intervals. Defaults to 0.01.
+    confidence : float, optional
+        Confidence level of the intervals, between 0 and 1. Defaults to 0.95.
+    top : int, optional
+        Number of most frequent outcomes checked. Defaults to 1.
+    min_shots : int, optional
+        Shots needed before the rule is evaluated at all. Defaults to 0.
+
+    Examples
+    --------
+    >>> rule = ConfidenceIntervalRule(half_width=0.02, top=2)
+    >>> executor.run_experiment(circuit, 100_000, backends, stopping_rule=rule, shots_per_round=1000)
+
+    """
+
+    def __init__(self, half_width: float = 0.01, confidence: float = 0.95, top: int = 1, min_shots: int = 0) -> None:
+        """Initialize the ConfidenceIntervalRule.
+
+        Parameters
+        ----------
+        half_width : float, optional
+            Largest accepted half-width of the intervals.
+        confidence : float, optional
+            Confidence level of the intervals, between 0 and 1.
+        top : int, optional
+            Number of most frequent outcomes checked.
+        min_shots : int, optional
+            Shots needed before the rule is evaluated at all.
+
+        Raises
+        ------
+        ValueError
+            If a parameter is out of range.
+
+        """
+        super().__init__(min_shots)
+        if not 0 < half_width < 1:
+            raise ValueError("half_width must be between 0 and 1.")
+        if not 0 < confidence < 1:
+            raise ValueError("confidence must be between 0 and 1.")
+        if top < 1:
+            raise ValueError("top must be at least 1.")
+        self.half_width = half_width
+        self.confidence = confidence
+        self.top = top
+        self._z = NormalDist().inv_cdf((1 + confidence) / 2)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the ConfidenceIntervalRule.
+
+        Returns
+        -------
+        str
+            Includes the half-width, the confidence level and the number of outcomes checked.
+
+        """
+        return f"ConfidenceIntervalRule(half_width={self.half_width}, confidence={self.confidence}, top={self.top})"
+
+    def interval(self, count: int, shots: int) -> tuple[float, float]:
+        """Return the Wilson score interval of an outcome's probability.
+
+        Parameters
+        ----------
+        count : int
+            Shots that gave the outcome.
+        shots : int
+            Total shots.
+
+        Returns
+        -------
+        Tuple[float, float]
+            Lower and upper bound.
+
+        """
+        z2 = self._z**2
+        center = (count + z2 / 2) / (shots + z2)
+        spread = self._z * math.sqrt(count * (shots - count) / shots + z2 / 4) / (shots + z2)
+        return center - spread, center + spread
+
+    def _met(self, counts: Counts, previous: Counts | None) -> bool:  # noqa: ARG002
+        """Check that the intervals of the most frequent outcomes are narrow enough.
+
+        Parameters
+        ----------
+        counts : Dict[str, int]
+            Counts of all rounds so far.
+        previous : Dict[str, int] or None
+            Not used by this rule.
+
+        Returns
+        -------
+        bool
+            True if every checked interval is at most ``2 * half_width`` wide.
+
+        """
+        shots = sum(counts.values())
+        if not shots:
+            return False
+        for count in sorted(counts.values(), reverse=True)[: self.top]:
+            low, high = self.interval(count, shots)
+            if high - low > 2 * self.half_width:
+                return False
+        return True
+
+
+class TotalVariationRule(StoppingRule):
+    """Stop once the last round barely moved the distribution.
+
+    Parameters
+    ----------
+    tolerance : float, optional
+        Largest accepted total variation distance between the distributions before
+        and after the last round. Defaults to 0.01.
+    min_shots : int, optional
+        Shots needed before the rule is evaluated at all. Defaults to 0.
+
+    Examples
+    --------
+    >>> rule = TotalVariationRule(tolerance=0.005, min_shots=2000)
+    >>> executor.run_experiment(circuit, 100_000, backends, stopping_rule=rule, shots_per_round=1000)
+
+    """
+
+    def __init__(self, tolerance: float = 0.01, min_shots: int = 0) -> None:
+        """Initialize the TotalVariationRule.
+
+        Parameters
+        ----------
+        tolerance : float, optional
+            Largest accepted total variation distance between consecutive rounds.
+        min_shots : int, optional
+            Shots needed before the rule is evaluated at all.
+
+        Raises
+        ------
+        ValueError
+            If `tolerance` is out of range.
+
+        """
+        super().__init__(min_shots)
+        if not 0 < tolerance < 1:
+            raise ValueError("tolerance must be between 0 and 1.")
+        self.tolerance = tolerance
+
+    def __repr__(self) -> str:
+        """Return a string representation of the TotalVariationRule.
+
+        Returns
+        -------
+        str
+            Includes the tolerance and the minimum number of shots.
+
+        """
+        return f"TotalVariationRule(tolerance={self.tolerance}, min_shots={self.min_shots})"
+
+    def _met(self, counts: Counts, previous: Counts | None) -> bool:
+        """Check the distance between the distributions before and after the last round.
+
+        Parameters
+        ----------
+        counts : Dict[str, int]
+            Counts of all rounds so far.
+        previous : Dict[str, int] or None
+            Counts of all rounds but the last; the rule is never met after the first round.
+
+        Returns
+        -------
+        bool
+            True if the distance is at most `tolerance`.
+
+        """
+        return previous is not None and total_variation_distance(previous, counts) <= self.tolerance
@@ -0,0 +1,7 @@
+"""Synthetic Provider and Backend Classes compatible with qBraid, for load testing."""
+
+from .device import SyntheticBackend
+from .device import SyntheticJob
+from .provider import SyntheticProvider
+
+__all__ = ["SyntheticBackend", "SyntheticJob", "SyntheticProvider"]
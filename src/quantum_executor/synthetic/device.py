@@ -0,0 +1,370 @@
+"""Synthetic Backend and Job Classes compatible with qBraid.
+
+The synthetic backend does not simulate anything. It returns random counts after a
+configurable queue latency and execution time, fails a configurable fraction of
+jobs and rejects submissions above a rate limit, so the executor's scheduling,
+retry and backpressure logic can be load tested without real hardware or clouds.
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+import random
+import threading
+import time
+from typing import TYPE_CHECKING
+from typing import Any
+
+import numpy as np  # type: ignore
+from qbraid.runtime import GateModelResultData  # type: ignore
+from qbraid.runtime import Result
+from qbraid.runtime.device import QuantumDevice  # type: ignore
+from qbraid.runtime.enums import DeviceStatus  # type: ignore
+from qbraid.runtime.enums import JobStatus
+from qbraid.runtime.job import QuantumJob  # type: ignore
+
+if TYPE_CHECKING:  # pragma: no cover
+    from qbraid.runtime import TargetProfile
+
+LATENCY_DISTRIBUTIONS = ("constant", "exponential", "lognormal", "uniform")
+
+
+class SyntheticJob(QuantumJob):  # type: ignore
+    """Job whose outcome is decided at submission and revealed once its ready time has passed.
+
+    Parameters
+    ----------
+    job_id : str
+        The job identifier.
+    device : SyntheticBackend
+        The backend the job was submitted to.
+    started_at : float
+        Monotonic time at which the job leaves the queue and starts running.
+    ready_at : float
+        Monotonic time at which the job finishes.
+    counts : Dict[str, int] or None
+        The counts to return, or None if the job fails.
+
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments too-many-positional-arguments
+        self,
+        job_id: str,
+        device: SyntheticBackend,
+        started_at: float,
+        ready_at: float,
+        counts: dict[str, int] | None,
+    ) -> None:
+        """Initialize a SyntheticJob.
+
+        Parameters
+        ----------
+        job_id : str
+            The job identifier.
+        device : SyntheticBackend
+            The backend the job was submitted to.
+        started_at : float
+            Monotonic time at which the job leaves the queue and starts running.
+        ready_at : float
+            Monotonic time at which the job finishes.
+        counts : Dict[str, int] or None
+            The counts to return, or None if the job fails.
+
+        """
+        super().__init__(job_id, device=device)
+        self._started_at = started_at
+        self._ready_at = ready_at
+        self._counts = counts
+        self._cancelled = threading.Event()
+
+    def status(self) -> JobStatus:
+        """Return the status of the job at the current time.
+
+        Returns
+        -------
+        JobStatus
+            QUEUED, RUNNING, then COMPLETED or FAILED; CANCELLED if cancelled before finishing.
+
+        """
+        if self._cancelled.is_set():
+            return JobStatus.CANCELLED
+        now = time.monotonic()
+        if now < self._started_at:
+            return JobStatus.QUEUED
+        if now < self._ready_at:
+            return JobStatus.RUNNING
+        return JobStatus.COMPLETED if self._counts is not None else JobStatus.FAILED
+
+    def result(self) -> Result[Any]:
+        """Wait until the job has finished and return its counts.
+
+        Returns
+        -------
+        Result[Any]
+            The synthetic counts, as GateModelResultData.
+
+        Raises
+        ------
+        RuntimeError
+            If the job was drawn to fail or was cancelled.
+
+        """
+        remaining = self._ready_at - time.monotonic()
+        # Waiting on the cancellation event lets `cancel` interrupt the wait.
+        if self._cancelled.wait(max(remaining, 0)):
+            raise RuntimeError(f"Synthetic job {self.id} was cancelled.")
+        if self._counts is None:
+            raise RuntimeError(f"Synthetic job {self.id} failed (injected failure).")
+        return Result(
+            device_id=self.device.id,
+            job_id=self.id,
+            success=True,
+            data=GateModelResultData(measurement_counts=self._counts),
+        )
+
+    def cancel(self) -> None:
+        """Cancel the job if it has not finished yet."""
+        if time.monotonic() < self._ready_at:
+            self._cancelled.set()
+
+
+class SyntheticBackend(QuantumDevice):  # type: ignore # pylint: disable=too-many-instance-attributes
+    """Backend returning synthetic counts with configurable latency, failures and rate limits.
+
+    Parameters
+    ----------
+    profile : TargetProfile
+        The target profile configuration.
+    queue_latency : float, optional
+        Mean time in seconds a job waits before it starts running (the median for
+        the lognormal distribution). Defaults to 0.
+    latency_distribution : str, optional
+        Distribution of the queue latency: "constant", "exponential", "lognormal"
+        or "uniform" (between 0 and twice the mean). Defaults to "constant".
+    latency_sigma : float, optional
+        Shape parameter of the lognormal distribution. Defaults to 0.5.
+    shot_time : float, optional
+        Execution time in seconds per shot. Defaults to 0.
+    failure_rate : float, optional
+        Probability that a job fails. Defaults to 0.
+    rate_limit : float, optional
+        Maximum sustained submissions per second; submissions above it raise a
+        RuntimeError. The limit applies per backend instance, i.e. per process.
+        Defaults to no limit.
+    rate_burst : int, optional
+        Number of submissions allowed at once before the rate limit applies.
+        Defaults to one second worth of `rate_limit`.
+    result_size : int, optional
+        Number of distinct bitstrings in each result; bounded by the shots and the
+        number of possible outcomes. Defaults to every possible outcome.
+    seed : int, optional
+        Seed for reproducible latencies, failures and counts.
+
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        profile: TargetProfile,
+        *,
+        queue_latency: float = 0.0,
+        latency_distribution: str = "constant",
+        latency_sigma: float = 0.5,
+        shot_time: float = 0.0,
+        failure_rate: float = 0.0,
+        rate_limit: float | None = None,
+        rate_burst: int | None = None,
+        result_size: int | None = None,
+        seed: int | None = None,
+    ) -> None:
+        """Initialize a SyntheticBackend.
+
+        Parameters
+        ----------
+        profile : TargetProfile
+            The target profile configuration.
+        queue_latency : float, optional
+            Mean queue latency in seconds.
+        latency_distribution : str, optional
+            "constant", "exponential", "lognormal" or "uniform".
+        latency_sigma : float, optional
+            Shape parameter of the lognormal distribution.
+        shot_time : float, optional
+            Execution time in seconds per shot.
+        failure_rate : float, optional
+            Probability that a job fails.
+        rate_limit : float, optional
+            Maximum sustained submissions per second.
+        rate_burst : int, optional
+            Number of submissions allowed at once before the rate limit applies.
+        result_size : int, optional
+            Number of distinct bitstrings in each result.
+        seed : int, optional
+            Seed for reproducible latencies, failures and counts.
+
+        Raises
+        ------
+        ValueError
+            If a parameter is out of range.
+
+        """
+        if latency_distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(
+                f"Unknown latency distribution '{latency_distribution}'; expected one of {LATENCY_DISTRIBUTIONS}."
+            )
+        if queue_latency < 0 or shot_time < 0 or latency_sigma < 0:
+            raise ValueError("Latencies and times must be non-negative.")
+        if not 0 <= failure_rate <= 1:
+            raise ValueError("failure_rate must be between 0 and 1.")
+        if rate_limit is not None and rate_limit <= 0:
+            raise ValueError("rate_limit must be positive.")
+        if result_size is not None and result_size < 1:
+            raise ValueError("result_size must be a positive integer.")
+        super().__init__(profile=profile)
+
+        self.queue_latency = queue_latency
+        self.latency_distribution = latency_distribution
+        self.latency_sigma = latency_sigma
+        self.shot_time = shot_time
+        self.failure_rate = failure_rate
+        self.rate_limit = rate_limit
+        self.rate_burst = rate_burst or (max(1, math.ceil(rate_limit)) if rate_limit else 0)
+        self.result_size = result_size
+
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)  # noqa: S311
+        self._rng = np.random.default_rng(seed)
+        self._tokens = float(self.rate_burst)
+        self._refilled_at = time.monotonic()
+        self._job_ids = itertools.count()
+
+    def __str__(self) -> str:
+        """Return the string representation of the backend.
+
+        Returns
+        -------
+        str
+            A string containing the class name and device id.
+
+        """
+        return f"{self.__class__.__name__}('{self.id}')"
+
+    def status(self) -> DeviceStatus:
+        """Get the current status of the device.
+
+        Returns
+        -------
+        DeviceStatus
+            Synthetic backends are always online.
+
+        """
+        return DeviceStatus.ONLINE
+
+    def _take_token(self) -> bool:
+        """Consume one submission from the rate-limit token bucket; the caller must hold the lock.
+
+        Returns
+        -------
+        bool
+            False if the rate limit is exceeded.
+
+        """
+        if self.rate_limit is None:
+            return True
+        now = time.monotonic()
+        self._tokens = min(float(self.rate_burst), self._tokens + (now - self._refilled_at) * self.rate_limit)
+        self._refilled_at = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def _draw_latency(self) -> float:
+        """Draw a queue latency; the caller must hold the lock.
+
+        Returns
+        -------
+        float
+            Seconds the job waits before running.
+
+        """
+        if self.queue_latency == 0 or self.latency_distribution == "constant":
+            return self.queue_latency
+        if self.latency_distribution == "exponential":
+            return float(self._rng.exponential(self.queue_latency))
+        if self.latency_distribution == "lognormal":
+            return float(self._rng.lognormal(math.log(self.queue_latency), self.latency_sigma))
+        return float(self._rng.uniform(0.0, 2 * self.queue_latency))
+
+    def _draw_counts(self, width: int, shots: int) -> dict[str, int]:
+        """Spread the shots randomly over a random set of bitstrings; the caller must hold the lock.
+
+        Parameters
+        ----------
+        width : int
+            Number of measured bits.
+        shots : int
+            Number of shots.
+
+        Returns
+        -------
+        Dict[str, int]
+            Bitstring → count, summing to `shots`.
+
+        """
+        outcomes = 1 << width
+        size = min(outcomes, shots, self.result_size or outcomes)
+        values = self._random.sample(range(outcomes), size)
+        hits = self._rng.multinomial(shots, np.full(size, 1.0 / size))
+        return {format(value, f"0{width}b"): int(hit) for value, hit in zip(values, hits, strict=True) if hit}
+
+    def submit(
+        self,
+        run_input: Any,  # noqa: ANN401
+        *_args: Any,  # noqa: ANN401
+        **kwargs: Any,  # noqa: ANN401
+    ) -> QuantumJob | list[QuantumJob]:
+        """Submit one or more circuits; nothing is simulated.
+
+        Parameters
+        ----------
+        run_input : Any or list[Any]
+            One circuit or a list of circuits. Only their number of classical bits
+            (or qubits) is used, to size the bitstrings.
+        *_args : tuple
+            Additional positional arguments, ignored in this implementation.
+        **kwargs : dict
+            Keyword arguments; ``shots`` (int) is required, others are ignored.
+
+        Returns
+        -------
+        QuantumJob or list[QuantumJob]
+            One SyntheticJob per circuit.
+
+        Raises
+        ------
+        ValueError
+            If shots is missing or not positive.
+        RuntimeError
+            If the rate limit is exceeded.
+
+        """
+        shots: int | None = kwargs.pop("shots", None)
+        if shots is None:
+            raise ValueError("shots must be specified in the keyword arguments.")
+        if shots <= 0:
+            raise ValueError("shots must be a positive integer.")
+
+        circuits = run_input if isinstance(run_input, list) else [run_input]
+        jobs: list[QuantumJob] = []
+        with self._lock:
+            for circuit in circuits:
+                if not self._take_token():
+                    raise RuntimeError(f"Rate limit of {self.rate_limit} jobs/s exceeded on '{self.id}'.")
+                width = getattr(circuit, "num_clbits", 0) or getattr(circuit, "num_qubits", 0) or self.num_qubits or 1
+                failed = self.failure_rate > 0 and self._random.random() < self.failure_rate
+                counts = None if failed else self._draw_counts(width, shots)
+                started_at = time.monotonic() + self._draw_latency()
+                ready_at = started_at + shots * self.shot_time
+                jobs.append(SyntheticJob(f"{self.id}-{next(self._job_ids)}", self, started_at, ready_at, counts))
+        return jobs if isinstance(run_input, list) else jobs[0]
@@ -0,0 +1,161 @@
+"""Synthetic Provider Class compatible with qBraid."""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+from qbraid.runtime.device import QuantumDevice  # type: ignore
+from qbraid.runtime.profile import TargetProfile  # type: ignore
+from qbraid.runtime.provider import QuantumProvider  # type: ignore
+
+from quantum_executor.synthetic.device import SyntheticBackend
+
+DEFAULT_NUM_QUBITS = 32
+
+# Built-in devices: an instant backend to measure pure executor overhead, and a
+# cloud-like one with queueing, per-shot execution time, failures and a rate limit.
+DEFAULT_DEVICES: dict[str, dict[str, Any]] = {
+    "synthetic": {},
+    "synthetic_cloud": {
+        "queue_latency": 0.5,
+        "latency_distribution": "lognormal",
+        "shot_time": 1e-4,
+        "failure_rate": 0.01,
+        "rate_limit": 20.0,
+    },
+}
+
+
+class SyntheticProvider(QuantumProvider):  # type: ignore
+    """Provider of synthetic backends for load testing.
+
+    Parameters
+    ----------
+    devices : Dict[str, Dict[str, Any]], optional
+        Device id → keyword arguments of :class:`SyntheticBackend` (e.g. ``queue_latency``,
+        ``failure_rate``). Replaces the built-in "synthetic" and "synthetic_cloud" devices.
+    num_qubits : int, optional
+        Number of qubits reported by every device.
+    **defaults : Any
+        Backend keyword arguments applied to every device unless overridden in `devices`.
+
+    Examples
+    --------
+    >>> executor = QuantumExecutor(
+    ...     providers=["synthetic"],
+    ...     providers_info={"synthetic": {"devices": {"slow": {"queue_latency": 2.0}}, "seed": 7}},
+    ... )
+
+    """
+
+    def __init__(
+        self,
+        devices: dict[str, dict[str, Any]] | None = None,
+        num_qubits: int = DEFAULT_NUM_QUBITS,
+        **defaults: Any,  # noqa: ANN401
+    ) -> None:
+        """Initialize the SyntheticProvider.
+
+        Parameters
+        ----------
+        devices : Dict[str, Dict[str, Any]], optional
+            Device id → keyword arguments of :class:`SyntheticBackend`.
+        num_qubits : int, optional
+            Number of qubits reported by every device.
+        **defaults : Any
+            Backend keyword arguments applied to every device unless overridden in `devices`.
+
+        """
+        super().__init__()
+        self._devices = {
+            device_id: {**defaults, **settings}
+            for device_id, settings in (DEFAULT_DEVICES if devices is None else devices).items()
+        }
+        self._num_qubits = num_qubits
+        self._backends: dict[str, SyntheticBackend] = {}
+        self._lock = threading.Lock()
+        # Validate the settings now rather than on first use.
+        for device_id in self._devices:
+            self.get_device(device_id)
+
+    def _build_runtime_profile(self, device_id: str) -> TargetProfile:
+        """Build the runtime profile of a synthetic device.
+
+        Parameters
+        ----------
+        device_id : str
+            The device identifier.
+
+        Returns
+        -------
+        TargetProfile
+            A simulator profile without a program spec, so programs are passed through untouched.
+
+        """
+        return TargetProfile(
+            device_id=device_id,
+            simulator=True,
+            num_qubits=self._num_qubits,
+            provider_name="Synthetic",
+        )
+
+    def get_devices(self, **_kwargs: Any) -> list[QuantumDevice]:  # noqa: ANN401
+        """Retrieve the configured synthetic backends.
+
+        Parameters
+        ----------
+        **_kwargs : dict
+            Filtering criteria, ignored: every configured device is returned.
+
+        Returns
+        -------
+        list[QuantumDevice]
+            One SyntheticBackend per configured device.
+
+        """
+        return [self.get_device(device_id) for device_id in self._devices]
+
+    def get_device(self, device_id: str) -> SyntheticBackend:
+        """Retrieve a synthetic backend by its device identifier.
+
+        Backends are created once per provider instance, so the rate limit and
+        random state of a device are shared by every job submitted to it.
+
+        Parameters
+        ----------
+        device_id : str
+            The identifier of the desired backend.
+
+        Returns
+        -------
+        SyntheticBackend
+            The corresponding backend.
+
+        Raises
+        ------
+        ValueError
+            If the device is not configured.
+
+        """
+        if device_id not in self._devices:
+            raise ValueError(f"Device '{device_id}' not found in synthetic backends.")
+        with self._lock:
+            backend = self._backends.get(device_id)
+            if backend is None:
+                backend = SyntheticBackend(self._build_runtime_profile(device_id), **self._devices[device_id])
+                self._backends[device_id] = backend
+            return backend
+
+    def __hash__(self) -> int:
+        """Return a hash value for the SyntheticProvider instance.
+
+        Every instance has its own devices, so instances hash by identity.
+
+        Returns
+        -------
+        int
+            The hash value of the SyntheticProvider instance.
+
+        """
+        return object.__hash__(self)
@@ -0,0 +1,75 @@
+"""Record where the time of a quantum job goes, phase by phase.
+
+Timestamps come from ``time.monotonic()``, which is system-wide, so phases recorded
+in worker processes can be compared with those recorded in the parent process.
+"""
+
+import os
+import threading
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+
+Timings = dict[str, tuple[float, float]]  # phase -> (start, end) on the time.monotonic() clock
+WorkerInfo = tuple[int, int]  # (process id, thread id)
+
+# Phases spent outside the job itself: waiting for a worker, handing the result back,
+# and failed attempts followed by their backoff before a retry.
+OVERHEAD_PHASES: frozenset[str] = frozenset({"queue", "transfer", "attach", "retry"})
+
+
+@contextmanager
+def record_phase(timings: Timings | None, phase: str) -> Generator[None, None, None]:
+    """Record the start and end of a job phase on the monotonic clock.
+
+    Parameters
+    ----------
+    timings : Timings or None
+        Mapping updated in place with ``phase -> (start, end)``; nothing is recorded if None.
+    phase : str
+        Name of the phase.
+
+    Yields
+    ------
+    None
+        Control to the timed block.
+
+    """
+    start = time.monotonic()
+    try:
+        yield
+    finally:
+        if timings is not None:
+            timings[phase] = (start, time.monotonic())
+
+
+def run_time(timings: Timings) -> float:
+    """Return the time a job spent running, excluding queueing and result transfer.
+
+    Parameters
+    ----------
+    timings : Timings
+        The recorded phases of the job.
+
+    Returns
+    -------
+    float
+        Seconds between the start of the first and the end of the last execution phase.
+
+    """
+    spans = [span for phase, span in timings.items() if phase not in OVERHEAD_PHASES]
+    if not spans:
+        return 0.0
+    return max(end for _, end in spans) - min(start for start, _ in spans)
+
+
+def current_worker() -> WorkerInfo:
+    """Return the identity of the process and thread running the caller.
+
+    Returns
+    -------
+    WorkerInfo
+        The process id and the native thread id.
+
+    """
+    return os.getpid(), threading.get_native_id()
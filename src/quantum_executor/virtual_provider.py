@@ -7,6 +7,7 @@ online status, and access specific backends by their identifiers.
 """
 
 import logging
+import time
 from typing import TYPE_CHECKING
 from typing import Any
 
@@ -18,6 +19,10 @@ from qbraid.runtime import QbraidProvider
 from qbraid.runtime import QiskitRuntimeProvider
 
 from quantum_executor.local_aer import LocalAERProvider
+from quantum_executor.metrics import NULL_METRICS
+from quantum_executor.metrics import MetricsRegistry
+from quantum_executor.metrics import NullMetrics
+from quantum_executor.synthetic import SyntheticProvider
 
 if TYPE_CHECKING:  # pragma: no cover
     from qbraid.runtime.device import QuantumDevice  # type: ignore
@@ -34,6 +39,7 @@ DEFAULT_PROVIDERS: dict[str, Any] = {
     "local_aer": LocalAERProvider,
     "qbraid": QbraidProvider,
     "qiskit": QiskitRuntimeProvider,
+    "synthetic": SyntheticProvider,
 }
 
 
@@ -72,6 +78,9 @@ class VirtualProvider:
         If True, exceptions during provider initialization will be propagated.
         Otherwise, the error is logged and initialization continues.
         Defaults to False.
+    metrics : MetricsRegistry, optional
+        Registry receiving provider initialization failures and backend lookup
+        counts and latencies. Defaults to no metrics.
 
     Examples
     --------
@@ -86,6 +95,7 @@ class VirtualProvider:
         providers_info: dict[str, dict[str, Any]] | None = None,
         include: list[str] | None = None,
         raise_exc: bool = False,
+        metrics: MetricsRegistry | NullMetrics | None = None,
     ) -> None:
         """Initialize VirtualProvider instance with API keys and an optional list of providers to include.
 
@@ -112,6 +122,9 @@ class VirtualProvider:
             If True, exceptions during provider initialization will be propagated;
             otherwise, errors are logged and initialization continues.
             Defaults to False.
+        metrics : MetricsRegistry, optional
+            Registry receiving provider initialization failures and backend lookup
+            counts and latencies. Defaults to no metrics.
 
         Examples
         --------
@@ -133,6 +146,7 @@ class VirtualProvider:
         # Filter API keys to only include those specified.
         self._providers_info = {k: v for k, v in self._providers_info.items() if k in self._include}
 
+        self._metrics = metrics or NULL_METRICS
         self._providers: dict[str, Any] = {}
         self._init_providers(raise_exc)
 
@@ -170,6 +184,7 @@ class VirtualProvider:
                 self._providers[provider_name] = instance
             except Exception as e:  # pylint: disable=broad-except
                 logger.error("Unable to initialize provider '%s': %s", provider_name, e)
+                self._metrics.inc("quantum_executor_provider_init_failures_total", provider=provider_name)
                 if raise_exc:
                     raise ValueError(f"Unable to initialize provider {provider_name}") from e
 
@@ -277,6 +292,64 @@ class VirtualProvider:
             If the backend is offline when online status is required, or if another error occurs
             during retrieval.
 
+        """
+        if self._metrics.enabled:
+            return self._get_backend_measured(provider_name, backend_name, online)
+        return self._get_backend(provider_name, backend_name, online)
+
+    def _get_backend_measured(self, provider_name: str, backend_name: str, online: bool) -> "QuantumDevice":
+        """Retrieve a backend while reporting the lookup outcome and latency to the metrics registry.
+
+        Parameters
+        ----------
+        provider_name : str
+            The name of the provider from which the backend should be retrieved.
+        backend_name : str
+            The identifier (device_id) of the backend to retrieve.
+        online : bool
+            If True, raises an error if the backend is not online.
+
+        Returns
+        -------
+        QuantumDevice
+            An instance of the requested backend.
+
+        """
+        outcome = "error"
+        start = time.monotonic()
+        try:
+            backend = self._get_backend(provider_name, backend_name, online)
+            outcome = "ok"
+            return backend
+        finally:
+            labels = {"provider": provider_name, "backend": backend_name}
+            self._metrics.inc("quantum_executor_backend_lookups_total", outcome=outcome, **labels)
+            self._metrics.observe("quantum_executor_backend_lookup_seconds", time.monotonic() - start, **labels)
+
+    def _get_backend(self, provider_name: str, backend_name: str, online: bool) -> "QuantumDevice":
+        """Retrieve a backend from the specified provider.
+
+        Parameters
+        ----------
+        provider_name : str
+            The name of the provider from which the backend should be retrieved.
+        backend_name : str
+            The identifier (device_id) of the backend to retrieve.
+        online : bool
+            If True, raises an error if the backend is not online.
+
+        Returns
+        -------
+        QuantumDevice
+            An instance of the requested backend.
+
+        Raises
+        ------
+        ValueError
+            If the provider with the given name is not initialized.
+        RuntimeError
+            If the backend is offline when online status is required.
+
         """
         try:
             provider = self._providers[provider_name]
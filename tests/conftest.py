@@ -0,0 +1,47 @@
+##############################################################################
+# conftest.py
+##############################################################################
+"""Fixtures shared by the test suites."""
+
+from collections.abc import Callable
+from typing import Any
+
+import pytest  # type: ignore
+from qiskit import QuantumCircuit  # type: ignore
+
+from quantum_executor import QuantumExecutor  # type: ignore[import-not-found,unused-ignore]
+
+
+@pytest.fixture  # type: ignore
+def circuit() -> QuantumCircuit:
+    """Provide a one-qubit circuit measuring an equal superposition.
+
+    Returns
+    -------
+    QuantumCircuit
+        The circuit.
+
+    """
+    qc = QuantumCircuit(1, 1)
+    qc.h(0)
+    qc.measure(0, 0)
+    return qc
+
+
+@pytest.fixture  # type: ignore
+def synthetic_executor() -> Callable[..., QuantumExecutor]:
+    """Provide a factory of executors running synthetic devices.
+
+    Returns
+    -------
+    Callable[..., QuantumExecutor]
+        Takes the synthetic devices (device id → backend settings; the provider's default
+        devices if None) and further QuantumExecutor arguments, and returns the executor.
+
+    """
+
+    def make(devices: dict[str, dict[str, Any]] | None = None, **kwargs: Any) -> QuantumExecutor:  # noqa: ANN401
+        providers_info = None if devices is None else {"synthetic": {"devices": devices}}
+        return QuantumExecutor(providers=["synthetic"], providers_info=providers_info, **kwargs)
+
+    return make
@@ -0,0 +1,183 @@
+##############################################################################
+# test_cancellation.py
+##############################################################################
+"""Test suite for job timeouts and the cancellation of dispatches."""
+
+import pickle
+import time
+from collections.abc import Callable
+
+import pytest  # type: ignore
+from qiskit import QuantumCircuit  # type: ignore
+
+from quantum_executor import QuantumExecutor  # type: ignore[import-not-found,unused-ignore]
+from quantum_executor.cancellation import CANCELLED_ERROR  # type: ignore[import-not-found,unused-ignore]
+from quantum_executor.cancellation import CancelFlag  # type: ignore[import-not-found,unused-ignore]
+from quantum_executor.cancellation import CancelScope  # type: ignore[import-not-found,unused-ignore]
+from quantum_executor.job_runner import run_single_job_static  # type: ignore[import-not-found,unused-ignore]
+from quantum_executor.metrics import MetricsRegistry  # type: ignore[import-not-found,unused-ignore]
+from quantum_executor.result_collector import MergedResultCollector  # type: ignore[import-not-found,unused-ignore]
+from quantum_executor.result_collector import ResultCollector  # type: ignore[import-not-found,unused-ignore]
+from quantum_executor.virtual_provider import VirtualProvider  # type: ignore[import-not-found,unused-ignore]
+
+DEVICES = {"fast": {}, "slow": {"queue_latency": 5.0}}
+
+
+class FakeJob:  # pylint: disable=too-few-public-methods
+    """Provider job handle recording whether it was cancelled."""
+
+    def __init__(self, fail: bool = False) -> None:
+        """Initialize the FakeJob.
+
+        Parameters
+        ----------
+        fail : bool, optional
+            If True, cancelling the job raises.
+
+        """
+        self.cancelled = False
+        self.fail = fail
+
+    def cancel(self) -> None:
+        """Cancel the job.
+
+        Raises
+        ------
+        RuntimeError
+            If the job was created with ``fail=True``.
+
+        """
+        if self.fail:
+            raise RuntimeError("cannot cancel")
+        self.cancelled = True
+
+
+# ------------------------------------------------------------------------
+# TESTS FOR CancelScope and the job runner
+# ------------------------------------------------------------------------
+
+
+def test_cancel_scope() -> None:
+    """Test that a scope cancels its tracked jobs, not discarded ones, and later ones right away."""
+    scope = CancelScope()
+    running, finished, failing = FakeJob(), FakeJob(), FakeJob(fail=True)
+    assert scope.add(running) and scope.add(finished) and scope.add(failing)
+    scope.discard(finished)
+    scope.cancel()
+    assert scope.cancelled
+    assert running.cancelled and not finished.cancelled
+
+    late = FakeJob()
+    assert not scope.add(late)
+    assert late.cancelled
+
+
+def test_cancel_flag() -> None:
+    """Test that setting a flag cancels the scope watching its attached copy, and that it is released."""
+    flag = CancelFlag()
+    attached = pickle.loads(pickle.dumps(flag))  # noqa: S301
+    scope, job = CancelScope(), FakeJob()
+    scope.add(job)
+    done = attached.watch(scope, interval=0.01)
+    assert not attached.cancelled
+    flag.cancel()
+    assert attached.cancelled
+    for _ in range(500):
+        if scope.cancelled:
+            break
+        time.sleep(0.01)
+    assert scope.cancelled and job.cancelled
+    done.set()
+    attached.close()
+    flag.close()
+    flag.close()  # Idempotent.
+    flag.cancel()  # Ignored once closed.
+    assert not flag.cancelled
+
+
+def test_run_single_job_timeout(circuit: QuantumCircuit) -> None:
+    """Test that a job exceeding its timeout is cancelled through its handle."""
+    virtual_provider = VirtualProvider(providers_info={"synthetic": {"devices": DEVICES}}, include=["synthetic"])
+    start = time.monotonic()
+    result = run_single_job_static(
+        "synthetic", "slow", circuit, 10, {"timeout": 0.1}, virtual_provider=virtual_provider
+    )
+    assert time.monotonic() - start < 2.0
+    assert result == {"error": "Job timed out after 0.1 s and was cancelled.", "cancelled": True}
+
+    scope = CancelScope()
+    scope.cancel()
+    result = run_single_job_static(
+        "synthetic", "fast", circuit, 10, virtual_provider=virtual_provider, cancel_scope=scope
+    )
+    assert result == {"error": CANCELLED_ERROR, "cancelled": True}
+
+
+# ------------------------------------------------------------------------
+# TESTS FOR timeouts and cancellation in the QuantumExecutor
+# ------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("execution_mode", ["sequential", "threads", "processes"])  # type: ignore
+def test_quantum_executor_job_timeout(
+    execution_mode: str, circuit: QuantumCircuit, synthetic_executor: Callable[..., QuantumExecutor]
+) -> None:
+    """Test per-job and dispatch-wide timeouts."""
+    metrics = MetricsRegistry()
+    dispatch = {
+        "synthetic": {
+            "slow": [{"circuit": circuit, "shots": 10, "configuration": {"timeout": 0.2}}],
+            "fast": [{"circuit": circuit, "shots": 10}],
+        }
+    }
+    jobs = (
+        synthetic_executor(DEVICES, metrics=metrics)
+        .run_dispatch(dispatch, execution_mode=execution_mode, timeout=30.0)
+        .get_jobs()
+    )
+    slow, fast = jobs["synthetic"]["slow"][0], jobs["synthetic"]["fast"][0]
+    assert slow.cancelled and "timed out after 0.2 s" in slow.data["error"]
+    assert "cancelled" not in slow.data
+    assert not fast.cancelled and sum(fast.data.values()) == 10
+    assert metrics.get("quantum_executor_jobs_cancelled_total", provider="synthetic", backend="slow") == 1
+    assert metrics.get("quantum_executor_jobs_failed_total", provider="synthetic", backend="slow") == 0
+
+    with pytest.raises(ValueError, match="timeout"):
+        synthetic_executor(DEVICES).run_dispatch(dispatch, timeout=0)
+
+
+@pytest.mark.parametrize("execution_mode", ["sequential", "threads"])  # type: ignore
+def test_result_collector_cancel(
+    execution_mode: str, circuit: QuantumCircuit, synthetic_executor: Callable[..., QuantumExecutor]
+) -> None:
+    """Test that cancelling a running dispatch cancels its jobs and frees the executor at once."""
+    executor = synthetic_executor(DEVICES, max_threads=2)
+    dispatch = {"synthetic": {"slow": [{"circuit": circuit, "shots": 10}] * 6}}
+    start = time.monotonic()
+    collector = executor.run_dispatch(dispatch, execution_mode=execution_mode, wait=False)
+    time.sleep(0.2)
+    collector.cancel()
+    collector.cancel()  # Idempotent.
+
+    assert isinstance(collector, ResultCollector), "Expected a ResultCollector without a merge policy."
+    assert collector.cancelled
+    assert collector.wait_for_completion(timeout=0)
+    jobs = collector.get_jobs()["synthetic"]["slow"]
+    assert all(job.cancelled and job.data == {"error": CANCELLED_ERROR} for job in jobs)
+    assert "status=Cancelled" in repr(jobs[0])
+    # The running provider jobs were cancelled, so the background work ends right away.
+    executor.close()
+    assert time.monotonic() - start < 3.0
+
+
+def test_merged_result_collector_cancel(
+    circuit: QuantumCircuit, synthetic_executor: Callable[..., QuantumExecutor]
+) -> None:
+    """Test that cancelling a merged dispatch still runs the merge policy on what was collected."""
+    executor = synthetic_executor(DEVICES)
+    dispatch = {"synthetic": {"slow": [{"circuit": circuit, "shots": 10}]}}
+    merged = executor.run_dispatch(dispatch, execution_mode="threads", wait=False, merge_policy="uniform")
+    merged.cancel()
+    assert merged.wait_for_completion(timeout=5.0)
+    assert isinstance(merged, MergedResultCollector), "Expected a MergedResultCollector with a merge policy."
+    assert merged.results.cancelled
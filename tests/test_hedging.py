@@ -0,0 +1,182 @@
+##############################################################################
+# test_hedging.py
+##############################################################################
+"""Test suite for the HedgePolicy class and hedged execution in the QuantumExecutor."""
+
+from collections.abc import Callable
+from typing import Any
+
+import pytest  # type: ignore
+from qiskit import QuantumCircuit  # type: ignore
+
+from quantum_executor import QuantumExecutor  # type: ignore[import-not-found,unused-ignore]
+from quantum_executor.cost_model import CircuitCostModel  # type: ignore[import-not-found,unused-ignore]
+from quantum_executor.cost_model import RuntimeHistory  # type: ignore[import-not-found,unused-ignore]
+from quantum_executor.hedging import HedgePolicy  # type: ignore[import-not-found,unused-ignore]
+from quantum_executor.metrics import MetricsRegistry  # type: ignore[import-not-found,unused-ignore]
+from quantum_executor.result_collector import ResultCollector  # type: ignore[import-not-found,unused-ignore]
+
+# ------------------------------------------------------------------------
+# TESTS FOR HedgePolicy
+# ------------------------------------------------------------------------
+
+
+def test_hedge_policy_deadline() -> None:
+    """Test the fallback delay, then the nearest-rank percentile of the latency window."""
+    policy = HedgePolicy(percentile=90, min_samples=5, delay=3.0, window=10)
+    assert policy.deadline("p", "b") == 3.0
+    for latency in range(1, 21):
+        policy.observe("p", "b", float(latency))
+    # Only the last 10 latencies (11..20) are kept.
+    assert policy.deadline("p", "b") == 19.0
+    assert HedgePolicy().deadline("p", "b") is None
+
+
+def test_hedge_policy_alternates_and_budget() -> None:
+    """Test where duplicates run and how many jobs may be hedged."""
+    policy = HedgePolicy(max_ratio=0.1, alternates={"ionq": {"qpu.aria-1": ("ionq", "qpu.forte-1")}})
+    assert policy.alternate("ionq", "qpu.aria-1") == ("ionq", "qpu.forte-1")
+    assert policy.alternate("ionq", "simulator") == ("ionq", "simulator")
+    assert policy.alternate("ionq", "qpu.aria-1", {"ionq": ["qpu.aria-1", "qpu.aria-2"]}) == ("ionq", "qpu.forte-1")
+
+    # Without a configured alternate, another backend of the same provider in the dispatch, fastest first.
+    backends = {"ionq": ["simulator", "qpu.aria-1", "qpu.forte-1"], "braket": ["sv1"]}
+    assert policy.alternate("ionq", "simulator", backends) == ("ionq", "qpu.aria-1")
+    policy.observe("ionq", "qpu.aria-1", 5.0)
+    policy.observe("ionq", "qpu.forte-1", 1.0)
+    assert policy.alternate("ionq", "simulator", backends) == ("ionq", "qpu.forte-1")
+    assert policy.alternate("braket", "sv1", backends) == ("braket", "sv1")
+    assert policy.budget(5) == 1
+    assert policy.budget(100) == 10
+    assert HedgePolicy(max_ratio=0).budget(100) == 0
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "settings",
+    [{"percentile": 0}, {"min_samples": 0}, {"min_samples": 10, "window": 5}, {"delay": -1.0}, {"max_ratio": 2.0}],
+)
+def test_hedge_policy_invalid(settings: dict[str, Any]) -> None:
+    """Test that out-of-range parameters raise ValueError."""
+    with pytest.raises(ValueError):
+        HedgePolicy(**settings)
+
+
+# ------------------------------------------------------------------------
+# TESTS FOR hedged execution
+# ------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("execution_mode", ["threads", "processes"])  # type: ignore
+def test_quantum_executor_hedge_wins(
+    execution_mode: str, circuit: QuantumCircuit, synthetic_executor: Callable[..., QuantumExecutor]
+) -> None:
+    """Test that a job stuck on a slow backend is completed by its duplicate on the alternate."""
+    metrics = MetricsRegistry()
+    history = RuntimeHistory()
+    policy = HedgePolicy(delay=0.2, max_ratio=1.0, alternates={"synthetic": {"slow": ("synthetic", "fast")}})
+    # The original cannot finish before the hedge, and is cancelled once the hedge has won.
+    devices = {"slow": {"queue_latency": 10.0}, "fast": {}}
+    with synthetic_executor(
+        devices,
+        hedge_policy=policy,
+        metrics=metrics,
+        cost_model=CircuitCostModel(history=history),
+        max_workers=2,
+        max_threads=2,
+    ) as executor:
+        # "lpt" ordering records the runtimes of the jobs in the cost model's history.
+        collector = executor.run_dispatch(
+            {"synthetic": {"slow": [{"circuit": circuit, "shots": 10}]}}, execution_mode=execution_mode, job_order="lpt"
+        )
+
+    result = collector.get_jobs()["synthetic"]["slow"][0]
+    assert sum(result.data.values()) == 10
+    assert result.hedge == "hedge"
+    assert metrics.get("quantum_executor_hedges_total", provider="synthetic", backend="slow") == 1
+    assert metrics.get("quantum_executor_hedge_wins_total", provider="synthetic", backend="slow") == 1
+
+    # The original was cancelled on its provider, so it never finished and no saving is measured.
+    assert metrics.get("quantum_executor_hedge_losers_cancelled_total", provider="synthetic", backend="slow") == 1
+    assert isinstance(collector, ResultCollector), "Expected a ResultCollector without a merge policy."
+    summary = collector.get_hedge_summary()
+    assert summary["jobs"] == summary["hedged"] == summary["hedge_wins"] == 1
+    assert summary["hedge_rate"] == 1.0
+    assert summary["saved"] == 0 and result.hedge_saved is None
+    # The runtime is that of the alternate backend, which ran the winning copy.
+    assert list(history.to_dict()["records"]["synthetic"]) == ["fast"]
+
+
+def test_quantum_executor_hedges_on_other_backend_by_default(
+    circuit: QuantumCircuit, synthetic_executor: Callable[..., QuantumExecutor]
+) -> None:
+    """Test that without alternates, a slow job is hedged on another backend of the dispatch, not its own queue."""
+    metrics = MetricsRegistry()
+    policy = HedgePolicy(delay=0.2, max_ratio=1.0)
+    # A duplicate on the slow backend's own queue could not overtake the original; one on "fast" does.
+    devices = {"slow": {"queue_latency": 10.0}, "fast": {}}
+    dispatch = {"synthetic": {"slow": [{"circuit": circuit, "shots": 10}], "fast": [{"circuit": circuit, "shots": 10}]}}
+    with synthetic_executor(devices, hedge_policy=policy, metrics=metrics, max_threads=4) as executor:
+        collector = executor.run_dispatch(dispatch, execution_mode="threads")
+
+    # Closing the session waited for the cancelled original to stop and be counted.
+    result = collector.get_jobs()["synthetic"]["slow"][0]
+    assert result.hedge == "hedge" and sum(result.data.values()) == 10
+    assert metrics.get("quantum_executor_hedge_wins_total", provider="synthetic", backend="slow") == 1
+    assert metrics.get("quantum_executor_hedge_losers_cancelled_total", provider="synthetic", backend="slow") == 1
+
+
+def test_quantum_executor_hedge_respects_limits(
+    circuit: QuantumCircuit, synthetic_executor: Callable[..., QuantumExecutor]
+) -> None:
+    """Test that a job is not hedged when its alternate backend has no free slot under the concurrency limits."""
+    metrics = MetricsRegistry()
+    policy = HedgePolicy(delay=0.1, max_ratio=1.0, alternates={"synthetic": {"slow": ("synthetic", "fast")}})
+    executor = synthetic_executor(
+        {"slow": {"queue_latency": 0.5}, "fast": {}},
+        hedge_policy=policy,
+        metrics=metrics,
+        provider_limits={"synthetic": 1},
+    )
+
+    collector = executor.run_dispatch(
+        {"synthetic": {"slow": [{"circuit": circuit, "shots": 10}]}}, execution_mode="threads"
+    )
+    result = collector.get_jobs()["synthetic"]["slow"][0]
+    assert sum(result.data.values()) == 10
+    assert result.hedge is None, "The original holds the only slot of its provider."
+    assert metrics.get("quantum_executor_hedges_total", provider="synthetic", backend="slow") == 0
+
+
+def test_quantum_executor_hedge_primary_wins_and_budget(
+    circuit: QuantumCircuit, synthetic_executor: Callable[..., QuantumExecutor]
+) -> None:
+    """Test that the original is kept when it wins, and that only the budgeted jobs are hedged."""
+    policy = HedgePolicy(delay=0.1, max_ratio=0.25, alternates={"synthetic": {"slow": ("synthetic", "slower")}})
+    executor = synthetic_executor(
+        {"slow": {"queue_latency": 0.3}, "slower": {"queue_latency": 0.6}}, hedge_policy=policy
+    )
+
+    collector = executor.run_dispatch(
+        {"synthetic": {"slow": [{"circuit": circuit, "shots": 10}] * 4}}, execution_mode="threads", max_workers=8
+    )
+    jobs = collector.get_jobs()["synthetic"]["slow"]
+    assert all(sum(job.data.values()) == 10 for job in jobs)
+    assert [job.hedge for job in jobs].count("primary") == 1
+    assert [job.hedge for job in jobs].count(None) == 3
+    assert isinstance(collector, ResultCollector), "Expected a ResultCollector without a merge policy."
+    summary = collector.get_hedge_summary()
+    assert summary["hedged"] == 1 and summary["hedge_wins"] == 0 and summary["saved"] == 0
+
+
+def test_quantum_executor_hedge_learns_deadline(
+    circuit: QuantumCircuit, synthetic_executor: Callable[..., QuantumExecutor]
+) -> None:
+    """Test that successful jobs feed the policy's latency window."""
+    policy = HedgePolicy(min_samples=3)
+    executor = synthetic_executor({"synthetic": {}}, hedge_policy=policy)
+    assert policy.deadline("synthetic", "synthetic") is None
+    executor.run_dispatch(
+        {"synthetic": {"synthetic": [{"circuit": circuit, "shots": 10}] * 3}}, execution_mode="threads"
+    )
+    deadline = policy.deadline("synthetic", "synthetic")
+    assert deadline is not None and deadline >= 0
@@ -0,0 +1,108 @@
+##############################################################################
+# test_metrics.py
+##############################################################################
+"""Test suite for the metrics registry and its Prometheus exporter."""
+
+import multiprocessing
+import urllib.request
+
+import pytest  # type: ignore
+from qiskit import QuantumCircuit  # type: ignore
+
+from quantum_executor import Dispatch  # type: ignore[import-not-found,unused-ignore]
+from quantum_executor import QuantumExecutor  # type: ignore[import-not-found,unused-ignore]
+from quantum_executor.metrics import NULL_METRICS  # type: ignore[import-not-found,unused-ignore]
+from quantum_executor.metrics import MetricsRegistry  # type: ignore[import-not-found,unused-ignore]
+
+# Use 'spawn' like test_quantum_executor.py, so worker processes behave the same on every platform.
+multiprocessing.set_start_method("spawn", force=True)
+
+
+def test_metrics_registry_renders_prometheus_text() -> None:
+    """Test counters, gauges and histograms in the Prometheus text format."""
+    metrics = MetricsRegistry(buckets=(0.1, 1.0))
+    metrics.inc("quantum_executor_jobs_submitted_total", provider="local_aer", backend="aer_simulator")
+    metrics.inc("quantum_executor_jobs_submitted_total", 2, provider="local_aer", backend="aer_simulator")
+    metrics.add("quantum_executor_jobs_in_flight", 1, provider="local_aer", backend="aer_simulator")
+    metrics.observe("quantum_executor_job_duration_seconds", 0.5, provider="local_aer", backend="aer_simulator")
+    metrics.observe("quantum_executor_job_duration_seconds", 2.0, provider="local_aer", backend="aer_simulator")
+    metrics.set("custom_gauge", 1.5, label='a "quoted" label')
+
+    labels = 'backend="aer_simulator",provider="local_aer"'
+    text = metrics.render()
+    assert "# TYPE quantum_executor_jobs_submitted_total counter" in text
+    assert f"quantum_executor_jobs_submitted_total{{{labels}}} 3" in text
+    assert f"quantum_executor_jobs_in_flight{{{labels}}} 1" in text
+    assert f'quantum_executor_job_duration_seconds_bucket{{{labels},le="0.1"}} 0' in text
+    assert f'quantum_executor_job_duration_seconds_bucket{{{labels},le="1"}} 1' in text
+    assert f'quantum_executor_job_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+    assert f"quantum_executor_job_duration_seconds_sum{{{labels}}} 2.5" in text
+    assert f"quantum_executor_job_duration_seconds_count{{{labels}}} 2" in text
+    assert 'custom_gauge{label="a \\"quoted\\" label"} 1.5' in text, "Label values should be escaped."
+    assert metrics.get("quantum_executor_job_duration_seconds", provider="local_aer", backend="aer_simulator") == 2
+
+    with pytest.raises(ValueError, match="Counters can only increase"):
+        metrics.inc("quantum_executor_jobs_submitted_total", -1)
+    with pytest.raises(ValueError, match="strictly increasing"):
+        MetricsRegistry(buckets=(1.0, 0.1))
+
+
+def test_null_metrics_discard_everything() -> None:
+    """Test that the default metrics sink records nothing."""
+    NULL_METRICS.inc("quantum_executor_jobs_submitted_total", provider="local_aer")
+    NULL_METRICS.observe("quantum_executor_job_duration_seconds", 1.0)
+    assert not NULL_METRICS.enabled
+    assert NULL_METRICS.render() == ""
+    assert not QuantumExecutor(providers=["local_aer"]).metrics.enabled, "Metrics should be disabled by default."
+
+
+def test_metrics_server_serves_registry() -> None:
+    """Test the local HTTP endpoint."""
+    metrics = MetricsRegistry()
+    metrics.inc("quantum_executor_jobs_submitted_total", provider="local_aer", backend="aer_simulator")
+    server = metrics.serve()
+    try:
+        with urllib.request.urlopen(server.url, timeout=10) as response:  # noqa: S310
+            body = response.read().decode("utf-8")
+            content_type = response.headers["Content-Type"]
+    finally:
+        server.close()
+    assert content_type.startswith("text/plain; version=0.0.4")
+    assert body == metrics.render(), "The endpoint should serve the registry exposition."
+
+
+@pytest.mark.timeout(60)  # type: ignore
+@pytest.mark.parametrize("multiprocess", [False, True])  # type: ignore
+def test_executor_reports_metrics(multiprocess: bool) -> None:
+    """Test that running a dispatch feeds the registry.
+
+    Parameters
+    ----------
+    multiprocess : bool
+        Whether to run the jobs in worker processes.
+
+    """
+    metrics = MetricsRegistry()
+    executor = QuantumExecutor(providers=["local_aer"], metrics=metrics)
+    qc = QuantumCircuit(1, 1)
+    qc.h(0)
+    qc.measure(0, 0)
+    dispatch = Dispatch()
+    dispatch.add_job("local_aer", "aer_simulator", [qc, qc.copy()], 10)
+    dispatch.add_job("local_aer", "missing_backend", qc, 10)
+
+    executor.run_dispatch(dispatch, multiprocess=multiprocess, wait=True)
+
+    ok = {"provider": "local_aer", "backend": "aer_simulator"}
+    missing = {"provider": "local_aer", "backend": "missing_backend"}
+    assert metrics.get("quantum_executor_jobs_submitted_total", **ok) == 2
+    assert metrics.get("quantum_executor_jobs_completed_total", **ok) == 2
+    assert metrics.get("quantum_executor_jobs_failed_total", **missing) == 1
+    assert metrics.get("quantum_executor_jobs_in_flight", **ok) == 0, "No job should be left in flight."
+    assert metrics.get("quantum_executor_job_duration_seconds", **ok) == 2
+    assert metrics.get("quantum_executor_job_queue_seconds", **ok) == 2
+    assert metrics.get("quantum_executor_pool_workers") == 0
+    assert metrics.get("quantum_executor_pool_busy_workers") == 0
+    if not multiprocess:
+        assert metrics.get("quantum_executor_backend_lookups_total", outcome="ok", **ok) == 2
+        assert metrics.get("quantum_executor_backend_lookups_total", outcome="error", **missing) == 1
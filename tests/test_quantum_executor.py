@@ -3,20 +3,40 @@
 ##############################################################################
 """Test suite for the QuantumExecutor, Dispatch, Job, MergedResultCollector, and ResultCollector classes."""
 
+# pylint: disable=too-many-lines
+
+import json
 import logging
 import multiprocessing
+import os
+import pickle
+import threading
+import uuid
 from collections.abc import Callable
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
 from typing import Any
 
 import pytest  # type: ignore
 from qiskit import QuantumCircuit  # type: ignore
 
 from quantum_executor.dispatch import Dispatch  # type: ignore[import-not-found,unused-ignore]
+from quantum_executor.dispatch import FrozenConfig  # type: ignore[import-not-found,unused-ignore]
+from quantum_executor.dispatch import FrozenList  # type: ignore[import-not-found,unused-ignore]
+from quantum_executor.dispatch import IdScope  # type: ignore[import-not-found,unused-ignore]
 from quantum_executor.dispatch import Job  # type: ignore[import,unused-ignore]
+from quantum_executor.dispatch import LazyDispatch  # type: ignore[import-not-found,unused-ignore]
 from quantum_executor.executor import QuantumExecutor  # type: ignore[import-not-found,unused-ignore]
+from quantum_executor.job_runner import init_worker  # type: ignore[import-not-found,unused-ignore]
+from quantum_executor.metrics import MetricsRegistry  # type: ignore[import-not-found,unused-ignore]
 from quantum_executor.result_collector import JobResult  # type: ignore[import-not-found,unused-ignore]
 from quantum_executor.result_collector import MergedResultCollector  # type: ignore[import,unused-ignore]
 from quantum_executor.result_collector import ResultCollector  # type: ignore[import,unused-ignore]
+from quantum_executor.shared_result import SharedResultHandle  # type: ignore[import,unused-ignore]
+from quantum_executor.shared_result import attach_result  # type: ignore[import,unused-ignore]
+from quantum_executor.shared_result import estimate_size  # type: ignore[import,unused-ignore]
+from quantum_executor.shared_result import share_result  # type: ignore[import,unused-ignore]
 
 # Force the use of the 'spawn' start method for multiprocessing to ensure compatibility
 # with operating systems like Windows and macOS, where 'spawn' is the default.
@@ -175,6 +195,163 @@ def test_dispatch_iteration() -> None:
     assert all_jobs[2][0] == "p2" and all_jobs[2][1] == "b2", "Provider and backend mismatch in third job."
 
 
+def test_dispatch_columnar() -> None:
+    """Test that a columnar Dispatch behaves like the default one while sharing its tables."""
+    circuit = QuantumCircuit(1, 1)
+    config = {"seed": 1}
+    jobs_info = {"p1": {"b1": [{"circuit": circuit, "shots": 5, "configuration": config, "id": "first"}]}}
+    default, columnar = Dispatch(jobs_info), Dispatch(jobs_info, columnar=True)
+    for dispatch in (default, columnar):
+        dispatch.add_job("p2", "b2", [circuit, circuit], [10, 20], config)
+        dispatch.add_job("p1", "b1", circuit, 30)
+    assert columnar.columnar and not default.columnar
+
+    def _shape(dispatch: Dispatch) -> list[tuple[str, str, int, Mapping[str, Any]]]:
+        return [(prov, back, job.shots, job.configuration) for prov, back, job in dispatch.all_jobs()]
+
+    assert (
+        _shape(columnar)
+        == _shape(default)
+        == [
+            ("p1", "b1", 5, config),
+            ("p1", "b1", 30, {}),
+            ("p2", "b2", 10, config),
+            ("p2", "b2", 20, config),
+        ]
+    )
+    jobs = [job for _, _, job in columnar.all_jobs()]
+    assert jobs[0].id == "first" and len({job.id for job in jobs}) == 4
+    assert all(job.circuit is circuit for job in jobs)
+    # One copy of the configuration serves every job given it unchanged, and is taken when added.
+    assert jobs[0].configuration is not config and jobs[2].configuration is jobs[3].configuration
+    config["seed"] = 2
+    columnar.add_job("p2", "b2", circuit, 40, config)
+    assert [job.configuration["seed"] for _, _, job in columnar.all_jobs() if job.configuration] == [1, 1, 1, 2]
+    # Jobs in use keep their identity, so they can be mapped to their results.
+    assert [job for _, _, job in columnar.all_jobs()][:4] == jobs
+    assert columnar.items()["p2"]["b2"][0] is jobs[2]
+    assert columnar.to_dict()["p1"]["b1"][0]["id"] == "first"
+
+
+def test_dispatch_frozen_config() -> None:
+    """Test that jobs share a frozen configuration whose values are never copied."""
+    circuit = QuantumCircuit(1, 1)
+    noise_model = object()
+    config = {"noise_model": noise_model, "seed": 1}
+    dispatch = Dispatch({"p1": {"b1": [{"circuit": circuit, "shots": 5, "configuration": config}]}})
+    dispatch.add_job("p1", "b1", [circuit, circuit], 10, config)
+    dispatch.add_job("p1", "b1", circuit, 10, FrozenConfig(config))
+    jobs = [job for _, _, job in dispatch.all_jobs()]
+    assert isinstance(jobs[0].configuration, FrozenConfig)
+    assert jobs[0].configuration is jobs[1].configuration is jobs[2].configuration
+    assert all(job.configuration["noise_model"] is noise_model for job in jobs)
+    assert jobs[3].configuration == jobs[0].configuration == config
+
+    with pytest.raises(TypeError):
+        jobs[0].configuration["seed"] = 2  # type: ignore[index]
+    changed = jobs[0].configuration.replace(seed=2)
+    assert changed == {"noise_model": noise_model, "seed": 2} and jobs[0].configuration["seed"] == 1
+    thawed = jobs[0].configuration.thaw()
+    assert isinstance(thawed, dict) and thawed["noise_model"] is not noise_model
+    assert not Job(circuit, 1).configuration and Job(circuit, 1).configuration is Job(circuit, 2).configuration
+
+    # to_dict() returns plain dictionaries, from which the dispatch can be rebuilt.
+    exported = dispatch.to_dict()["p1"]["b1"][0]["configuration"]
+    assert isinstance(exported, dict) and exported["noise_model"] is noise_model
+    assert Dispatch(dispatch.to_dict()).items()["p1"]["b1"][0].configuration == jobs[0].configuration
+    unpickled = pickle.loads(pickle.dumps(FrozenConfig({"seed": 1})))  # noqa: S301
+    assert isinstance(unpickled, FrozenConfig) and unpickled == {"seed": 1}
+
+
+def test_dispatch_frozen_config_nested() -> None:
+    """Test that a frozen configuration also freezes its nested containers, but shares other values."""
+    circuit = QuantumCircuit(1, 1)
+    noise_model = object()
+    options = {"method": "statevector", "noise_model": noise_model}
+    config = {"backend_options": options, "layout": [0, 1], "seed": 1}
+    dispatch = Dispatch()
+    dispatch.add_job("p1", "b1", circuit, 10, config)
+    job = dispatch.items()["p1"]["b1"][0]
+
+    # Changes to the caller's dictionary, at any depth, are not seen by the job...
+    config["seed"] = 2
+    options["method"] = "density_matrix"
+    config["layout"].append(2)  # type: ignore[attr-defined]
+    assert job.configuration["seed"] == 1
+    assert job.configuration["backend_options"]["method"] == "statevector"
+    assert job.configuration["layout"] == [0, 1] and isinstance(job.configuration["layout"], FrozenList)
+    # ...nor can the job's configuration be changed in place, at any depth...
+    with pytest.raises(TypeError):
+        job.configuration["backend_options"]["method"] = "automatic"
+    with pytest.raises(AttributeError):
+        job.configuration["layout"].append(3)  # type: ignore[attr-defined]
+    # ...while values that are not containers are shared, not copied.
+    assert job.configuration["backend_options"]["noise_model"] is noise_model
+
+    # A changed dictionary is frozen anew when it is given again.
+    dispatch.add_job("p1", "b1", circuit, 10, config)
+    assert dispatch.items()["p1"]["b1"][1].configuration["backend_options"]["method"] == "density_matrix"
+
+    # Thawing returns plain dicts and lists, sharing the other values unless it is deep.
+    shallow, deep = job.configuration.thaw(deep=False), job.configuration.thaw()
+    assert shallow == {
+        "backend_options": {"method": "statevector", "noise_model": noise_model},
+        "layout": [0, 1],
+        "seed": 1,
+    }
+    assert isinstance(shallow["backend_options"], dict) and isinstance(shallow["layout"], list)
+    assert shallow["backend_options"]["noise_model"] is noise_model
+    assert deep["backend_options"]["noise_model"] is not noise_model
+    assert dispatch.to_dict()["p1"]["b1"][0]["configuration"] == shallow
+
+
+def test_dispatch_job_ids() -> None:
+    """Test that generated job ids are sequential within a dispatch and unique across dispatches."""
+    circuit = QuantumCircuit(1, 1)
+    first, second, columnar = Dispatch(), Dispatch(), Dispatch(columnar=True)
+    for dispatch in (first, second, columnar):
+        dispatch.add_job("p1", "b1", [circuit, circuit, circuit], 10)
+    ids = [[job.id for _, _, job in dispatch.all_jobs()] for dispatch in (first, second, columnar)]
+    prefix = ids[0][0].rsplit("-", 1)[0]
+    assert ids[0] == [f"{prefix}-{n}" for n in range(3)]
+    assert len({job_id for dispatch_ids in ids for job_id in dispatch_ids} | {Job(circuit, 1).id}) == 10
+    assert Job(circuit, 1, job_id="mine").id == "mine"
+
+    persistent = Dispatch(persistent_ids=True)
+    persistent.add_job("p1", "b1", circuit, 10)
+    job_id = next(persistent.all_jobs())[2].id
+    assert uuid.UUID(job_id.rsplit("-", 1)[0])
+    assert repr(IdScope()).startswith("IdScope(prefix=")
+
+
+def _new_job_ids(count: int) -> list[str]:
+    """Return the ids of new jobs created outside of a Dispatch."""
+    return [Job(QuantumCircuit(1, 1), 1).id for _ in range(count)]
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="Needs fork.")  # type: ignore
+def test_job_ids_unique_after_fork() -> None:
+    """Test that jobs created in forked children do not repeat the ids of their parent or siblings."""
+    ids = _new_job_ids(3)
+    with ProcessPoolExecutor(2, mp_context=multiprocessing.get_context("fork")) as pool:
+        children = [pool.submit(_new_job_ids, 3) for _ in range(4)]
+        ids += [job_id for future in children for job_id in future.result()]
+    ids += _new_job_ids(3)
+    assert len(set(ids)) == len(ids) == 18
+
+
+def test_quantum_executor_run_dispatch_columnar() -> None:
+    """Test that a columnar Dispatch runs like any other."""
+    circuit = QuantumCircuit(1, 1)
+    circuit.measure(0, 0)
+    dispatch = Dispatch(columnar=True)
+    dispatch.add_job("synthetic", "synthetic", [circuit] * 5, 10)
+    executor = QuantumExecutor(providers=["synthetic"])
+    for execution_mode in ("sequential", "threads"):
+        jobs = executor.run_dispatch(dispatch, execution_mode=execution_mode).get_jobs()["synthetic"]["synthetic"]
+        assert len(jobs) == 5 and all(sum(job.data.values()) == 10 for job in jobs)
+
+
 def test_dispatch_items_structure() -> None:
     """Test that Dispatch.items() returns the correct nested dictionary structure.
 
@@ -785,9 +962,9 @@ def test_dispatch_init_from_dict_single_job() -> None:
     assert job.circuit is circuit, "Job circuit should be the same object."
     assert job.shots == 7, "Job shots should match the provided shots."
     assert job.configuration == config, "Working configuration should match the provided dict."
-    # Ensure deep copy of configuration
+    # Ensure the configuration is frozen when the job is added
     config["param"] = 99
-    assert job.configuration["param"] == 42, "Configuration should be deep-copied and not reflect external changes."
+    assert job.configuration["param"] == 42, "Configuration should be frozen and not reflect external changes."
 
 
 def test_dispatch_init_from_dict_multiple_jobs() -> None:
@@ -911,3 +1088,757 @@ def test_generate_dispatch_preserves_initial_split_data(quantum_executor: Quantu
         circuits=qc, shots=10, backends=backends, split_policy="test_policy", split_data=initial_data
     )
     assert split_data is initial_data
+
+
+@pytest.mark.parametrize("execution_mode", ["sequential", "threads"])  # type: ignore
+def test_quantum_executor_stream_dispatch(
+    execution_mode: str, synthetic_executor: Callable[..., QuantumExecutor]
+) -> None:
+    """Test that a lazy dispatch splits its circuits only as they run, and runs them all."""
+    circuit = QuantumCircuit(1, 1)
+    circuit.measure(0, 0)
+    split: list[int] = []
+
+    def _sweep(count: int) -> Any:  # noqa: ANN401
+        for i in range(count):
+            split.append(i)
+            yield circuit
+
+    executor = synthetic_executor({"a": {}, "b": {}})
+    backends = {"synthetic": ["a", "b"]}
+    lazy = executor.stream_dispatch(_sweep(6), 20, backends, split_policy="uniform", split_data={"seen": True})
+    assert not split and not lazy.consumed
+    collector = executor.run_dispatch(lazy, execution_mode=execution_mode)
+    assert lazy.consumed and split == list(range(6)) and lazy.error is None
+    assert lazy.split_data == {"seen": True}
+    for backend in backends["synthetic"]:
+        jobs = collector.get_jobs()["synthetic"][backend]
+        assert len(jobs) == 6 and all(sum(job.data.values()) == 10 for job in jobs)
+    with pytest.raises(RuntimeError, match="once"):
+        executor.run_dispatch(lazy)
+
+    # An error in a later circuit stops the dispatch there; the circuits split before it still run.
+    lazy = executor.stream_dispatch(_sweep(3), [10, 10], {"synthetic": ["a"]}, split_policy="uniform")
+    collector = executor.run_dispatch(lazy, execution_mode=execution_mode)
+    assert "fewer shot counts" in str(lazy.error)
+    assert len(collector.get_results()["synthetic"]["a"]) == 2 and collector.complete
+
+    with pytest.raises(ValueError, match="more shot counts"):
+        executor.run_dispatch(executor.stream_dispatch([], [10], backends, split_policy="uniform"))
+    with pytest.raises(ValueError, match="quorum_backends"):
+        executor.run_dispatch(executor.stream_dispatch([], 10, backends), quorum_backends=1)
+    empty = executor.run_dispatch(LazyDispatch([]), execution_mode=execution_mode)
+    assert empty.complete and not empty.get_results()
+
+
+def test_result_collector_registration_open() -> None:
+    """Test that a collector expecting more jobs does not complete when the registered ones finish."""
+    collector = ResultCollector()
+    job = Job(QuantumCircuit(1, 1), 10)
+    collector.registration_open = True
+    collector.register_job_mapping(job, "p1", "b1")
+    collector.store_result(job, {"0": 10})
+    assert collector.registration_open and not collector.complete
+    collector.registration_open = False
+    assert collector.complete and collector.wait_for_completion(timeout=0)
+
+
+# ---------------------------------------------------------------------------
+# Tests for shared-memory result transfer
+# ---------------------------------------------------------------------------
+
+
+def test_shared_result_roundtrip_and_release() -> None:
+    """Test that large results go through shared memory and are released with their JobResult."""
+    counts = {format(i, "012b"): i for i in range(4096)}
+
+    assert share_result(counts, threshold=None) is counts, "A None threshold should never share results."
+    assert share_result({"0": 1}) == {"0": 1}, "Small results should be returned unchanged."
+
+    handle = share_result(counts, threshold=0)
+    assert isinstance(handle, SharedResultHandle), "Results above the threshold should be shared."
+    data, segment = attach_result(pickle.loads(pickle.dumps(handle)))  # noqa: S301
+    assert data == counts, "Attached data should match the original result."
+    assert segment is not None, "A shared result should come with its backing segment."
+
+    rc = ResultCollector()
+    job = Job(QuantumCircuit(1, 1), 10)
+    rc.register_job_mapping(job, "prov", "backend")
+    rc.store_result(job, data, shared_segment=segment)
+    job_result = rc.get_jobs()["prov"]["backend"][0]
+    assert job_result.shared, "The JobResult should own the shared segment."
+
+    job_result.release()
+    assert not job_result.shared, "Releasing the JobResult should release its segment."
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name=handle.name)
+
+
+def test_shared_result_estimates_size(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that result sizes are estimated without serializing, and that small results are not serialized."""
+    counts = {format(i, "012b"): i for i in range(4096)}
+    for result in (counts, [counts, {"0": 1}], [{"0": 1, "1": 2}] * 1000, {"error": "failed"}):
+        size = estimate_size(result)
+        assert size is not None and size >= len(pickle.dumps(result, protocol=5)) / 2
+    assert estimate_size({"counts": object()}) is None, "Unknown values cannot be estimated."
+
+    def _no_pickling(*_: Any, **__: Any) -> bytes:  # noqa: ANN401
+        raise AssertionError("Small results should not be serialized by share_result.")
+
+    monkeypatch.setattr("quantum_executor.shared_result.pickle.dumps", _no_pickling)
+    assert share_result(counts, threshold=1 << 20) is counts
+
+
+@pytest.mark.timeout(60)  # type: ignore
+def test_quantum_executor_run_dispatch_shared_memory() -> None:
+    """Test that results returned through shared memory by worker processes are collected correctly."""
+    executor = QuantumExecutor(providers=["local_aer"], shared_memory_threshold=0)
+    qc = QuantumCircuit(1, 1)
+    qc.x(0)
+    qc.measure(0, 0)
+    dispatch = Dispatch()
+    dispatch.add_job("local_aer", "aer_simulator", [qc, qc.copy()], 20)
+
+    collector = executor.run_dispatch(dispatch, multiprocess=True, wait=True)
+    assert collector.complete, "Collector should be complete after wait=True."
+    for job_result in collector.get_jobs()["local_aer"]["aer_simulator"]:
+        assert job_result.data == {"1": 20}, "Shared results should match the simulated counts."
+        assert job_result.shared, "Worker results should be backed by shared memory with a zero threshold."
+        job_result.release()
+
+
+def test_quantum_executor_run_dispatch_job_order(
+    quantum_executor: QuantumExecutor,  # pylint: disable=redefined-outer-name
+) -> None:
+    """Test that LPT job ordering runs every job and that unknown orders are rejected.
+
+    Parameters
+    ----------
+    quantum_executor : QuantumExecutor
+        The QuantumExecutor instance to use for the test.
+
+    """
+    dispatch = Dispatch()
+    dispatch.add_job("local_aer", "aer_simulator", [QuantumCircuit(1, 1), QuantumCircuit(3, 3)], [10, 20])
+
+    with pytest.raises(ValueError, match="Unknown job order"):
+        quantum_executor.run_dispatch(dispatch, job_order="random")
+
+    collector = quantum_executor.run_dispatch(dispatch, multiprocess=True, wait=True, job_order="lpt", max_workers=1)
+    assert collector.complete, "Collector should be complete after wait=True."
+    assert len(collector.get_results()["local_aer"]["aer_simulator"]) == 2, "Both jobs should have a result."
+
+
+def test_quantum_executor_records_runtimes_only_when_used() -> None:
+    """Test that runtimes are measured only with a history file or an LPT order."""
+    executor = QuantumExecutor(providers=["synthetic"])
+    dispatch = Dispatch()
+    dispatch.add_job("synthetic", "synthetic", [QuantumCircuit(1, 1)] * 2, 10)
+
+    executor.run_dispatch(dispatch, execution_mode="threads")
+    assert executor.runtime_history.mean_seconds("synthetic", "synthetic") is None
+    executor.run_dispatch(dispatch, execution_mode="threads", job_order="lpt")
+    assert executor.runtime_history.mean_seconds("synthetic", "synthetic") is not None
+
+
+def test_quantum_executor_estimate_dispatch(tmp_path: Any) -> None:  # noqa: ANN401
+    """Test dispatch estimates before and after runtimes have been measured and persisted.
+
+    Parameters
+    ----------
+    tmp_path : Any
+        Temporary directory for the runtime history file.
+
+    """
+    history_path = str(tmp_path / "history.json")
+    executor = QuantumExecutor(providers=["local_aer"], history_path=history_path)
+    qc = QuantumCircuit(2, 2)
+    qc.h(0)
+    qc.cx(0, 1)
+    qc.measure([0, 1], [0, 1])
+    dispatch = Dispatch()
+    dispatch.add_job("local_aer", "aer_simulator", [qc, qc.copy(), qc.copy()], 100)
+
+    estimate = executor.estimate_dispatch(dispatch, max_workers=2)
+    assert estimate["jobs"] == 3 and estimate["max_workers"] == 2
+    assert not estimate["calibrated"], "A fresh executor should have no measured runtimes."
+    assert estimate["wall_time"] <= estimate["total_time"], "Parallel wall time cannot exceed the total work."
+    assert estimate["backend_load"]["local_aer"]["aer_simulator"] == pytest.approx(estimate["total_time"])
+    assert estimate["peak_memory"] > 0, "Simulator jobs should need some memory."
+
+    executor.run_dispatch(dispatch, wait=True)
+    reloaded = QuantumExecutor(providers=["local_aer"], history_path=history_path)
+    assert reloaded.runtime_history.mean_seconds("local_aer", "aer_simulator") is not None, (
+        "Measured runtimes should be persisted to the history file."
+    )
+    sequential = reloaded.estimate_dispatch(dispatch, multiprocess=False)
+    assert sequential["calibrated"], "Estimates should use the persisted runtimes."
+    assert sequential["wall_time"] == pytest.approx(sequential["total_time"]), (
+        "A sequential run should take as long as the total work."
+    )
+
+
+@pytest.mark.timeout(60)  # type: ignore
+@pytest.mark.parametrize("multiprocess", [False, True])  # type: ignore
+def test_quantum_executor_job_timings(multiprocess: bool) -> None:
+    """Test that every job records its phase timings and that they are aggregated per backend.
+
+    Parameters
+    ----------
+    multiprocess : bool
+        Whether to run the jobs in worker processes.
+
+    """
+    executor = QuantumExecutor(providers=["local_aer"])
+    qc = QuantumCircuit(1, 1)
+    qc.h(0)
+    qc.measure(0, 0)
+    dispatch = Dispatch()
+    dispatch.add_job("local_aer", "aer_simulator", [qc, qc.copy()], 10)
+
+    collector = executor.run_dispatch(dispatch, multiprocess=multiprocess, wait=True)
+    assert isinstance(collector, ResultCollector), "Expected a ResultCollector without a merge policy."
+    expected = {"queue", "get_backend", "submit", "execute", "convert"}
+    if multiprocess:
+        expected |= {"provider_init", "serialize", "transfer"}
+
+    for job_result in collector.get_jobs()["local_aer"]["aer_simulator"]:
+        durations = job_result.durations()
+        assert expected <= set(durations), f"Missing phases: {expected - set(durations)}"
+        assert all(seconds >= 0 for seconds in durations.values()), "Phase durations should be non-negative."
+        assert job_result.worker is not None, "The worker that ran the job should be recorded."
+        assert (job_result.worker[0] != os.getpid()) == multiprocess, "Only pool jobs should run in another process."
+
+    summary = collector.get_timing_summary()["local_aer"]["aer_simulator"]
+    assert summary["execute"]["count"] == 2, "Each job should contribute to the backend aggregate."
+    assert summary["execute"]["mean"] == pytest.approx(summary["execute"]["total"] / 2)
+    assert len(collector.get_timings()["local_aer"]["aer_simulator"]) == 2
+
+
+@pytest.mark.timeout(60)  # type: ignore
+def test_result_collector_export_trace(tmp_path: Any) -> None:  # noqa: ANN401
+    """Test that the job timeline is exported as a Chrome trace-event file.
+
+    Parameters
+    ----------
+    tmp_path : Any
+        Temporary directory for the trace file.
+
+    """
+    executor = QuantumExecutor(providers=["local_aer"])
+    qc = QuantumCircuit(1, 1)
+    qc.h(0)
+    qc.measure(0, 0)
+    dispatch = Dispatch()
+    dispatch.add_job("local_aer", "aer_simulator", [qc, qc.copy()], 10)
+
+    collector = executor.run_dispatch(dispatch, multiprocess=True, wait=True)
+    path = tmp_path / "dispatch.trace.json"
+    collector.export_trace(path)
+    with path.open(encoding="utf-8") as f:
+        trace = json.load(f)
+
+    events = trace["traceEvents"]
+    spans = [event for event in events if event["ph"] == "X"]
+    assert sum(event["cat"] == "job" for event in spans) == 2, "Each job should get a span on its worker track."
+    assert {"execute", "convert"} <= {event["name"] for event in spans}, "Worker phases should be nested spans."
+    assert all(event["ts"] >= 0 and event["dur"] >= 0 for event in spans), "Timestamps should be relative."
+    queue = [event["ph"] for event in events if event["name"] == "queue"]
+    assert sorted(queue) == ["b", "b", "e", "e"], "Queueing should be shown as paired async events."
+    assert all(event["pid"] != os.getpid() for event in spans), "Pool jobs should appear on worker processes."
+
+
+@pytest.mark.timeout(120)  # type: ignore
+def test_quantum_executor_session_reuses_pool() -> None:
+    """Test that a session keeps its worker pool across dispatches and drains pending ones on exit."""
+    qc = QuantumCircuit(1, 1)
+    qc.x(0)
+    qc.measure(0, 0)
+    dispatch = Dispatch()
+    dispatch.add_job("local_aer", "aer_simulator", [qc, qc.copy()], 10)
+
+    with QuantumExecutor(providers=["local_aer"], max_workers=1) as executor:
+        first = executor.run_dispatch(dispatch, multiprocess=True)
+        second = executor.run_dispatch(dispatch, multiprocess=True)
+        pending = executor.run_dispatch(dispatch, multiprocess=True, wait=False, merge_policy="simple_aggregate")
+
+    workers = {job_result.worker for c in (first, second) for job_result in c.get_jobs()["local_aer"]["aer_simulator"]}
+    assert len(workers) == 1, "Every dispatch should run on the single long-lived worker."
+    for job_result in second.get_jobs()["local_aer"]["aer_simulator"]:
+        assert "provider_init" not in job_result.timings, "Session workers should build their provider once."
+        assert job_result.data == {"1": 10}
+    assert pending.complete, "Closing the session should wait for non-blocking dispatches."
+    assert not executor._pools, "The pools should be released on exit."  # pylint: disable=protected-access
+
+    # A closed executor falls back to a pool per dispatch.
+    collector = executor.run_dispatch(dispatch, multiprocess=True)
+    assert collector.get_results()["local_aer"]["aer_simulator"] == [{"1": 10}, {"1": 10}]
+
+
+@pytest.mark.timeout(120)  # type: ignore
+@pytest.mark.parametrize("execution_mode", ["threads", "auto"])  # type: ignore
+def test_quantum_executor_execution_modes(execution_mode: str) -> None:
+    """Test that remote-like jobs run in threads of the calling process and local simulator jobs in workers.
+
+    Parameters
+    ----------
+    execution_mode : str
+        The execution mode to run the dispatch with.
+
+    """
+    executor = QuantumExecutor(
+        providers=["local_aer", "synthetic"],
+        providers_info={"synthetic": {"devices": {"remote": {"queue_latency": 0.2}}}},
+        max_threads=8,
+    )
+    qc = QuantumCircuit(1, 1)
+    qc.x(0)
+    qc.measure(0, 0)
+    dispatch = Dispatch()
+    dispatch.add_job("synthetic", "remote", [qc] * 8, 10)
+    dispatch.add_job("local_aer", "aer_simulator", qc, 10)
+
+    with pytest.raises(ValueError, match="Unknown execution mode"):
+        executor.run_dispatch(dispatch, execution_mode="fibers")
+
+    collector = executor.run_dispatch(dispatch, execution_mode=execution_mode)
+    remote = collector.get_jobs()["synthetic"]["remote"]
+    assert all(sum(job_result.data.values()) == 10 for job_result in remote)
+    assert all(job_result.worker is not None and job_result.worker[0] == os.getpid() for job_result in remote), (
+        "Remote jobs should run in threads."
+    )
+    assert all("provider_init" not in job_result.timings for job_result in remote), (
+        "Threads should share the executor's VirtualProvider."
+    )
+    # Eight 0.2 s waits overlap instead of adding up.
+    executions = [job_result.timings["execute"] for job_result in remote]
+    assert max(end for _, end in executions) - min(start for start, _ in executions) < 1.2
+    (local,) = collector.get_jobs()["local_aer"]["aer_simulator"]
+    assert local.data == {"1": 10}
+    assert local.worker is not None, "Expected the worker that ran the local job."
+    assert (local.worker[0] != os.getpid()) == (execution_mode == "auto"), "Only 'auto' uses processes."
+
+
+class _WorkerKiller:  # pylint: disable=too-few-public-methods
+    """Circuit stand-in that kills the worker process unpickling it, like an out-of-memory kill."""
+
+    def __reduce__(self) -> tuple[Callable[[int], None], tuple[int]]:
+        """Make unpickling call ``os._exit``.
+
+        Returns
+        -------
+        tuple[Callable[[int], None], tuple[int]]
+            The function and arguments called by the unpickler.
+
+        """
+        return os._exit, (1,)
+
+
+@pytest.mark.timeout(180)  # type: ignore
+def test_quantum_executor_recovers_from_worker_crash(
+    synthetic_executor: Callable[..., QuantumExecutor], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a dead worker does not lose the other jobs and that the crashing job is isolated and failed."""
+    metrics = MetricsRegistry()
+    executor = synthetic_executor({"slow": {"queue_latency": 0.5}, "poison": {}}, metrics=metrics)
+
+    # Count the jobs running in isolation at once: the suspects of a crash are rerun one at a time.
+    new_process_pool = executor._new_process_pool  # pylint: disable=protected-access
+    lock = threading.Lock()
+    isolated = {"running": 0, "peak": 0}
+
+    def _finished(_: Any) -> None:  # noqa: ANN401
+        with lock:
+            isolated["running"] -= 1
+
+    def _counting_pool(workers: int, session: bool = False, dedicated: bool = False) -> ProcessPoolExecutor:
+        pool = new_process_pool(workers, session=session, dedicated=dedicated)
+        if dedicated:
+            submit = pool.submit
+
+            def _submit(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+                with lock:
+                    isolated["running"] += 1
+                    isolated["peak"] = max(isolated["peak"], isolated["running"])
+                future = submit(*args, **kwargs)
+                future.add_done_callback(_finished)
+                return future
+
+            pool.submit = _submit  # type: ignore[method-assign]
+        return pool
+
+    monkeypatch.setattr(executor, "_new_process_pool", _counting_pool)
+    # Retiring the broken pools must not break the threads managing them.
+    thread_errors: list[threading.ExceptHookArgs] = []
+    monkeypatch.setattr(threading, "excepthook", thread_errors.append)
+    qc = QuantumCircuit(1, 1)
+    qc.measure(0, 0)
+    dispatch = Dispatch()
+    dispatch.add_job("synthetic", "slow", [qc] * 3, 10)
+    dispatch.add_job("synthetic", "poison", _WorkerKiller(), 10)
+
+    with pytest.raises(ValueError, match="crash_retries"):
+        executor.run_dispatch(dispatch, multiprocess=True, crash_retries=-1)
+
+    collector = executor.run_dispatch(dispatch, multiprocess=True, max_workers=2, crash_retries=1)
+    results = collector.get_results()["synthetic"]
+    assert all(counts is not None and sum(counts.values()) == 10 for counts in results["slow"]), (
+        "Other jobs should be rerun and succeed."
+    )
+    (poison,) = results["poison"]
+    assert poison is not None and "error" in poison, "The crashing job should be reported as failed."
+    # Once in the shared pool, then twice alone: the first isolated crash plus one retry.
+    assert metrics.get("quantum_executor_worker_crashes_total", provider="synthetic", backend="poison") == 3
+    assert isolated["peak"] == 1, "Suspects should be rerun in isolation one at a time."
+    executor.close()
+    assert not thread_errors, f"Unhandled exceptions in background threads: {thread_errors}"
+
+
+@pytest.mark.timeout(180)  # type: ignore
+def test_quantum_executor_worker_recycling(synthetic_executor: Callable[..., QuantumExecutor]) -> None:
+    """Test recycling workers by task count and memory, and routing high-memory jobs to a dedicated worker."""
+    metrics = MetricsRegistry()
+    small = QuantumCircuit(1, 1)
+    small.measure(0, 0)
+    large = QuantumCircuit(3, 3)
+    large.measure([0, 1, 2], [0, 1, 2])
+    dispatch = Dispatch()
+    dispatch.add_job("synthetic", "synthetic", [small] * 3, 10)
+    dispatch.add_job("synthetic", "synthetic_cloud", [large] * 2, 10)
+
+    executor = synthetic_executor(
+        {"synthetic": {}, "synthetic_cloud": {}},
+        max_workers=1,
+        max_tasks_per_worker=1,
+        max_worker_memory=1,
+        high_memory_threshold=500,  # bytes of counts: only the 3-qubit jobs exceed it
+        metrics=metrics,
+    )
+    jobs = executor.run_dispatch(dispatch, multiprocess=True).get_jobs()["synthetic"]
+    small_workers = {job_result.worker[0] for job_result in jobs["synthetic"] if job_result.worker is not None}
+    large_workers = {job_result.worker[0] for job_result in jobs["synthetic_cloud"] if job_result.worker is not None}
+    assert all(sum(job_result.data.values()) == 10 for results in jobs.values() for job_result in results)
+    assert len(small_workers) == 3, "Each worker should be replaced after a single job."
+    assert len(large_workers) == 2 and not small_workers & large_workers, (
+        "High-memory jobs should run one by one on a dedicated worker."
+    )
+    assert metrics.get("quantum_executor_pool_recycles_total") >= 1, "Workers above the RSS limit should be recycled."
+
+
+def test_init_worker_memory_limit() -> None:
+    """Test that worker processes can be given an address-space limit."""
+    resource = pytest.importorskip("resource")
+    limit = 1 << 40
+    with ProcessPoolExecutor(1, initializer=init_worker, initargs=(None, None, False, limit, False)) as pool:
+        soft, _ = pool.submit(resource.getrlimit, resource.RLIMIT_AS).result()
+    assert soft <= limit, "The worker's address space should be capped."
+
+
+@pytest.mark.parametrize("execution_mode", ["sequential", "threads"])  # type: ignore
+def test_quantum_executor_quorum_cancels_slow_backend(
+    execution_mode: str, synthetic_executor: Callable[..., QuantumExecutor]
+) -> None:
+    """Test that the merge resolves once enough backends finished, cancelling the slowest one."""
+    circuit = QuantumCircuit(1, 1)
+    circuit.measure(0, 0)
+    devices = {"a": {}, "b": {}, "c": {}, "slow": {"queue_latency": 10.0}}
+    executor = synthetic_executor(devices)
+    merged = executor.run_experiment(
+        circuit,
+        400,
+        {"synthetic": ["a", "b", "c", "slow"]},
+        split_policy="uniform",
+        merge_policy="simple_aggregate",
+        execution_mode=execution_mode,
+        quorum_backends=3,
+    )
+    assert isinstance(merged, MergedResultCollector)
+    assert merged.quorum_reached
+    assert sum(merged.get_merged_results().values()) == 300, "Only the three finished backends should be merged."
+    slow = merged.get_jobs()["synthetic"]["slow"][0]
+    assert slow.cancelled, "The job of the slowest backend should be cancelled."
+    executor.close()
+
+
+def test_quantum_executor_quorum_abandon(synthetic_executor: Callable[..., QuantumExecutor]) -> None:
+    """Test that abandoned jobs keep running after a shot quorum and still store their results."""
+    circuit = QuantumCircuit(1, 1)
+    circuit.measure(0, 0)
+    devices = {"fast": {}, "slow": {"queue_latency": 0.5}}
+    executor = synthetic_executor(devices)
+    dispatch = {
+        "synthetic": {
+            "fast": [{"circuit": circuit, "shots": 200}],
+            "slow": [{"circuit": circuit, "shots": 100}],
+        }
+    }
+    collector = executor.run_dispatch(dispatch, execution_mode="threads", quorum_shots=200, quorum_action="abandon")
+    assert collector.quorum_reached and collector.complete
+    slow = collector.get_jobs()["synthetic"]["slow"][0]
+    assert not slow.complete and not slow.cancelled, "The slow job should be left running."
+    executor.close()
+    assert slow.complete and sum(slow.data.values()) == 100, "The abandoned job should still store its result."
+
+    with pytest.raises(ValueError, match="quorum action"):
+        ResultCollector(quorum_shots=10, quorum_action="ignore")
+    with pytest.raises(ValueError, match="positive"):
+        ResultCollector(quorum_backends=0)
+
+
+def test_quantum_executor_quorum_per_circuit(synthetic_executor: Callable[..., QuantumExecutor]) -> None:
+    """Test that the shot quorum waits for every circuit, not for the shots of all circuits together."""
+    circuits = [QuantumCircuit(1, 1), QuantumCircuit(1, 1)]
+    for ckt in circuits:
+        ckt.measure(0, 0)
+    devices = {"a": {}, "b": {"queue_latency": 0.2}, "slow": {"queue_latency": 10.0}}
+    executor = synthetic_executor(devices)
+    # The first circuit reaches the quorum on "a" alone; the second needs "b" as well.
+    dispatch = {
+        "synthetic": {
+            "a": [{"circuit": circuits[0], "shots": 200}, {"circuit": circuits[1], "shots": 100}],
+            "b": [{"circuit": circuits[0], "shots": 100}, {"circuit": circuits[1], "shots": 100}],
+            "slow": [{"circuit": circuits[0], "shots": 100}],
+        }
+    }
+    collector = executor.run_dispatch(dispatch, execution_mode="threads", quorum_shots=200)
+    assert collector.quorum_reached and collector.complete
+    jobs = collector.get_jobs()["synthetic"]
+    assert jobs["a"][0].circuit_key == jobs["b"][0].circuit_key != jobs["b"][1].circuit_key
+    second = jobs["b"][1]
+    assert second.complete and not second.cancelled, "The second circuit should wait for its shots on 'b'."
+    assert jobs["slow"][0].cancelled, "The job beyond the quorum of both circuits should be cancelled."
+    executor.close()
+
+
+def test_result_collector_quorum_by_circuit_not_position() -> None:
+    """Test that jobs are grouped by circuit for the shot quorum, whatever their position on their backend."""
+    first, second = QuantumCircuit(1, 1), QuantumCircuit(1, 1)
+    collector = ResultCollector(quorum_shots=150)
+    jobs = {"B": [Job(first, 100), Job(second, 100)], "A": [Job(second, 100)]}
+    for backend, backend_jobs in jobs.items():
+        for job in backend_jobs:
+            collector.register_job_mapping(job, "p", backend)
+    collector.store_result(jobs["A"][0], {"0": 100})
+    collector.store_result(jobs["B"][0], {"0": 100})
+    assert not collector.quorum_reached, "Neither circuit has 150 shots."
+    collector.store_result(jobs["B"][1], {"error": "failed"})
+    assert collector.complete and not collector.quorum_reached
+
+
+def test_adaptive_split_policy() -> None:
+    """Test the pilot of the adaptive policy, then its allocation by measured speed."""
+    executor = QuantumExecutor(providers=["synthetic"])
+    split = executor.get_split_policy("adaptive")
+    circuit = QuantumCircuit(1, 1)
+    backends = {"synthetic": ["fast", "slow"]}
+
+    dispatch, data = split(circuit, 1000, backends, executor.virtual_provider, {})
+    pilot = {back: [job.shots for job in jobs] for back, jobs in dispatch.items()["synthetic"].items()}
+    assert pilot == {"fast": [6, 19], "slow": [6, 19]}
+    assert data["pending_shots"] == 950
+
+    data = {
+        "rates": {
+            "synthetic": {"fast": {"throughput": 300.0, "latency": 0.0}, "slow": {"throughput": 100.0, "latency": 0.0}}
+        }
+    }
+    dispatch, data = split(circuit, 1000, backends, executor.virtual_provider, data)
+    assert {back: jobs[0].shots for back, jobs in dispatch.items()["synthetic"].items()} == {"fast": 750, "slow": 250}
+    assert "pending_shots" not in data
+
+    # A backend that would only start after the others are done gets no shots.
+    data["rates"]["synthetic"]["slow"]["latency"] = 10.0
+    dispatch, _ = split(circuit, 1000, backends, executor.virtual_provider, data)
+    assert {back: jobs[0].shots for back, jobs in dispatch.items()["synthetic"].items()} == {"fast": 1000}
+
+
+@pytest.mark.parametrize("shots", [1, 3, 4, 6])  # type: ignore
+def test_adaptive_split_policy_too_few_shots_for_pilot(shots: int) -> None:
+    """Test that the adaptive policy splits evenly when the shots are too few for a pilot."""
+    executor = QuantumExecutor(providers=["synthetic"])
+    backends = {"synthetic": ["fast", "slow", "flaky"]}
+
+    dispatch, data = executor.generate_dispatch(QuantumCircuit(1, 1), shots, backends, split_policy="adaptive")
+    allocation = [job.shots for _, _, job in dispatch.all_jobs()]
+    assert sum(allocation) == shots and max(allocation) - min(allocation) <= 1
+    assert "pending_shots" not in data
+
+
+def test_adaptive_split_policy_partly_measured() -> None:
+    """Test that measured backends split their share by speed while an unmeasured one gets an even share."""
+    split = QuantumExecutor(providers=["synthetic"]).get_split_policy("adaptive")
+    backends = {"synthetic": ["fast", "slow", "flaky"]}
+    rates = {"fast": {"throughput": 300.0, "latency": 0.0}, "slow": {"throughput": 100.0, "latency": 0.0}}
+
+    # Two shots cannot pay for a pilot on the unmeasured backend.
+    dispatch, data = split(QuantumCircuit(1, 1), 2, backends, None, {"rates": {"synthetic": rates}})
+    allocation = {backend: jobs[0].shots for backend, jobs in dispatch.items()["synthetic"].items()}
+    assert allocation == {"fast": 1, "flaky": 1}
+    assert "pending_shots" not in data
+
+
+@pytest.mark.parametrize("policy_name", ["uniform", "multiplier", "adaptive"])  # type: ignore
+@pytest.mark.parametrize("rates", [False, True])  # type: ignore
+def test_split_many_matches_split(policy_name: str, rates: bool) -> None:  # pylint: disable=too-many-locals
+    """Test that a built-in batch split gives the jobs of splitting each circuit in turn."""
+    executor = QuantumExecutor(providers=["synthetic"])
+    policy = executor._policies[policy_name]  # pylint: disable=protected-access
+    circuits = [QuantumCircuit(1, 1), QuantumCircuit(2, 2), QuantumCircuit(1, 1)]
+    shots_list = [1000, 7, 1000]
+    backends = {"synthetic": ["fast", "slow", "other"]}
+
+    def _data() -> dict[str, Any]:
+        if not rates:
+            return {}
+        speed = {"throughput": 100.0, "latency": 0.0}
+        return {"rates": {"synthetic": {"fast": dict(speed, throughput=300.0), "slow": speed, "other": speed}}}
+
+    def _shape(dispatch: Dispatch) -> list[tuple[str, str, int, int]]:
+        return [(prov, back, job.circuit.num_qubits, job.shots) for prov, back, job in dispatch.all_jobs()]
+
+    batch, batch_data = policy["split_many"](circuits, shots_list, backends, executor.virtual_provider, _data())
+    expected, pending, indices = Dispatch(), [], []
+    data = _data()
+    for index, (circuit, shots) in enumerate(zip(circuits, shots_list, strict=True)):
+        part, data = policy["split"](circuit, shots, backends, executor.virtual_provider, data)
+        pending.append(data.pop("pending_shots", 0))
+        expected.extend(part)
+        indices += [index] * len(list(part.all_jobs()))
+    assert _shape(batch) == _shape(expected)
+    assert sorted(job.circuit_key for _, _, job in batch.all_jobs()) == indices, "Jobs should be keyed by circuit."
+    assert batch_data.get("pending_shots", [0, 0, 0]) == pending
+    assert all(job.circuit is not circuits[0] for _, _, job in batch.all_jobs())
+
+
+def test_generate_dispatch_split_many() -> None:
+    """Test that generate_dispatch splits a batch with split_many, and circuits one by one without it."""
+    executor = QuantumExecutor(providers=["synthetic"])
+    calls: list[str] = []
+
+    def _split(circuit: Any, shots: int, _backends: Any, _vp: Any, data: Any) -> tuple[Dispatch, Any]:  # noqa: ANN401
+        calls.append("split")
+        dispatch = Dispatch()
+        dispatch.add_job("synthetic", "fast", circuit, shots)
+        return dispatch, data
+
+    def _split_many(
+        circuits: Any,  # noqa: ANN401
+        shots_list: Any,  # noqa: ANN401
+        _backends: Any,  # noqa: ANN401
+        _vp: Any,  # noqa: ANN401
+        _data: Any,  # noqa: ANN401
+    ) -> tuple[Dispatch, Any]:
+        calls.append("split_many")
+        dispatch = Dispatch()
+        dispatch.add_job("synthetic", "fast", list(circuits), list(shots_list))
+        return dispatch, None
+
+    circuits = [QuantumCircuit(1, 1), QuantumCircuit(1, 1)]
+    executor.add_policy("batched", _split, split_many=_split_many)
+    dispatch, data = executor.generate_dispatch(circuits, [5, 6], {"synthetic": ["fast"]}, split_policy="batched")
+    assert calls == ["split_many"] and data == {}
+    assert [job.shots for _, _, job in dispatch.all_jobs()] == [5, 6]
+    executor.generate_dispatch(circuits[0], 5, {"synthetic": ["fast"]}, split_policy="batched")
+    assert calls == ["split_many", "split"]
+
+    executor.add_policy("one_by_one", _split)
+    executor.generate_dispatch(circuits, 5, {"synthetic": ["fast"]}, split_policy="one_by_one")
+    assert calls == ["split_many", "split", "split", "split"]
+    with pytest.raises(ValueError, match="split_many"):
+        executor.add_policy("broken", split_many=_split_many)
+
+
+@pytest.mark.parametrize("parallel", ["threads", "processes"])  # type: ignore
+def test_generate_dispatch_parallel(parallel: str) -> None:
+    """Test that a stateless policy splits circuits in parallel, keeping the order of a serial split."""
+    executor = QuantumExecutor(providers=["synthetic"])
+    backends = {"synthetic": ["fast", "slow"]}
+    circuits = [QuantumCircuit(n % 3 + 1, 1) for n in range(50)]
+    shots = [100 + n for n in range(50)]
+
+    serial, _ = executor.generate_dispatch(circuits, shots, backends, split_policy="uniform")
+    dispatch, data = executor.generate_dispatch(
+        circuits, shots, backends, split_policy="uniform", split_data={"key": 1}, parallel=parallel, max_workers=2
+    )
+    assert data == {"key": 1}
+    expected = [(p, b, job.shots, job.circuit.num_qubits) for p, b, job in serial.all_jobs()]
+    assert [(p, b, job.shots, job.circuit.num_qubits) for p, b, job in dispatch.all_jobs()] == expected
+    assert len({job.id for _, _, job in dispatch.all_jobs()}) == len(expected)
+    # Every chunk keys its jobs by the index of their circuit among all the circuits.
+    indices = [job.circuit_key[1] for _, _, job in dispatch.all_jobs() if isinstance(job.circuit_key, tuple)]
+    assert len(indices) == len(expected), "Every job should be keyed by its circuit."
+    assert indices == [job.circuit_key[1] for _, _, job in serial.all_jobs() if isinstance(job.circuit_key, tuple)]
+    assert len({job.circuit_key for _, _, job in dispatch.all_jobs()}) == len(circuits)
+
+
+def test_generate_dispatch_keys_circuits() -> None:
+    """Test that the jobs of one circuit share a key unique to the split, however many jobs a backend gets."""
+    executor = QuantumExecutor(providers=["synthetic"])
+    circuits = [QuantumCircuit(1, 1), QuantumCircuit(2, 2)]
+    backends = {"synthetic": ["fast", "slow"]}
+
+    # The adaptive pilot gives every backend two jobs of each circuit.
+    dispatch, _ = executor.generate_dispatch(circuits, 1000, backends, split_policy="adaptive")
+    keys: dict[Any, set[int]] = {}
+    for _, _, job in dispatch.all_jobs():
+        keys.setdefault(job.circuit_key, set()).add(job.circuit.num_qubits)
+    assert len(keys) == 2 and all(len(qubits) == 1 for qubits in keys.values())
+
+    other, _ = executor.generate_dispatch(circuits, 1000, backends, split_policy="adaptive")
+    assert not keys.keys() & {job.circuit_key for _, _, job in other.all_jobs()}, "Each split should have its own keys."
+    lazy = executor.stream_dispatch(iter(circuits), 100, backends)
+    assert len({job.circuit_key for _, _, job in lazy.all_jobs()}) == 2
+
+
+def test_generate_dispatch_parallel_requires_stateless() -> None:
+    """Test that parallel splitting is refused for stateful policies, unknown modes and unloadable policies."""
+    executor = QuantumExecutor(providers=["synthetic"])
+    circuits = [QuantumCircuit(1, 1), QuantumCircuit(1, 1)]
+    backends = {"synthetic": ["fast"]}
+
+    with pytest.raises(ValueError, match="not stateless"):
+        executor.generate_dispatch(circuits, 100, backends, split_policy="adaptive", parallel="threads")
+    with pytest.raises(ValueError, match="Unknown parallel mode"):
+        executor.generate_dispatch(circuits, 100, backends, split_policy="uniform", parallel="gpu")
+
+    def _split(circuit: Any, shots: int, _backends: Any, _vp: Any, data: Any) -> tuple[Dispatch, Any]:  # noqa: ANN401
+        dispatch = Dispatch()
+        dispatch.add_job("synthetic", "fast", circuit, shots)
+        return dispatch, data
+
+    executor.add_policy("local", _split, stateless=True)
+    dispatch, _ = executor.generate_dispatch(circuits, 100, backends, split_policy="local", parallel="threads")
+    assert len(list(dispatch.all_jobs())) == 2
+    with pytest.raises(ValueError, match="top level"):
+        executor.generate_dispatch(circuits, 100, backends, split_policy="local", parallel="processes")
+    with pytest.raises(ValueError, match="stateless"):
+        executor.add_policy("broken", merge_policy=_split, stateless=True)
+
+
+def test_quantum_executor_run_experiment_adaptive(synthetic_executor: Callable[..., QuantumExecutor]) -> None:
+    """Test that an adaptive experiment runs a pilot round, then favours the faster backend."""
+    circuit = QuantumCircuit(1, 1)
+    circuit.measure(0, 0)
+    devices = {"fast": {"shot_time": 0.0005}, "slow": {"shot_time": 0.005}}
+    executor = synthetic_executor(devices)
+    backends = {"synthetic": ["fast", "slow"]}
+    split_data: dict[str, Any] = {"pilot_fraction": 0.2}
+
+    collector = executor.run_experiment(
+        [circuit, circuit], 1000, backends, split_policy="adaptive", split_data=split_data, execution_mode="threads"
+    )
+    jobs = collector.get_jobs()["synthetic"]
+    assert sum(job.job.shots for results in jobs.values() for job in results) == 2000
+    assert len(jobs["fast"]) == len(jobs["slow"]) == 6, "Each circuit should get a pilot and a final job per backend."
+    assert all(sum(job.data.values()) == job.job.shots for results in jobs.values() for job in results)
+    rates = split_data["rates"]["synthetic"]
+    assert rates["fast"]["throughput"] > rates["slow"]["throughput"]
+    assert jobs["fast"][-1].job.shots > 2 * jobs["slow"][-1].job.shots
+
+    # The measured rates are reused: the next experiment skips the pilot.
+    merged = executor.run_experiment(
+        circuit, 500, backends, split_policy="adaptive", merge_policy="simple_aggregate", split_data=split_data
+    )
+    assert isinstance(merged, MergedResultCollector)
+    assert sum(merged.get_merged_results().values()) == 500
+    assert all(len(results) == 1 for results in merged.get_jobs()["synthetic"].values())
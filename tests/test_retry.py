@@ -0,0 +1,127 @@
+##############################################################################
+# test_retry.py
+##############################################################################
+"""Test suite for the RetryPolicy class and retries in the QuantumExecutor."""
+
+from collections.abc import Callable
+from typing import Any
+
+import pytest  # type: ignore
+from qiskit import QuantumCircuit  # type: ignore
+
+from quantum_executor import QuantumExecutor  # type: ignore[import-not-found,unused-ignore]
+from quantum_executor.metrics import MetricsRegistry  # type: ignore[import-not-found,unused-ignore]
+from quantum_executor.retry import RetryPolicy  # type: ignore[import-not-found,unused-ignore]
+
+# ------------------------------------------------------------------------
+# TESTS FOR RetryPolicy
+# ------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(  # type: ignore
+    ("error", "retryable"),
+    [
+        ("Rate limit of 5 jobs/s exceeded on 'qpu'.", True),
+        ("HTTP 503 Service Unavailable", True),
+        ("Read timed out.", True),
+        ("ConnectionResetError: [Errno 104]", True),
+        ("Circuit has 40 qubits but the backend has 32.", False),
+        ("Synthetic job qpu-0 failed (injected failure).", False),
+        ("Server returned status 429.", True),
+        ("Circuit needs 5030 shots.", False),
+        ("Job 4291 failed.", False),
+    ],
+)
+def test_retry_policy_default_classification(error: str, retryable: bool) -> None:
+    """Test that throttling, timeouts and unavailability are retryable and other errors are not."""
+    assert RetryPolicy().is_retryable("any", error) is retryable
+
+
+def test_retry_policy_classifiers() -> None:
+    """Test that a provider classifier replaces the default rule for that provider only."""
+    policy = RetryPolicy(classifiers={"ionq": lambda error: "queue is full" in error})
+    assert policy.is_retryable("ionq", "The queue is full")
+    assert not policy.is_retryable("ionq", "HTTP 503")
+    assert policy.is_retryable("braket", "HTTP 503")
+    assert RetryPolicy(retryable=["Flaky"]).is_retryable("any", "flaky backend")
+
+
+def test_retry_policy_delays() -> None:
+    """Test the exponential backoff, its cap, the jitter and the attempt limit."""
+    policy = RetryPolicy(max_attempts=5, backoff=1.0, multiplier=3.0, max_backoff=5.0, jitter=0.0)
+    assert [policy.delay(attempt) for attempt in (1, 2, 3)] == [1.0, 3.0, 5.0]
+    assert policy.next_delay("any", "timeout", 4) == 5.0
+    assert policy.next_delay("any", "timeout", 5) is None
+    assert policy.next_delay("any", "invalid circuit", 1) is None
+
+    jittered = RetryPolicy(backoff=2.0, jitter=0.5, seed=1)
+    delays = [jittered.delay(1) for _ in range(50)]
+    assert all(1.0 <= delay <= 2.0 for delay in delays)
+    assert len(set(delays)) > 1
+    same_seed = RetryPolicy(backoff=2.0, jitter=0.5, seed=1)
+    assert delays == [same_seed.delay(1) for _ in range(50)]
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "settings",
+    [{"max_attempts": 0}, {"backoff": -1.0}, {"multiplier": 0.5}, {"jitter": 2.0}],
+)
+def test_retry_policy_invalid(settings: dict[str, Any]) -> None:
+    """Test that out-of-range parameters raise ValueError."""
+    with pytest.raises(ValueError):
+        RetryPolicy(**settings)
+
+
+# ------------------------------------------------------------------------
+# TESTS FOR retries in the QuantumExecutor
+# ------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("execution_mode", ["sequential", "threads"])  # type: ignore
+def test_quantum_executor_retries_rate_limited_jobs(
+    execution_mode: str, circuit: QuantumCircuit, synthetic_executor: Callable[..., QuantumExecutor]
+) -> None:
+    """Test that rate-limited jobs are retried until they succeed, and other failures are not."""
+    metrics = MetricsRegistry()
+    # One job per second: the second job always comes too early, however slowly the jobs are submitted.
+    executor = synthetic_executor(
+        {"throttled": {"rate_limit": 1.0, "rate_burst": 1}, "broken": {"failure_rate": 1.0}},
+        retry_policy=RetryPolicy(max_attempts=20, backoff=0.02, jitter=0.0),
+        metrics=metrics,
+    )
+    dispatch = {
+        "synthetic": {
+            "throttled": [{"circuit": circuit, "shots": 10}] * 2,
+            "broken": [{"circuit": circuit, "shots": 10}],
+        }
+    }
+    collector = executor.run_dispatch(dispatch, execution_mode=execution_mode, max_workers=4)
+    throttled = collector.get_jobs()["synthetic"]["throttled"]
+
+    assert all(sum(result.data.values()) == 10 for result in throttled)
+    assert sum(result.attempts for result in throttled) > len(throttled)
+    for result in throttled:
+        assert len(result.errors) == result.attempts - 1
+        assert all("Rate limit" in error for error in result.errors)
+        assert ("retry" in result.timings) == (result.attempts > 1)
+    retried = sum(result.attempts - 1 for result in throttled)
+    assert metrics.get("quantum_executor_job_retries_total", provider="synthetic", backend="throttled") == retried
+
+    broken = collector.get_jobs()["synthetic"]["broken"][0]
+    assert "injected failure" in broken.data["error"]
+    assert broken.attempts == 1 and not broken.errors
+
+
+def test_quantum_executor_retry_gives_up(
+    circuit: QuantumCircuit, synthetic_executor: Callable[..., QuantumExecutor]
+) -> None:
+    """Test that a job still failing after max_attempts reports its last error."""
+    executor = synthetic_executor({"broken": {"failure_rate": 1.0}})
+    policy = RetryPolicy(max_attempts=3, backoff=0.0, classifiers={"synthetic": lambda error: "injected" in error})
+    collector = executor.run_dispatch(
+        {"synthetic": {"broken": [{"circuit": circuit, "shots": 10}]}}, execution_mode="threads", retry_policy=policy
+    )
+    result = collector.get_jobs()["synthetic"]["broken"][0]
+    assert "injected failure" in result.data["error"]
+    assert result.attempts == 3
+    assert len(result.errors) == 2
@@ -0,0 +1,280 @@
+##############################################################################
+# test_scheduler.py
+##############################################################################
+"""Test suite for the JobScheduler class and the job cost models."""
+
+import threading
+import time
+from collections.abc import Generator
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest  # type: ignore
+from qiskit import QuantumCircuit  # type: ignore
+
+from quantum_executor.cost_model import CircuitCostModel  # type: ignore[import-not-found,unused-ignore]
+from quantum_executor.cost_model import CostModel  # type: ignore[import-not-found,unused-ignore]
+from quantum_executor.cost_model import RuntimeHistory  # type: ignore[import-not-found,unused-ignore]
+from quantum_executor.cost_model import circuit_stats  # type: ignore[import-not-found,unused-ignore]
+from quantum_executor.cost_model import lpt_schedule  # type: ignore[import-not-found,unused-ignore]
+from quantum_executor.dispatch import Job  # type: ignore[import-not-found,unused-ignore]
+from quantum_executor.scheduler import JobScheduler  # type: ignore[import-not-found,unused-ignore]
+
+
+class ConcurrencyProbe:  # pylint: disable=too-few-public-methods
+    """Track the peak number of concurrently running jobs per key."""
+
+    def __init__(self) -> None:
+        """Initialize the ConcurrencyProbe."""
+        self._lock = threading.Lock()
+        self.running: dict[str, int] = {}
+        self.peak: dict[str, int] = {}
+
+    def run(self, *keys: str) -> None:
+        """Simulate a short job, counting it as running under each key.
+
+        Parameters
+        ----------
+        *keys : str
+            Keys (e.g. "total", provider or backend names) under which the job is counted.
+
+        """
+        with self._lock:
+            for key in keys:
+                self.running[key] = self.running.get(key, 0) + 1
+                self.peak[key] = max(self.peak.get(key, 0), self.running[key])
+        time.sleep(0.01)
+        with self._lock:
+            for key in keys:
+                self.running[key] -= 1
+
+
+def make_jobs(spec: dict[str, dict[str, int]]) -> list[tuple[str, str, Job]]:
+    """Build (provider, backend, job) tuples from a provider -> backend -> count mapping.
+
+    Parameters
+    ----------
+    spec : Dict[str, Dict[str, int]]
+        Number of jobs to create per provider and backend.
+
+    Returns
+    -------
+    List[Tuple[str, str, Job]]
+        The scheduled job tuples.
+
+    """
+    return [
+        (prov, back, Job(None, 1))
+        for prov, backends in spec.items()
+        for back, count in backends.items()
+        for _ in range(count)
+    ]
+
+
+def test_scheduler_enforces_limits() -> None:
+    """Test that global, provider and backend limits are never exceeded and every job completes."""
+    jobs = make_jobs({"p1": {"b1": 10, "b2": 10}, "p2": {"b3": 10}})
+    probe = ConcurrencyProbe()
+    done: list[Job] = []
+    scheduler = JobScheduler(max_in_flight=4, provider_limits={"p1": 3}, backend_limits={"p1": {"b1": 1}})
+
+    with ThreadPoolExecutor(8) as pool:
+
+        def submit(prov: str, back: str, _job: Job) -> "Future[Any]":
+            return pool.submit(probe.run, "total", prov, f"{prov}/{back}")
+
+        scheduler.run(jobs, submit, lambda _p, _b, job, _f: done.append(job))
+
+    assert len(done) == len(jobs), "Every job should be reported as done exactly once."
+    assert probe.peak["total"] <= 4, "The global in-flight cap should be respected."
+    assert probe.peak["p1"] <= 3, "The provider limit should be respected."
+    assert probe.peak["p1/b1"] == 1, "The backend limit should be respected."
+
+
+def test_scheduler_consumes_jobs_lazily() -> None:
+    """Test that jobs are pulled from the source only as in-flight slots free up."""
+    pulled: list[int] = []
+    finished: list[Job] = []
+    lead: list[int] = []
+
+    def source() -> Generator[tuple[str, str, Job], None, None]:
+        for i in range(20):
+            pulled.append(i)
+            yield "p", "b", Job(None, 1)
+
+    def submit(_prov: str, _back: str, _job: Job) -> "Future[Any]":
+        lead.append(len(pulled) - len(finished))
+        fut: Future[Any] = Future()
+        fut.set_result({"0": 1})
+        return fut
+
+    JobScheduler(max_in_flight=2).run(source(), submit, lambda _p, _b, job, _f: finished.append(job))
+    assert len(finished) == 20, "All jobs should eventually be consumed and completed."
+    assert max(lead) <= 2, "No more than max_in_flight jobs should be pulled ahead of completion."
+
+
+def test_scheduler_submit_error_is_reported() -> None:
+    """Test that a failing submission is reported through a failed future instead of aborting the run."""
+    failures: list[BaseException | None] = []
+
+    def submit(_prov: str, _back: str, _job: Job) -> "Future[Any]":
+        raise RuntimeError("pool is broken")
+
+    JobScheduler().run(make_jobs({"p": {"b": 2}}), submit, lambda *args: failures.append(args[3].exception()))
+    assert len(failures) == 2, "Each job should be reported once."
+    assert all(isinstance(exc, RuntimeError) for exc in failures), "The submission error should be preserved."
+
+
+def test_scheduler_reserve_counts_against_limits() -> None:
+    """Test that a reserved slot holds back scheduled jobs until it is released."""
+    scheduler = JobScheduler(max_in_flight=2, backend_limits={"p": {"b": 1}})
+    assert scheduler.reserve("p", "b")
+    assert not scheduler.reserve("p", "b"), "The backend limit should cover reservations."
+    assert scheduler.reserve("p", "other")
+    assert not scheduler.reserve("p", "third"), "The global limit should cover reservations."
+    scheduler.release_reservation("p", "other")
+
+    started: list[str] = []
+
+    def submit(_prov: str, back: str, _job: Job) -> "Future[Any]":
+        started.append(back)
+        fut: Future[Any] = Future()
+        fut.set_result(None)
+        return fut
+
+    def on_done(_prov: str, _back: str, _job: Job, _fut: "Future[Any]") -> None:
+        if "p/b" not in started:
+            # Once the other job has run, give the reserved slot back.
+            started.append("p/b")
+            scheduler.release_reservation("p", "b")
+
+    scheduler.run(make_jobs({"p": {"b": 1, "other": 1}}), submit, on_done)
+    assert started == ["other", "p/b", "b"], "The job on the reserved backend should wait for the slot."
+
+
+def test_scheduler_invalid_limits() -> None:
+    """Test that non-positive limits are rejected."""
+    with pytest.raises(ValueError, match="positive integers"):
+        JobScheduler(max_in_flight=0)
+    with pytest.raises(ValueError, match="positive integers"):
+        JobScheduler(backend_limits={"p": {"b": 0}})
+
+
+# ---------------------------------------------------------------------------
+# Tests for the cost model and LPT ordering
+# ---------------------------------------------------------------------------
+
+
+def test_lpt_schedule_minimizes_makespan() -> None:
+    """Test that LPT submits the longest job first and balances worker loads."""
+    costs = [1.0, 1.0, 1.0, 1.0, 4.0]
+    order, loads = lpt_schedule(costs, workers=2)
+    assert order[0] == 4, "The longest job should be submitted first."
+    assert max(loads) == 4.0, "LPT should reach the optimal makespan for this workload."
+    assert sorted(order) == list(range(len(costs))), "Every job should be scheduled exactly once."
+    with pytest.raises(ValueError, match="positive integer"):
+        lpt_schedule(costs, workers=0)
+
+
+def test_circuit_cost_model_ranks_jobs() -> None:
+    """Test that larger circuits, more shots and remote backends cost more."""
+    small = QuantumCircuit(2)
+    small.h(0)
+    large = QuantumCircuit(12)
+    for q in range(12):
+        large.h(q)
+        large.cx(q, (q + 1) % 12)
+    model = CircuitCostModel()
+
+    assert circuit_stats(large) == (12, large.depth()), "Qiskit circuits should be inspected directly."
+    assert circuit_stats(object()) == (0, 0), "Unknown programs should have no cost information."
+    assert model.estimate("local_aer", "aer_simulator", Job(large, 100)) > model.estimate(
+        "local_aer", "aer_simulator", Job(small, 100)
+    ), "Larger circuits should cost more on a simulator."
+    assert model.estimate("local_aer", "aer_simulator", Job(small, 10000)) > model.estimate(
+        "local_aer", "aer_simulator", Job(small, 10)
+    ), "More shots should cost more."
+    assert model.estimate("ionq", "simulator", Job(small, 100)) > model.estimate(
+        "local_aer", "aer_simulator", Job(small, 100)
+    ), "Remote backends should carry a queue overhead."
+
+
+def test_cost_model_is_abstract() -> None:
+    """Test that a cost model without an estimate fails when it is created."""
+
+    class Incomplete(CostModel):  # pylint: disable=abstract-method
+        """A cost model without an estimate."""
+
+    with pytest.raises(TypeError, match="estimate"):
+        Incomplete()  # type: ignore[abstract] # pylint: disable=abstract-class-instantiated
+
+
+def test_circuit_stats_cached_per_circuit() -> None:
+    """Test that each circuit is inspected once while it is alive."""
+
+    class CountingCircuit(QuantumCircuit):  # type: ignore[misc]
+        """A circuit counting the calls to its depth."""
+
+        depth_calls = 0
+
+        def depth(self, *args: Any, **kwargs: Any) -> int:  # noqa: ANN401
+            CountingCircuit.depth_calls += 1
+            return int(super().depth(*args, **kwargs))
+
+    circuit = CountingCircuit(2)
+    circuit.h(0)
+    model = CircuitCostModel(history=RuntimeHistory())
+    job = Job(circuit, 100)
+    model.estimate("local_aer", "aer_simulator", job)
+    model.estimate_memory("local_aer", "aer_simulator", job)
+    model.observe("local_aer", "aer_simulator", job, 1.0)
+    assert circuit_stats(circuit) == (2, 1)
+    assert CountingCircuit.depth_calls == 1, "Later lookups should reuse the cached statistics."
+    assert circuit_stats(CountingCircuit(3)) == (3, 0)
+    assert CountingCircuit.depth_calls == 2, "Another circuit should be inspected on its own."
+
+
+def test_circuit_cost_model_history_calibration() -> None:
+    """Test that recorded runtimes convert heuristic costs into seconds."""
+    history = RuntimeHistory()
+    model = CircuitCostModel(history=history)
+    job = Job(QuantumCircuit(3), 100)
+    raw = model.estimate("local_aer", "aer_simulator", job)
+
+    model.observe("local_aer", "aer_simulator", job, 2.0)
+    assert model.estimate("local_aer", "aer_simulator", job) == pytest.approx(2.0), (
+        "A job identical to the recorded one should be estimated at its measured runtime."
+    )
+    assert model.estimate("local_aer", "fake_oslo", job) == pytest.approx(2.0), (
+        "Backends without history should fall back to the overall calibration."
+    )
+    assert history.mean_seconds("local_aer", "aer_simulator") == pytest.approx(2.0)
+    assert history.seconds_per_cost("local_aer", "aer_simulator") == pytest.approx(2.0 / raw)
+
+
+def test_runtime_history_save_and_load(tmp_path: Any) -> None:  # noqa: ANN401
+    """Test that the runtime history survives a JSON round trip and tolerates bad files.
+
+    Parameters
+    ----------
+    tmp_path : Any
+        Temporary directory for the history file.
+
+    """
+    history = RuntimeHistory()
+    history.record("local_aer", "aer_simulator", 0.5, 1.5)
+    history.record("local_aer", "aer_simulator", 0.5, 0.5)
+    path = tmp_path / "nested" / "history.json"
+    history.save(path)
+
+    loaded = RuntimeHistory.load(path)
+    assert loaded.to_dict() == history.to_dict(), "The loaded history should match the saved one."
+    assert loaded.mean_seconds("local_aer", "aer_simulator") == pytest.approx(1.0)
+
+    assert RuntimeHistory.load(tmp_path / "missing.json").to_dict()["records"] == {}, (
+        "A missing file should give an empty history."
+    )
+    bad = tmp_path / "bad.json"
+    bad.write_text("{not json")
+    assert RuntimeHistory.load(bad).to_dict()["records"] == {}, "A corrupt file should give an empty history."
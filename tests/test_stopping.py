@@ -0,0 +1,132 @@
+##############################################################################
+# test_stopping.py
+##############################################################################
+"""Test suite for the stopping rules and sequential sampling in the QuantumExecutor."""
+
+from collections.abc import Callable
+from typing import Any
+
+import pytest  # type: ignore
+from qiskit import QuantumCircuit  # type: ignore
+
+from quantum_executor import QuantumExecutor  # type: ignore[import-not-found,unused-ignore]
+from quantum_executor.result_collector import MergedResultCollector  # type: ignore[import-not-found,unused-ignore]
+from quantum_executor.stopping import ConfidenceIntervalRule  # type: ignore[import-not-found,unused-ignore]
+from quantum_executor.stopping import StoppingRule  # type: ignore[import-not-found,unused-ignore]
+from quantum_executor.stopping import TotalVariationRule  # type: ignore[import-not-found,unused-ignore]
+from quantum_executor.stopping import total_counts  # type: ignore[import-not-found,unused-ignore]
+from quantum_executor.stopping import total_variation_distance  # type: ignore[import-not-found,unused-ignore]
+
+BACKENDS = {"synthetic": ["a", "b"]}
+DEVICES: dict[str, dict[str, float]] = {"a": {}, "b": {}}
+
+
+# ------------------------------------------------------------------------
+# TESTS FOR the stopping rules
+# ------------------------------------------------------------------------
+
+
+def test_total_counts_and_distance() -> None:
+    """Test that counts add up over successful jobs, and the total variation distance."""
+    results: dict[str, dict[str, list[Any]]] = {
+        "p": {"a": [{"0": 3, "1": 1}, {"error": "boom"}], "b": [{"1": 4}, None]}
+    }
+    assert total_counts(results) == {"0": 3, "1": 5}
+    assert total_variation_distance({"0": 5, "1": 5}, {"0": 50, "1": 50}) == 0.0
+    assert total_variation_distance({"0": 1}, {"1": 1}) == 1.0
+    assert total_variation_distance({"0": 3, "1": 1}, {"0": 1, "1": 1}) == pytest.approx(0.25)
+    assert total_variation_distance({}, {"0": 1}) == 1.0
+
+
+def test_confidence_interval_rule() -> None:
+    """Test the Wilson intervals and when they are narrow enough."""
+    rule = ConfidenceIntervalRule(half_width=0.05, confidence=0.95, top=2)
+    low, high = rule.interval(500, 1000)
+    assert low == pytest.approx(0.469, abs=1e-3) and high == pytest.approx(0.531, abs=1e-3)
+    assert not rule.should_stop({"0": 50, "1": 50}, None)
+    assert rule.should_stop({"0": 500, "1": 500}, None)
+    assert not rule.should_stop({}, None)
+    # Skewed distributions converge sooner.
+    assert rule.should_stop({"0": 190, "1": 10}, None)
+    assert not ConfidenceIntervalRule(half_width=0.05, min_shots=2000).should_stop({"0": 500, "1": 500}, None)
+
+
+def test_total_variation_rule() -> None:
+    """Test that the rule compares the distributions before and after the last round."""
+    rule = TotalVariationRule(tolerance=0.02, min_shots=100)
+    assert not rule.should_stop({"0": 50, "1": 50}, None)
+    assert rule.should_stop({"0": 101, "1": 99}, {"0": 50, "1": 50})
+    assert not rule.should_stop({"0": 120, "1": 80}, {"0": 50, "1": 50})
+    assert not rule.should_stop({"0": 26, "1": 24}, {"0": 13, "1": 12})
+
+
+@pytest.mark.parametrize(  # type: ignore
+    ("rule", "settings"),
+    [
+        (ConfidenceIntervalRule, {"half_width": 0}),
+        (ConfidenceIntervalRule, {"confidence": 1.0}),
+        (ConfidenceIntervalRule, {"top": 0}),
+        (TotalVariationRule, {"tolerance": 1.5}),
+        (TotalVariationRule, {"min_shots": -1}),
+    ],
+)
+def test_stopping_rule_invalid(rule: type, settings: dict[str, float]) -> None:
+    """Test that out-of-range parameters raise ValueError."""
+    with pytest.raises(ValueError):
+        rule(**settings)
+
+
+# ------------------------------------------------------------------------
+# TESTS FOR sequential sampling in the QuantumExecutor
+# ------------------------------------------------------------------------
+
+
+def test_stopping_rule_is_abstract() -> None:
+    """Test that a stopping rule without a criterion fails when it is created."""
+
+    class Incomplete(StoppingRule):  # pylint: disable=abstract-method too-few-public-methods
+        """A stopping rule without a criterion."""
+
+    with pytest.raises(TypeError, match="_met"):
+        Incomplete()  # type: ignore[abstract] # pylint: disable=abstract-class-instantiated
+
+
+def test_quantum_executor_stops_early(
+    circuit: QuantumCircuit, synthetic_executor: Callable[..., QuantumExecutor]
+) -> None:
+    """Test that an experiment ends once the rule is met, far below its shot budget."""
+    merged = synthetic_executor(DEVICES).run_experiment(
+        circuit,
+        100_000,
+        BACKENDS,
+        merge_policy="simple_aggregate",
+        stopping_rule=ConfidenceIntervalRule(half_width=0.05),
+        shots_per_round=200,
+    )
+    assert isinstance(merged, MergedResultCollector)
+    shots = sum(merged.get_merged_results().values())
+    # About 385 shots give a half-width of 0.05 around p = 0.5.
+    assert shots in {400, 600}
+    jobs = merged.get_jobs()["synthetic"]
+    assert sum(job.job.shots for results in jobs.values() for job in results) == shots
+    assert all(job.job.shots == 100 for results in jobs.values() for job in results)
+
+
+def test_quantum_executor_spends_budget_when_rule_unmet(
+    circuit: QuantumCircuit, synthetic_executor: Callable[..., QuantumExecutor]
+) -> None:
+    """Test that the whole budget is sent in increments when the rule is never met."""
+    collector = synthetic_executor(DEVICES).run_experiment(
+        circuit,
+        1000,
+        BACKENDS,
+        stopping_rule=ConfidenceIntervalRule(half_width=0.001),
+        shots_per_round=300,
+        execution_mode="threads",
+    )
+    jobs = collector.get_jobs()["synthetic"]
+    assert sorted(job.job.shots for job in jobs["a"]) == [50, 150, 150, 150]
+    assert sum(sum(job.data.values()) for results in jobs.values() for job in results) == 1000
+
+    with pytest.raises(ValueError, match="single circuit"):
+        synthetic_executor(DEVICES).run_experiment([circuit], 1000, BACKENDS, stopping_rule=TotalVariationRule())
@@ -0,0 +1,225 @@
+##############################################################################
+# test_synthetic.py
+##############################################################################
+"""Test suite for SyntheticProvider, SyntheticBackend and SyntheticJob classes.
+
+This test file covers:
+- Configuring devices and validating their settings.
+- Synthetic counts (shots, result size, reproducibility).
+- Queue latency and job statuses.
+- Injected failures and rate limits.
+- Running a dispatch on synthetic backends through the QuantumExecutor.
+"""
+
+from __future__ import annotations
+
+import time
+
+import pytest  # type: ignore
+from qbraid.runtime.enums import DeviceStatus  # type: ignore
+from qbraid.runtime.enums import JobStatus
+from qiskit import QuantumCircuit  # type: ignore
+
+from quantum_executor import QuantumExecutor  # type: ignore[import-not-found,unused-ignore]
+from quantum_executor.synthetic import SyntheticBackend  # type: ignore[import-not-found,unused-ignore]
+from quantum_executor.synthetic import SyntheticJob
+from quantum_executor.synthetic import SyntheticProvider
+from quantum_executor.synthetic.provider import DEFAULT_DEVICES  # type: ignore[import-not-found,unused-ignore]
+
+
+def _circuit(num_qubits: int = 3) -> QuantumCircuit:
+    """Build a small measured circuit.
+
+    Parameters
+    ----------
+    num_qubits : int, optional
+        Number of qubits and classical bits.
+
+    Returns
+    -------
+    QuantumCircuit
+        The circuit.
+
+    """
+    circuit = QuantumCircuit(num_qubits, num_qubits)
+    circuit.h(0)
+    circuit.measure(range(num_qubits), range(num_qubits))
+    return circuit
+
+
+def _submit(device: SyntheticBackend, shots: int, num_qubits: int = 3) -> SyntheticJob:
+    """Submit a single circuit and return its job.
+
+    Parameters
+    ----------
+    device : SyntheticBackend
+        The device to submit to.
+    shots : int
+        Number of shots.
+    num_qubits : int, optional
+        Number of qubits of the circuit.
+
+    Returns
+    -------
+    SyntheticJob
+        The submitted job.
+
+    """
+    job = device.submit(_circuit(num_qubits), shots=shots)
+    assert isinstance(job, SyntheticJob), "Expected a single job for a single circuit."
+    return job
+
+
+# ------------------------------------------------------------------------
+# TESTS FOR SyntheticProvider
+# ------------------------------------------------------------------------
+
+
+def test_provider_default_devices() -> None:
+    """Test that the built-in devices are available and cached per provider."""
+    provider = SyntheticProvider()
+    assert {device.id for device in provider.get_devices()} == set(DEFAULT_DEVICES)
+    assert provider.get_device("synthetic") is provider.get_device("synthetic")
+    assert provider.get_device("synthetic") is not SyntheticProvider().get_device("synthetic")
+    assert provider.get_device("synthetic").status() == DeviceStatus.ONLINE
+
+
+def test_provider_custom_devices_and_defaults() -> None:
+    """Test that provider-wide defaults are overridden by per-device settings."""
+    provider = SyntheticProvider(devices={"a": {}, "b": {"failure_rate": 0.5}}, num_qubits=5, failure_rate=0.1)
+    assert provider.get_device("a").failure_rate == 0.1
+    assert provider.get_device("b").failure_rate == 0.5
+    assert provider.get_device("a").num_qubits == 5
+    with pytest.raises(ValueError, match="not found"):
+        provider.get_device("synthetic")
+
+
+@pytest.mark.parametrize(  # type: ignore
+    "settings",
+    [
+        {"latency_distribution": "pareto"},
+        {"queue_latency": -1},
+        {"failure_rate": 1.5},
+        {"rate_limit": 0},
+        {"result_size": 0},
+    ],
+)
+def test_provider_invalid_settings(settings: dict[str, object]) -> None:
+    """Test that invalid device settings are rejected when the provider is created."""
+    with pytest.raises(ValueError):
+        SyntheticProvider(devices={"bad": settings})
+
+
+# ------------------------------------------------------------------------
+# TESTS FOR SyntheticBackend and SyntheticJob
+# ------------------------------------------------------------------------
+
+
+def test_submit_requires_shots() -> None:
+    """Test that submitting without valid shots raises ValueError."""
+    device = SyntheticProvider().get_device("synthetic")
+    with pytest.raises(ValueError, match="shots must be specified"):
+        device.submit(_circuit())
+    with pytest.raises(ValueError, match="positive"):
+        device.submit(_circuit(), shots=0)
+
+
+def test_counts_and_result_size() -> None:
+    """Test that counts sum to the shots and respect the result size and circuit width."""
+    device = SyntheticProvider(devices={"d": {"result_size": 4}}).get_device("d")
+    jobs = device.submit([_circuit(5), _circuit(5)], shots=1000)
+    assert isinstance(jobs, list) and len(jobs) == 2
+    counts = jobs[0].result().data.get_counts()
+    assert sum(counts.values()) == 1000
+    assert len(counts) <= 4
+    assert all(len(bitstring) == 5 for bitstring in counts)
+    # Never more distinct outcomes than shots.
+    assert len(_submit(device, 2, 5).result().data.get_counts()) <= 2
+
+
+def test_seed_is_reproducible() -> None:
+    """Test that two providers with the same seed produce the same counts."""
+    first = _submit(SyntheticProvider(seed=3).get_device("synthetic"), 100)
+    second = _submit(SyntheticProvider(seed=3).get_device("synthetic"), 100)
+    assert first.result().data.get_counts() == second.result().data.get_counts()
+
+
+def test_queue_latency_and_status() -> None:
+    """Test that a job is queued until its latency has elapsed, then completes."""
+    device = SyntheticProvider(devices={"d": {"queue_latency": 0.2}}).get_device("d")
+    start = time.monotonic()
+    job = _submit(device, 10)
+    assert job.status() == JobStatus.QUEUED
+    job.result()
+    assert time.monotonic() - start >= 0.2
+    assert job.status() == JobStatus.COMPLETED
+
+
+@pytest.mark.parametrize("distribution", ["exponential", "lognormal", "uniform"])  # type: ignore
+def test_latency_distributions(distribution: str) -> None:
+    """Test that random latency distributions draw non-negative latencies."""
+    device = SyntheticProvider(
+        devices={"d": {"queue_latency": 0.01, "latency_distribution": distribution}}, seed=1
+    ).get_device("d")
+    latencies = [device._draw_latency() for _ in range(100)]  # pylint: disable=protected-access
+    assert all(latency >= 0 for latency in latencies)
+    assert len(set(latencies)) > 1
+
+
+def test_injected_failure() -> None:
+    """Test that a failure rate of 1 makes every job fail."""
+    job = _submit(SyntheticProvider(devices={"d": {"failure_rate": 1.0}}).get_device("d"), 10)
+    assert job.status() == JobStatus.FAILED
+    with pytest.raises(RuntimeError, match="injected failure"):
+        job.result()
+
+
+def test_cancel() -> None:
+    """Test that a queued job can be cancelled."""
+    job = _submit(SyntheticProvider(devices={"d": {"queue_latency": 10.0}}).get_device("d"), 10)
+    job.cancel()
+    assert job.status() == JobStatus.CANCELLED
+    with pytest.raises(RuntimeError, match="cancelled"):
+        job.result()
+
+
+def test_rate_limit() -> None:
+    """Test that submissions beyond the burst are rejected until tokens refill."""
+    device = SyntheticProvider(devices={"d": {"rate_limit": 50.0, "rate_burst": 2}}).get_device("d")
+    device.submit(_circuit(), shots=10)
+    device.submit(_circuit(), shots=10)
+    with pytest.raises(RuntimeError, match="Rate limit"):
+        device.submit(_circuit(), shots=10)
+    time.sleep(0.05)
+    device.submit(_circuit(), shots=10)
+
+
+def test_backend_str() -> None:
+    """Test the string representation of a synthetic backend."""
+    device = SyntheticProvider().get_device("synthetic")
+    assert isinstance(device, SyntheticBackend)
+    assert str(device) == "SyntheticBackend('synthetic')"
+
+
+# ------------------------------------------------------------------------
+# TESTS FOR the executor on synthetic backends
+# ------------------------------------------------------------------------
+
+
+def test_executor_runs_synthetic_dispatch() -> None:
+    """Test that the executor collects counts and errors from synthetic backends."""
+    executor = QuantumExecutor(
+        providers=["synthetic"],
+        providers_info={"synthetic": {"devices": {"ok": {}, "broken": {"failure_rate": 1.0}}, "seed": 0}},
+    )
+    dispatch = {
+        "synthetic": {
+            "ok": [{"circuit": _circuit(), "shots": 100}] * 5,
+            "broken": [{"circuit": _circuit(), "shots": 100}],
+        }
+    }
+    results = executor.run_dispatch(dispatch, multiprocess=False).get_results()
+    assert all(counts is not None and sum(counts.values()) == 100 for counts in results["synthetic"]["ok"])
+    broken = results["synthetic"]["broken"][0]
+    assert broken is not None, "Expected an error result for the broken device."
+    assert "injected failure" in broken["error"]